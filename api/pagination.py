@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# api/pagination.py
+"""
+페이지네이션 유틸리티
+- 키셋(커서): 정렬 컬럼 + id 기준 seek 조건 생성 (OFFSET/COUNT 없이 깊은 페이지도 일정한 비용)
+- 커서: 마지막 행의 정렬 값 JSON → base64url (datetime/time은 마이크로초까지 유지)
+- EstimatedCountPaginator: 대용량 테이블 개수를 추정값으로 제공 (페이지 범위/다음 페이지 여부는 실제 행 기준)
+"""
+import json
+import base64
+import logging
+import datetime
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator, Page, EmptyPage, PageNotAnInteger
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime, parse_time
+from django.utils.functional import cached_property
+
+from phrase.models.counting import estimate_count
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidCursor(ValueError):
+    """해석할 수 없는 커서"""
+
+
+def get_keyset_ordering(queryset, default_ordering=None):
+    """
+    쿼리셋 정렬을 (필드명, 내림차순 여부) 목록으로 변환하고 pk 타이브레이커 추가
+    문자열 정렬만 지원 (OrderingFilter/뷰 ordering 형식)
+    """
+    ordering = (
+        list(queryset.query.order_by)
+        or list(default_ordering or [])
+        or list(queryset.model._meta.ordering)
+    )
+    pk_name = queryset.model._meta.pk.name
+
+    keys = []
+    for item in ordering:
+        if not isinstance(item, str) or '__' in item or item.lstrip('-') == '?':
+            continue
+        name = item.lstrip('-')
+        if name == 'pk':
+            name = pk_name
+        keys.append((name, item.startswith('-')))
+
+    if pk_name not in [name for name, _ in keys]:
+        descending = keys[0][1] if keys else False
+        keys.append((pk_name, descending))
+
+    return keys
+
+
+def order_by_keyset(queryset, keys):
+    """NULL을 항상 마지막에 두는 결정적 정렬 적용 (DB 벤더 간 동일한 seek 의미 보장)"""
+    return queryset.order_by(*[
+        F(name).desc(nulls_last=True) if descending else F(name).asc(nulls_last=True)
+        for name, descending in keys
+    ])
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder + datetime/time 전체 정밀도 isoformat
+    (DjangoJSONEncoder는 밀리초로 잘라서, 같은 밀리초의 행이 strict seek 조건에서 건너뛰어지거나 반복됨)
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(instance, keys):
+    """마지막 행의 정렬 값으로 커서 생성"""
+    values = [getattr(instance, name) for name, _ in keys]
+    payload = json.dumps(values, cls=CursorJSONEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _restore_value(field, value):
+    """커서 JSON 값 → 필드 값 (datetime/time은 마이크로초까지 그대로 복원)"""
+    if isinstance(field, models.DateTimeField) and isinstance(value, str):
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise ValidationError(f"datetime 형식이 아님: {value}")
+        return field.to_python(parsed)
+    if isinstance(field, models.TimeField) and isinstance(value, str):
+        parsed = parse_time(value)
+        if parsed is None:
+            raise ValidationError(f"time 형식이 아님: {value}")
+        return parsed
+    return field.to_python(value)
+
+
+def decode_cursor(token, model, keys):
+    """커서 → 정렬 값 목록 (모델 필드 타입으로 복원)"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursor(f"잘못된 커서: {e}")
+
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise InvalidCursor("커서와 정렬 조건이 일치하지 않습니다")
+
+    restored = []
+    for (name, _), value in zip(keys, values):
+        if value is None:
+            restored.append(None)
+            continue
+        try:
+            restored.append(_restore_value(model._meta.get_field(name), value))
+        except FieldDoesNotExist:
+            # 주석(annotate) 필드 - JSON 값 그대로 사용
+            restored.append(value)
+        except ValidationError as e:
+            raise InvalidCursor(f"잘못된 커서 값 ({name}): {e}")
+
+    return restored
+
+
+def _is_nullable(model, name):
+    try:
+        return model._meta.get_field(name).null
+    except FieldDoesNotExist:
+        return True
+
+
+def build_seek_filter(model, keys, values):
+    """
+    커서 이후 행 조건 (NULLS LAST 정렬 기준)
+    (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ... - 방향에 따라 > / <
+    """
+    condition = Q(pk__in=[])
+    equal_prefix = Q()
+
+    for (name, descending), value in zip(keys, values):
+        if value is None:
+            # NULL은 마지막 - 이 컬럼에서는 더 뒤의 값이 없고, 동일 조건은 IS NULL
+            equal_prefix &= Q(**{f"{name}__isnull": True})
+            continue
+
+        lookup = 'lt' if descending else 'gt'
+        beyond = Q(**{f"{name}__{lookup}": value})
+        if _is_nullable(model, name):
+            beyond |= Q(**{f"{name}__isnull": True})
+        condition |= equal_prefix & beyond
+        equal_prefix &= Q(**{name: value})
+
+    return condition
+
+
+class EstimatedCountPage(Page):
+    """다음 페이지 여부를 개수 추정값 대신 실제로 조회한 행(page_size + 1)으로 판단하는 페이지"""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return self.paginator.per_page * (self.number - 1) + 1
+
+    def end_index(self):
+        if not self.object_list:
+            return 0
+        return self.start_index() + len(self.object_list) - 1
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    개수 추정 페이지네이터 - count_is_estimate가 True면 count/num_pages는 근사값 (응답 메타데이터용)
+    페이지 번호 검증/조회 범위/다음 페이지 여부는 추정값을 쓰지 않고 page_size + 1개 조회로 판단
+    (추정값이 작아도 뒤 페이지에 접근 가능, 커도 빈 페이지를 다음 페이지로 안내하지 않음)
+    """
+
+    count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, 'query'):
+            return super().count
+
+        estimate = estimate_count(self.object_list)
+        self.count_is_estimate = estimate.is_estimate
+        return estimate.count
+
+    def validate_number(self, number):
+        """1 이상의 정수인지만 확인 (마지막 페이지 검증은 page()에서 실제 행으로)"""
+        if not hasattr(self.object_list, 'query'):
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger("페이지 번호가 정수가 아닙니다")
+        if number < 1:
+            raise EmptyPage("페이지 번호는 1 이상이어야 합니다")
+        return number
+
+    def page(self, number):
+        if not hasattr(self.object_list, 'query'):
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if not rows and number > 1:
+            raise EmptyPage("해당 페이지에 결과가 없습니다")
+
+        # 추정값이 실제로 확인한 행 수보다 작으면 확인한 값으로 보정 (num_pages 포함)
+        seen = bottom + len(rows) + (1 if has_next else 0)
+        if self.count < seen:
+            self.__dict__['count'] = seen
+            self.__dict__.pop('num_pages', None)
+
+        return EstimatedCountPage(rows, number, self, has_next)
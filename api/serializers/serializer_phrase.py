@@ -9,6 +9,7 @@
 from rest_framework import serializers
 from django.core.cache import cache
 from django.conf import settings
+from phrase.caching import make_key, cache_get
 from phrase.models import (
     RequestTable, MovieTable, DialogueTable,
     UserSearchQuery, UserSearchResult,
@@ -52,7 +53,7 @@ class CacheOptimizedMixin:
     
     def get_cached_data(self, cache_key, fetch_func, timeout=300):
         """캐시된 데이터 조회 또는 생성"""
-        data = cache.get(cache_key)
+        data = cache_get(cache_key)
         if data is None:
             data = fetch_func()
             cache.set(cache_key, data, timeout)
@@ -168,7 +169,7 @@ class OptimizedMovieTableSerializer(serializers.ModelSerializer, MediaURLMixin,
     
     def get_dialogue_count(self, obj):
         """대사 개수 조회 (캐싱 적용)"""
-        cache_key = f"movie_dialogue_count_{obj.id}"
+        cache_key = make_key('movie_dialogue_count', obj.id)
         return self.get_cached_data(
             cache_key,
             lambda: obj.dialogues.filter(is_active=True).count(),
@@ -1,3 +1,67 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils import timezone
+
+from api.pagination import (
+    get_keyset_ordering,
+    order_by_keyset,
+    encode_cursor,
+    decode_cursor,
+    build_seek_filter,
+)
+from phrase.models import RequestTable
+
+
+class KeysetCursorTests(TestCase):
+    """키셋 커서 - 같은 밀리초에 생성된 행도 건너뛰거나 반복하지 않고 한 번씩 조회"""
+
+    @classmethod
+    def setUpTestData(cls):
+        base = timezone.now().replace(microsecond=123000)
+        cls.ids = []
+        for index in range(5):
+            request = RequestTable.objects.create(request_phrase=f"same millisecond {index}")
+            # 모두 같은 밀리초 (마이크로초만 다름), 마지막 두 행은 마이크로초까지 같음 (id로 구분)
+            created_at = base + timedelta(microseconds=min(index, 3) * 100)
+            RequestTable.objects.filter(pk=request.pk).update(created_at=created_at)
+            cls.ids.append(request.pk)
+
+    def _page_through(self, ordering, page_size=1):
+        queryset = RequestTable.objects.order_by(ordering)
+        keys = get_keyset_ordering(queryset)
+        queryset = order_by_keyset(queryset, keys)
+
+        seen, token = [], None
+        while True:
+            page = queryset
+            if token:
+                values = decode_cursor(token, RequestTable, keys)
+                page = page.filter(build_seek_filter(RequestTable, keys, values))
+            rows = list(page[:page_size])
+            if not rows:
+                break
+            seen.extend(row.pk for row in rows)
+            token = encode_cursor(rows[-1], keys)
+        return seen
+
+    def test_cursor_keeps_microseconds(self):
+        queryset = RequestTable.objects.order_by('-created_at')
+        keys = get_keyset_ordering(queryset)
+        row = RequestTable.objects.get(pk=self.ids[1])
+
+        values = decode_cursor(encode_cursor(row, keys), RequestTable, keys)
+
+        self.assertEqual(values, [row.created_at, row.pk])
+
+    def test_descending_pages_visit_every_row_once(self):
+        seen = self._page_through('-created_at')
+
+        self.assertEqual(sorted(seen), sorted(self.ids))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_ascending_pages_visit_every_row_once(self):
+        seen = self._page_through('created_at', page_size=2)
 
-# Create your tests here.
+        self.assertEqual(sorted(seen), sorted(self.ids))
+        self.assertEqual(len(seen), len(set(seen)))
@@ -18,6 +18,9 @@ urlpatterns = [
     # ===== 핵심 검색 API (최적화) =====
     path('search/', views.search_movie_quotes, name='search-quotes'),
     
+    # 검색어 자동완성 (메모리 트라이)
+    path('search/autocomplete/', views.autocomplete_search_phrases, name='search-autocomplete'),
+    
     # ===== 최적화된 테이블별 조회 API =====
     # 요청테이블 조회 (궁극적 최적화)
     path('requests/', views.get_request_table_list, name='request-table-list'),
@@ -246,7 +249,21 @@ urlpatterns = [
      "operation_details": {...}
    }
 
-9. 레거시 API (Flutter 호환)
+9. 검색어 자동완성 API (입력 중 호출, DB 조회 없음)
+   GET /api/search/autocomplete/?q=i lo&limit=5
+   
+   응답:
+   {
+     "query": "i lo",
+     "count": 2,
+     "suggestions": [
+       {"text": "I love you", "search_count": 120},
+       {"text": "I lost it", "search_count": 15}
+     ],
+     "meta": {"response_time_ms": 0.021}
+   }
+
+10. 레거시 API (Flutter 호환)
    GET /api/legacy/search/?q=hello
    GET /api/quotes/123/
    GET /api/movies/456/quotes/
@@ -291,5 +308,5 @@ GET /api/search/?q=love&sort=popular&quality=excellent&movie=titanic&year=1997
 
 - 대부분의 API: 인증 불필요
 - 대량 업데이트: 인증 필요
-- 스로틀링: 일반 API (2000/시간), 검색 API (200/시간), 대량 작업 (50/시간)
+- 스로틀링: 일반 API (2000/시간), 검색 API (200/시간), 자동완성 (10000/시간), 대량 작업 (50/시간)
 """
\ No newline at end of file
@@ -31,6 +31,7 @@ from .view_phrase import (
     get_optimized_serializer,
     log_serializer_performance,
     search_movie_quotes,
+    autocomplete_search_phrases,
     get_request_table_list,
     get_movie_table_list,
     get_dialogue_table_list,
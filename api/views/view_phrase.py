@@ -14,9 +14,11 @@ from rest_framework import generics, status, filters
 from rest_framework.decorators import api_view, throttle_classes, permission_classes
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from django.db.models import Q, Prefetch, Count, Avg, F
+from django.db.models import Q, Prefetch, Count, Avg
 from django.core.cache import cache
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
@@ -26,15 +28,53 @@ from django.utils import timezone
 from django.db import transaction
 import time
 import logging
-import hashlib
 
 # 새로운 모델 구조 임포트
+from phrase.caching import (
+    make_key,
+    cache_get,
+    get_cache_key_statistics,
+    get_with_tags,
+    set_with_tags,
+    get_tag_generations,
+    bump_tags,
+    SEARCH_TAG,
+    REQUESTS_TAG,
+    dialogue_tag,
+    movie_tag,
+    single_flight,
+    get_single_flight_statistics,
+    is_negative,
+    record_negative,
+    stale_while_revalidate,
+    ModelRowCodec,
+    get_serialization_statistics,
+    get_rate_limiter_statistics,
+)
 from phrase.models import (
     RequestTable,
     MovieTable,
     DialogueTable,
     UserSearchQuery,
     UserSearchResult,
+    rank_dialogues_bm25,
+    estimate_count,
+    contains_hangul,
+    get_existence_filter_statistics,
+    increment_counter,
+    increment_counters,
+    get_counter_statistics,
+)
+
+# 키셋(커서) 페이지네이션
+from api.pagination import (
+    InvalidCursor,
+    get_keyset_ordering,
+    order_by_keyset,
+    encode_cursor,
+    decode_cursor,
+    build_seek_filter,
+    EstimatedCountPaginator,
 )
 
 # 최적화된 시리얼라이저 임포트
@@ -78,11 +118,24 @@ from phrase.utils.load_to_db import (
     save_request_table_optimized,
 )
 from phrase.utils.translate import (
-    LibreTranslator,
+    get_translator,
     translate_dialogue_batch,
     get_translation_quality_report,
 )
-from phrase.utils.search_history import SearchHistoryManager
+from phrase.utils.jobs import enqueue_job, get_job_statistics
+from phrase.utils.batch_translate import get_batch_translation_statistics
+from phrase.utils.http_client import get_http_statistics
+from phrase.utils.cache_warmer import (
+    warm_search_result,
+    schedule_cache_warming,
+    get_cache_warmer_report,
+)
+from phrase.utils.autocomplete import (
+    autocomplete,
+    is_autocomplete_ready,
+    start_autocomplete_build,
+    AUTOCOMPLETE_TOP_K,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -90,18 +143,93 @@ logger = logging.getLogger(__name__)
 
 
 class AdvancedPagination(PageNumberPagination):
-    """고급 페이지네이션 (성능 최적화)"""
+    """
+    고급 페이지네이션 (성능 최적화)
+    ?cursor= 파라미터 사용 시 키셋(커서) 모드 - OFFSET 없이 정렬 컬럼 + id로 seek,
+    전체 개수는 include_count=true 일 때만 계산
+    """
 
+    django_paginator_class = EstimatedCountPaginator
     page_size = 20
     page_size_query_param = "limit"
     max_page_size = 100
+    cursor_query_param = "cursor"
+    include_count_query_param = "include_count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.cursor_mode = self.cursor_query_param in request.query_params
+
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        return self.paginate_queryset_by_cursor(queryset, request, view)
+
+    def paginate_queryset_by_cursor(self, queryset, request, view=None):
+        """키셋 페이지네이션 - page_size + 1개를 조회해 다음 페이지 여부 판단"""
+        page_size = self.get_page_size(request)
+        keys = get_keyset_ordering(queryset, getattr(view, "ordering", None))
+        ordered_queryset = order_by_keyset(queryset, keys)
+
+        self.total_count = None
+        self.count_is_estimate = False
+        if request.query_params.get(self.include_count_query_param, "").lower() == "true":
+            self.total_count, self.count_is_estimate = estimate_count(queryset)
+
+        token = request.query_params.get(self.cursor_query_param)
+        if token:
+            try:
+                values = decode_cursor(token, queryset.model, keys)
+            except InvalidCursor as e:
+                raise NotFound(str(e))
+            ordered_queryset = ordered_queryset.filter(
+                build_seek_filter(queryset.model, keys, values)
+            )
+
+        rows = list(ordered_queryset[: page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page_rows = rows[:page_size]
+        self.next_cursor = (
+            encode_cursor(self.page_rows[-1], keys) if self.has_next else None
+        )
+        return self.page_rows
+
+    def get_next_cursor_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
 
     def get_paginated_response(self, data):
         """최적화된 페이지네이션 응답"""
+        if self.cursor_mode:
+            return Response(
+                {
+                    "pagination": {
+                        "mode": "cursor",
+                        "count": self.total_count,
+                        "count_is_estimate": self.count_is_estimate,
+                        "page_size": self.get_page_size(self.request),
+                        "has_next": self.has_next,
+                        "next_cursor": self.next_cursor,
+                    },
+                    "links": {
+                        "next": self.get_next_cursor_link(),
+                        "previous": None,
+                    },
+                    "results": data,
+                    "meta": {
+                        "generated_at": timezone.now().isoformat(),
+                        "cached": getattr(self, "_cached_response", False),
+                    },
+                }
+            )
+
         return Response(
             {
                 "pagination": {
                     "count": self.page.paginator.count,
+                    "count_is_estimate": self.page.paginator.count_is_estimate,
                     "total_pages": self.page.paginator.num_pages,
                     "current_page": self.page.number,
                     "page_size": self.get_page_size(self.request),
@@ -142,6 +270,13 @@ class GeneralAPIThrottle(AnonRateThrottle):
     rate = "2000/hour"
 
 
+class AutocompleteThrottle(AnonRateThrottle):
+    """자동완성 스로틀링 (입력 중 키 입력마다 호출)"""
+
+    scope = "autocomplete"
+    rate = "10000/hour"
+
+
 # ===== 고급 믹스인 클래스 =====
 
 
@@ -225,8 +360,8 @@ class AdvancedPerformanceMonitoringMixin:
 
     def update_performance_cache(self, view_name, duration_ms):
         """성능 통계 캐시 업데이트"""
-        cache_key = f"perf_stats_{view_name}"
-        stats = cache.get(cache_key, {"count": 0, "total_time": 0, "avg_time": 0})
+        cache_key = make_key("perf_stats", view_name)
+        stats = cache_get(cache_key, {"count": 0, "total_time": 0, "avg_time": 0})
 
         stats["count"] += 1
         stats["total_time"] += duration_ms
@@ -236,28 +371,30 @@ class AdvancedPerformanceMonitoringMixin:
 
 
 class SmartCachingMixin:
-    """스마트 캐싱 믹스인"""
+    """스마트 캐싱 믹스인 (cache_tags: 응답이 의존하는 캐시 태그 - 태그 무효화 시 캐시 미스)"""
+
+    cache_tags = ()
+
+    def get_cache_tags(self):
+        return list(self.cache_tags)
 
     def get_cache_key(self, *args, **kwargs):
         """동적 캐시 키 생성"""
         view_name = self.__class__.__name__
         cache_data = {
-            "view": view_name,
             "args": args,
             "kwargs": kwargs,
             "user": getattr(self.request.user, "id", "anonymous"),
             "version": getattr(settings, "CACHE_VERSION", "1.0"),
         }
 
-        # 해시 기반 키 생성
-        cache_string = str(sorted(cache_data.items()))
-        cache_hash = hashlib.md5(cache_string.encode()).hexdigest()
-        return f"view_cache:{view_name}:{cache_hash}"
+        # 프로세스와 무관한 안정적인 해시 키
+        return make_key("view_cache", view_name, cache_data, normalize=False)
 
     def get_cached_response(self, cache_key, fetch_func, timeout=300, **kwargs):
         """안전하고 효율적인 캐싱 로직"""
-        # 캐시 조회
-        cached_data = cache.get(cache_key)
+        # 캐시 조회 (의존 태그가 무효화되었으면 미스)
+        cached_data = get_with_tags(cache_key)
 
         if cached_data is not None:
             logger.info(f"💰 [Cache] Hit: {cache_key[:50]}...")
@@ -269,7 +406,9 @@ class SmartCachingMixin:
 
         logger.info(f"🔍 [Cache] Miss: {cache_key[:50]}...")
 
-        # 데이터 조회
+        # 데이터 조회 (조회 전 태그 세대 기록 - 조회 중 변경되면 다음 요청에서 미스)
+        cache_tags = self.get_cache_tags()
+        generations = get_tag_generations(cache_tags)
         response = fetch_func(**kwargs)
 
         # 캐시 가능한 데이터 추출
@@ -282,18 +421,15 @@ class SmartCachingMixin:
             timeout = timeout * 2
 
         # 안전한 캐시 저장
-        if safe_cache_set(cache_key, data_to_cache, timeout):
+        if safe_cache_set(cache_key, data_to_cache, timeout, cache_tags, generations):
             logger.info(f"💾 [Cache] 저장 성공: {cache_key[:50]}...")
 
         # 새로운 Response 반환
         return create_response_from_cache(data_to_cache, getattr(self, "request", None))
 
-    def invalidate_related_cache(self, patterns):
-        """관련 캐시 무효화"""
-        for pattern in patterns:
-            # Redis 사용 시 패턴 매칭으로 삭제 가능
-            # 여기서는 기본적인 로깅만 수행
-            logger.info(f"🗑️ [Cache] Invalidating: {pattern}")
+    def invalidate_related_cache(self, tags, model_name="", instance_id=None, action="update"):
+        """관련 캐시 무효화 - 태그 세대 증가 (키 스캔 없음, CacheInvalidation에 이력 기록)"""
+        bump_tags(tags or self.get_cache_tags(), model_name, instance_id, action)
 
 
 class AdvancedErrorHandlingMixin:
@@ -492,7 +628,57 @@ def ultimate_search_movie_quotes(request):
     logger.info(f"🎯 [UltimateSearch] 시작: '{query}' (limit: {limit})")
 
     try:
-        # 2단계: 스마트 번역 처리
+        # 2-1단계: 한글 검색어는 번역 없이 원문으로 한글 n-gram 색인 먼저 검색 (원문 기준 캐시/single-flight)
+        korean_results = perform_local_korean_search(query, limit, search_options)
+
+        if korean_results["found"]:
+            translation_result = build_untranslated_korean_result(query)
+            search_analytics = initialize_search_analytics(
+                query, translation_result, search_start_time
+            )
+            search_analytics.update(
+                {
+                    "search_method": "db_korean",
+                    "cache_hit": korean_results["from_cache"],
+                    "result_count": len(korean_results["results"]),
+                }
+            )
+
+            response_data = build_ultimate_response(
+                query,
+                translation_result,
+                korean_results["results"],
+                limit,
+                search_analytics,
+            )
+
+            schedule_post_search_tasks(korean_results["results"], search_analytics)
+
+            logger.info(
+                f"✅ [UltimateSearch] 한글 색인 성공: {len(korean_results['results'])}개"
+            )
+            return Response(response_data)
+
+        # 2-2단계: 최근 결과가 없었던 검색어는 번역(번역 메모리/외부 번역 API)부터 전부 생략
+        if is_negative(query):
+            translation_result = build_untranslated_result(query)
+            search_analytics = initialize_search_analytics(
+                query, translation_result, search_start_time
+            )
+            search_analytics.update(
+                {
+                    "search_method": "no_results",
+                    "negative_cache_hit": True,
+                    "cache_hit": True,
+                    "result_count": 0,
+                }
+            )
+            logger.info(f"⛔ [UltimateSearch] 결과 없음 캐시: '{query}'")
+            return Response(
+                build_no_results_response(query, translation_result, search_analytics)
+            )
+
+        # 2단계: 스마트 번역 처리 (한글 색인에 결과가 없을 때만 번역)
         translation_result = get_smart_translation_result(query)
 
         # 3단계: 검색 분석 초기화
@@ -500,10 +686,17 @@ def ultimate_search_movie_quotes(request):
             query, translation_result, search_start_time
         )
 
+        # 번역된 구문이 최근 결과가 없었던 구문이면 이후 검색(정확/유사/외부 API) 모두 생략
+        negative = is_negative(translation_result["request_phrase"])
+        search_analytics["negative_cache_hit"] = negative
+
         # 4단계: DB 우선 검색 (매니저 최적화)
-        db_results = perform_db_search_optimized(
-            translation_result, limit, search_options
-        )
+        if negative:
+            db_results = {"found": False, "results": [], "from_cache": False}
+        else:
+            db_results = perform_db_search_optimized(
+                translation_result, limit, search_options
+            )
 
         if db_results["found"]:
             # DB에서 결과 발견
@@ -529,8 +722,42 @@ def ultimate_search_movie_quotes(request):
             logger.info(f"✅ [UltimateSearch] DB 성공: {len(db_results['results'])}개")
             return Response(response_data)
 
-        # 5단계: 외부 API 검색 (조건부)
-        if should_perform_external_search(translation_result, search_options):
+        # 5단계: 오타 허용 로컬 검색 (트라이그램 유사도) - 외부 API 호출 전
+        if negative:
+            fuzzy_results = {"found": False, "results": []}
+        else:
+            fuzzy_results = perform_fuzzy_search(
+                translation_result, limit, search_options
+            )
+
+        if fuzzy_results["found"]:
+            search_analytics.update(
+                {
+                    "search_method": "db_fuzzy",
+                    "cache_hit": False,
+                    "result_count": len(fuzzy_results["results"]),
+                }
+            )
+
+            response_data = build_ultimate_response(
+                query,
+                translation_result,
+                fuzzy_results["results"],
+                limit,
+                search_analytics,
+            )
+
+            schedule_post_search_tasks(fuzzy_results["results"], search_analytics)
+
+            logger.info(
+                f"✅ [UltimateSearch] 유사 검색 성공: {len(fuzzy_results['results'])}개"
+            )
+            return Response(response_data)
+
+        # 6단계: 외부 API 검색 (조건부)
+        if not negative and should_perform_external_search(
+            translation_result, search_options
+        ):
             external_results = perform_external_search_ultimate(
                 translation_result, search_options
             )
@@ -557,7 +784,13 @@ def ultimate_search_movie_quotes(request):
                 )
                 return Response(response_data)
 
-        # 6단계: 검색 결과 없음
+        # 7단계: 검색 결과 없음 - 번역된 구문이 결과 없음으로 기록됐으면 원문 검색어도 기록
+        # (다음 요청은 번역 전에 차단)
+        if query != translation_result["request_phrase"] and is_negative(
+            translation_result["request_phrase"]
+        ):
+            record_negative(query)
+
         search_analytics.update(
             {"search_method": "no_results", "cache_hit": False, "result_count": 0}
         )
@@ -584,9 +817,74 @@ def ultimate_search_movie_quotes(request):
         return Response(error_response, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(["GET"])
+@throttle_classes([AutocompleteThrottle])
+@permission_classes([AllowAny])
+def autocomplete_search_phrases(request):
+    """
+    검색어 자동완성 API - 프로세스 메모리 트라이 조회 (DB 접근 없음)
+    GET /api/search/autocomplete/?q=i lo&limit=5
+    """
+    query = request.GET.get("q", "")
+    if not query.strip():
+        return Response(
+            {
+                "error": "검색어가 필요합니다.",
+                "code": "MISSING_QUERY",
+                "timestamp": timezone.now().isoformat(),
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        limit = int(request.GET.get("limit", AUTOCOMPLETE_TOP_K))
+    except ValueError:
+        limit = AUTOCOMPLETE_TOP_K
+
+    try:
+        started = time.perf_counter()
+        suggestions = autocomplete(query, limit)
+
+        return Response(
+            {
+                "query": query,
+                "count": len(suggestions),
+                "suggestions": suggestions,
+                "meta": {
+                    "response_time_ms": round((time.perf_counter() - started) * 1000, 3),
+                    "index_ready": is_autocomplete_ready(),
+                },
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"❌ [Autocomplete] 자동완성 오류: {e}")
+        return Response(
+            {
+                "error": "자동완성 처리 중 오류가 발생했습니다.",
+                "code": "AUTOCOMPLETE_ERROR",
+                "timestamp": timezone.now().isoformat(),
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
 # ===== 검색 지원 함수들 (최적화) =====
 
 
+# 검색 파라미터 기본값 (요청에 파라미터가 없을 때와 같은 값 - 캐시 예열 시 같은 캐시 키 사용)
+DEFAULT_SEARCH_LIMIT = 20
+DEFAULT_SEARCH_OPTIONS = {
+    "include_inactive": False,
+    "quality_filter": "",
+    "translation_required": False,
+    "sort_by": "relevance",
+    "movie_filter": "",
+    "year_filter": "",
+    "exact_match": False,
+}
+
+
 def validate_and_optimize_search_params(request):
     """검색 파라미터 검증 및 최적화"""
     query = request.GET.get("q", "").strip()
@@ -602,10 +900,10 @@ def validate_and_optimize_search_params(request):
 
     # 제한 파라미터 처리
     try:
-        limit = int(request.GET.get("limit", "20"))
+        limit = int(request.GET.get("limit", DEFAULT_SEARCH_LIMIT))
         limit = max(1, min(limit, 100))
     except (ValueError, TypeError):
-        limit = 20
+        limit = DEFAULT_SEARCH_LIMIT
 
     # 고급 검색 옵션
     search_options = {
@@ -625,17 +923,25 @@ def validate_and_optimize_search_params(request):
 
 def get_smart_translation_result(query):
     """스마트 번역 처리 (캐싱 포함)"""
-    cache_key = f"smart_translation:{hashlib.md5(query.encode()).hexdigest()}"
-    cached_result = cache.get(cache_key)
+    cache_key = make_key("smart_translation", query)
+    cached_result = cache_get(cache_key)
 
     if cached_result:
         logger.info(f"💰 [Translation] 캐시 히트: {query[:30]}...")
         return cached_result
 
+    # 같은 검색어의 동시 요청은 번역 API를 한 번만 호출
+    return single_flight(
+        "smart_translation", query, lambda: compute_smart_translation(query, cache_key)
+    )
+
+
+def compute_smart_translation(query, cache_key):
+    """언어 감지/번역 후 캐싱"""
     logger.info(f"🔍 [Translation] 처리 중: {query[:30]}...")
 
     # LibreTranslator 활용
-    translator = LibreTranslator()
+    translator = get_translator()
     translation_info = translator.get_translation_info(query)
 
     result = {
@@ -663,6 +969,57 @@ def get_smart_translation_result(query):
     return result
 
 
+def reproduce_translation_result(request_row):
+    """
+    요청 행을 만든 사용자 입력의 번역 결과 재현 - 요청 구문/한글 요청이 행과 같아지는 입력 (없으면 None)
+    행에는 입력 언어가 없으므로 영어 요청 구문 → 한글 요청 순서로 입력 후보 시도
+    (한글로 입력한 검색어는 한글 요청을 다시 번역해야 사용자와 같은 db_search 키가 나옴)
+    """
+    request_phrase = (request_row.request_phrase or "").strip()
+    request_korean = (request_row.request_korean or "").strip()
+
+    for candidate in dict.fromkeys(filter(None, (request_phrase, request_korean))):
+        translation_result = get_smart_translation_result(candidate)
+        if (translation_result["request_phrase"] or "").strip() != request_phrase:
+            continue
+        if request_korean and (translation_result["request_korean"] or "").strip() != request_korean:
+            continue
+        return translation_result
+    return None
+
+
+def warm_db_search(request_row):
+    """
+    API 검색(db_search) 캐시 예열 - 인기 검색어 예열 대상 (phrase.utils.cache_warmer)
+    행을 만든 원래 입력 + 기본 파라미터로 실제 검색과 같은 경로 실행 (번역 캐시도 함께 예열)
+    사용자 검색과 같은 캐시 키를 재현할 수 없는 행은 건너뜀
+    한글 요청은 검색 경로와 같이 원문 한글 색인 검색을 먼저 예열 (결과가 있으면 번역하지 않음)
+    """
+    request_korean = (request_row.request_korean or "").strip()
+    if contains_hangul(request_korean) and perform_local_korean_search(
+        request_korean, DEFAULT_SEARCH_LIMIT, dict(DEFAULT_SEARCH_OPTIONS)
+    )["found"]:
+        return True
+
+    translation_result = reproduce_translation_result(request_row)
+    if translation_result is None:
+        logger.debug(f"🔥 [CacheWarm] 검색 키 재현 불가, 건너뜀: {request_row.request_phrase[:30]}")
+        return False
+    if is_negative(translation_result["request_phrase"]):
+        return False
+
+    return perform_db_search_optimized(
+        translation_result, DEFAULT_SEARCH_LIMIT, dict(DEFAULT_SEARCH_OPTIONS)
+    )["found"]
+
+
+# 인기 검색어 예열 대상 (warm_search_cache 명령/서버 시작 시 예열)
+CACHE_WARM_TARGETS = {
+    "db_search": warm_db_search,
+    "search_result": warm_search_result,
+}
+
+
 def initialize_search_analytics(query, translation_result, start_time):
     """검색 분석 초기화"""
     return {
@@ -682,126 +1039,277 @@ def perform_db_search_optimized(translation_result, limit, search_options):
     request_korean = translation_result["request_korean"]
 
     # 캐시 키 생성
-    cache_components = [
-        request_phrase,
-        request_korean,
-        limit,
-        search_options.get("quality_filter", ""),
-        search_options.get("sort_by", "relevance"),
-        search_options.get("include_inactive", False),
-    ]
-    cache_key = f"db_search:{hashlib.md5(str(cache_components).encode()).hexdigest()}"
+    cache_components = [request_phrase, request_korean, limit] + search_option_components(search_options)
+    cache_key = make_key("db_search", cache_components)
 
-    # 캐시 확인
-    cached_results = cache.get(cache_key)
+    # 캐시 확인 (검색 대상/결과 대사가 변경되었으면 미스, 컴팩트 행 → 인스턴스 복원)
+    cached_payload = get_with_tags(cache_key)
+    cached_results = SEARCH_RESULT_CODEC.loads(cached_payload) if cached_payload else None
     if cached_results:
         logger.info(f"💰 [DBSearch] 캐시 히트")
         return {"found": True, "results": cached_results, "from_cache": True}
 
     logger.info(f"🔍 [DBSearch] 매니저 검색 수행")
 
-    # 기본 쿼리셋 설정
-    def apply_filters(queryset):
-        # 고급 필터링 적용
-        if search_options.get("quality_filter"):
-            queryset = queryset.filter(
-                translation_quality=search_options["quality_filter"]
-            )
+    # 검색 전 세대 기록 - 검색 중 변경된 결과가 최신 세대로 캐싱되지 않도록
+    generations = get_tag_generations([SEARCH_TAG])
+
+    # 영어 검색 + 번역된 한글의 한글 n-gram 색인 검색 병합
+    # (한글로 입력한 검색어는 번역 전에 원문으로 한글 색인을 이미 검색함 - perform_local_korean_search)
+    results = execute_dialogue_search(request_phrase, limit * 2, search_options)
+    if (
+        request_korean
+        and contains_hangul(request_korean)
+        and translation_result["language_detected"] != "korean"
+    ):
+        korean_results = execute_dialogue_search(
+            request_korean, limit * 2, search_options, korean=True
+        )
+        results = merge_search_results(results, korean_results, limit=limit * 2)
+    elif not results and request_korean:
+        results = execute_dialogue_search(request_korean, limit * 2, search_options)
 
-        if search_options.get("movie_filter"):
-            queryset = queryset.filter(
-                movie__movie_title__icontains=search_options["movie_filter"]
-            )
+    if results:
+        store_search_results(cache_key, results, generations)
+        return {"found": True, "results": results, "from_cache": False}
 
-        if search_options.get("year_filter"):
-            queryset = queryset.filter(
-                movie__release_year=search_options["year_filter"]
-            )
+    return {"found": False, "results": [], "from_cache": False}
 
-        if not search_options.get("include_inactive", False):
-            queryset = queryset.filter(is_active=True)
 
-        return queryset
+# 검색 결과 시리얼라이저(OptimizedDialogueSearchSerializer)가 사용하는 컬럼만 조회
+SEARCH_RESULT_FIELDS = (
+    "id",
+    "dialogue_phrase",
+    "dialogue_phrase_ko",
+    "dialogue_start_time",
+    "video_url",
+    "video_file",
+    "play_count",
+    "like_count",
+    "translation_quality",
+    "translation_method",
+    "created_at",
+    "movie__id",
+    "movie__movie_title",
+    "movie__movie_title_full",
+    "movie__release_year",
+    "movie__director",
+    "movie__director_full",
+    "movie__production_country",
+    "movie__imdb_url",
+    "movie__poster_url",
+    "movie__poster_image",
+)
+
+# 검색 결과 캐시 코덱 - SEARCH_RESULT_FIELDS만 컴팩트 행으로 저장 (영화는 중복 제거)
+SEARCH_RESULT_CODEC = ModelRowCodec(
+    "db_search",
+    "phrase.DialogueTable",
+    [field for field in SEARCH_RESULT_FIELDS if not field.startswith("movie__")] + ["movie"],
+    related="movie",
+    related_fields=[
+        field[len("movie__"):] for field in SEARCH_RESULT_FIELDS if field.startswith("movie__")
+    ],
+)
+
+# 정렬 옵션별 ORDER BY (마지막 id는 동점 시 결정적 순서 보장)
+SEARCH_ORDERINGS = {
+    "popular": ("-play_count", "created_at", "id"),
+    "recent": ("-created_at", "-id"),
+    "relevance": ("-search_rank", "-play_count", "id"),
+}
+
+
+# relevance 정렬 시 BM25 재정렬 대상 후보 수 (백엔드 관련도 순 상위)
+RELEVANCE_CANDIDATE_LIMIT = 200
 
-    # 영어 검색 쿼리셋
-    search_queryset = apply_filters(
-        DialogueTable.objects.search_with_movie(request_phrase)
-    )
 
-    # 한글 검색 쿼리셋 (필요한 경우)
-    results = []
-    if search_queryset.exists():
-        results = list(search_queryset)
-    elif request_korean:
-        korean_queryset = apply_filters(
-            DialogueTable.objects.search_with_movie(request_korean)
+def build_search_queryset(query, search_options, korean=False):
+    """검색 조건, 필터, 정렬, 컬럼 프로젝션을 하나의 쿼리셋으로 구성"""
+    if korean:
+        queryset = DialogueTable.objects.search_korean(query)
+    else:
+        queryset = DialogueTable.objects.search_with_movie(
+            query, active_only=not search_options.get("include_inactive", False)
         )
-        results = list(korean_queryset)
 
-    # 정렬 옵션 적용
-    sort_by = search_options.get("sort_by", "relevance")
-    if sort_by == "popular":
-        results.sort(key=lambda x: (-x.play_count, x.created_at))
-    elif sort_by == "recent":
-        results.sort(key=lambda x: x.created_at, reverse=True)
-    else:  # relevance
-        # 이미 매니저 메소드에서 적절히 정렬되었다고 가정
-        pass
-
-    # 쿼리 최적화 적용
-    results = [
-        DialogueTable.objects.select_related("movie")
-        .only(
-            "id",
-            "dialogue_phrase",
-            "dialogue_phrase_ko",
-            "dialogue_start_time",
-            "video_url",
-            "play_count",
-            "like_count",
-            "translation_quality",
-            "translation_method",
-            "movie__id",
-            "movie__movie_title",
-            "movie__movie_title_full",
-            "movie__release_year",
-            "movie__director",
-            "movie__director_full",
-            "movie__poster_url",
-            "movie__poster_image",
+    # 고급 필터링 적용
+    if search_options.get("quality_filter"):
+        queryset = queryset.filter(
+            translation_quality=search_options["quality_filter"]
+        )
+
+    if search_options.get("movie_filter"):
+        queryset = queryset.filter(
+            movie__movie_title__icontains=search_options["movie_filter"]
+        )
+
+    if search_options.get("year_filter"):
+        queryset = queryset.filter(
+            movie__release_year=search_options["year_filter"]
         )
-        .get(id=result.id)
-        for result in results[: limit * 2]  # 여유 있게 조회
+
+    sort_by = search_options.get("sort_by", "relevance")
+    ordering = SEARCH_ORDERINGS.get(sort_by, SEARCH_ORDERINGS["relevance"])
+    fields = SEARCH_RESULT_FIELDS
+    if sort_by not in ("popular", "recent"):
+        # BM25 재정렬에 필요한 정규화 텍스트
+        fields += ("search_vector_full",)
+
+    return queryset.only(*fields).order_by(*ordering)
+
+
+def execute_dialogue_search(query, limit, search_options, korean=False):
+    """
+    검색 실행 - 필터/정렬/LIMIT을 포함한 단일 SELECT
+    relevance 정렬은 상위 후보를 BM25로 재정렬 (용어 통계 조회 1회 추가)
+    """
+    queryset = build_search_queryset(query, search_options, korean=korean)
+
+    if search_options.get("sort_by", "relevance") in ("popular", "recent"):
+        return list(queryset[:limit])
+
+    candidates = list(queryset[: max(limit, RELEVANCE_CANDIDATE_LIMIT)])
+    return rank_dialogues_bm25(candidates, query)[:limit]
+
+
+def search_option_components(search_options):
+    """검색 결과 캐시 키에 들어가는 검색 옵션"""
+    return [
+        search_options.get("quality_filter", ""),
+        search_options.get("movie_filter", ""),
+        search_options.get("year_filter", ""),
+        search_options.get("sort_by", "relevance"),
+        search_options.get("include_inactive", False),
     ]
 
-    if results:
-        # 5분간 캐싱
-        cache.set(cache_key, results, 300)
-        return {"found": True, "results": results, "from_cache": False}
 
-    return {"found": False, "results": [], "from_cache": False}
+def store_search_results(cache_key, results, generations):
+    """검색 결과 5분간 캐싱 (검색 태그 + 결과 대사/영화 단건 태그, 컴팩트 행) - 저장한 페이로드"""
+    result_tags = [dialogue_tag(dialogue.id) for dialogue in results]
+    result_tags += [movie_tag(dialogue.movie_id) for dialogue in results]
+    generations.update(get_tag_generations(result_tags))
+    payload = SEARCH_RESULT_CODEC.dumps(results)
+    set_with_tags(cache_key, payload, [SEARCH_TAG] + result_tags, 300, generations)
+    return payload
 
 
-def should_perform_external_search(translation_result, search_options):
-    """외부 검색 수행 여부 결정"""
-    request_phrase = translation_result["request_phrase"]
+def perform_local_korean_search(query, limit, search_options):
+    """
+    한글 검색어를 번역 없이 한글 n-gram 색인으로 직접 검색
+    원문 검색어 기준 태그 캐시 + 같은 검색어 동시 요청은 single-flight로 한 번만 검색
+    """
+    if not contains_hangul(query):
+        return {"found": False, "results": [], "from_cache": False}
+
+    cache_components = ["korean", query, limit] + search_option_components(search_options)
+    cache_key = make_key("db_search", cache_components)
+
+    cached_payload = get_with_tags(cache_key)
+    if cached_payload:
+        logger.info(f"💰 [KoreanSearch] 캐시 히트")
+        return {"found": True, "results": SEARCH_RESULT_CODEC.loads(cached_payload), "from_cache": True}
+
+    def search():
+        generations = get_tag_generations([SEARCH_TAG])
+        results = execute_dialogue_search(query, limit * 2, search_options, korean=True)
+        return store_search_results(cache_key, results, generations) if results else None
+
+    # 결과는 컴팩트 행 페이로드로 공유 (pickle 가능)
+    payload = single_flight("korean_search", cache_components, search)
+    results = SEARCH_RESULT_CODEC.loads(payload) if payload else []
+    return {"found": bool(results), "results": results, "from_cache": False}
+
+
+def build_untranslated_result(query):
+    """번역하지 않은 검색어의 번역 결과 형태 (결과 없음 캐시로 번역을 생략한 경우)"""
+    if contains_hangul(query):
+        return build_untranslated_korean_result(query)
+    return {
+        "original_query": query,
+        "language_detected": "english",
+        "has_korean": False,
+        "has_english": True,
+        "translation_needed": False,
+        "translated_text": None,
+        "confidence": 1.0,
+        "request_phrase": query,
+        "request_korean": None,
+    }
+
+
+def build_untranslated_korean_result(query):
+    """번역 없이 처리한 한글 검색어의 번역 결과 형태 (응답 생성용)"""
+    return {
+        "original_query": query,
+        "language_detected": "korean",
+        "has_korean": True,
+        "has_english": False,
+        "translation_needed": False,
+        "translated_text": None,
+        "confidence": 1.0,
+        "request_phrase": query,
+        "request_korean": query,
+    }
+
+
+def merge_search_results(*result_lists, limit):
+    """검색 결과 목록 병합 - 앞 목록 우선, 같은 대사는 한 번만"""
+    merged, seen = [], set()
+    for results in result_lists:
+        for dialogue in results:
+            if dialogue.id not in seen:
+                seen.add(dialogue.id)
+                merged.append(dialogue)
+    return merged[:limit]
+
+
+def fetch_search_results_by_ids(dialogue_ids):
+    """대사 ID 목록을 검색 결과 형태로 일괄 조회 (입력 순서 유지, 단일 쿼리)"""
+    dialogues = (
+        DialogueTable.objects.select_related("movie")
+        .only(*SEARCH_RESULT_FIELDS)
+        .in_bulk(dialogue_ids)
+    )
+    return [dialogues[dialogue_id] for dialogue_id in dialogue_ids if dialogue_id in dialogues]
+
+
+# 유사 검색 결과로 인정할 최소 트라이그램 Jaccard 유사도
+FUZZY_SEARCH_THRESHOLD = 0.35
+
 
-    # 이미 검색했던 구문인지 확인 (RequestTable 활용)
-    existing_request = RequestTable.objects.filter(
-        request_phrase=request_phrase
-    ).first()
-
-    if existing_request:
-        # 최근에 검색했고 결과가 없었다면 스킵
-        time_diff = timezone.now() - existing_request.updated_at
-        if (
-            time_diff.total_seconds() < 3600 and existing_request.result_count == 0
-        ):  # 1시간 이내
+def perform_fuzzy_search(translation_result, limit, search_options):
+    """오타 허용 유사 검색 (트라이그램 Jaccard 상위 k개, 검색어당 단일 쿼리)"""
+    if search_options.get("exact_match"):
+        return {"found": False, "results": []}
+
+    for search_phrase in (
+        translation_result["request_phrase"],
+        translation_result["request_korean"],
+    ):
+        if not search_phrase:
+            continue
+
+        results = list(
+            DialogueTable.objects.similar_to(
+                search_phrase, limit=limit, threshold=FUZZY_SEARCH_THRESHOLD
+            ).only(*SEARCH_RESULT_FIELDS)
+        )
+        if results:
             logger.info(
-                f"🔄 [ExternalSearch] 최근 검색 기록으로 스킵: {request_phrase}"
+                f"🔍 [FuzzySearch] '{search_phrase}' 유사 대사 {len(results)}개 "
+                f"(최고 유사도 {results[0].similarity:.2f})"
             )
-            return False
+            return {"found": True, "results": results}
+
+    return {"found": False, "results": []}
+
 
+def should_perform_external_search(translation_result, search_options):
+    """
+    외부 검색 수행 여부 결정
+    최근 결과가 없었던 구문은 호출 전에 negative 캐시로 걸러짐 (DB 조회 없음)
+    """
     # 번역 신뢰도가 낮으면 스킵
     if translation_result.get("confidence", 1.0) < 0.3:
         logger.info(
@@ -818,48 +1326,16 @@ def perform_external_search_ultimate(translation_result, search_options):
     request_korean = translation_result["request_korean"]
 
     try:
-        logger.info(f"🌐 [ExternalSearch] 시작: {request_phrase}")
-
-        # get_movie_info를 통한 API 호출
-        playphrase_data = get_movie_info(request_phrase)
-
-        if not playphrase_data:
-            logger.info(f"🌐 [ExternalSearch] API 데이터 없음")
-            return {"found": False, "results": []}
-
-        # clean_data를 통한 데이터 추출
-        movies_data = extract_movie_info(playphrase_data)
-
-        if not movies_data:
-            logger.info(f"🌐 [ExternalSearch] 추출된 영화 없음")
-            return {"found": False, "results": []}
-
-        # load_to_db를 통한 저장 및 결과 반환
-        saved_results = load_to_db(
-            movies_data,
+        # 같은 구문의 동시 요청은 외부 API 호출/저장을 한 번만 수행하고 저장된 대사 ID 공유
+        dialogue_ids = single_flight(
+            "external_search",
             request_phrase,
-            request_korean,
-            batch_size=20,
-            auto_translate=True,
-            download_media=False,
+            lambda: fetch_external_dialogue_ids(request_phrase, request_korean),
         )
 
-        if saved_results:
-            logger.info(f"🌐 [ExternalSearch] 성공: {len(saved_results)}개 저장")
-
-            # 저장된 결과를 DialogueTable 객체로 변환
-            dialogue_results = []
-            for movie_data in saved_results:
-                for dialogue_info in movie_data.get("dialogues", []):
-                    if dialogue_info.get("id"):
-                        try:
-                            dialogue = DialogueTable.objects.select_related(
-                                "movie"
-                            ).get(id=dialogue_info["id"])
-                            dialogue_results.append(dialogue)
-                        except DialogueTable.DoesNotExist:
-                            continue
-
+        if dialogue_ids:
+            # 저장된 결과를 DialogueTable 객체로 변환 (일괄 조회)
+            dialogue_results = fetch_search_results_by_ids(dialogue_ids)
             return {"found": True, "results": dialogue_results}
 
         return {"found": False, "results": []}
@@ -869,6 +1345,47 @@ def perform_external_search_ultimate(translation_result, search_options):
         return {"found": False, "results": []}
 
 
+def fetch_external_dialogue_ids(request_phrase, request_korean):
+    """외부 API 조회 → 추출 → DB 저장 후 저장된 대사 ID 목록 반환"""
+    logger.info(f"🌐 [ExternalSearch] 시작: {request_phrase}")
+
+    # get_movie_info를 통한 API 호출
+    playphrase_data = get_movie_info(request_phrase)
+
+    if not playphrase_data:
+        logger.info(f"🌐 [ExternalSearch] API 데이터 없음")
+        return []
+
+    # clean_data를 통한 데이터 추출
+    movies_data = extract_movie_info(playphrase_data)
+
+    if not movies_data:
+        logger.info(f"🌐 [ExternalSearch] 추출된 영화 없음")
+        record_negative(request_phrase)
+        return []
+
+    # load_to_db를 통한 저장 및 결과 반환
+    saved_results = load_to_db(
+        movies_data,
+        request_phrase,
+        request_korean,
+        batch_size=20,
+        auto_translate=True,
+        download_media=False,
+    )
+
+    if not saved_results:
+        return []
+
+    logger.info(f"🌐 [ExternalSearch] 성공: {len(saved_results)}개 저장")
+    return [
+        dialogue_info["id"]
+        for movie_data in saved_results
+        for dialogue_info in movie_data.get("dialogues", [])
+        if dialogue_info.get("id")
+    ]
+
+
 def build_ultimate_response(
     query, translation_result, results, limit, search_analytics
 ):
@@ -982,32 +1499,23 @@ def calculate_query_complexity(query):
 
 
 def generate_search_suggestions(query, translation_result):
-    """검색 제안 생성"""
+    """검색 제안 생성 (자동완성 인덱스 - DB 조회 없음)"""
     suggestions = []
+    seen = {query.lower()}
 
-    # 인기 검색어 추천
-    popular_searches = RequestTable.objects.popular_searches(5)
-    for req in popular_searches:
-        if req.request_phrase.lower() != query.lower():
-            suggestions.append(
-                {
-                    "type": "popular",
-                    "text": req.request_phrase,
-                    "search_count": req.search_count,
-                }
-            )
+    # 유사 검색어 추천 (앞 5글자 접두사 완성) + 인기 검색어 추천 (빈 접두사 = 전체 상위)
+    candidates = [("similar", item) for item in autocomplete(query[:5], 3)]
+    candidates += [("popular", item) for item in autocomplete("", 5)]
 
-    # 유사 검색어 추천 (간단한 패턴 매칭)
-    similar_requests = RequestTable.objects.filter(
-        request_phrase__icontains=query[:5]  # 앞 5글자로 유사 검색
-    ).exclude(request_phrase=query)[:3]
-
-    for req in similar_requests:
+    for suggestion_type, item in candidates:
+        if item["text"].lower() in seen:
+            continue
+        seen.add(item["text"].lower())
         suggestions.append(
             {
-                "type": "similar",
-                "text": req.request_phrase,
-                "search_count": req.search_count,
+                "type": suggestion_type,
+                "text": item["text"],
+                "search_count": item["search_count"],
             }
         )
 
@@ -1035,17 +1543,19 @@ def schedule_post_search_tasks(results, search_analytics):
     try:
         # 조회수 증가 (상위 결과만)
         top_results = results[:10]
-        for result in top_results:
-            if hasattr(result, "id"):
-                DialogueTable.objects.filter(id=result.id).update(
-                    play_count=F("play_count") + 1
-                )
-
-        # 검색 히스토리 저장
-        SearchHistoryManager.save_search_query(
-            search_analytics["original_query"],
-            search_analytics.get("translated_query"),
-            len(results),
+        top_ids = [result.id for result in top_results if hasattr(result, "id")]
+        if top_ids:
+            # 지연 쓰기 - 여러 검색의 증가분을 모아 UPDATE 한 번으로 반영
+            increment_counters("phrase.DialogueTable", top_ids, "play_count")
+
+        # 검색 히스토리 저장 (작업 큐 - 응답 후 워커에서 처리)
+        enqueue_job(
+            "search_history",
+            {
+                "original_query": search_analytics["original_query"],
+                "translated_query": search_analytics.get("translated_query"),
+                "result_count": len(results),
+            },
         )
 
         logger.info(f"📊 [PostSearch] 후처리 완료: {len(top_results)}개 조회수 증가")
@@ -1065,6 +1575,7 @@ class UltimateRequestTableListView(
 ):
     """궁극적으로 최적화된 요청테이블 조회 뷰"""
 
+    cache_tags = (REQUESTS_TAG,)
     serializer_class = OptimizedRequestTableSerializer
     pagination_class = AdvancedPagination
     permission_classes = [AllowAny]
@@ -1096,6 +1607,11 @@ class UltimateRequestTableListView(
             request.GET.get("search", ""),
             request.GET.get("ordering", ""),
             request.GET.get("page", "1"),
+            request.GET.get("limit", ""),
+            request.GET.get("cursor"),
+            request.GET.get("include_count", ""),
+            request.GET.get("quality", ""),
+            request.GET.get("min_results", ""),
         )
 
         def fetch_data():
@@ -1245,58 +1761,11 @@ class UltimateDialogueTableListView(
 
 @api_view(["GET"])
 @throttle_classes([GeneralAPIThrottle])
-@cache_page(1800)  # 30분 캐싱
 @permission_classes([AllowAny])
 def get_ultimate_statistics(request):
-    """궁극적으로 최적화된 종합 통계 API"""
+    """궁극적으로 최적화된 종합 통계 API (만료된 통계는 즉시 반환 후 백그라운드 재계산)"""
     try:
-        # 매니저 메소드를 활용한 효율적인 통계 수집
-        stats_data = {
-            "requests": RequestTable.objects.get_statistics(),
-            "movies": MovieTable.objects.get_statistics(),
-            "dialogues": DialogueTable.objects.get_statistics(),
-        }
-
-        # 교차 통계 계산
-        cross_stats = calculate_cross_statistics()
-
-        # 번역 품질 리포트
-        translation_report = get_translation_quality_report()
-
-        # API 사용 통계
-        api_stats = get_api_statistics()
-
-        # 통합 통계 생성
-        comprehensive_stats = {
-            "overview": {
-                "total_requests": stats_data["requests"]["total_requests"],
-                "active_requests": stats_data["requests"]["active_requests"],
-                "total_movies": stats_data["movies"]["total_movies"],
-                "active_movies": stats_data["movies"]["active_movies"],
-                "total_dialogues": stats_data["dialogues"]["total_dialogues"],
-                "active_dialogues": stats_data["dialogues"]["active_dialogues"],
-                "korean_translation_rate": stats_data["dialogues"]["translation_rate"],
-                "overall_data_quality": calculate_overall_quality(stats_data),
-            },
-            "detailed_stats": stats_data,
-            "cross_statistics": cross_stats,
-            "translation_report": translation_report,
-            "api_usage": api_stats,
-            "performance_metrics": get_performance_metrics(),
-            "cache_statistics": get_cache_statistics(),
-            "meta": {
-                "generated_at": timezone.now().isoformat(),
-                "cache_duration": "30 minutes",
-                "api_version": "2.0",
-            },
-        }
-
-        # 통계 시리얼라이저 적용
-        serializer = StatisticsSerializer(data=comprehensive_stats)
-        if serializer.is_valid():
-            return Response(serializer.validated_data)
-        else:
-            return Response(comprehensive_stats)  # 시리얼라이저 실패 시 원본 데이터
+        return Response(collect_ultimate_statistics())
 
     except Exception as e:
         logger.error(f"❌ [Statistics] 통계 수집 오류: {e}")
@@ -1310,6 +1779,57 @@ def get_ultimate_statistics(request):
         )
 
 
+@stale_while_revalidate("ultimate_statistics", fresh_for=1800, max_stale=3600)
+def collect_ultimate_statistics():
+    """종합 통계 집계 (30분 신선, 최대 1시간 추가로 이전 값 사용)"""
+    # 매니저 메소드를 활용한 효율적인 통계 수집
+    stats_data = {
+        "requests": RequestTable.objects.get_statistics(),
+        "movies": MovieTable.objects.get_statistics(),
+        "dialogues": DialogueTable.objects.get_statistics(),
+    }
+
+    # 교차 통계 계산
+    cross_stats = calculate_cross_statistics()
+
+    # 번역 품질 리포트
+    translation_report = get_translation_quality_report()
+
+    # API 사용 통계
+    api_stats = get_api_statistics()
+
+    # 통합 통계 생성
+    comprehensive_stats = {
+        "overview": {
+            "total_requests": stats_data["requests"]["total_requests"],
+            "active_requests": stats_data["requests"]["active_requests"],
+            "total_movies": stats_data["movies"]["total_movies"],
+            "active_movies": stats_data["movies"]["active_movies"],
+            "total_dialogues": stats_data["dialogues"]["total_dialogues"],
+            "active_dialogues": stats_data["dialogues"]["active_dialogues"],
+            "korean_translation_rate": stats_data["dialogues"]["translation_rate"],
+            "overall_data_quality": calculate_overall_quality(stats_data),
+        },
+        "detailed_stats": stats_data,
+        "cross_statistics": cross_stats,
+        "translation_report": translation_report,
+        "api_usage": api_stats,
+        "performance_metrics": get_performance_metrics(),
+        "cache_statistics": get_cache_statistics(),
+        "meta": {
+            "generated_at": timezone.now().isoformat(),
+            "cache_duration": "30 minutes (stale-while-revalidate, max 90 minutes)",
+            "api_version": "2.0",
+        },
+    }
+
+    # 통계 시리얼라이저 적용
+    serializer = StatisticsSerializer(data=comprehensive_stats)
+    if serializer.is_valid():
+        return serializer.validated_data
+    return comprehensive_stats  # 시리얼라이저 실패 시 원본 데이터
+
+
 def calculate_cross_statistics():
     """교차 통계 계산"""
     try:
@@ -1403,10 +1923,23 @@ def get_performance_metrics():
         performance_data = {}
 
         for view_name in view_names:
-            cache_key = f"perf_stats_{view_name}"
-            stats = cache.get(cache_key, {"count": 0, "avg_time": 0})
+            cache_key = make_key("perf_stats", view_name)
+            stats = cache_get(cache_key, {"count": 0, "avg_time": 0})
             performance_data[view_name] = stats
 
+        # 조회/재생/검색 횟수 지연 쓰기 (UPDATE 문 수 대비 반영 행 수, 현재 프로세스)
+        performance_data["write_behind_counters"] = get_counter_statistics()
+
+        # 백그라운드 작업 큐 (상태별 작업 수, 가장 오래 기다린 작업)
+        performance_data["background_jobs"] = get_job_statistics()
+
+        # 배치 번역 (중복 제거/저장된 번역 적중/API 호출 수와 속도 제한 대기, 현재 프로세스)
+        performance_data["batch_translation"] = get_batch_translation_statistics()
+        performance_data["rate_limiters"] = get_rate_limiter_statistics()
+
+        # 외부 호출 (호스트별 요청/오류 수, 응답 지연 시간, 현재 프로세스)
+        performance_data["outbound_http"] = get_http_statistics()
+
         return performance_data
 
     except Exception as e:
@@ -1417,15 +1950,31 @@ def get_performance_metrics():
 def get_cache_statistics():
     """캐시 통계 조회"""
     try:
-        # 캐시 히트율 등의 통계를 실제 환경에서는 Redis 등에서 수집
-        # 여기서는 기본적인 정보만 제공
+        # 네임스페이스별 실제 히트율 (모든 워커 합산 + 현재 프로세스)
+        key_statistics = get_cache_key_statistics()
         return {
-            "estimated_hit_rate": 85.0,  # 예상 히트율
-            "cache_keys_estimated": 1500,  # 예상 키 수
+            "hit_rate": key_statistics["overall"]["hit_rate"],
+            "hits": key_statistics["overall"]["hits"],
+            "misses": key_statistics["overall"]["misses"],
+            "namespaces": key_statistics["namespaces"],
             "cache_strategy": "multi_level",
             "cache_backends": (
-                ["memory", "redis"] if "redis" in str(settings.CACHES) else ["memory"]
+                ["memory", "redis"] if "redis" in str(settings.CACHES) else ["memory", "file"]
             ),
+            # L1(프로세스)/L2(공유) 계층별 히트율 - TwoTierCache 사용 시
+            "tiers": (
+                cache.get_tier_statistics()
+                if hasattr(cache, "get_tier_statistics")
+                else None
+            ),
+            # 동시 요청 병합 (작업 종류별 실행/대기 횟수)
+            "single_flight": get_single_flight_statistics(),
+            # 외부 API 호출 전 존재 확인 블룸 필터 (현재 프로세스)
+            "existence_filter": get_existence_filter_statistics(),
+            # 검색 결과 캐시 페이로드 크기/인코딩 시간 (현재 프로세스)
+            "serialization": get_serialization_statistics(),
+            # 마지막 인기 검색어 캐시 예열 (소요 시간, 검색량 대비 포함 비율)
+            "cache_warmer": get_cache_warmer_report(),
         }
 
     except Exception as e:
@@ -1496,11 +2045,19 @@ def ultimate_bulk_update_dialogues(request):
                 **update_fields, updated_at=timezone.now()
             )
 
-            # 관련 캐시 무효화
-            cache_patterns = ["db_search:*", "dialogue_*", "movie_*"]
-            for pattern in cache_patterns:
-                # 실제 환경에서는 Redis KEYS 명령어로 패턴 매칭 삭제
-                pass
+            # 관련 캐시 무효화 (update()는 시그널이 없으므로 직접 태그 증가, 커밋 후 실행)
+            movie_ids = set(
+                DialogueTable.objects.filter(id__in=dialogue_ids).values_list(
+                    "movie_id", flat=True
+                )
+            )
+            bump_tags(
+                [SEARCH_TAG]
+                + [dialogue_tag(dialogue_id) for dialogue_id in dialogue_ids]
+                + [movie_tag(movie_id) for movie_id in movie_ids],
+                "DialogueTable",
+                action="update",
+            )
 
         # 업데이트 로그 기록
         logger.info(
@@ -1735,6 +2292,8 @@ def get_system_health(request):
                 "external_api": api_health,
                 "translation_service": translation_health,
             },
+            # 호스트별 외부 호출 지연 시간/오류 수 (현재 프로세스)
+            "outbound_http": get_http_statistics(),
             "system_info": {
                 "api_version": "2.0",
                 "optimization_level": "ultimate",
@@ -1792,7 +2351,7 @@ def test_cache_health():
     """캐시 상태 테스트"""
     try:
         # 캐시 읽기/쓰기 테스트
-        test_key = "health_check_test"
+        test_key = make_key("health_check")
         test_value = {"timestamp": timezone.now().isoformat()}
 
         cache.set(test_key, test_value, 60)
@@ -1819,7 +2378,7 @@ def test_cache_health():
 def test_translation_health():
     """번역 서비스 상태 테스트"""
     try:
-        translator = LibreTranslator()
+        translator = get_translator()
 
         # 간단한 번역 테스트
         test_text = "hello"
@@ -1884,8 +2443,8 @@ def legacy_get_quote_detail(request, quote_id):
             id=quote_id, is_active=True
         )
 
-        # 조회수 증가
-        DialogueTable.objects.filter(id=quote_id).update(play_count=F("play_count") + 1)
+        # 조회수 증가 (지연 쓰기)
+        increment_counter("phrase.DialogueTable", quote_id, "play_count")
 
         # 레거시 형식으로 직렬화
         serializer = LegacySearchSerializer(dialogue, context={"request": request})
@@ -1914,8 +2473,8 @@ def legacy_get_movie_quotes(request, movie_id):
             .order_by("dialogue_start_time")
         )
 
-        # 영화 조회수 증가
-        MovieTable.objects.filter(id=movie_id).update(view_count=F("view_count") + 1)
+        # 영화 조회수 증가 (지연 쓰기)
+        increment_counter("phrase.MovieTable", movie_id, "view_count")
 
         # 레거시 형식으로 직렬화
         serializer = LegacySearchSerializer(
@@ -1976,6 +2535,7 @@ def get_api_info(request):
             "search": {
                 "ultimate_search": "/api/search/",
                 "legacy_search": "/api/legacy/search/",
+                "autocomplete": "/api/search/autocomplete/",
                 "analytics": "/api/search/analytics/",
             },
             "data_access": {
@@ -2058,16 +2618,23 @@ def initialize_api_module():
         ]
 
         for view_name in performance_views:
-            cache_key = f"perf_stats_{view_name}"
+            cache_key = make_key("perf_stats", view_name)
             if not cache.get(cache_key):
                 cache.set(cache_key, {"count": 0, "total_time": 0, "avg_time": 0}, 3600)
 
-        # 캐시 예열 (선택적)
-        try:
-            popular_requests = RequestTable.objects.popular_searches(10)
-            logger.info(f"📊 인기 검색어 {len(popular_requests)}개 확인")
-        except Exception as e:
-            logger.warning(f"⚠️ 캐시 예열 실패: {e}")
+        # 자동완성 인덱스 (프로세스별 트라이) 백그라운드 빌드 - 첫 자동완성 요청이 빌드를 기다리지 않도록
+        if start_autocomplete_build():
+            logger.info("🔤 자동완성 인덱스 빌드 시작 (백그라운드)")
+
+        # 인기 검색어 캐시 예열 (선택적, 백그라운드 - 모든 워커 중 한 곳에서만 실행)
+        if getattr(settings, "PHRASE_CACHE_WARM_ON_STARTUP", False):
+            try:
+                if schedule_cache_warming(
+                    CACHE_WARM_TARGETS, top_n=settings.PHRASE_CACHE_WARM_TOP_N
+                ):
+                    logger.info("🔥 인기 검색어 캐시 예열 시작 (백그라운드)")
+            except Exception as e:
+                logger.warning(f"⚠️ 캐시 예열 실패: {e}")
 
         logger.info("✅ 최적화된 API 모듈 초기화 완료")
         return True
@@ -2113,7 +2680,7 @@ def create_response_from_cache(cached_data, request=None):
     return response
 
 
-def safe_cache_set(cache_key, data, timeout=300):
+def safe_cache_set(cache_key, data, timeout=300, tags=None, generations=None):
     """안전한 캐시 저장 (pickle 에러 방지)"""
     try:
         # 데이터가 pickle 가능한지 테스트
@@ -2121,8 +2688,11 @@ def safe_cache_set(cache_key, data, timeout=300):
 
         pickle.dumps(data)
 
-        # 안전하다면 저장
-        cache.set(cache_key, data, timeout)
+        # 안전하다면 저장 (태그가 있으면 세대와 함께 저장)
+        if tags:
+            set_with_tags(cache_key, data, tags, timeout, generations)
+        else:
+            cache.set(cache_key, data, timeout)
         return True
     except Exception as e:
         logger.warning(f"⚠️ [Cache] 저장 실패: {cache_key[:50]}... - {e}")
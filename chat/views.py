@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 
 # 모델 import 추가
 from chat.models import UserQuestion, AIResponse
+from phrase.utils.http_client import get_http_client, HTTP_INTERACTIVE_MAX_RETRY_AFTER
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -402,8 +403,14 @@ def call_openrouter_api(api_key, user_message, conversation_history, request):
 
         logger.info(f"Calling OpenRouter API for user {request.user.username}")
 
-        # API 호출
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        # API 호출 (공용 HTTP 클라이언트 - 연결 재사용, 요청 처리 중이므로 짧은 Retry-After만 대기 후 재시도)
+        response = get_http_client().post(
+            url,
+            headers=headers,
+            json=payload,
+            timeout=30,
+            max_retry_after=HTTP_INTERACTIVE_MAX_RETRY_AFTER,
+        )
 
         # 응답 처리
         if response.status_code == 200:
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class PhraseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'phrase'
+
+    def ready(self):
+        from phrase.caching.backends import warn_if_shared_cache_not_atomic
+        warn_if_shared_cache_not_atomic()
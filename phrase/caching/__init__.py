@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# phrase/caching/__init__.py
+"""
+캐시 인프라 모듈
+phrase.models / phrase.utils / api 어디서든 임포트 가능 (모델 임포트 없음)
+"""
+
+from .keys import (
+    CACHE_NAMESPACES,
+    stable_digest,
+    make_key,
+    namespace_of,
+    cache_get,
+    record_cache_access,
+    flush_cache_statistics,
+    get_cache_key_statistics
+)
+
+from .tags import (
+    SEARCH_TAG,
+    REQUESTS_TAG,
+    dialogue_tag,
+    movie_tag,
+    get_tag_generations,
+    set_with_tags,
+    get_with_tags,
+    cached_with_tags,
+    bump_tags
+)
+
+from .singleflight import (
+    single_flight,
+    get_single_flight_statistics
+)
+
+from .negative import (
+    is_negative,
+    record_negative,
+    clear_negative
+)
+
+from .swr import stale_while_revalidate
+
+from .ratelimit import (
+    RateLimiter,
+    get_rate_limiter_statistics
+)
+
+from .serialization import (
+    ModelRowCodec,
+    encode_payload,
+    decode_payload,
+    get_serialization_statistics
+)
+
+from .backends import (
+    TwoTierCache,
+    FrequencySketch,
+    get_backend_atomicity
+)
+
+__all__ = [
+    'CACHE_NAMESPACES',
+    'stable_digest',
+    'make_key',
+    'namespace_of',
+    'cache_get',
+    'record_cache_access',
+    'flush_cache_statistics',
+    'get_cache_key_statistics',
+    'SEARCH_TAG',
+    'REQUESTS_TAG',
+    'dialogue_tag',
+    'movie_tag',
+    'get_tag_generations',
+    'set_with_tags',
+    'get_with_tags',
+    'cached_with_tags',
+    'bump_tags',
+    'single_flight',
+    'get_single_flight_statistics',
+    'is_negative',
+    'record_negative',
+    'clear_negative',
+    'stale_while_revalidate',
+    'RateLimiter',
+    'get_rate_limiter_statistics',
+    'ModelRowCodec',
+    'encode_payload',
+    'decode_payload',
+    'get_serialization_statistics',
+    'TwoTierCache',
+    'FrequencySketch',
+    'get_backend_atomicity'
+]
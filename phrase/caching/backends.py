@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+# phrase/caching/backends.py
+"""
+2단계 캐시 백엔드 (django.core.cache.cache로 그대로 사용)
+- L1: 프로세스 메모리 LRU, 네임스페이스별 크기 제한, TinyLFU 빈도 기반 승인
+- L2: 워커 간 공유 캐시 (CACHES의 다른 별칭 - 파일/DB/Redis)
+
+읽기: L1 → L2 (L2 히트는 승인 정책에 따라 L1에 적재)
+쓰기: L2에 쓰고 L1 갱신 (write-through)
+다른 워커의 변경/삭제는 L1_TIMEOUT 이내에 반영됨 (L1 항목 최대 수명)
+incr/decr 등 원자적 연산과 L1 크기 0인 네임스페이스는 항상 L2 사용
+
+설정 예:
+    CACHES = {
+        "default": {
+            "BACKEND": "phrase.caching.backends.TwoTierCache",
+            "OPTIONS": {"L2": "shared", "L1_TIMEOUT": 30, "NAMESPACE_LIMITS": {"db_search": 500}},
+        },
+        "shared": {...},
+    }
+"""
+import time
+import pickle
+import random
+import logging
+import threading
+from collections import OrderedDict, defaultdict
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+
+from .keys import CACHE_NAMESPACES, namespace_of
+
+logger = logging.getLogger(__name__)
+
+# 네임스페이스별 L1 최대 항목 수 (0이면 L1 사용 안 함)
+DEFAULT_NAMESPACE_LIMITS = {
+    'smart_translation': 2000,
+    'translation': 2000,
+    'db_search': 500,
+    'search_result': 200,
+    'view_cache': 200,
+    'count_estimate': 500,
+    'trigram_frequency': 5000,
+    'negative_result': 5000,
+
+    # 여러 워커가 함께 갱신하는 카운터/통계는 항상 공유 캐시에서 읽음
+    'cache_tag': 0,
+    'single_flight': 0,
+    'swr_lock': 0,
+    'rate_limit': 0,
+    'cache_warmer': 0,
+    'job_schedule': 0,
+    'perf_stats': 0,
+    'cache_stats': 0,
+    'translation_stats': 0,
+    'bulk_translation_stats': 0,
+    'playphrase_stats': 0,
+    'imdb_performance': 0,
+    'health_check': 0,
+}
+DEFAULT_NAMESPACE_LIMIT = 200
+
+# 등록되지 않은 키(cache_page 등)가 함께 쓰는 세그먼트
+OTHER_NAMESPACE = '_other'
+
+# L1 항목 최대 수명 (초) - 다른 워커의 변경이 보이기까지의 최대 지연
+DEFAULT_L1_TIMEOUT = 30
+
+# L2 백엔드 클래스 이름 → (프로세스 간 원자적 add, 프로세스 간 원자적 incr)
+# 파일 캐시는 둘 다 읽고-쓰기, DB 캐시의 incr는 get + set, 로컬 메모리 캐시는 프로세스 간 공유 안 됨
+SHARED_BACKEND_ATOMICITY = {
+    'RedisCache': (True, True),
+    'PyMemcacheCache': (True, True),
+    'PyLibMCCache': (True, True),
+    'DatabaseCache': (True, False),
+    'FileBasedCache': (False, False),
+    'LocMemCache': (False, False),
+    'DummyCache': (False, False),
+}
+
+
+class FrequencySketch:
+    """
+    TinyLFU 접근 빈도 추정 (Count-Min Sketch, 4비트 포화 카운터)
+    샘플 수가 sample_size에 도달하면 모든 카운터를 절반으로 줄여 오래된 인기도를 감쇠
+    """
+
+    depth = 4
+    max_count = 15
+    halve_table = bytes(value >> 1 for value in range(256))
+
+    def __init__(self, capacity):
+        width = 1
+        while width < max(capacity, 16) * 4:
+            width <<= 1
+        self.mask = width - 1
+        self.rows = [bytearray(width) for _ in range(self.depth)]
+        self.seeds = [random.getrandbits(64) | 1 for _ in range(self.depth)]
+        self.sample_size = max(capacity, 16) * 10
+        self.additions = 0
+
+    def _indexes(self, key):
+        h = hash(key)
+        return [((h * seed) >> 17) & self.mask for seed in self.seeds]
+
+    def increment(self, key):
+        incremented = False
+        for row, index in zip(self.rows, self._indexes(key)):
+            if row[index] < self.max_count:
+                row[index] += 1
+                incremented = True
+
+        if incremented:
+            self.additions += 1
+            if self.additions >= self.sample_size:
+                self._reset()
+
+    def frequency(self, key):
+        return min(row[index] for row, index in zip(self.rows, self._indexes(key)))
+
+    def _reset(self):
+        for row in self.rows:
+            row[:] = row.translate(self.halve_table)
+        self.additions //= 2
+
+
+class LocalTier:
+    """L1 - 네임스페이스별 LRU 세그먼트 + 공유 빈도 스케치 (스레드 안전)"""
+
+    def __init__(self, namespace_limits, default_limit, timeout):
+        self.namespace_limits = namespace_limits
+        self.default_limit = default_limit
+        self.timeout = timeout
+        self.segments = defaultdict(OrderedDict)
+        self.sketch = FrequencySketch(
+            sum(limit for limit in namespace_limits.values()) + default_limit * 8
+        )
+        self.lock = threading.Lock()
+        self.rejections = 0
+        self.evictions = 0
+
+    def limit_for(self, namespace):
+        return self.namespace_limits.get(namespace, self.default_limit)
+
+    def get(self, namespace, key):
+        """(히트 여부, 피클된 값)"""
+        with self.lock:
+            self.sketch.increment(key)
+            segment = self.segments.get(namespace)
+            entry = segment.get(key) if segment else None
+            if entry is None:
+                return False, None
+
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                del segment[key]
+                return False, None
+
+            segment.move_to_end(key)
+            return True, payload
+
+    def set(self, namespace, key, payload, timeout):
+        """L1 적재 - 세그먼트가 가득 차면 후보 빈도 > 희생자 빈도일 때만 승인"""
+        limit = self.limit_for(namespace)
+        if limit <= 0:
+            return
+
+        lifetime = self.timeout if timeout is None else min(timeout, self.timeout)
+        if lifetime <= 0:
+            self.discard(namespace, key)
+            return
+
+        with self.lock:
+            segment = self.segments[namespace]
+            if key not in segment and len(segment) >= limit:
+                victim = next(iter(segment))
+                if self.sketch.frequency(key) <= self.sketch.frequency(victim):
+                    self.rejections += 1
+                    return
+                del segment[victim]
+                self.evictions += 1
+
+            segment[key] = (time.monotonic() + lifetime, payload)
+            segment.move_to_end(key)
+
+    def discard(self, namespace, key):
+        with self.lock:
+            segment = self.segments.get(namespace)
+            if segment:
+                segment.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.segments.clear()
+
+    def sizes(self):
+        with self.lock:
+            return {namespace: len(segment) for namespace, segment in self.segments.items() if segment}
+
+
+class TwoTierCache(BaseCache):
+    """프로세스 LRU(L1) + 공유 캐시(L2) 백엔드"""
+
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+
+        self._l2_alias = options.get('L2', location or 'shared')
+        self._l2 = None
+
+        namespace_limits = dict(DEFAULT_NAMESPACE_LIMITS)
+        namespace_limits.update(options.get('NAMESPACE_LIMITS', {}))
+        self._local = LocalTier(
+            namespace_limits,
+            options.get('DEFAULT_NAMESPACE_LIMIT', DEFAULT_NAMESPACE_LIMIT),
+            options.get('L1_TIMEOUT', DEFAULT_L1_TIMEOUT),
+        )
+
+        self._stats_lock = threading.Lock()
+        self._stats = defaultdict(lambda: {'l1_hits': 0, 'l2_hits': 0, 'misses': 0})
+
+    @property
+    def shared(self):
+        """L2 캐시 (첫 사용 시 CACHES 별칭으로 생성)"""
+        if self._l2 is None:
+            from django.core.cache import caches
+            self._l2 = caches[self._l2_alias]
+        return self._l2
+
+    def _namespace(self, key):
+        namespace = namespace_of(key)
+        if namespace in CACHE_NAMESPACES or namespace in self._local.namespace_limits:
+            return namespace
+        return OTHER_NAMESPACE
+
+    def _record(self, namespace, outcome):
+        with self._stats_lock:
+            self._stats[namespace][outcome] += 1
+
+    def _l1_key(self, key, version):
+        return self.make_and_validate_key(key, version=version)
+
+    def _l1_timeout(self, timeout):
+        """L1 수명 계산용 초 단위 타임아웃 (None = 만료 없음)"""
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        return None if timeout is None else max(timeout, 0)
+
+    def _store_local(self, key, value, timeout, version):
+        try:
+            payload = pickle.dumps(value, self.pickle_protocol)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        self._local.set(self._namespace(key), self._l1_key(key, version), payload, self._l1_timeout(timeout))
+
+    def get(self, key, default=None, version=None):
+        namespace = self._namespace(key)
+        l1_key = self._l1_key(key, version)
+
+        if self._local.limit_for(namespace) > 0:
+            hit, payload = self._local.get(namespace, l1_key)
+            if hit:
+                self._record(namespace, 'l1_hits')
+                # 호출 측의 값 변경이 L1에 영향을 주지 않도록 매번 복원
+                return pickle.loads(payload)
+
+        missing = object()
+        value = self.shared.get(key, missing, version=version)
+        if value is missing:
+            self._record(namespace, 'misses')
+            return default
+
+        self._record(namespace, 'l2_hits')
+        self._store_local(key, value, DEFAULT_TIMEOUT, version)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        remaining = []
+        for key in keys:
+            namespace = self._namespace(key)
+            if self._local.limit_for(namespace) > 0:
+                hit, payload = self._local.get(namespace, self._l1_key(key, version))
+                if hit:
+                    self._record(namespace, 'l1_hits')
+                    found[key] = pickle.loads(payload)
+                    continue
+            remaining.append(key)
+
+        if remaining:
+            shared_values = self.shared.get_many(remaining, version=version)
+            for key in remaining:
+                namespace = self._namespace(key)
+                if key in shared_values:
+                    self._record(namespace, 'l2_hits')
+                    found[key] = shared_values[key]
+                    self._store_local(key, shared_values[key], DEFAULT_TIMEOUT, version)
+                else:
+                    self._record(namespace, 'misses')
+
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version=version)
+        self._store_local(key, value, timeout, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            if key not in failed:
+                self._store_local(key, value, timeout, version)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version=version)
+        if added:
+            self._store_local(key, value, timeout, version)
+        else:
+            self._local.discard(self._namespace(key), self._l1_key(key, version))
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self._local.discard(self._namespace(key), self._l1_key(key, version))
+        return self.shared.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._local.discard(self._namespace(key), self._l1_key(key, version))
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self._local.discard(self._namespace(key), self._l1_key(key, version))
+        return self.shared.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        namespace = self._namespace(key)
+        if self._local.limit_for(namespace) > 0:
+            hit, _ = self._local.get(namespace, self._l1_key(key, version))
+            if hit:
+                return True
+        return self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._local.discard(self._namespace(key), self._l1_key(key, version))
+        return self.shared.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        self._local.discard(self._namespace(key), self._l1_key(key, version))
+        return self.shared.decr(key, delta, version=version)
+
+    def clear(self):
+        self._local.clear()
+        return self.shared.clear()
+
+    def close(self, **kwargs):
+        if self._l2 is not None:
+            self._l2.close(**kwargs)
+
+    def get_atomicity(self):
+        """L2가 프로세스 간 원자적 add/incr를 지원하는지 - {'add': bool, 'incr': bool}"""
+        return get_backend_atomicity(self.shared)
+
+    def get_tier_statistics(self):
+        """네임스페이스별 L1/L2 히트, 미스, L1 크기 (현재 프로세스)"""
+        with self._stats_lock:
+            stats = {namespace: dict(counts) for namespace, counts in self._stats.items()}
+
+        sizes = self._local.sizes()
+        for namespace, counts in stats.items():
+            total = counts['l1_hits'] + counts['l2_hits'] + counts['misses']
+            counts['l1_hit_rate'] = round(counts['l1_hits'] / total * 100, 1) if total else None
+            counts['l1_size'] = sizes.get(namespace, 0)
+            counts['l1_limit'] = self._local.limit_for(namespace)
+
+        return {
+            'l2_backend': self.shared.__class__.__name__,
+            'l2_atomic': self.get_atomicity(),
+            'l1_timeout': self._local.timeout,
+            'l1_evictions': self._local.evictions,
+            'l1_admission_rejections': self._local.rejections,
+            'namespaces': stats,
+        }
+
+
+def get_backend_atomicity(backend):
+    """캐시 백엔드가 프로세스 간 원자적 add/incr를 지원하는지 - {'add': bool, 'incr': bool}"""
+    if isinstance(backend, TwoTierCache):
+        return backend.get_atomicity()
+    atomic_add, atomic_incr = SHARED_BACKEND_ATOMICITY.get(backend.__class__.__name__, (False, False))
+    return {'add': atomic_add, 'incr': atomic_incr}
+
+
+def warn_if_shared_cache_not_atomic():
+    """
+    기본 캐시의 공유 계층에 원자적 add/incr가 없으면 경고 로그 (서버 시작 시)
+    add: single-flight/작업 등록/속도 제한 잠금, incr: 태그 세대 번호/카운터 버퍼
+    """
+    from django.core.cache import cache
+
+    atomicity = get_backend_atomicity(cache)
+    missing = [operation for operation, atomic in atomicity.items() if not atomic]
+    if missing:
+        backend = getattr(cache, 'shared', cache).__class__.__name__
+        logger.warning(
+            f"공유 캐시({backend})에 프로세스 간 원자적 {'/'.join(missing)} 없음 - "
+            f"여러 워커가 동시에 쓰면 잠금 중복 획득/카운터 유실 가능 (운영 환경은 REDIS_URL 설정 권장)"
+        )
+    return atomicity
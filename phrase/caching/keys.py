@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# phrase/caching/keys.py
+"""
+캐시 키 생성 및 네임스페이스별 히트율 통계
+- 키 형식: "{namespace}:v{version}:{blake2b(정규화된 구성 요소)}"
+- 파이썬 hash()와 달리 프로세스/재시작과 무관하게 같은 입력이면 항상 같은 키
+- 네임스페이스는 CACHE_NAMESPACES에 등록된 것만 사용 (오타로 인한 키 불일치 방지)
+- 버전: 캐시 값 형식이 바뀌면 네임스페이스 버전을 올려 이전 키를 자연 만료
+"""
+import json
+import time
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import defaultdict
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# 네임스페이스: (설명, 버전)
+CACHE_NAMESPACES = {
+    # 검색
+    'search_result': ("템플릿 검색 결과 (컴팩트 대사 행)", 2),
+    'db_search': ("API 대사 검색 결과 (컴팩트 대사 행)", 2),
+    'smart_translation': ("검색어 언어 감지/번역 결과", 1),
+    'count_estimate': ("정확한 COUNT(*) 결과", 1),
+    'trigram_frequency': ("트라이그램별 대사 수 (상한까지만 집계)", 1),
+    'view_cache': ("목록 API 응답", 1),
+
+    # 번역
+    'translation': ("단일 텍스트 번역", 1),
+    'translation_stats': ("일별 번역 API 사용량", 1),
+    'bulk_translation_stats': ("일별 대량 번역 사용량", 1),
+
+    # 외부 데이터
+    'playphrase_api': ("playphrase.me API 응답", 1),
+    'playphrase_stats': ("일별 playphrase.me API 사용량", 1),
+    'decoded_playphrase': ("playphrase 인코딩 디코딩 결과", 1),
+    'extracted_movies': ("playphrase 응답에서 추출한 영화 정보", 1),
+    'processed_movies': ("템플릿 뷰 처리 결과", 1),
+    'imdb_poster': ("IMDB 포스터 URL", 1),
+    'imdb_info': ("IMDB 영화 정보", 1),
+    'imdb_data': ("IMDB 포스터 URL/다운로드 경로", 1),
+    'imdb_stats': ("IMDB 추출 통계", 1),
+    'imdb_performance': ("일별 IMDB 추출 성능", 1),
+    'extraction_stats': ("데이터 추출 통계", 1),
+
+    # 모델 단위
+    'request_statistics': ("요청 테이블 통계 (stale-while-revalidate)", 2),
+    'movie_statistics': ("영화 테이블 통계", 1),
+    'dialogue_statistics': ("대사 테이블 통계 (stale-while-revalidate)", 2),
+    'ultimate_statistics': ("종합 통계 API (stale-while-revalidate)", 1),
+    'statistics_api': ("통계 API (stale-while-revalidate)", 1),
+    'translation_status': ("한글 번역 상태 (stale-while-revalidate)", 1),
+    'movie': ("영화 단건", 1),
+    'movie_dialogues': ("영화별 대사 목록", 1),
+    'movie_dialogue_count': ("영화별 대사 수", 1),
+    'dialogue_translation': ("대사 번역", 1),
+
+    # 무효화
+    'cache_tag': ("태그 세대 번호", 1),
+
+    # 동시 요청 병합
+    'single_flight': ("single-flight 잠금/결과", 1),
+    'negative_result': ("결과 없음 구문 (지수 백오프 차단)", 1),
+    'swr_lock': ("stale-while-revalidate 재계산 잠금", 1),
+    'rate_limit': ("외부 API 공유 토큰 버킷", 1),
+
+    # 운영
+    'perf_stats': ("뷰별 응답 시간 통계", 1),
+    'cache_warmer': ("인기 검색어 캐시 예열 잠금/마지막 보고", 1),
+    'job_schedule': ("백그라운드 작업 중복 등록 방지", 1),
+    'health_check': ("캐시 상태 확인", 1),
+}
+
+# 통계 저장용 (make_key 대상 아님)
+STATS_KEY_PREFIX = 'cache_stats'
+STATS_FLUSH_INTERVAL = 30
+STATS_TIMEOUT = 86400 * 7
+
+_MISSING = object()
+
+
+def _canonical(value, normalize):
+    """키 구성 요소를 결정적인 JSON 호환 값으로 변환"""
+    if isinstance(value, str):
+        if normalize:
+            value = ' '.join(unicodedata.normalize('NFC', value).split())
+        return value
+    if isinstance(value, dict):
+        return {str(k): _canonical(v, normalize) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item, normalize) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(item, normalize) for item in value), key=repr)
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return str(value)
+
+
+def stable_digest(*parts, normalize=True):
+    """구성 요소의 안정적인 해시 (blake2b 128bit, 16진수)"""
+    payload = json.dumps(
+        [_canonical(part, normalize) for part in parts],
+        ensure_ascii=False, separators=(',', ':')
+    )
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def get_namespace_version(namespace):
+    if namespace not in CACHE_NAMESPACES:
+        raise ValueError(f"등록되지 않은 캐시 네임스페이스: {namespace}")
+    overrides = getattr(settings, 'PHRASE_CACHE_NAMESPACE_VERSIONS', {})
+    return overrides.get(namespace, CACHE_NAMESPACES[namespace][1])
+
+
+def make_key(namespace, *parts, normalize=True):
+    """
+    캐시 키 생성
+    normalize=True: 문자열의 유니코드(NFC)/공백 정규화 후 해시 (원문 그대로의 결과를 캐싱할 때는 False)
+    구성 요소가 없으면 "{namespace}:v{version}" (통계 등 단일 키)
+    """
+    prefix = f"{namespace}:v{get_namespace_version(namespace)}"
+    if not parts:
+        return prefix
+    return f"{prefix}:{stable_digest(*parts, normalize=normalize)}"
+
+
+def namespace_of(key):
+    return key.split(':', 1)[0]
+
+
+# ===== 네임스페이스별 히트율 통계 =====
+
+_stats_lock = threading.Lock()
+_pending_stats = defaultdict(lambda: [0, 0])
+_process_stats = defaultdict(lambda: [0, 0])
+_stats_state = {'flushed_at': time.monotonic()}
+
+
+def _stats_key(namespace, kind):
+    return f"{STATS_KEY_PREFIX}:{namespace}:{kind}"
+
+
+def _increment(key, delta):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, STATS_TIMEOUT):
+            cache.incr(key, delta)
+
+
+def record_cache_access(namespace, hit):
+    """캐시 조회 결과 기록 (프로세스 내 누적 후 주기적으로 공유 캐시에 합산)"""
+    index = 0 if hit else 1
+    with _stats_lock:
+        _pending_stats[namespace][index] += 1
+        _process_stats[namespace][index] += 1
+        due = time.monotonic() - _stats_state['flushed_at'] >= STATS_FLUSH_INTERVAL
+
+    if due:
+        flush_cache_statistics()
+
+
+def flush_cache_statistics():
+    """누적된 통계를 공유 캐시 카운터에 반영 (모든 워커 합산용)"""
+    with _stats_lock:
+        pending = {namespace: counts[:] for namespace, counts in _pending_stats.items()}
+        _pending_stats.clear()
+        _stats_state['flushed_at'] = time.monotonic()
+
+    try:
+        for namespace, (hits, misses) in pending.items():
+            if hits:
+                _increment(_stats_key(namespace, 'hits'), hits)
+            if misses:
+                _increment(_stats_key(namespace, 'misses'), misses)
+    except Exception as e:
+        logger.warning(f"캐시 통계 반영 실패: {e}")
+
+
+def cache_get(key, default=None, backend=None):
+    """cache.get + 네임스페이스 히트/미스 기록 (None 값도 히트로 구분)"""
+    value = (backend or cache).get(key, _MISSING)
+    hit = value is not _MISSING
+    record_cache_access(namespace_of(key), hit)
+    return value if hit else default
+
+
+def _summarize(hits, misses):
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total * 100, 1) if total else None,
+    }
+
+
+def get_cache_key_statistics():
+    """
+    네임스페이스별 히트율
+    shared: 모든 워커 합산 (공유 캐시 카운터), process: 현재 프로세스
+    """
+    flush_cache_statistics()
+
+    keys = [
+        _stats_key(namespace, kind)
+        for namespace in CACHE_NAMESPACES
+        for kind in ('hits', 'misses')
+    ]
+    try:
+        shared = cache.get_many(keys)
+    except Exception as e:
+        logger.warning(f"캐시 통계 조회 실패: {e}")
+        shared = {}
+
+    with _stats_lock:
+        process = {namespace: counts[:] for namespace, counts in _process_stats.items()}
+
+    namespaces = {}
+    total_hits = total_misses = 0
+    for namespace in CACHE_NAMESPACES:
+        hits = shared.get(_stats_key(namespace, 'hits'), 0)
+        misses = shared.get(_stats_key(namespace, 'misses'), 0)
+        process_hits, process_misses = process.get(namespace, (0, 0))
+        if not (hits or misses or process_hits or process_misses):
+            continue
+
+        namespaces[namespace] = {
+            **_summarize(hits, misses),
+            'process': _summarize(process_hits, process_misses),
+        }
+        total_hits += hits
+        total_misses += misses
+
+    return {
+        'overall': _summarize(total_hits, total_misses),
+        'namespaces': namespaces,
+    }
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# phrase/caching/negative.py
+"""
+결과 없음(negative) 캐시
+- playphrase.me/DB 어디에도 결과가 없었던 구문을 기록해 DB 조회와 외부 API 호출을 건너뜀
+- 같은 구문이 계속 결과가 없으면 차단 시간을 지수적으로 늘림 (기본 5분 → 최대 1일)
+- 차단 시간이 끝난 뒤에도 연속 횟수는 한동안 유지 (다시 실패하면 더 긴 차단)
+- 크기 제한: 프로세스 메모리는 TwoTierCache L1 세그먼트 한도, 공유 캐시 항목은 TTL로 자연 만료
+- 키: 대소문자/유니코드/공백 정규화된 구문
+"""
+import time
+import logging
+from django.conf import settings
+from django.core.cache import cache
+
+from .keys import make_key, record_cache_access
+
+logger = logging.getLogger(__name__)
+
+# 첫 실패 차단 시간 / 최대 차단 시간 (초)
+NEGATIVE_CACHE_BASE_TTL = 300
+NEGATIVE_CACHE_MAX_TTL = 86400
+
+# 차단이 끝난 뒤 연속 실패 횟수를 유지하는 시간 (차단 시간의 배수)
+NEGATIVE_CACHE_STREAK_FACTOR = 2
+
+
+def _negative_key(phrase):
+    return make_key('negative_result', phrase.casefold())
+
+
+def _ttl_for(streak):
+    base = getattr(settings, 'PHRASE_NEGATIVE_CACHE_BASE_TTL', NEGATIVE_CACHE_BASE_TTL)
+    maximum = getattr(settings, 'PHRASE_NEGATIVE_CACHE_MAX_TTL', NEGATIVE_CACHE_MAX_TTL)
+    return min(base * 2 ** min(streak - 1, 32), maximum)
+
+
+def is_negative(phrase):
+    """최근 결과가 없었던 구문인지 (차단 시간 내)"""
+    if not phrase or not phrase.strip():
+        return False
+
+    try:
+        entry = cache.get(_negative_key(phrase))
+    except Exception as e:
+        logger.warning(f"negative 캐시 조회 실패: {e}")
+        return False
+
+    blocked = entry is not None and entry['blocked_until'] > time.time()
+    record_cache_access('negative_result', blocked)
+    return blocked
+
+
+def record_negative(phrase):
+    """결과 없음 기록 - 연속 횟수에 따라 차단 시간 증가, 적용된 차단 시간(초) 반환"""
+    if not phrase or not phrase.strip():
+        return 0
+
+    key = _negative_key(phrase)
+    try:
+        entry = cache.get(key)
+        streak = (entry['streak'] if entry else 0) + 1
+        ttl = _ttl_for(streak)
+        cache.set(
+            key,
+            {'streak': streak, 'blocked_until': time.time() + ttl},
+            ttl * NEGATIVE_CACHE_STREAK_FACTOR,
+        )
+    except Exception as e:
+        logger.warning(f"negative 캐시 기록 실패: {e}")
+        return 0
+
+    logger.info(f"🚫 [NegativeCache] '{phrase[:50]}' {ttl}초 차단 (연속 {streak}회)")
+    return ttl
+
+
+def clear_negative(phrase):
+    """결과가 생긴 구문의 기록 삭제"""
+    if not phrase or not phrase.strip():
+        return
+
+    try:
+        cache.delete(_negative_key(phrase))
+    except Exception as e:
+        logger.warning(f"negative 캐시 삭제 실패: {e}")
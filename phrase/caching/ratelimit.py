@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# phrase/caching/ratelimit.py
+"""
+공유 토큰 버킷 속도 제한
+- 모든 워커/프로세스가 공유 캐시의 같은 버킷을 사용 (외부 API 전체 호출 속도 제한)
+- 버킷 상태 = (남은 토큰 수, 마지막 보충 시각): 경과 시간 × rate만큼 연속 보충, 최대 burst개
+- L2가 Redis면 Lua 스크립트 한 번으로 보충/차감 (원자적, 시각은 Redis 서버 시각)
+- 그 외 백엔드는 짧은 잠금 키(add) 안에서 읽고-계산하고-쓰기 - 잠금도 백엔드의 add에 기대므로
+  add가 원자적이지 않은 백엔드(파일 캐시 등)에서는 동시 호출이 드물게 토큰을 중복 사용할 수 있음
+- 토큰이 없으면 토큰 1개가 보충될 때까지만 대기 (고정 sleep 없음)
+- 공유 캐시 오류 시에는 제한하지 않음 (속도 제한 때문에 요청이 실패하지는 않음)
+"""
+import math
+import time
+import random
+import logging
+import threading
+from collections import defaultdict
+from django.core.cache import cache
+
+from .keys import make_key
+
+logger = logging.getLogger(__name__)
+
+# 토큰을 기다리는 워커가 한꺼번에 몰리지 않도록 더하는 대기 시간 비율 (토큰 1개 보충 시간 대비 최대)
+RATE_LIMIT_JITTER = 0.1
+
+# 잠금 방식 버킷의 잠금 수명 (초) / 잠금을 못 얻었을 때 다시 시도하기까지 대기 (초)
+RATE_LIMIT_LOCK_TIMEOUT = 2
+RATE_LIMIT_LOCK_RETRY = 0.01
+
+# KEYS[1] = 버킷 해시 / ARGV = rate, burst, 만료(초) → {성공 여부, 대기 시간(초, 문자열)}
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = burst
+    ts = now
+end
+
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[3]))
+return {allowed, tostring(wait)}
+"""
+
+# 프로세스별 대기 통계
+_limiter_stats = defaultdict(lambda: {'acquired': 0, 'waits': 0, 'wait_seconds': 0.0, 'timeouts': 0, 'errors': 0})
+_limiter_stats_lock = threading.Lock()
+
+
+def _shared_backend():
+    """공유 캐시(L2) 백엔드 - 기본 캐시가 TwoTierCache가 아니면 기본 캐시 그대로"""
+    return getattr(cache, 'shared', cache)
+
+
+def _redis_client(backend):
+    """L2가 Django Redis 백엔드면 쓰기용 redis 클라이언트, 아니면 None"""
+    from django.core.cache.backends.redis import RedisCache
+
+    if not isinstance(backend, RedisCache):
+        return None
+    return backend._cache.get_client(write=True)
+
+
+class RateLimiter:
+    """이름별 공유 토큰 버킷 - rate: 초당 토큰 수, burst: 버킷 용량 (한 번에 쓸 수 있는 최대 토큰 수)"""
+
+    def __init__(self, name, rate, burst=None):
+        if rate <= 0:
+            raise ValueError(f"속도 제한은 0보다 커야 함: {rate}")
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, int(burst or math.ceil(rate)))
+        # 버킷이 가득 차는 데 걸리는 시간 + 여유 - 그보다 오래 쓰지 않은 버킷은 만료 (가득 찬 것과 같음)
+        self.expiry = math.ceil(self.burst / rate) + 1
+        self.key = make_key('rate_limit', self.name)
+        self._script = None
+        self._script_client = None
+
+    def _record(self, field, amount=1):
+        with _limiter_stats_lock:
+            _limiter_stats[self.name][field] += amount
+
+    def _refill(self, tokens, updated_at, now):
+        """마지막 보충 이후 경과 시간만큼 보충한 토큰 수 (최대 burst)"""
+        return min(self.burst, tokens + max(0.0, now - updated_at) * self.rate)
+
+    def _try_acquire_redis(self, backend, client):
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+            self._script_client = client
+        allowed, wait = self._script(
+            keys=[backend.make_and_validate_key(self.key)],
+            args=[self.rate, self.burst, self.expiry],
+        )
+        return bool(int(allowed)), float(wait)
+
+    def _try_acquire_locked(self):
+        """잠금 키 안에서 버킷 상태 읽기 → 보충/차감 → 쓰기"""
+        lock_key = make_key('rate_limit', self.name, 'lock')
+        if not cache.add(lock_key, True, RATE_LIMIT_LOCK_TIMEOUT):
+            return False, RATE_LIMIT_LOCK_RETRY
+
+        try:
+            now = time.time()
+            state = cache.get(self.key)
+            tokens = self.burst if state is None else self._refill(state[0], state[1], now)
+
+            if tokens >= 1:
+                cache.set(self.key, (tokens - 1, now), self.expiry)
+                return True, 0.0
+            cache.set(self.key, (tokens, now), self.expiry)
+            return False, (1 - tokens) / self.rate
+        finally:
+            cache.delete(lock_key)
+
+    def try_acquire(self):
+        """
+        토큰 1개 차감 시도 - (성공 여부, 토큰 1개가 보충될 때까지 남은 시간(초))
+        """
+        try:
+            backend = _shared_backend()
+            client = _redis_client(backend)
+            if client is not None:
+                return self._try_acquire_redis(backend, client)
+            return self._try_acquire_locked()
+        except Exception as e:
+            logger.warning(f"속도 제한 버킷 조회 실패 ({self.name}) - 제한 없이 진행: {e}")
+            self._record('errors')
+            return True, 0.0
+
+    def acquire(self, timeout=None):
+        """토큰을 얻을 때까지 대기 - 얻으면 True, timeout(초) 안에 못 얻으면 False"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = 0.0
+
+        while True:
+            acquired, wait = self.try_acquire()
+            if acquired:
+                self._record('acquired')
+                if waited:
+                    self._record('waits')
+                    self._record('wait_seconds', waited)
+                return True
+
+            wait += random.uniform(0, RATE_LIMIT_JITTER / self.rate)
+            if deadline is not None and time.monotonic() + wait > deadline:
+                self._record('timeouts')
+                return False
+
+            time.sleep(wait)
+            waited += wait
+
+
+def get_rate_limiter_statistics():
+    """이름별 토큰 획득/대기 통계 (현재 프로세스)"""
+    with _limiter_stats_lock:
+        return {
+            name: dict(stats, wait_seconds=round(stats['wait_seconds'], 2))
+            for name, stats in _limiter_stats.items()
+        }
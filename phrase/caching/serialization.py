@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# phrase/caching/serialization.py
+"""
+검색 결과 캐시 직렬화 (컴팩트 행 + 압축)
+- 모델 인스턴스를 pickle(_state, 관련 객체, 전체 필드 포함)하는 대신 필요한 필드 값만 튜플로 저장
+- select_related 관련 객체(영화)는 중복 제거 후 한 번만 저장하고 행에서는 인덱스로 참조
+- 인코딩: msgpack (설치된 경우) / JSON, 임계값 이상이면 zlib 압축
+- 읽을 때 Model.from_db로 인스턴스 복원 (.only()로 조회한 것과 같은 지연 필드 인스턴스)
+- 코덱별 인코딩/디코딩 시간과 저장 크기(압축 전/후) 통계
+"""
+import json
+import time
+import zlib
+import logging
+import threading
+from collections import defaultdict
+from django.apps import apps
+from django.db.models.fields.files import FieldFile
+
+from .keys import stable_digest
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# 이 크기(바이트) 이상이면 zlib 압축
+COMPRESS_THRESHOLD = 1024
+COMPRESS_LEVEL = 6
+
+# 페이로드 첫 바이트: 하위 비트 = 포맷, FLAG_COMPRESSED = 압축 여부
+FORMAT_JSON = 0x01
+FORMAT_MSGPACK = 0x02
+FLAG_COMPRESSED = 0x80
+
+# 복원 시 문자열 → 파이썬 값 변환이 필요한 필드 타입
+_PARSED_FIELD_TYPES = {'DateTimeField', 'DateField', 'TimeField', 'DecimalField', 'UUIDField', 'DurationField'}
+
+
+# ===== 인코딩 =====
+
+def encode_payload(data):
+    """JSON 호환 값 → 바이트 (msgpack/JSON + 조건부 zlib 압축)"""
+    if msgpack is not None:
+        fmt, raw = FORMAT_MSGPACK, msgpack.packb(data, use_bin_type=True)
+    else:
+        fmt, raw = FORMAT_JSON, json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    if len(raw) >= COMPRESS_THRESHOLD:
+        return bytes([fmt | FLAG_COMPRESSED]) + zlib.compress(raw, COMPRESS_LEVEL), len(raw)
+    return bytes([fmt]) + raw, len(raw)
+
+
+def decode_payload(payload):
+    """encode_payload의 역변환"""
+    header, body = payload[0], payload[1:]
+    if header & FLAG_COMPRESSED:
+        body = zlib.decompress(body)
+
+    fmt = header & ~FLAG_COMPRESSED
+    if fmt == FORMAT_MSGPACK:
+        if msgpack is None:
+            raise ValueError("msgpack 미설치 - 다른 워커가 저장한 msgpack 페이로드를 읽을 수 없음")
+        return msgpack.unpackb(body, raw=False)
+    if fmt == FORMAT_JSON:
+        return json.loads(body.decode('utf-8'))
+    raise ValueError(f"알 수 없는 페이로드 형식: {header:#x}")
+
+
+# ===== 통계 =====
+
+_stats_lock = threading.Lock()
+_stats = defaultdict(lambda: {
+    'encodes': 0, 'decodes': 0, 'rows': 0,
+    'raw_bytes': 0, 'stored_bytes': 0,
+    'encode_ms': 0.0, 'decode_ms': 0.0,
+})
+
+
+def _record(name, **values):
+    with _stats_lock:
+        entry = _stats[name]
+        for field, value in values.items():
+            entry[field] += value
+
+
+def get_serialization_statistics():
+    """코덱별 평균 저장 크기/압축률/인코딩·디코딩 시간 (현재 프로세스)"""
+    with _stats_lock:
+        snapshot = {name: dict(values) for name, values in _stats.items()}
+
+    statistics = {}
+    for name, values in snapshot.items():
+        encodes, decodes = values['encodes'], values['decodes']
+        statistics[name] = {
+            'format': 'msgpack' if msgpack is not None else 'json',
+            'encodes': encodes,
+            'decodes': decodes,
+            'avg_rows': round(values['rows'] / encodes, 1) if encodes else None,
+            'avg_raw_bytes': round(values['raw_bytes'] / encodes) if encodes else None,
+            'avg_stored_bytes': round(values['stored_bytes'] / encodes) if encodes else None,
+            'compression_ratio': (
+                round(values['stored_bytes'] / values['raw_bytes'], 3) if values['raw_bytes'] else None
+            ),
+            'avg_encode_ms': round(values['encode_ms'] / encodes, 3) if encodes else None,
+            'avg_decode_ms': round(values['decode_ms'] / decodes, 3) if decodes else None,
+        }
+    return statistics
+
+
+# ===== 모델 행 코덱 =====
+
+class ModelRowCodec:
+    """
+    모델 인스턴스 목록 ↔ 컴팩트 페이로드
+    fields: 저장할 필드 이름 (pk 포함), related: select_related 관계 이름, related_fields: 관련 모델 필드
+    필드 구성이 바뀌면 서명이 달라져 이전 페이로드는 캐시 미스로 처리
+    """
+
+    def __init__(self, name, model_label, fields, related=None, related_fields=()):
+        self.name = name
+        self.model_label = model_label
+        self.field_names = tuple(fields)
+        self.related = related
+        self.related_field_names = tuple(related_fields)
+        self.signature = stable_digest(model_label, self.field_names, related, self.related_field_names)[:12]
+        self._resolved = None
+
+    def _resolve(self):
+        """(모델, 필드 목록, 관련 필드, 관련 모델, 관련 모델 필드 목록) - 앱 로딩 후 최초 1회"""
+        if self._resolved is None:
+            model = apps.get_model(self.model_label)
+            fields = self._concrete_fields(model, self.field_names)
+            relation = related_model = None
+            related_fields = []
+            if self.related:
+                relation = model._meta.get_field(self.related)
+                related_model = relation.related_model
+                related_fields = self._concrete_fields(related_model, self.related_field_names)
+            self._resolved = (model, fields, relation, related_model, related_fields)
+        return self._resolved
+
+    @staticmethod
+    def _concrete_fields(model, names):
+        """필드 목록 (from_db가 값을 concrete_fields 순서로 대응시키므로 같은 순서로 정렬)"""
+        concrete = list(model._meta.concrete_fields)
+        return sorted((model._meta.get_field(name) for name in names), key=concrete.index)
+
+    @staticmethod
+    def _dump_value(field, value):
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        if isinstance(value, FieldFile):
+            return value.name or ''
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return str(value)
+
+    @staticmethod
+    def _load_value(field, value):
+        if value is not None and field.get_internal_type() in _PARSED_FIELD_TYPES:
+            return field.to_python(value)
+        return value
+
+    def _dump_row(self, instance, fields):
+        return [self._dump_value(field, getattr(instance, field.attname)) for field in fields]
+
+    def dumps(self, instances):
+        """인스턴스 목록 → 바이트"""
+        started = time.perf_counter()
+        model, fields, relation, related_model, related_fields = self._resolve()
+
+        related_rows = []
+        related_index = {}
+        rows = []
+        for instance in instances:
+            row = self._dump_row(instance, fields)
+            if relation is not None:
+                related_pk = getattr(instance, relation.attname)
+                if related_pk is not None and related_pk not in related_index:
+                    related_index[related_pk] = len(related_rows)
+                    related_rows.append(self._dump_row(getattr(instance, relation.name), related_fields))
+                row.append(related_index.get(related_pk))
+            rows.append(row)
+
+        payload, raw_size = encode_payload([self.signature, related_rows, rows])
+        _record(
+            self.name, encodes=1, rows=len(rows), raw_bytes=raw_size, stored_bytes=len(payload),
+            encode_ms=(time.perf_counter() - started) * 1000,
+        )
+        return payload
+
+    def loads(self, payload, using='default'):
+        """바이트 → 인스턴스 목록 (형식/필드 구성이 다르거나 손상되면 None)"""
+        started = time.perf_counter()
+        try:
+            signature, related_rows, rows = decode_payload(payload)
+        except Exception as e:
+            logger.warning(f"캐시 페이로드 디코딩 실패 ({self.name}): {e}")
+            return None
+        if signature != self.signature:
+            return None
+
+        model, fields, relation, related_model, related_fields = self._resolve()
+        attnames = [field.attname for field in fields]
+
+        related_objects = []
+        if relation is not None:
+            related_attnames = [field.attname for field in related_fields]
+            related_objects = [
+                related_model.from_db(using, related_attnames, [
+                    self._load_value(field, value) for field, value in zip(related_fields, row)
+                ])
+                for row in related_rows
+            ]
+
+        instances = []
+        for row in rows:
+            values = [self._load_value(field, value) for field, value in zip(fields, row)]
+            instance = model.from_db(using, attnames, values)
+            if relation is not None and row[-1] is not None:
+                # select_related와 같이 관련 객체 캐시에 연결 (추가 쿼리 없음)
+                relation.set_cached_value(instance, related_objects[row[-1]])
+            instances.append(instance)
+
+        _record(self.name, decodes=1, decode_ms=(time.perf_counter() - started) * 1000)
+        return instances
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# phrase/caching/singleflight.py
+"""
+동일 작업 동시 요청 병합 (single-flight)
+- 같은 키(정규화된 검색어 등)의 작업은 한 번에 하나의 워커만 실행, 나머지는 결과를 기다렸다가 공유
+- 같은 프로세스 안에서는 스레드 이벤트로 대기 (공유 캐시 폴링 없음)
+- 프로세스 간에는 공유 캐시 잠금(cache.add) + 결과 키 폴링
+  (공유 캐시의 add가 원자적일 때만 - Redis/Memcached/DB 캐시. 파일 캐시 등에서는 두 워커가 함께
+   잠금을 얻을 수 있으므로 프로세스 간 병합을 하지 않고 프로세스 안에서만 병합)
+- 대기 시간이 초과되거나 실행 워커가 실패하면 대기하던 워커가 직접 실행 (요청이 실패하지는 않음)
+- 결과는 pickle 가능한 값이어야 함 (모델 인스턴스 대신 ID 목록 등을 공유)
+"""
+import time
+import uuid
+import logging
+import threading
+from collections import defaultdict
+from django.core.cache import cache
+
+from .keys import make_key, _increment, STATS_KEY_PREFIX
+from .backends import get_backend_atomicity
+
+logger = logging.getLogger(__name__)
+
+# 실행 워커가 비정상 종료했을 때 잠금이 풀리기까지의 시간 (초)
+SINGLE_FLIGHT_LOCK_TIMEOUT = 120
+
+# 대기 워커의 최대 대기 시간 (초) - 초과 시 직접 실행
+SINGLE_FLIGHT_WAIT_TIMEOUT = 30
+
+# 실행 결과를 대기 워커에게 전달하기 위해 보관하는 시간 (초)
+SINGLE_FLIGHT_RESULT_TIMEOUT = 30
+
+# 결과 키 폴링 간격 (초) - 최소값에서 시작해 최대값까지 2배씩 증가
+SINGLE_FLIGHT_POLL_MIN = 0.05
+SINGLE_FLIGHT_POLL_MAX = 0.5
+
+# 결과 (실행 워커 / 같은 프로세스 대기 / 다른 프로세스 대기 / 대기 시간 초과 / 실행 워커 실패 후 직접 실행)
+SINGLE_FLIGHT_OUTCOMES = ('leader', 'coalesced_local', 'coalesced_shared', 'timeout', 'fallback')
+
+
+class _Flight:
+    """같은 프로세스 안에서 진행 중인 작업"""
+    __slots__ = ('done', 'result', 'failed')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.failed = False
+
+
+_flights_lock = threading.Lock()
+_flights = {}
+
+_stats_lock = threading.Lock()
+_process_stats = defaultdict(lambda: dict.fromkeys(SINGLE_FLIGHT_OUTCOMES, 0))
+
+
+_shared_enabled = None
+
+
+def _shared_coalescing_enabled():
+    """프로세스 간 병합 사용 여부 - 공유 캐시에 원자적 add가 있을 때만 (프로세스별 한 번 확인)"""
+    global _shared_enabled
+    if _shared_enabled is None:
+        _shared_enabled = get_backend_atomicity(cache)['add']
+        if not _shared_enabled:
+            logger.info("공유 캐시에 원자적 add 없음 - single-flight는 프로세스 안에서만 병합")
+    return _shared_enabled
+
+
+def _stats_key(name, outcome):
+    return f"{STATS_KEY_PREFIX}:single_flight:{name}:{outcome}"
+
+
+def _record(name, outcome):
+    with _stats_lock:
+        _process_stats[name][outcome] += 1
+    try:
+        _increment(_stats_key(name, outcome), 1)
+    except Exception as e:
+        logger.debug(f"single-flight 통계 반영 실패: {e}")
+
+
+def _run_leader(name, lock_key, result_key, token, fn):
+    """잠금을 가진 워커: 실행 후 결과 게시, 잠금 해제"""
+    try:
+        result = fn()
+        try:
+            # None 결과도 구분하도록 튜플로 저장
+            cache.set(result_key, (result,), SINGLE_FLIGHT_RESULT_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"single-flight 결과 게시 실패 ({name}): {e}")
+        _record(name, 'leader')
+        return result
+    finally:
+        try:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"single-flight 잠금 해제 실패 ({name}): {e}")
+
+
+def _run_shared(name, flight_key, fn, wait_timeout):
+    """프로세스 간 병합: 잠금을 얻으면 실행, 아니면 결과 게시를 기다림"""
+    lock_key = f"{flight_key}:lock"
+    result_key = f"{flight_key}:result"
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + wait_timeout
+    interval = SINGLE_FLIGHT_POLL_MIN
+    waited = False
+
+    while True:
+        try:
+            acquired = cache.add(lock_key, token, SINGLE_FLIGHT_LOCK_TIMEOUT)
+        except Exception as e:
+            # 공유 캐시 장애 시 병합 없이 실행
+            logger.warning(f"single-flight 잠금 실패 ({name}): {e}")
+            return fn()
+
+        if acquired:
+            if waited:
+                # 기다리던 실행 워커가 결과 없이 끝남
+                _record(name, 'fallback')
+            return _run_leader(name, lock_key, result_key, token, fn)
+
+        waited = True
+        entry = cache.get(result_key)
+        if entry is not None:
+            _record(name, 'coalesced_shared')
+            return entry[0]
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"⏱️ [SingleFlight] 대기 시간 초과, 직접 실행: {name}")
+            _record(name, 'timeout')
+            return fn()
+
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, SINGLE_FLIGHT_POLL_MAX)
+
+
+def single_flight(name, key_parts, fn, wait_timeout=SINGLE_FLIGHT_WAIT_TIMEOUT):
+    """
+    같은 (name, key_parts) 작업을 동시에 한 번만 실행하고 결과 공유
+    name: 작업 종류 (통계 구분용), key_parts: make_key 구성 요소 (정규화됨)
+    fn: 인자 없는 함수, 반환값은 pickle 가능해야 함
+    """
+    flight_key = make_key('single_flight', name, key_parts)
+
+    with _flights_lock:
+        flight = _flights.get(flight_key)
+        leader = flight is None
+        if leader:
+            flight = _flights[flight_key] = _Flight()
+
+    if not leader:
+        if flight.done.wait(wait_timeout) and not flight.failed:
+            _record(name, 'coalesced_local')
+            return flight.result
+
+        outcome = 'fallback' if flight.done.is_set() else 'timeout'
+        logger.warning(f"⏱️ [SingleFlight] 같은 프로세스 작업 {outcome}, 직접 실행: {name}")
+        _record(name, outcome)
+        return fn()
+
+    try:
+        if _shared_coalescing_enabled():
+            flight.result = _run_shared(name, flight_key, fn, wait_timeout)
+        else:
+            flight.result = fn()
+            _record(name, 'leader')
+        return flight.result
+    except Exception:
+        flight.failed = True
+        raise
+    finally:
+        with _flights_lock:
+            _flights.pop(flight_key, None)
+        flight.done.set()
+
+
+def get_single_flight_statistics():
+    """
+    작업 종류별 병합 통계 (현재 프로세스에서 실행된 작업 종류)
+    shared: 모든 워커 합산, process: 현재 프로세스
+    coalesced_rate: 실행 없이 다른 워커의 결과를 받은 요청 비율
+    """
+    with _stats_lock:
+        process = {name: dict(counts) for name, counts in _process_stats.items()}
+
+    keys = [_stats_key(name, outcome) for name in process for outcome in SINGLE_FLIGHT_OUTCOMES]
+    try:
+        shared = cache.get_many(keys) if keys else {}
+    except Exception as e:
+        logger.warning(f"single-flight 통계 조회 실패: {e}")
+        shared = {}
+
+    statistics = {}
+    for name, process_counts in process.items():
+        counts = {outcome: shared.get(_stats_key(name, outcome), 0) for outcome in SINGLE_FLIGHT_OUTCOMES}
+        total = sum(counts.values())
+        coalesced = counts['coalesced_local'] + counts['coalesced_shared']
+        statistics[name] = {
+            **counts,
+            'coalesced_rate': round(coalesced / total * 100, 1) if total else None,
+            'process': process_counts,
+        }
+    return statistics
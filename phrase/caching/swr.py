@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# phrase/caching/swr.py
+"""
+stale-while-revalidate 캐싱 (집계가 무거운 통계용)
+- fresh_for 이내: 캐시 값 그대로 반환
+- fresh_for ~ fresh_for + max_stale: 이전 값을 즉시 반환하고 백그라운드 스레드에서 재계산
+  (공유 캐시 잠금으로 모든 워커 중 한 곳에서만 재계산)
+- fresh_for + max_stale 초과 또는 값 없음: 동기 계산 (최초 1회/장기간 무요청 후에만 발생, 동시 요청은 병합)
+- 계산 함수의 반환값은 pickle 가능해야 함 (Response 대신 데이터를 반환하도록 분리)
+"""
+import time
+import logging
+import functools
+import threading
+from django.core.cache import cache
+from django.db import connections
+
+from .keys import make_key, cache_get
+from .singleflight import single_flight
+
+logger = logging.getLogger(__name__)
+
+# 백그라운드 재계산 잠금 유지 시간 (초) - 재계산 실패 시 이 시간 후 재시도
+SWR_LOCK_TIMEOUT = 300
+
+
+def _store(key, value, fresh_for, max_stale):
+    cache.set(key, {'value': value, 'computed_at': time.time()}, fresh_for + max_stale)
+    return value
+
+
+def _refresh_in_background(key, lock_key, compute, fresh_for, max_stale):
+    try:
+        _store(key, compute(), fresh_for, max_stale)
+        cache.delete(lock_key)
+    except Exception as e:
+        # 잠금은 유지 - SWR_LOCK_TIMEOUT 동안 이전 값 계속 사용 후 재시도
+        logger.error(f"백그라운드 재계산 실패 ({key[:40]}): {e}")
+    finally:
+        connections.close_all()
+
+
+def stale_while_revalidate(namespace, fresh_for, max_stale, lock_timeout=SWR_LOCK_TIMEOUT):
+    """
+    stale-while-revalidate 데코레이터
+    namespace: CACHE_NAMESPACES에 등록된 이름, 인자는 캐시 키 구성 요소로 사용
+    wrapper.refresh(*args, **kwargs): 즉시 재계산 후 저장 (캐시 워밍용)
+    """
+    def decorator(func):
+        def key_parts(args, kwargs):
+            return [func.__qualname__, list(args), kwargs]
+
+        def compute_and_store(*args, **kwargs):
+            key = make_key(namespace, *key_parts(args, kwargs))
+            return _store(key, func(*args, **kwargs), fresh_for, max_stale)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parts = key_parts(args, kwargs)
+            key = make_key(namespace, *parts)
+            entry = cache_get(key)
+
+            if entry is not None:
+                age = time.time() - entry['computed_at']
+                if age < fresh_for:
+                    return entry['value']
+
+                if age < fresh_for + max_stale:
+                    lock_key = make_key('swr_lock', key)
+                    if cache.add(lock_key, True, lock_timeout):
+                        logger.info(f"🔄 [SWR] 백그라운드 재계산 시작: {func.__qualname__} ({age:.0f}초 경과)")
+                        threading.Thread(
+                            target=_refresh_in_background,
+                            args=(key, lock_key, lambda: func(*args, **kwargs), fresh_for, max_stale),
+                            name=f'swr-{namespace}',
+                            daemon=True,
+                        ).start()
+                    return entry['value']
+
+            # 값 없음 / 최대 허용 지연 초과 - 동기 계산 (동시 요청은 한 번만 계산)
+            return single_flight(
+                namespace, parts, lambda: compute_and_store(*args, **kwargs)
+            )
+
+        wrapper.refresh = compute_and_store
+        return wrapper
+
+    return decorator
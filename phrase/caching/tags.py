@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# phrase/caching/tags.py
+"""
+태그(세대 번호) 기반 캐시 무효화
+- 캐시 항목은 저장 시점의 의존 태그 세대 번호를 함께 기록
+- 조회 시 현재 세대와 다르면 미스로 처리 (get_many 1회)
+- 태그 무효화는 세대 번호 증가 1회 - 키 스캔/패턴 삭제 없음
+- 한 트랜잭션 안의 무효화는 모아서 커밋 후 한 번에 반영 (태그별 세대 증가 1회, 이력 1행)
+- 무효화 이력은 CacheInvalidation 모델에 기록 (배치당 1행, 작업 워커가 주기적으로 정리)
+
+태그:
+    search          검색 대상 내용 변경 (대사 문구/활성 상태, 영화 제목/감독, 생성/삭제)
+    requests        요청 테이블 변경
+    dialogue:<id>   대사 단건
+    movie:<id>      영화 단건
+"""
+import time
+import logging
+import threading
+from collections import namedtuple
+from django.apps import apps
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+
+from .keys import make_key, namespace_of, record_cache_access
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TAG = 'search'
+REQUESTS_TAG = 'requests'
+
+# 캐시 항목 + 저장 시점 태그 세대
+TaggedValue = namedtuple('TaggedValue', ['value', 'generations'])
+
+
+def dialogue_tag(dialogue_id):
+    return f"dialogue:{dialogue_id}"
+
+
+def movie_tag(movie_id):
+    return f"movie:{movie_id}"
+
+
+def _tag_key(tag):
+    return make_key('cache_tag', tag)
+
+
+def get_tag_generations(tags):
+    """
+    태그별 현재 세대 번호
+    세대 키가 없으면(최초 사용/축출) 시각 기반 값으로 초기화 - 이전 세대와 겹치지 않음
+    """
+    tags = list(dict.fromkeys(tags))
+    if not tags:
+        return {}
+
+    keys = {tag: _tag_key(tag) for tag in tags}
+    current = cache.get_many(list(keys.values()))
+
+    generations = {}
+    for tag, key in keys.items():
+        generation = current.get(key)
+        if generation is None:
+            cache.add(key, time.time_ns(), None)
+            generation = cache.get(key)
+        generations[tag] = generation
+    return generations
+
+
+def set_with_tags(key, value, tags, timeout=DEFAULT_TIMEOUT, generations=None):
+    """
+    의존 태그의 세대와 함께 저장
+    generations: 값을 계산하기 전에 읽어 둔 세대 (계산 중 무효화되면 다음 조회에서 미스)
+    """
+    if generations is None:
+        generations = get_tag_generations(tags)
+    cache.set(key, TaggedValue(value, generations), timeout)
+
+
+def get_with_tags(key, default=None):
+    """저장 이후 의존 태그가 무효화되지 않았을 때만 값 반환"""
+    entry = cache.get(key)
+    valid = isinstance(entry, TaggedValue) and (
+        get_tag_generations(entry.generations) == entry.generations
+    )
+    record_cache_access(namespace_of(key), valid)
+    return entry.value if valid else default
+
+
+def cached_with_tags(key, tags, fetch, timeout=DEFAULT_TIMEOUT):
+    """태그 캐시 조회, 없거나 무효화되었으면 fetch() 결과 저장 후 반환 (None은 캐싱하지 않음)"""
+    missing = object()
+    value = get_with_tags(key, missing)
+    if value is not missing:
+        return value
+
+    generations = get_tag_generations(tags)
+    value = fetch()
+    if value is not None:
+        set_with_tags(key, value, tags, timeout, generations)
+    return value
+
+
+def _record_invalidation(tags, changes):
+    """무효화 배치 1건 이력 - 변경이 한 종류(모델/행/동작)면 그대로, 여러 종류면 요약"""
+    if not changes:
+        return
+
+    model_names = sorted({model_name for model_name, _, _ in changes})
+    instance_ids = {instance_id or 0 for _, instance_id, _ in changes}
+    actions = {action for _, _, action in changes}
+
+    CacheInvalidation = apps.get_model('phrase', 'CacheInvalidation')
+    try:
+        CacheInvalidation.objects.create(
+            cache_key=', '.join(tags)[:250],
+            model_name=','.join(model_names)[:100],
+            instance_id=instance_ids.pop() if len(instance_ids) == 1 else 0,
+            action=actions.pop() if len(actions) == 1 else 'update',
+        )
+    except Exception as e:
+        logger.warning(f"캐시 무효화 기록 실패: {e}")
+
+
+def _bump(tags, changes):
+    for tag in tags:
+        key = _tag_key(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 세대 키가 없으면 이전 값과 겹치지 않는 새 세대로 시작
+            cache.set(key, time.time_ns(), None)
+
+    _record_invalidation(tags, changes)
+
+    logger.info(f"🗑️ [Cache] 태그 무효화: {', '.join(tags)} ({len(changes)}건 변경)")
+
+
+# 스레드별 {DB 별칭: 진행 중인 트랜잭션의 배치}
+_batches = threading.local()
+
+
+def _pending_batches():
+    batches = getattr(_batches, 'by_alias', None)
+    if batches is None:
+        batches = _batches.by_alias = {}
+    return batches
+
+
+class _InvalidationBatch:
+    """트랜잭션 하나에서 쌓인 태그/변경 이력 - 커밋 시 한 번에 반영"""
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.tags = {}
+        self.changes = []
+
+    def add(self, tags, change):
+        self.tags.update(dict.fromkeys(tags))
+        if change:
+            self.changes.append(change)
+
+    def commit(self):
+        batches = _pending_batches()
+        if batches.get(self.alias) is self:
+            del batches[self.alias]
+        _bump(list(self.tags), self.changes)
+
+
+def _current_batch(connection):
+    """현재 트랜잭션의 배치 - 없거나 롤백으로 커밋 콜백이 사라졌으면 새로 만들어 커밋 콜백 등록"""
+    batches = _pending_batches()
+    batch = batches.get(connection.alias)
+    if batch is None or not any(entry[1] == batch.commit for entry in connection.run_on_commit):
+        batch = batches[connection.alias] = _InvalidationBatch(connection.alias)
+        transaction.on_commit(batch.commit, using=connection.alias)
+    return batch
+
+
+def bump_tags(tags, model_name='', instance_id=None, action='update'):
+    """
+    태그 무효화 (세대 번호 증가)
+    트랜잭션 안에서는 커밋 후 실행 - 커밋 전 데이터가 새 세대로 다시 캐싱되는 것을 방지
+    같은 트랜잭션의 무효화는 합쳐서 태그별 1회만 증가
+    model_name이 있으면 CacheInvalidation에 이력 기록 (배치당 1행)
+    """
+    tags = list(dict.fromkeys(tags))
+    if not tags:
+        return
+
+    change = (model_name, instance_id, action) if model_name else None
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        _bump(tags, [change] if change else [])
+        return
+
+    _current_batch(connection).add(tags, change)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/build_substring_index.py
+"""
+대사 부분 문자열(suffix array) 인덱스 빌드 명령
+사용법: python manage.py build_substring_index [--path /path/to/index]
+빌드 완료 시 파일이 원자적으로 교체되며, 실행 중인 워커는 자동으로 새 인덱스를 사용
+"""
+import time
+from django.core.management.base import BaseCommand, CommandError
+
+from phrase.models import DialogueTable
+from phrase.models.substring_index import get_substring_index_path, write_substring_index
+
+
+class Command(BaseCommand):
+    help = '활성 대사의 검색 벡터로 부분 문자열(suffix array) 인덱스 파일을 생성합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default=None,
+            help='인덱스 파일 경로 (기본값: settings.PHRASE_SUBSTRING_INDEX_PATH)'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path'] or get_substring_index_path()
+        if not path:
+            raise CommandError('PHRASE_SUBSTRING_INDEX_PATH 설정 또는 --path 옵션이 필요합니다')
+
+        start_time = time.time()
+        documents = DialogueTable.objects.filter(is_active=True).order_by('id').values_list(
+            'id', 'search_vector_full'
+        ).iterator(chunk_size=2000)
+
+        document_count = write_substring_index(str(path), documents)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'부분 문자열 인덱스 생성 완료: {document_count}개 대사, '
+            f'{time.time() - start_time:.1f}초 → {path}'
+        ))
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/rebuild_search_index.py
+"""
+검색 벡터 및 대사 역색인 재구축 명령
+사용법: python manage.py rebuild_search_index [--batch-size 500]
+"""
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from phrase.models import DialogueTable, SearchTermStatistic
+from phrase.models.search_backends import get_search_backend, install_fulltext_backends
+
+
+class Command(BaseCommand):
+    help = '대사 검색 벡터, 역색인(토큰 포스팅), 용어 통계를 재구축합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 처리할 대사 수 (기본값: 500)'
+        )
+
+    def handle(self, *args, **options):
+        updated_count = DialogueTable.objects.update_search_vectors_bulk(
+            batch_size=options['batch_size']
+        )
+        self.stdout.write(self.style.SUCCESS(f'검색 역색인 재구축 완료: {updated_count}개 대사'))
+        
+        # BM25 용어 통계 (증분 갱신 누적 오차 정리)
+        term_count = SearchTermStatistic.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'검색 용어 통계 재구축 완료: {term_count}개 용어'))
+        
+        # 전문 검색 인덱스 (미설치 시 설치, 설치된 경우 재구축)
+        connection = connections[DialogueTable.objects.db]
+        install_fulltext_backends(connection)
+        
+        backend = get_search_backend(DialogueTable.objects.db)
+        backend.rebuild(connection)
+        self.stdout.write(self.style.SUCCESS(f'검색 백엔드: {backend.name}'))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/run_job_worker.py
+"""
+백그라운드 작업 워커 명령 (검색 기록, 대사 번역, 포스터 수집 등)
+사용법: python manage.py run_job_worker [--concurrency 4] [--poll-interval 1.0] [--type translate_dialogue] [--once]
+SIGTERM/SIGINT 수신 시 새 작업 선점을 멈추고 실행 중인 작업을 마친 뒤 종료
+"""
+import signal
+from django.core.management.base import BaseCommand
+
+from phrase.models import flush_counters
+from phrase.utils.jobs import JobWorker, DEFAULT_JOB_CONCURRENCY, DEFAULT_JOB_POLL_INTERVAL
+
+
+class Command(BaseCommand):
+    help = 'background_job 테이블의 작업을 선점해 스레드 풀에서 실행합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=DEFAULT_JOB_CONCURRENCY,
+            help=f'동시 실행 작업 수 (기본값: {DEFAULT_JOB_CONCURRENCY})'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=DEFAULT_JOB_POLL_INTERVAL,
+            help=f'대기 작업이 없을 때 조회 간격(초) (기본값: {DEFAULT_JOB_POLL_INTERVAL})'
+        )
+        parser.add_argument(
+            '--type',
+            action='append',
+            dest='job_types',
+            help='처리할 작업 종류 (여러 번 지정 가능, 기본값: 전체)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='지금 실행 가능한 작업을 모두 처리한 뒤 종료'
+        )
+
+    def handle(self, *args, **options):
+        worker = JobWorker(
+            concurrency=options['concurrency'],
+            poll_interval=options['poll_interval'],
+            job_types=options['job_types'],
+        )
+
+        def request_stop(signum, frame):
+            self.stdout.write(self.style.WARNING('종료 요청 - 실행 중인 작업을 마친 뒤 종료합니다'))
+            worker.stop()
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'작업 워커 시작: {worker.worker_id} (동시 실행 {worker.concurrency})'
+        ))
+        processed = worker.run(once=options['once'])
+
+        # 작업 중 누적된 조회/재생 횟수 반영
+        flush_counters()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"작업 워커 종료: 완료 {processed['done']}개, 재시도 예정 {processed['queued']}개, "
+            f"실패 {processed['failed']}개"
+        ))
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/seed_translation_memory.py
+"""
+번역 메모리 시드 명령 (기존 대사/요청 번역 쌍 → TranslationMemory)
+사용법: python manage.py seed_translation_memory [--batch-size 1000]
+"""
+from django.core.management.base import BaseCommand
+
+from phrase.models import TranslationMemory
+
+
+class Command(BaseCommand):
+    help = '기존 대사/요청의 번역 쌍으로 번역 메모리를 채웁니다 (이미 있는 원문은 유지)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 저장할 항목 수 (기본값: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        added = TranslationMemory.objects.seed_from_existing(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'번역 메모리 시드 완료: {added}개 추가'))
+
+        stats = TranslationMemory.objects.get_statistics()
+        self.stdout.write(self.style.SUCCESS(
+            f"번역 메모리: {stats['entries']}개 항목, 누적 적중 {stats['total_hits'] or 0}회, "
+            f"출처별 {stats['by_origin']}"
+        ))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/warm_search_cache.py
+"""
+인기 검색어 캐시 예열 명령 (배포/캐시 초기화 직후 또는 주기 실행)
+사용법: python manage.py warm_search_cache [--top 100] [--concurrency 4] [--only db_search]
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from api.views.view_phrase import CACHE_WARM_TARGETS
+from phrase.utils.cache_warmer import warm_search_cache, DEFAULT_WARM_TOP_N, DEFAULT_WARM_CONCURRENCY
+
+
+class Command(BaseCommand):
+    help = '인기 검색어 상위 N개의 검색 결과 캐시(db_search, search_result)를 미리 계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=DEFAULT_WARM_TOP_N,
+            help=f'예열할 인기 검색어 수 (기본값: {DEFAULT_WARM_TOP_N})'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=DEFAULT_WARM_CONCURRENCY,
+            help=f'동시 실행 수 (기본값: {DEFAULT_WARM_CONCURRENCY})'
+        )
+        parser.add_argument(
+            '--only',
+            action='append',
+            choices=sorted(CACHE_WARM_TARGETS),
+            help='예열할 캐시 종류 (여러 번 지정 가능, 기본값: 전체)'
+        )
+
+    def handle(self, *args, **options):
+        if options['top'] < 1:
+            raise CommandError('--top은 1 이상이어야 합니다')
+
+        targets = {
+            name: warm for name, warm in CACHE_WARM_TARGETS.items()
+            if not options['only'] or name in options['only']
+        }
+        report = warm_search_cache(targets, top_n=options['top'], concurrency=options['concurrency'])
+
+        for name, counts in report['targets'].items():
+            self.stdout.write(
+                f"  {name}: 결과 있음 {counts['found']}개, 결과 없음 {counts['empty']}개, 실패 {counts['failed']}개"
+            )
+
+        coverage = report['traffic_coverage']
+        self.stdout.write(self.style.SUCCESS(
+            f"캐시 예열 완료: {report['queries']}개 검색어, {report['elapsed_seconds']}초 "
+            f"(검색어당 평균 {report['avg_ms_per_query']}ms)"
+        ))
+        self.stdout.write(self.style.SUCCESS(
+            f"검색량 대비 포함 비율: {coverage if coverage is not None else '-'}% "
+            f"({report['covered_searches']}/{report['total_searches']}회)"
+        ))
@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-17 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from phrase.models.utils import tokenize_search_text
+
+
+def build_search_tokens(apps, schema_editor):
+    """기존 대사의 검색 벡터로 역색인 생성"""
+    DialogueTable = apps.get_model('phrase', 'DialogueTable')
+    DialogueSearchToken = apps.get_model('phrase', 'DialogueSearchToken')
+
+    postings = []
+    for dialogue_id, search_text in DialogueTable.objects.values_list('id', 'search_vector_full').iterator():
+        for token in tokenize_search_text(search_text):
+            postings.append(DialogueSearchToken(token=token, dialogue_id=dialogue_id))
+
+        if len(postings) >= 5000:
+            DialogueSearchToken.objects.bulk_create(postings, batch_size=1000, ignore_conflicts=True)
+            postings = []
+
+    if postings:
+        DialogueSearchToken.objects.bulk_create(postings, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DialogueSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64, verbose_name='토큰')),
+                ('dialogue', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='phrase.dialoguetable', verbose_name='대사')),
+            ],
+            options={
+                'verbose_name': '대사 검색 토큰',
+                'verbose_name_plural': '대사 검색 토큰들',
+                'db_table': 'dialogue_search_token',
+                'constraints': [models.UniqueConstraint(fields=('token', 'dialogue'), name='unique_dialogue_search_token')],
+            },
+        ),
+        migrations.RunPython(build_search_tokens, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-17 09:30
+
+from django.db import migrations
+
+
+def install_fulltext_index(apps, schema_editor):
+    """DB 벤더별 전문 검색 인덱스 설치 (MySQL: FULLTEXT ngram, SQLite: FTS5)"""
+    from phrase.models.search_backends import install_fulltext_backends
+
+    install_fulltext_backends(schema_editor.connection)
+
+
+def uninstall_fulltext_index(apps, schema_editor):
+    from phrase.models.search_backends import uninstall_fulltext_backends
+
+    uninstall_fulltext_backends(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0002_dialoguesearchtoken'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_fulltext_index, uninstall_fulltext_index),
+    ]
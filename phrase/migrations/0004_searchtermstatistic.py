@@ -0,0 +1,52 @@
+# Generated by Django 5.2 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+CORPUS_TERM = '__corpus__'
+
+
+def build_term_statistics(apps, schema_editor):
+    """기존 역색인 포스팅으로 용어 통계 생성"""
+    DialogueSearchToken = apps.get_model('phrase', 'DialogueSearchToken')
+    SearchTermStatistic = apps.get_model('phrase', 'SearchTermStatistic')
+
+    frequencies = DialogueSearchToken.objects.values('token').annotate(
+        frequency=models.Count('dialogue_id')
+    ).values_list('token', 'frequency')
+
+    statistics = [
+        SearchTermStatistic(term=term, document_frequency=frequency)
+        for term, frequency in frequencies.iterator()
+    ]
+    statistics.append(SearchTermStatistic(
+        term=CORPUS_TERM,
+        document_frequency=DialogueSearchToken.objects.values('dialogue_id').distinct().count(),
+        total_length=DialogueSearchToken.objects.count()
+    ))
+    SearchTermStatistic.objects.bulk_create(statistics, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0003_dialogue_fulltext_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchTermStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64, unique=True, verbose_name='용어')),
+                ('document_frequency', models.BigIntegerField(default=0, verbose_name='문서 빈도')),
+                ('total_length', models.BigIntegerField(default=0, verbose_name='전체 문서 길이')),
+            ],
+            options={
+                'verbose_name': '검색 용어 통계',
+                'verbose_name_plural': '검색 용어 통계들',
+                'db_table': 'search_term_statistic',
+            },
+        ),
+        migrations.RunPython(build_term_statistics, migrations.RunPython.noop),
+    ]
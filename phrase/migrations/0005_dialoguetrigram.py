@@ -0,0 +1,51 @@
+# Generated by Django 5.2 on 2026-10-17 10:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from phrase.models.utils import extract_trigrams
+
+
+def build_trigrams(apps, schema_editor):
+    """기존 대사의 검색 벡터로 트라이그램 색인 생성"""
+    DialogueTable = apps.get_model('phrase', 'DialogueTable')
+    DialogueTrigram = apps.get_model('phrase', 'DialogueTrigram')
+
+    rows = []
+    for dialogue_id, search_text in DialogueTable.objects.values_list('id', 'search_vector_full').iterator():
+        trigrams = extract_trigrams(search_text)
+        for trigram in trigrams:
+            rows.append(DialogueTrigram(trigram=trigram, dialogue_id=dialogue_id, gram_count=len(trigrams)))
+
+        if len(rows) >= 5000:
+            DialogueTrigram.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+            rows = []
+
+    if rows:
+        DialogueTrigram.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0004_searchtermstatistic'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DialogueTrigram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trigram', models.CharField(max_length=3, verbose_name='트라이그램')),
+                ('gram_count', models.PositiveIntegerField(default=0, verbose_name='대사 트라이그램 수')),
+                ('dialogue', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trigrams', to='phrase.dialoguetable', verbose_name='대사')),
+            ],
+            options={
+                'verbose_name': '대사 트라이그램',
+                'verbose_name_plural': '대사 트라이그램들',
+                'db_table': 'dialogue_trigram',
+                'constraints': [models.UniqueConstraint(fields=('trigram', 'dialogue'), name='unique_dialogue_trigram')],
+            },
+        ),
+        migrations.RunPython(build_trigrams, migrations.RunPython.noop),
+    ]
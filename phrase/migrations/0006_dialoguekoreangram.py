@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-17 11:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from phrase.models.utils import extract_korean_grams
+
+
+def build_korean_grams(apps, schema_editor):
+    """기존 한글 대사로 n-gram 색인 생성"""
+    DialogueTable = apps.get_model('phrase', 'DialogueTable')
+    DialogueKoreanGram = apps.get_model('phrase', 'DialogueKoreanGram')
+
+    rows = []
+    dialogues = DialogueTable.objects.exclude(dialogue_phrase_ko__isnull=True).exclude(dialogue_phrase_ko='')
+    for dialogue_id, korean_text in dialogues.values_list('id', 'dialogue_phrase_ko').iterator():
+        for gram in extract_korean_grams(korean_text):
+            rows.append(DialogueKoreanGram(gram=gram, dialogue_id=dialogue_id))
+
+        if len(rows) >= 5000:
+            DialogueKoreanGram.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+            rows = []
+
+    if rows:
+        DialogueKoreanGram.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0005_dialoguetrigram'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DialogueKoreanGram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gram', models.CharField(max_length=2, verbose_name='n-gram')),
+                ('dialogue', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='korean_grams', to='phrase.dialoguetable', verbose_name='대사')),
+            ],
+            options={
+                'verbose_name': '한글 대사 n-gram',
+                'verbose_name_plural': '한글 대사 n-gram들',
+                'db_table': 'dialogue_korean_gram',
+                'constraints': [models.UniqueConstraint(fields=('gram', 'dialogue'), name='unique_dialogue_korean_gram')],
+            },
+        ),
+        migrations.RunPython(build_korean_grams, migrations.RunPython.noop),
+    ]
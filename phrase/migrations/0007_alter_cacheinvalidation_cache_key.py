@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0006_dialoguekoreangram'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cacheinvalidation',
+            name='cache_key',
+            field=models.CharField(db_index=True, max_length=250),
+        ),
+    ]
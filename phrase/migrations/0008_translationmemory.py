@@ -0,0 +1,114 @@
+# Generated by Django 5.2 on 2026-10-17 13:00
+
+import hashlib
+import unicodedata
+
+import phrase.models.fields
+from django.db import migrations, models
+
+
+# 시드 시점의 규칙 사본 - 이후 코드(phrase.models.utils)가 바뀌어도 이 마이그레이션 결과는 고정
+# (번역 메모리 키 규칙은 translation_source_hash와 같아야 조회됨)
+TRANSLATION_QUALITY_SCORES = {
+    'excellent': 1.0,
+    'good': 0.85,
+    'fair': 0.7,
+    'unknown': 0.6,
+    'needs_review': 0.4,
+    'poor': 0.3,
+}
+TRUSTED_TRANSLATION_METHODS = {'manual', 'user_submitted'}
+SEED_BATCH_SIZE = 1000
+
+
+def source_hash(text, langpair):
+    """sha256(언어쌍 + 정규화된 원문) - 유니코드 NFC, 대소문자 무시, 공백 정리"""
+    normalized = ' '.join(unicodedata.normalize('NFC', text).casefold().split()) if text else ''
+    return hashlib.sha256(f"{langpair}\x00{normalized}".encode('utf-8')).hexdigest()
+
+
+def quality_score(quality, method=None):
+    if method in TRUSTED_TRANSLATION_METHODS:
+        return 1.0
+    return TRANSLATION_QUALITY_SCORES.get(quality, TRANSLATION_QUALITY_SCORES['unknown'])
+
+
+def translation_pairs(DialogueTable, RequestTable):
+    """(원문, 번역, 언어쌍, 품질 점수, 출처) - 대사: 영어 → 한글, 요청: 양방향"""
+    dialogues = DialogueTable.objects.exclude(dialogue_phrase_ko__isnull=True).exclude(dialogue_phrase_ko='')
+    for phrase, korean, quality, method in dialogues.values_list(
+        'dialogue_phrase', 'dialogue_phrase_ko', 'translation_quality', 'translation_method'
+    ).iterator(chunk_size=2000):
+        if phrase and phrase.strip() != korean.strip():
+            yield phrase, korean, 'en|ko', quality_score(quality, method), 'dialogue'
+
+    requests = RequestTable.objects.exclude(request_korean__isnull=True).exclude(request_korean='')
+    for phrase, phrase_full, korean, korean_full, quality in requests.values_list(
+        'request_phrase', 'request_phrase_full', 'request_korean', 'request_korean_full', 'translation_quality'
+    ).iterator(chunk_size=2000):
+        phrase = phrase_full or phrase
+        korean = korean_full or korean
+        if phrase and phrase.strip() != korean.strip():
+            score = quality_score(quality)
+            yield phrase, korean, 'en|ko', score, 'request'
+            yield korean, phrase, 'ko|en', score, 'request'
+
+
+def seed_from_existing_translations(apps, schema_editor):
+    """기존 대사/요청 번역 쌍으로 번역 메모리 시드 (배치 안의 같은 원문은 품질 점수가 높은 번역)"""
+    TranslationMemory = apps.get_model('phrase', 'TranslationMemory')
+    batch = {}
+
+    for source, translated, langpair, score, origin in translation_pairs(
+        apps.get_model('phrase', 'DialogueTable'),
+        apps.get_model('phrase', 'RequestTable'),
+    ):
+        key = source_hash(source, langpair)
+        current = batch.get(key)
+        if current is None or score > current.quality_score:
+            batch[key] = TranslationMemory(
+                source_hash=key,
+                langpair=langpair,
+                source_text=source,
+                translated_text=translated,
+                quality_score=score,
+                origin=origin,
+            )
+        if len(batch) >= SEED_BATCH_SIZE:
+            TranslationMemory.objects.bulk_create(batch.values(), batch_size=SEED_BATCH_SIZE, ignore_conflicts=True)
+            batch.clear()
+
+    if batch:
+        TranslationMemory.objects.bulk_create(batch.values(), batch_size=SEED_BATCH_SIZE, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0007_alter_cacheinvalidation_cache_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationMemory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_hash', models.CharField(max_length=64, unique=True, verbose_name='원문 해시')),
+                ('langpair', models.CharField(choices=[('en|ko', '영어 → 한글'), ('ko|en', '한글 → 영어')], max_length=5, verbose_name='언어쌍')),
+                ('source_text', phrase.models.fields.MySQLTextField(verbose_name='원문')),
+                ('translated_text', phrase.models.fields.MySQLTextField(verbose_name='번역')),
+                ('quality_score', models.FloatField(default=0.0, verbose_name='품질 점수')),
+                ('origin', models.CharField(choices=[('api', '번역 API'), ('dialogue', '기존 대사 번역'), ('request', '기존 요청 번역')], default='api', max_length=20, verbose_name='출처')),
+                ('hit_count', models.PositiveIntegerField(default=0, verbose_name='적중 횟수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성시간')),
+                ('last_used_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 사용 시간')),
+            ],
+            options={
+                'verbose_name': '번역 메모리',
+                'verbose_name_plural': '번역 메모리들',
+                'db_table': 'translation_memory',
+                'indexes': [models.Index(fields=['-hit_count'], name='translation_memory_hits_idx')],
+            },
+        ),
+        migrations.RunPython(seed_from_existing_translations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-17 14:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0008_translationmemory'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackgroundJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_type', models.CharField(max_length=50, verbose_name='작업 종류')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='작업 인자')),
+                ('priority', models.SmallIntegerField(default=0, verbose_name='우선순위')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='queued', max_length=10, verbose_name='상태')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='실행 예정 시간')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='최대 시도 횟수')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='처리 워커')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='선점 시간')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성시간')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='완료 시간')),
+            ],
+            options={
+                'verbose_name': '백그라운드 작업',
+                'verbose_name_plural': '백그라운드 작업들',
+                'db_table': 'background_job',
+                'indexes': [
+                    models.Index(fields=['status', 'run_at'], name='background_job_claim_idx'),
+                    models.Index(fields=['status', 'locked_at'], name='background_job_lock_idx'),
+                    models.Index(fields=['job_type', 'status'], name='background_job_type_idx'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0009_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dialoguetable',
+            name='translation_method',
+            field=models.CharField(choices=[('manual', '수동 번역'), ('api_auto', 'API 자동번역'), ('ai_improved', 'AI 개선번역'), ('user_submitted', '사용자 제공'), ('pending', '번역 대기'), ('failed', '번역 실패'), ('unknown', '알 수 없음')], default='unknown', max_length=20, verbose_name='번역 방식'),
+        ),
+    ]
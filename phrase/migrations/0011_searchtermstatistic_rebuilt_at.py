@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0010_alter_dialoguetable_translation_method'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='searchtermstatistic',
+            name='rebuilt_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='재구축 시각'),
+        ),
+    ]
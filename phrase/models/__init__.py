@@ -20,10 +20,21 @@ from .user import UserSearchQuery, UserSearchResult
 # 캐시 모델
 from .cache import CacheInvalidation
 
+# 검색 역색인 모델
+from .search import DialogueSearchToken, SearchTermStatistic, DialogueTrigram, DialogueKoreanGram
+
+# 번역 메모리 모델
+from .translation import TranslationMemory
+
+# 백그라운드 작업 큐 모델
+from .jobs import BackgroundJob
+
 # 매니저들
 from .managers import (
     ActiveManager, RequestManager, MovieManager, DialogueManager,
-    UserSearchQueryManager, UserSearchResultManager, CacheInvalidationManager
+    UserSearchQueryManager, UserSearchResultManager, CacheInvalidationManager,
+    DialogueSearchTokenManager, SearchTermStatisticManager, DialogueTrigramManager,
+    DialogueKoreanGramManager, TranslationMemoryManager, BackgroundJobManager
 )
 
 # 유틸리티 함수들
@@ -32,7 +43,15 @@ from .utils import (
     cleanup_old_data,
     check_mysql_compatibility,
     get_poster_upload_path,
-    get_video_upload_path
+    get_video_upload_path,
+    normalize_search_text,
+    tokenize_search_text,
+    extract_trigrams,
+    extract_korean_grams,
+    korean_query_grams,
+    contains_hangul,
+    normalize_translation_source,
+    translation_source_hash
 )
 
 # MySQL 헬퍼 함수들
@@ -43,6 +62,33 @@ from .mysql_helpers import (
     get_mysql_migration_operations
 )
 
+# 검색 백엔드
+from .search_backends import (
+    get_search_backend,
+    reset_search_backend_cache
+)
+
+# 부분 문자열 인덱스
+from .substring_index import get_substring_index
+
+# 존재 확인 블룸 필터
+from .existence_filter import (
+    get_existence_filter,
+    request_might_exist,
+    request_text_might_exist,
+    dialogue_text_might_exist,
+    get_existence_filter_statistics
+)
+
+# 검색 랭킹
+from .ranking import rank_dialogues_bm25
+
+# 개수 추정
+from .counting import estimate_count, CountEstimate
+
+# 카운터 지연 쓰기
+from .counters import increment_counter, increment_counters, flush_counters, get_counter_statistics
+
 # 기존 호환성을 위한 별칭
 Movie = MovieTable
 MovieQuote = DialogueTable
@@ -77,6 +123,18 @@ __all__ = [
     # 캐시 모델
     'CacheInvalidation',
     
+    # 검색 역색인 모델
+    'DialogueSearchToken',
+    'SearchTermStatistic',
+    'DialogueTrigram',
+    'DialogueKoreanGram',
+    
+    # 번역 메모리 모델
+    'TranslationMemory',
+    
+    # 백그라운드 작업 큐 모델
+    'BackgroundJob',
+    
     # 매니저
     'ActiveManager',
     'RequestManager',
@@ -85,6 +143,12 @@ __all__ = [
     'UserSearchQueryManager',
     'UserSearchResultManager',
     'CacheInvalidationManager',
+    'DialogueSearchTokenManager',
+    'SearchTermStatisticManager',
+    'DialogueTrigramManager',
+    'DialogueKoreanGramManager',
+    'TranslationMemoryManager',
+    'BackgroundJobManager',
     
     # 유틸리티
     'get_model_statistics',
@@ -92,6 +156,14 @@ __all__ = [
     'check_mysql_compatibility',
     'get_poster_upload_path',
     'get_video_upload_path',
+    'normalize_search_text',
+    'tokenize_search_text',
+    'extract_trigrams',
+    'extract_korean_grams',
+    'korean_query_grams',
+    'contains_hangul',
+    'normalize_translation_source',
+    'translation_source_hash',
     
     # MySQL 헬퍼
     'get_mysql_engine',
@@ -99,6 +171,33 @@ __all__ = [
     'check_mysql_settings',
     'get_mysql_migration_operations',
     
+    # 검색 백엔드
+    'get_search_backend',
+    'reset_search_backend_cache',
+    
+    # 부분 문자열 인덱스
+    'get_substring_index',
+    
+    # 존재 확인 블룸 필터
+    'get_existence_filter',
+    'request_might_exist',
+    'request_text_might_exist',
+    'dialogue_text_might_exist',
+    'get_existence_filter_statistics',
+    
+    # 검색 랭킹
+    'rank_dialogues_bm25',
+    
+    # 개수 추정
+    'estimate_count',
+    'CountEstimate',
+    
+    # 카운터 지연 쓰기
+    'increment_counter',
+    'increment_counters',
+    'flush_counters',
+    'get_counter_statistics',
+    
     # 별칭
     'Movie',
     'MovieQuote',
@@ -8,8 +8,8 @@ from django.db import models
 from .managers import CacheInvalidationManager
 
 class CacheInvalidation(models.Model):
-    """캐시 무효화 관리"""
-    cache_key = models.CharField(max_length=250, unique=True)
+    """캐시 무효화 이력 (무효화 배치(트랜잭션) 1건당 1행, cache_key = 무효화한 태그 목록)"""
+    cache_key = models.CharField(max_length=250, db_index=True)
     model_name = models.CharField(max_length=100)
     instance_id = models.PositiveIntegerField()
     action = models.CharField(
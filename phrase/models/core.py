@@ -5,7 +5,6 @@
 RequestTable, MovieTable, DialogueTable
 """
 import os
-import re
 import hashlib
 import logging
 from django.db import models
@@ -15,7 +14,7 @@ from django.core.exceptions import ValidationError
 from .base import BaseModel
 from .fields import MySQLTextField, MySQLLongTextField, OptimizedCharField, SecureURLField
 from .managers import ActiveManager, RequestManager, MovieManager, DialogueManager
-from .utils import get_poster_upload_path, get_video_upload_path
+from .utils import get_poster_upload_path, get_video_upload_path, normalize_search_text
 from account.models import User
 
 logger = logging.getLogger(__name__)
@@ -391,6 +390,8 @@ class DialogueTable(BaseModel):
             ('api_auto', 'API 자동번역'),
             ('ai_improved', 'AI 개선번역'),
             ('user_submitted', '사용자 제공'),
+            ('pending', '번역 대기'),
+            ('failed', '번역 실패'),
             ('unknown', '알 수 없음')
         ],
         default='unknown',
@@ -474,6 +475,11 @@ class DialogueTable(BaseModel):
         # 검색 벡터 업데이트
         self.update_search_vector()
         
+        # 대사 일부만 저장하는 경우에도 검색 벡터는 함께 저장 (역색인 동기화 기준)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'dialogue_phrase', 'dialogue_phrase_ko'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'search_vector', 'search_vector_full'}
+        
         # 파일 크기 계산
         if self.video_file and not self.file_size_bytes:
             try:
@@ -481,13 +487,17 @@ class DialogueTable(BaseModel):
             except:
                 pass
         
-        # 자동 번역 처리
-        if not kwargs.get('skip_translation', False):
-            if self.dialogue_phrase and not self.dialogue_phrase_ko and self.translation_method == 'unknown':
-                self.auto_translate_korean()
+        # 한글 번역이 없으면 번역 대기로 표시 (저장 중에는 네트워크 호출 없음)
+        # 커밋 후 배치 번역 작업이 대기 중인 대사를 모아 번역 (signals.schedule_dialogue_translation)
+        if update_fields is None and self.needs_auto_translation():
+            self.translation_method = 'pending'
         
         super().save(*args, **kwargs)
     
+    def needs_auto_translation(self):
+        """자동 번역 대상 여부 (한글 번역 없음 + 번역 방식 미지정)"""
+        return bool(self.dialogue_phrase) and not self.dialogue_phrase_ko and self.translation_method == 'unknown'
+    
     def update_search_vector(self):
         """검색 벡터 업데이트 - MySQL 호환성 고려"""
         texts = []
@@ -503,9 +513,8 @@ class DialogueTable(BaseModel):
         # 텍스트 정규화
         normalized_texts = []
         for text in texts:
-            # 특수문자 제거 및 소문자 변환
-            normalized = re.sub(r'[^\w\s]', ' ', text.lower())
-            normalized = re.sub(r'\s+', ' ', normalized).strip()
+            # 특수문자 제거 및 소문자 변환 (검색 토큰화와 동일한 규칙)
+            normalized = normalize_search_text(text)
             if normalized:
                 normalized_texts.append(normalized)
         
@@ -517,21 +526,26 @@ class DialogueTable(BaseModel):
         self.search_vector = full_search_text[:191]
     
     def auto_translate_korean(self):
-        """자동 한글 번역"""
+        """
+        자동 한글 번역 (명시적 호출용 - 번역 API를 호출하므로 트랜잭션 밖에서 사용)
+        번역하면 True, 저장은 호출하는 쪽에서 처리
+        """
         if not self.dialogue_phrase:
-            return
+            return False
         
         try:
-            from phrase.application.translate import LibreTranslator
-            translator = LibreTranslator()
+            from phrase.utils.translate import get_translator
+            translator = get_translator()
             
             korean_text = translator.translate_to_korean(self.dialogue_phrase)
             if korean_text and korean_text != self.dialogue_phrase:
                 self.dialogue_phrase_ko = korean_text
                 self.translation_method = 'api_auto'
                 logger.info(f"자동 번역 완료: {self.dialogue_phrase[:30]}...")
+                return True
         except Exception as e:
             logger.error(f"자동 번역 실패: {e}")
+        return False
     
     def get_duration_display(self):
         """길이 표시용 문자열"""
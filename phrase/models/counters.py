@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+# phrase/models/counters.py
+"""
+조회/재생/검색 횟수, BM25 코퍼스 통계 지연 쓰기 (write-behind) 버퍼
+- 요청 처리 경로에서는 프로세스 메모리에 증가분만 누적 (DB 쓰기 없음)
+- 백그라운드 스레드가 주기적으로 테이블별 UPDATE 한 번(필드별 F() + CASE)으로 반영
+- 증가분이 적재 한도를 넘으면 주기 전이라도 즉시 반영
+- 비정상 종료 시 유실 상한: 반영 주기(기본 5초) 또는 적재 한도만큼의 증가분
+- 정상 종료 시 atexit 훅으로 남은 증가분 반영 (flush_counters)
+- 반영 실패 시 증가분을 버퍼에 되돌려 다음 주기에 재시도
+- 기본 키 대신 고유 필드(예: 검색 용어)로 행을 지정할 수 있음 - 없는 행은 반영 시 일괄 생성
+- 매니저에 counters_reset_at()이 있으면 반영 전에 확인해서, 그 시각(재계산) 이전부터 쌓인 증가분은 버림
+  (재계산과 겹친 증가분은 합산할 수 없으므로 반영 주기 하나만큼은 유실될 수 있음)
+"""
+import time
+import atexit
+import logging
+import threading
+from collections import defaultdict
+from django.apps import apps
+from django.db import models, connections
+from django.db.models.functions import Now
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# 반영 주기 (초) / 즉시 반영하는 적재 한도 (대기 중인 행 수)
+COUNTER_FLUSH_INTERVAL = 5
+COUNTER_FLUSH_THRESHOLD = 1000
+
+# UPDATE 한 번에 넣을 최대 행 수 (CASE 분기 수)
+COUNTER_FLUSH_BATCH_SIZE = 500
+
+# 버퍼링하는 (모델, 카운터 필드) → 함께 갱신할 시각 필드 (마지막 증가 시각)
+BUFFERED_COUNTERS = {
+    ('phrase.DialogueTable', 'play_count'): None,
+    ('phrase.MovieTable', 'view_count'): None,
+    ('phrase.RequestTable', 'search_count'): 'last_searched_at',
+    # BM25 용어별 문서 빈도/코퍼스 행 (문서 수/전체 문서 길이) - 대사 저장마다 같은(자주 쓰는 용어) 행을 UPDATE하면 잠금 경합
+    ('phrase.SearchTermStatistic', 'document_frequency'): None,
+    ('phrase.SearchTermStatistic', 'total_length'): None,
+}
+
+# 기본 키 대신 고유 필드로 지정하는 카운터 중 반영 시 없는 행을 생성하는 (모델, 키 필드)
+# (검색 용어 행은 대사 저장마다 확보하지 않고 반영 주기마다 INSERT IGNORE 한 번)
+COUNTER_CREATE_MISSING = {('phrase.SearchTermStatistic', 'term')}
+
+# 카운터 반영 시 updated_at도 갱신하는 모델 - update()는 auto_now를 적용하지 않으므로 직접 지정
+# (RequestTable: 자동완성 트라이가 updated_at 기준으로 검색 횟수 변경분을 반영)
+COUNTER_TOUCH_UPDATED_AT = {'phrase.RequestTable'}
+
+
+class CounterBuffer:
+    """(모델, 키 필드)별 {키: {필드: 증가분}} 누적 + 주기적 일괄 반영"""
+
+    def __init__(self, interval=COUNTER_FLUSH_INTERVAL, threshold=COUNTER_FLUSH_THRESHOLD):
+        self.interval = interval
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        self.pending = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+        self.touched = defaultdict(dict)
+        self.since = {}
+        self.pending_rows = 0
+        self.wakeup = threading.Event()
+        self.thread = None
+        self.stats = {'increments': 0, 'flushes': 0, 'rows_written': 0, 'statements': 0, 'failures': 0, 'discarded': 0}
+        self.last_flush_ms = None
+
+    # ===== 적재 =====
+
+    def increment(self, model_label, pk, field, amount=1, key_field='pk'):
+        if (model_label, field) not in BUFFERED_COUNTERS:
+            raise ValueError(f"버퍼링 대상이 아닌 카운터: {model_label}.{field}")
+        if pk is None or not amount:
+            return
+
+        touch_field = BUFFERED_COUNTERS[(model_label, field)]
+        target = (model_label, key_field)
+        with self.lock:
+            rows = self.pending[target]
+            if pk not in rows:
+                self.pending_rows += 1
+            rows[pk][field] += amount
+            self.since.setdefault(target, time.time())
+            if touch_field:
+                self.touched[target][pk] = timezone.now()
+            self.stats['increments'] += 1
+            over_threshold = self.pending_rows >= self.threshold
+
+        self._ensure_thread()
+        if over_threshold:
+            self.wakeup.set()
+
+    def _ensure_thread(self):
+        if self.thread is None or not self.thread.is_alive():
+            with self.lock:
+                if self.thread is None or not self.thread.is_alive():
+                    self.thread = threading.Thread(target=self._run, name='counter-flush', daemon=True)
+                    self.thread.start()
+
+    def _run(self):
+        while True:
+            self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                connections.close_all()
+
+    # ===== 반영 =====
+
+    def _take(self):
+        """대기 중인 증가분을 꺼내고 버퍼 비우기"""
+        with self.lock:
+            pending, touched, since = self.pending, self.touched, self.since
+            self.pending = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+            self.touched = defaultdict(dict)
+            self.since = {}
+            self.pending_rows = 0
+        return pending, touched, since
+
+    def _restore(self, target, rows, touched, since):
+        """반영 실패한 증가분 되돌리기 (그 사이 쌓인 증가분과 합산)"""
+        with self.lock:
+            self.since[target] = min(since, self.since.get(target, since))
+            current = self.pending[target]
+            for pk, deltas in rows.items():
+                if pk not in current:
+                    self.pending_rows += 1
+                for field, amount in deltas.items():
+                    current[pk][field] += amount
+            for pk, touched_at in touched.items():
+                current_touched = self.touched[target].get(pk)
+                self.touched[target][pk] = max(touched_at, current_touched) if current_touched else touched_at
+
+    def flush(self):
+        """대기 중인 증가분 전체 반영 - 반영한 행 수"""
+        started = time.perf_counter()
+        pending, touched, since = self._take()
+        written = 0
+
+        for target, rows in pending.items():
+            model_label, key_field = target
+            model_touched = touched.get(target, {})
+            target_since = since.get(target, time.time())
+            try:
+                model = apps.get_model(model_label)
+                if self._is_reset(model, target_since):
+                    logger.info(f"카운터 증가분 폐기 ({model_label}, {len(rows)}개 행) - 이후 재계산됨")
+                    with self.lock:
+                        self.stats['discarded'] += len(rows)
+                    continue
+                written += self._write(model, key_field, rows, model_touched)
+            except Exception as e:
+                logger.error(f"카운터 반영 실패 ({model_label}, {len(rows)}개 행) - 다음 주기에 재시도: {e}")
+                self._restore(target, rows, model_touched, target_since)
+                with self.lock:
+                    self.stats['failures'] += 1
+
+        if pending:
+            with self.lock:
+                self.stats['flushes'] += 1
+                self.stats['rows_written'] += written
+            self.last_flush_ms = round((time.perf_counter() - started) * 1000, 1)
+            logger.debug(f"카운터 반영: {written}개 행 ({self.last_flush_ms}ms)")
+        return written
+
+    def _is_reset(self, model, since):
+        """증가분이 쌓이기 시작한 뒤에 테이블 값이 재계산되었는지 (매니저의 counters_reset_at 기준)"""
+        reset_at = getattr(model.objects, 'counters_reset_at', None)
+        if reset_at is None:
+            return False
+        reset_at = reset_at()
+        return reset_at is not None and reset_at.timestamp() >= since
+
+    def _write(self, model, key_field, rows, touched):
+        """모델 하나의 증가분 반영 - 배치당 UPDATE 한 번 (필드별 CASE), 필요하면 없는 행 INSERT 한 번"""
+        fields = {field for deltas in rows.values() for field in deltas}
+        touch_fields = {
+            BUFFERED_COUNTERS[(model._meta.label, field)] for field in fields
+        } - {None}
+        create_missing = (model._meta.label, key_field) in COUNTER_CREATE_MISSING
+        pks = list(rows)
+
+        for start in range(0, len(pks), COUNTER_FLUSH_BATCH_SIZE):
+            batch = pks[start:start + COUNTER_FLUSH_BATCH_SIZE]
+            if create_missing:
+                # 증가분이 있는 키만 생성 (감소분만 있는 키는 이미 삭제된 행 - 음수 행을 만들지 않음)
+                new_rows = [
+                    model(**{key_field: pk}) for pk in batch
+                    if any(amount > 0 for amount in rows[pk].values())
+                ]
+                if new_rows:
+                    model.objects.bulk_create(new_rows, ignore_conflicts=True)
+
+            updates = {}
+            for field in fields:
+                whens = [
+                    models.When(**{key_field: pk}, then=models.Value(rows[pk][field]))
+                    for pk in batch if rows[pk].get(field)
+                ]
+                if whens:
+                    updates[field] = models.F(field) + models.Case(
+                        *whens, default=models.Value(0), output_field=models.IntegerField()
+                    )
+            for touch_field in touch_fields:
+                whens = [
+                    models.When(**{key_field: pk}, then=models.Value(touched[pk]))
+                    for pk in batch if pk in touched
+                ]
+                if whens:
+                    updates[touch_field] = models.Case(
+                        *whens, default=models.F(touch_field), output_field=models.DateTimeField()
+                    )
+
+            if updates:
+                if model._meta.label in COUNTER_TOUCH_UPDATED_AT:
+                    updates['updated_at'] = Now()
+                model.objects.filter(**{f'{key_field}__in': batch}).update(**updates)
+                with self.lock:
+                    self.stats['statements'] += 1
+
+        return len(pks)
+
+    def statistics(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['pending_rows'] = self.pending_rows
+        stats['last_flush_ms'] = self.last_flush_ms
+        stats['flush_interval'] = self.interval
+        return stats
+
+
+# 프로세스별 버퍼
+_counter_buffer = CounterBuffer()
+
+
+def increment_counter(model_label, pk, field, amount=1, key_field='pk'):
+    """
+    카운터 증가 예약 (DB 반영은 다음 반영 주기) - 예: increment_counter('phrase.DialogueTable', 1, 'play_count')
+    key_field: pk 대신 행을 지정할 고유 필드 (예: increment_counter('phrase.SearchTermStatistic', 'love', 'document_frequency', key_field='term'))
+    """
+    _counter_buffer.increment(model_label, pk, field, amount, key_field)
+
+
+def increment_counters(model_label, pks, field, amount=1, key_field='pk'):
+    """여러 행의 같은 카운터 증가 예약"""
+    for pk in pks:
+        _counter_buffer.increment(model_label, pk, field, amount, key_field)
+
+
+def flush_counters():
+    """대기 중인 증가분 즉시 반영 (종료 훅/관리 명령/테스트용) - 반영한 행 수"""
+    try:
+        return _counter_buffer.flush()
+    except Exception as e:
+        logger.error(f"카운터 즉시 반영 실패: {e}")
+        return 0
+
+
+def get_counter_statistics():
+    """지연 쓰기 통계 (현재 프로세스) - statements/rows_written: UPDATE 문 수 대비 반영 행 수"""
+    return _counter_buffer.statistics()
+
+
+# 정상 종료(워커 재시작 포함) 시 남은 증가분 반영
+atexit.register(flush_counters)
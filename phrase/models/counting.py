@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# phrase/models/counting.py
+"""
+대용량 테이블 개수 추정
+- 필터 없는 쿼리셋: 테이블 통계 (MySQL information_schema.tables.table_rows)
+- 필터 있는 쿼리셋: 옵티마이저 행 추정 (MySQL EXPLAIN rows × filtered)
+- 추정 불가/작은 결과: 정확한 COUNT(*)를 SQL 단위로 TTL 캐싱
+"""
+import logging
+from collections import namedtuple
+from django.core.cache import cache
+from django.db import connections
+
+from phrase.caching import make_key, cache_get
+
+logger = logging.getLogger(__name__)
+
+CountEstimate = namedtuple('CountEstimate', ['count', 'is_estimate'])
+
+# 추정값이 이보다 작으면 정확한 COUNT(*) 사용 (작은 결과는 정확한 값이 저렴함)
+EXACT_COUNT_THRESHOLD = 10000
+
+# 정확한 COUNT(*) 캐시 유지 시간 (초)
+EXACT_COUNT_TTL = 120
+
+
+def _mysql_table_rows(connection, table_name):
+    """InnoDB 테이블 통계 행 수 (근사값)"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = %s",
+            [table_name]
+        )
+        row = cursor.fetchone()
+        return int(row[0]) if row and row[0] is not None else None
+
+
+def _mysql_explain_rows(connection, queryset):
+    """EXPLAIN 옵티마이저 행 추정 (기준 테이블의 rows × filtered%)"""
+    sql, params = queryset.order_by().query.sql_with_params()
+    table_name = queryset.model._meta.db_table
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN {sql}", params)
+        columns = [column[0].lower() for column in cursor.description]
+        for row in cursor.fetchall():
+            plan = dict(zip(columns, row))
+            if plan.get('table') in (table_name, None) and plan.get('rows') is not None:
+                filtered = float(plan.get('filtered') or 100.0)
+                return int(int(plan['rows']) * filtered / 100.0)
+    return None
+
+
+def _cached_exact_count(queryset):
+    """정확한 COUNT(*) - 동일 SQL은 TTL 동안 재사용"""
+    sql, params = queryset.order_by().query.sql_with_params()
+    cache_key = make_key('count_estimate', queryset.db, sql, params, normalize=False)
+
+    count = cache_get(cache_key)
+    if count is None:
+        count = queryset.order_by().count()
+        cache.set(cache_key, count, EXACT_COUNT_TTL)
+    return count
+
+
+def estimate_count(queryset, exact_threshold=EXACT_COUNT_THRESHOLD):
+    """
+    쿼리셋 개수 추정
+    반환: CountEstimate(count, is_estimate)
+    """
+    connection = connections[queryset.db]
+
+    if connection.vendor == 'mysql':
+        try:
+            if not queryset.query.where and not queryset.query.distinct:
+                estimate = _mysql_table_rows(connection, queryset.model._meta.db_table)
+            else:
+                estimate = _mysql_explain_rows(connection, queryset)
+
+            if estimate is not None and estimate >= exact_threshold:
+                return CountEstimate(estimate, True)
+        except Exception as e:
+            logger.warning(f"개수 추정 실패, 정확한 개수 사용: {e}")
+
+    return CountEstimate(_cached_exact_count(queryset), False)
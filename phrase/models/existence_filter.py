@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+# phrase/models/existence_filter.py
+"""
+기존 데이터 존재 여부 사전 확인용 블룸 필터 (프로세스별 메모리)
+- 외부 API 호출 전 "DB에 이미 있는 구문인지" 확인하는 icontains/검색 쿼리를 메모리 확인으로 대체
+- 블룸 필터는 거짓 음성이 없으므로 "없음"은 확정, "있을 수 있음"일 때만 SQL로 재확인
+- 항목:
+    요청 구문 (대소문자 무시 완전 일치)
+    요청 구문/대사 검색 텍스트의 토큰별 문자 트라이그램 (부분 문자열/토큰 검색 후보 판정)
+- 한글 검색어는 판정하지 않음 (항상 "있을 수 있음") - 대사 검색은 한글을 초성/바이그램으로 매칭하므로
+  트라이그램이 없어도 매칭될 수 있음 (거짓 음성 방지)
+- 갱신: 백그라운드 전체 빌드 + updated_at 기준 증분 반영 + post_save 신호 즉시 반영
+  (post_save 반영은 저장한 프로세스만 - 다른 프로세스는 다음 증분 갱신까지, 최대
+   EXISTENCE_FILTER_REFRESH_INTERVAL초 동안 새 행을 "없음"으로 판정할 수 있음 → 그동안은 외부 API를 다시 호출할 수 있음)
+- 삭제/수정 전 값은 제거되지 않음 (거짓 양성만 늘어남) - 주기적 전체 재빌드로 정리
+- 빌드 완료 전에는 항상 "있을 수 있음" (기존 SQL 확인과 동일하게 동작)
+"""
+import math
+import time
+import logging
+import threading
+from django.apps import apps
+from django.db import connections
+
+from .utils import normalize_search_text, tokenize_search_text, contains_hangul
+
+logger = logging.getLogger(__name__)
+
+# 목표 거짓 양성률 / 빌드 시 여유 용량 배수 / 최소 용량
+EXISTENCE_FILTER_ERROR_RATE = 0.01
+EXISTENCE_FILTER_HEADROOM = 1.5
+EXISTENCE_FILTER_MIN_CAPACITY = 100000
+
+# 증분 갱신 / 전체 재빌드 주기 (초) - 증분 갱신 주기가 다른 프로세스의 저장이 보이기까지의 최대 지연
+# (증분 갱신은 updated_at 인덱스 범위 조회 2건)
+EXISTENCE_FILTER_REFRESH_INTERVAL = 10
+EXISTENCE_FILTER_REBUILD_INTERVAL = 3600
+
+EXISTENCE_FILTER_BATCH_SIZE = 2000
+
+# 트라이그램 길이 - 이보다 짧은 토큰은 판정에 사용하지 않음 (항상 "있을 수 있음")
+GRAM_LENGTH = 3
+
+# 항목 종류별 접두사 (하나의 비트 배열 공유)
+REQUEST_PREFIX = 'r\x00'
+REQUEST_GRAM_PREFIX = 'q\x00'
+DIALOGUE_GRAM_PREFIX = 'd\x00'
+
+
+class BloomFilter:
+    """
+    비트 배열 블룸 필터
+    프로세스 내부 전용이므로 내장 hash()를 64비트로 나눠 이중 해싱 (문자열 해시는 객체에 캐시됨)
+    """
+
+    def __init__(self, capacity, error_rate=EXISTENCE_FILTER_ERROR_RATE):
+        capacity = max(int(capacity), 1)
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        # 비트 갱신은 읽기-수정-쓰기이므로 동시 추가(신호/증분 갱신) 시 비트 유실 방지
+        self.lock = threading.Lock()
+
+    def _positions(self, item):
+        value = hash(item) & 0xFFFFFFFFFFFFFFFF
+        first, second = value & 0xFFFFFFFF, (value >> 32) | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def update(self, items):
+        bits = self.bits
+        with self.lock:
+            for item in items:
+                for position in self._positions(item):
+                    bits[position >> 3] |= 1 << (position & 7)
+                self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def saturated(self):
+        return self.count > self.capacity
+
+
+def text_grams(text):
+    """정규화된 토큰별 문자 트라이그램 (토큰 경계를 넘는 트라이그램 없음)"""
+    grams = set()
+    for token in normalize_search_text(text).split():
+        for start in range(len(token) - GRAM_LENGTH + 1):
+            grams.add(token[start:start + GRAM_LENGTH])
+    return grams
+
+
+def _query_grams(text):
+    """
+    검색어가 매칭되려면 반드시 존재해야 하는 트라이그램 (판정 불가면 빈 집합)
+    한글 검색어는 초성/바이그램으로도 매칭되므로 판정 불가
+    """
+    if contains_hangul(text):
+        return set()
+    grams = set()
+    for token in tokenize_search_text(text):
+        for start in range(len(token) - GRAM_LENGTH + 1):
+            grams.add(token[start:start + GRAM_LENGTH])
+    return grams
+
+
+def _request_key(phrase):
+    return REQUEST_PREFIX + ' '.join(phrase.casefold().split())
+
+
+class ExistenceFilter:
+    """요청 구문/대사 존재 여부 필터 (원천 테이블과 동기화)"""
+
+    def __init__(self):
+        self.bloom = None
+        self.watermarks = {}
+        self.built_at = None
+        self.refreshed_at = None
+        self.checks = 0
+        self.negatives = 0
+
+    # ===== 항목 추가 =====
+
+    @staticmethod
+    def _request_items(request_phrase, request_korean):
+        items = set()
+        if request_phrase:
+            items.add(_request_key(request_phrase))
+            items.update(REQUEST_GRAM_PREFIX + gram for gram in text_grams(request_phrase))
+        if request_korean:
+            items.update(REQUEST_GRAM_PREFIX + gram for gram in text_grams(request_korean))
+        return items
+
+    @staticmethod
+    def _dialogue_items(search_text):
+        return {DIALOGUE_GRAM_PREFIX + gram for gram in text_grams(search_text)}
+
+    def add_request(self, request_phrase, request_korean=None):
+        if self.bloom is not None:
+            self.bloom.update(self._request_items(request_phrase, request_korean))
+
+    def add_dialogue(self, search_text):
+        if self.bloom is not None:
+            self.bloom.update(self._dialogue_items(search_text))
+
+    # ===== 원천 테이블 로드 =====
+
+    def _rows(self, since):
+        """(원천 이름, updated_at, 항목 집합) - since 이후 변경분 또는 전체"""
+        sources = (
+            ('request', apps.get_model('phrase', 'RequestTable'),
+             ('request_phrase', 'request_korean'), self._request_items),
+            ('dialogue', apps.get_model('phrase', 'DialogueTable'),
+             ('search_vector_full',), self._dialogue_items),
+        )
+        for name, model, fields, extract in sources:
+            queryset = model.objects.order_by()
+            watermark = since.get(name) if since is not None else None
+            if watermark is not None:
+                queryset = queryset.filter(updated_at__gte=watermark)
+
+            for updated_at, *texts in queryset.values_list('updated_at', *fields).iterator(
+                chunk_size=EXISTENCE_FILTER_BATCH_SIZE
+            ):
+                yield name, updated_at, extract(*texts)
+
+    def _track(self, name, updated_at):
+        watermark = self.watermarks.get(name)
+        if updated_at and (watermark is None or updated_at > watermark):
+            self.watermarks[name] = updated_at
+
+    def build(self):
+        """전체 빌드 - 고유 항목 수에 맞춰 비트 배열 크기 결정"""
+        started = time.monotonic()
+        items = set()
+        for name, updated_at, row_items in self._rows(since=None):
+            items |= row_items
+            self._track(name, updated_at)
+
+        bloom = BloomFilter(max(len(items) * EXISTENCE_FILTER_HEADROOM, EXISTENCE_FILTER_MIN_CAPACITY))
+        bloom.update(items)
+
+        self.bloom = bloom
+        self.built_at = self.refreshed_at = time.monotonic()
+        logger.info(
+            f"존재 확인 필터 빌드 완료: {len(items)}개 항목, {len(bloom.bits) // 1024}KB "
+            f"({(self.built_at - started) * 1000:.0f}ms)"
+        )
+        return self
+
+    def refresh(self):
+        """마지막 반영 이후 변경된 행 반영"""
+        changed = 0
+        for name, updated_at, row_items in self._rows(since=dict(self.watermarks)):
+            self.bloom.update(row_items)
+            self._track(name, updated_at)
+            changed += 1
+
+        self.refreshed_at = time.monotonic()
+        if changed:
+            logger.debug(f"존재 확인 필터 증분 갱신: {changed}개 행")
+        return changed
+
+    # ===== 확인 =====
+
+    def _check(self, items):
+        """모든 항목이 있으면 True (있을 수 있음), 하나라도 없으면 False (확정)"""
+        self.checks += 1
+        present = all(item in self.bloom for item in items)
+        if not present:
+            self.negatives += 1
+        return present
+
+    def might_have_request(self, phrase):
+        """RequestTable.request_phrase 완전 일치 행이 있을 수 있는지"""
+        return self._check([_request_key(phrase)])
+
+    def might_match_requests(self, text):
+        """request_phrase/request_korean에 부분 문자열로 포함될 수 있는지"""
+        grams = _query_grams(text)
+        return not grams or self._check([REQUEST_GRAM_PREFIX + gram for gram in grams])
+
+    def might_match_dialogues(self, text):
+        """대사 검색(부분 문자열/토큰)에 매칭되는 대사가 있을 수 있는지"""
+        grams = _query_grams(text)
+        return not grams or self._check([DIALOGUE_GRAM_PREFIX + gram for gram in grams])
+
+    def statistics(self):
+        bloom = self.bloom
+        return {
+            'ready': bloom is not None,
+            'items': bloom.count if bloom else 0,
+            'capacity': bloom.capacity if bloom else 0,
+            'size_kb': len(bloom.bits) // 1024 if bloom else 0,
+            'checks': self.checks,
+            'sql_avoided': self.negatives,
+        }
+
+
+# 프로세스별 현재 필터 (빌드 완료 전에는 None)
+_refresh_lock = threading.Lock()
+_filter_state = {'filter': None, 'building': False}
+
+
+def _run_refresh(current):
+    try:
+        if current is None or current.bloom.saturated or (
+            time.monotonic() - current.built_at >= EXISTENCE_FILTER_REBUILD_INTERVAL
+        ):
+            _filter_state['filter'] = ExistenceFilter().build()
+        else:
+            current.refresh()
+    except Exception as e:
+        logger.error(f"존재 확인 필터 갱신 실패: {e}")
+        if current is not None:
+            current.refreshed_at = time.monotonic()
+    finally:
+        connections.close_all()
+        _filter_state['building'] = False
+        _refresh_lock.release()
+
+
+def get_existence_filter():
+    """
+    현재 필터 반환 (빌드 전이면 None)
+    빌드/갱신은 모두 백그라운드 스레드에서 수행 - 요청 처리 경로에서는 대기하지 않음
+    """
+    current = _filter_state['filter']
+    due = current is None or time.monotonic() - current.refreshed_at >= EXISTENCE_FILTER_REFRESH_INTERVAL
+
+    if due and not _filter_state['building'] and _refresh_lock.acquire(blocking=False):
+        _filter_state['building'] = True
+        threading.Thread(
+            target=_run_refresh, args=(current,), name='existence-filter-refresh', daemon=True
+        ).start()
+
+    return current
+
+
+def request_might_exist(phrase):
+    """요청 구문 완전 일치 행이 있을 수 있는지 (False면 확정적으로 없음)"""
+    existence_filter = get_existence_filter()
+    return existence_filter is None or existence_filter.might_have_request(phrase)
+
+
+def request_text_might_exist(text):
+    """요청 구문/한글 요청에 부분 문자열로 포함될 수 있는지"""
+    existence_filter = get_existence_filter()
+    return existence_filter is None or existence_filter.might_match_requests(text)
+
+
+def dialogue_text_might_exist(text):
+    """대사 검색에 매칭되는 대사가 있을 수 있는지"""
+    existence_filter = get_existence_filter()
+    return existence_filter is None or existence_filter.might_match_dialogues(text)
+
+
+def note_request_saved(request_phrase, request_korean=None):
+    """요청 저장 즉시 반영 (post_save 신호)"""
+    existence_filter = _filter_state['filter']
+    if existence_filter is not None:
+        existence_filter.add_request(request_phrase, request_korean)
+
+
+def note_dialogue_saved(search_text):
+    """대사 저장 즉시 반영 (post_save 신호)"""
+    existence_filter = _filter_state['filter']
+    if existence_filter is not None:
+        existence_filter.add_dialogue(search_text)
+
+
+def get_existence_filter_statistics():
+    existence_filter = _filter_state['filter']
+    if existence_filter is None:
+        return {'ready': False}
+    return existence_filter.statistics()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# phrase/models/jobs.py
+"""
+백그라운드 작업 큐 모델
+BackgroundJob - 요청 처리 후 작업 (검색 기록, 번역, 포스터 수집 등), run_job_worker 명령이 처리
+"""
+from django.db import models
+from django.utils import timezone
+from .managers import BackgroundJobManager
+
+class BackgroundJob(models.Model):
+    """작업 1건 - priority가 높은 순, 같으면 run_at이 이른 순으로 처리"""
+    job_type = models.CharField(max_length=50, verbose_name="작업 종류")
+    payload = models.JSONField(default=dict, blank=True, verbose_name="작업 인자")
+    priority = models.SmallIntegerField(default=0, verbose_name="우선순위")
+    status = models.CharField(
+        max_length=10,
+        choices=[
+            ('queued', '대기'),
+            ('running', '실행 중'),
+            ('done', '완료'),
+            ('failed', '실패'),
+        ],
+        default='queued',
+        verbose_name="상태"
+    )
+    run_at = models.DateTimeField(default=timezone.now, verbose_name="실행 예정 시간")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수")
+    max_attempts = models.PositiveSmallIntegerField(default=3, verbose_name="최대 시도 횟수")
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name="처리 워커")
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name="선점 시간")
+    last_error = models.TextField(blank=True, verbose_name="마지막 오류")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성시간")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="완료 시간")
+
+    objects = BackgroundJobManager()
+
+    class Meta:
+        db_table = 'background_job'
+        verbose_name = "백그라운드 작업"
+        verbose_name_plural = "백그라운드 작업들"
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='background_job_claim_idx'),
+            models.Index(fields=['status', 'locked_at'], name='background_job_lock_idx'),
+            models.Index(fields=['job_type', 'status'], name='background_job_type_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_type}#{self.pk} ({self.status})"
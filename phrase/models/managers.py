@@ -6,12 +6,25 @@ Django 모델 매니저 정의 (일본어/중국어 제거)
 - 성능 최적화된 쿼리 메소드
 - 재사용 가능한 비즈니스 로직
 """
-from django.db import models
+import math
+import uuid
+from collections import Counter
+from django.db import models, transaction, connections
 from django.core.cache import cache
 from django.utils import timezone
 from django.apps import apps
 import logging
 
+from phrase.caching import make_key, cache_get, stale_while_revalidate
+from .search_backends import get_search_backend
+from .substring_index import get_substring_index
+from .counters import increment_counter, flush_counters
+from .utils import (
+    tokenize_search_text, extract_trigrams, extract_korean_grams,
+    korean_query_grams, contains_hangul, translation_source_hash,
+    seed_translation_memory
+)
+
 logger = logging.getLogger(__name__)
 
 # ===== 기본 매니저들 =====
@@ -60,36 +73,77 @@ class RequestManager(models.Manager):
         ).filter(is_active=True)
     
     def increment_search_count(self, phrase):
-        """검색 횟수 증가 (안전한 방식)"""
-        try:
-            obj = self.get(request_phrase=phrase)
-            obj.search_count = models.F('search_count') + 1
-            obj.last_searched_at = timezone.now()
-            obj.save(update_fields=['search_count', 'last_searched_at'])
-            obj.refresh_from_db(fields=['search_count'])
-            return obj
-        except self.model.DoesNotExist:
+        """검색 횟수 증가 (지연 쓰기 - 다음 반영 주기에 search_count/last_searched_at 갱신)"""
+        request_id = self.filter(request_phrase=phrase).values_list('id', flat=True).first()
+        if request_id is None:
             return None
+        increment_counter(self.model._meta.label, request_id, 'search_count')
+        return request_id
     
     def get_statistics(self):
-        """요청 통계 조회"""
-        cache_key = 'request_statistics'
-        stats = cache.get(cache_key)
-        
-        if stats is None:
-            stats = {
-                'total_requests': self.count(),
-                'active_requests': self.filter(is_active=True).count(),
-                'with_korean': self.exclude(request_korean__isnull=True).exclude(request_korean='').count(),
-                'avg_search_count': self.aggregate(avg=models.Avg('search_count'))['avg'] or 0,
-                'top_quality_distribution': dict(
-                    self.values('translation_quality').annotate(count=models.Count('id')).values_list('translation_quality', 'count')
-                )
-            }
-            # 5분간 캐싱
-            cache.set(cache_key, stats, 300)
-        
-        return stats
+        """요청 통계 조회 (정확한 집계를 주기적으로 재계산 - compute_request_statistics)"""
+        return compute_request_statistics()
+
+# ===== 테이블 통계 (정확한 집계 + stale-while-revalidate) =====
+# 요청/대사 통계는 같은 방식: 집계 쿼리 1회로 정확한 값을 계산하고, 5분이 지나면 이전 값을 반환하면서
+# 백그라운드에서 재계산 (요청 경로에서 전체 집계를 기다리는 것은 최초 1회/장기간 무요청 후뿐)
+# 추정치와 정확한 값을 섞지 않으므로 without_korean/translation_rate 등 파생값이 항상 일관됨
+
+@stale_while_revalidate('request_statistics', fresh_for=300, max_stale=1800)
+def compute_request_statistics():
+    """요청 테이블 통계 (정확한 집계)"""
+    RequestTable = apps.get_model('phrase', 'RequestTable')
+    counts = RequestTable.objects.aggregate(
+        total=models.Count('id'),
+        active=models.Count('id', filter=models.Q(is_active=True)),
+        with_korean=models.Count('id', filter=models.Q(
+            request_korean__isnull=False
+        ) & ~models.Q(request_korean='')),
+        avg_search_count=models.Avg('search_count'),
+    )
+    return {
+        'total_requests': counts['total'],
+        'active_requests': counts['active'],
+        'count_is_estimate': False,
+        'with_korean': counts['with_korean'],
+        'avg_search_count': counts['avg_search_count'] or 0,
+        'top_quality_distribution': dict(
+            RequestTable.objects.values('translation_quality').annotate(count=models.Count('id')).values_list('translation_quality', 'count')
+        )
+    }
+
+
+@stale_while_revalidate('dialogue_statistics', fresh_for=300, max_stale=1800)
+def compute_dialogue_statistics():
+    """대사 테이블 통계 (정확한 집계)"""
+    DialogueTable = apps.get_model('phrase', 'DialogueTable')
+    counts = DialogueTable.objects.aggregate(
+        total=models.Count('id'),
+        active=models.Count('id', filter=models.Q(is_active=True)),
+        with_korean=models.Count('id', filter=models.Q(
+            is_active=True, dialogue_phrase_ko__isnull=False
+        ) & ~models.Q(dialogue_phrase_ko='')),
+        avg_play_count=models.Avg('play_count'),
+    )
+    total_dialogues = counts['total']
+    with_korean = counts['with_korean']
+
+    return {
+        'total_dialogues': total_dialogues,
+        'active_dialogues': counts['active'],
+        'count_is_estimate': False,
+        'with_korean': with_korean,
+        'without_korean': total_dialogues - with_korean,
+        'translation_rate': round((with_korean / total_dialogues * 100), 1) if total_dialogues > 0 else 0,
+        'with_videos': DialogueTable.objects.with_videos().count(),
+        'avg_play_count': counts['avg_play_count'] or 0,
+        'by_translation_method': dict(
+            DialogueTable.objects.values('translation_method').annotate(count=models.Count('id')).values_list('translation_method', 'count')
+        ),
+        'by_quality': dict(
+            DialogueTable.objects.values('translation_quality').annotate(count=models.Count('id')).values_list('translation_quality', 'count')
+        )
+    }
 
 # ===== 영화 테이블 매니저 =====
 
@@ -154,20 +208,13 @@ class MovieManager(models.Manager):
         ).filter(is_active=True).distinct()
     
     def increment_view_count(self, movie_id):
-        """조회수 증가 (안전한 방식)"""
-        try:
-            movie = self.get(id=movie_id)
-            movie.view_count = models.F('view_count') + 1
-            movie.save(update_fields=['view_count'])
-            movie.refresh_from_db(fields=['view_count'])
-            return movie
-        except self.model.DoesNotExist:
-            return None
+        """조회수 증가 (지연 쓰기 - 다음 반영 주기에 일괄 UPDATE)"""
+        increment_counter(self.model._meta.label, movie_id, 'view_count')
     
     def get_statistics(self):
         """영화 통계 조회"""
-        cache_key = 'movie_statistics'
-        stats = cache.get(cache_key)
+        cache_key = make_key('movie_statistics')
+        stats = cache_get(cache_key)
         
         if stats is None:
             stats = {
@@ -219,6 +266,10 @@ class DialogueManager(models.Manager):
             models.Q(dialogue_phrase_ko='')
         ).filter(is_active=True)
     
+    def pending_translation(self):
+        """번역 대기 중인 대사들 (배치 번역 작업 대상)"""
+        return self.filter(translation_method='pending', is_active=True)
+    
     def by_translation_quality(self, quality='good'):
         """번역 품질별 조회"""
         return self.filter(translation_quality=quality, is_active=True)
@@ -254,38 +305,133 @@ class DialogueManager(models.Manager):
         ).exclude(duration_seconds__isnull=True)
     
     def search_text(self, query):
-        """텍스트 검색 (영어/한국어만 지원)"""
-        return self.filter(
-            models.Q(dialogue_phrase__icontains=query) |
-            models.Q(dialogue_phrase_ko__icontains=query) |
-            models.Q(search_vector__icontains=query.lower())
-        ).filter(is_active=True).distinct()
+        """텍스트 검색 (영어/한국어만 지원) - 부분 문자열 인덱스/검색 백엔드 경유, search_rank 주석 포함"""
+        backend = get_search_backend(self.db)
+        return backend.annotate_rank(
+            self.filter(self.text_match_q(query, backend), is_active=True),
+            query
+        )
     
-    def search_with_movie(self, query):
+    def search_any(self, *queries):
+        """여러 검색어 중 하나라도 일치하는 대사 (영어 원문 + 한글 요청 등)"""
+        queries = [query for query in queries if query]
+        if not queries:
+            return self.none()
+        
+        backend = get_search_backend(self.db)
+        condition = models.Q()
+        for query in queries:
+            condition |= self.text_match_q(query, backend)
+        
+        return backend.annotate_rank(self.filter(condition, is_active=True), queries[0])
+    
+    def search_with_movie(self, query, active_only=True):
         """영화 정보 포함 검색"""
-        return self.select_related('movie').filter(
-            models.Q(dialogue_phrase__icontains=query) |
-            models.Q(dialogue_phrase_ko__icontains=query) |
-            models.Q(movie__movie_title__icontains=query) |
-            models.Q(movie__director__icontains=query)
-        ).filter(is_active=True).distinct()
+        MovieTable = apps.get_model('phrase', 'MovieTable')
+        movie_ids = MovieTable.objects.filter(
+            models.Q(movie_title__icontains=query) |
+            models.Q(director__icontains=query)
+        ).values('id')
+        
+        backend = get_search_backend(self.db)
+        queryset = self.select_related('movie').filter(
+            self.text_match_q(query, backend) |
+            models.Q(movie_id__in=movie_ids)
+        )
+        if active_only:
+            queryset = queryset.filter(is_active=True)
+        
+        return backend.annotate_rank(queryset, query)
     
-    def increment_play_count(self, dialogue_id):
-        """재생 횟수 증가 (안전한 방식)"""
-        try:
-            dialogue = self.get(id=dialogue_id)
-            dialogue.play_count = models.F('play_count') + 1
-            dialogue.save(update_fields=['play_count'])
-            dialogue.refresh_from_db(fields=['play_count'])
-            
-            # 영화 조회수도 함께 증가 (수정된 방식)
-            movie = dialogue.movie
-            movie.view_count = models.F('view_count') + 1
-            movie.save(update_fields=['view_count'])
-            
-            return dialogue
-        except self.model.DoesNotExist:
+    def text_match_q(self, query, backend=None):
+        """
+        검색어 → 대사 매칭 조건
+        부분 문자열 인덱스 파일이 있으면 icontains와 같은 부분 문자열 의미로 매칭하고,
+        인덱스 빌드 이후 추가된 대사만 검색 백엔드로 보완
+        """
+        backend = backend or get_search_backend(self.db)
+        condition = backend.match_q(query)
+        
+        index = get_substring_index()
+        if index is not None:
+            dialogue_ids = index.search(query)
+            if dialogue_ids is not None:
+                condition = models.Q(id__in=dialogue_ids) | (
+                    models.Q(id__gt=index.max_dialogue_id) & condition
+                )
+        
+        # 한글 검색어는 어절 토큰이 거의 일치하지 않으므로 한글 n-gram 색인도 함께 사용
+        if contains_hangul(query):
+            korean_condition = self.korean_match_q(query)
+            if korean_condition is not None:
+                condition |= korean_condition
+        
+        return condition
+    
+    def korean_match_q(self, query):
+        """한글 n-gram 색인 매칭 조건 (n-gram을 만들 수 없는 검색어는 None)"""
+        grams = korean_query_grams(query)
+        if not grams:
             return None
+        
+        DialogueKoreanGram = apps.get_model('phrase', 'DialogueKoreanGram')
+        return models.Q(id__in=DialogueKoreanGram.objects.matching_dialogue_ids(grams))
+    
+    def search_korean(self, query):
+        """
+        한글 대사 검색 (음절/초성 바이그램 색인, 번역 API 호출 없음)
+        예: '사랑' → '사랑해요', 'ㅅㄹㅎ' → '사랑해'
+        """
+        condition = self.korean_match_q(query)
+        if condition is None:
+            return self.none()
+        
+        return self.select_related('movie').filter(condition, is_active=True).annotate(
+            search_rank=models.Value(0.0, output_field=models.FloatField())
+        )
+    
+    def similar_to(self, query, limit=10, threshold=0.3):
+        """
+        오타 허용 유사 대사 검색 (트라이그램 Jaccard 유사도 상위 k개)
+        similarity = 공유 트라이그램 수 / (대사 트라이그램 수 + 검색어 트라이그램 수 - 공유 수)
+        후보는 흔하지 않은 트라이그램으로 먼저 좁힌 뒤(DialogueTrigramManager.candidate_dialogue_ids)
+        후보 대사에 대해서만 전체 트라이그램으로 유사도 계산
+        """
+        query_trigrams = extract_trigrams(query)
+        if not query_trigrams:
+            return self.none()
+        
+        DialogueTrigram = apps.get_model('phrase', 'DialogueTrigram')
+        candidate_ids = DialogueTrigram.objects.candidate_dialogue_ids(query_trigrams, threshold)
+        if not candidate_ids:
+            return self.none()
+        
+        shared = models.Count('trigrams')
+        union = models.Max('trigrams__gram_count') + len(query_trigrams) - shared
+        
+        return self.select_related('movie').filter(
+            id__in=candidate_ids,
+            trigrams__trigram__in=query_trigrams,
+            is_active=True
+        ).annotate(
+            similarity=models.ExpressionWrapper(
+                shared * 1.0 / union,
+                output_field=models.FloatField()
+            )
+        ).filter(
+            similarity__gte=threshold
+        ).order_by('-similarity', '-play_count', 'id')[:limit]
+    
+    def increment_play_count(self, dialogue_id, movie_id=None):
+        """재생 횟수 증가 + 영화 조회수 증가 (지연 쓰기 - 다음 반영 주기에 일괄 UPDATE)"""
+        if movie_id is None:
+            movie_id = self.filter(id=dialogue_id).values_list('movie_id', flat=True).first()
+            if movie_id is None:
+                return None
+        
+        increment_counter(self.model._meta.label, dialogue_id, 'play_count')
+        increment_counter('phrase.MovieTable', movie_id, 'view_count')
+        return dialogue_id
     
     def needs_translation(self, language='ko'):
         """번역이 필요한 대사들 (한국어만 지원)"""
@@ -295,69 +441,539 @@ class DialogueManager(models.Manager):
             # 한국어 외 다른 언어는 지원하지 않음
             return self.none()
     
-    def update_search_vectors_bulk(self):
-        """검색 벡터 일괄 업데이트"""
-        import re
+    def update_search_vectors_bulk(self, batch_size=500):
+        """검색 벡터 및 역색인 일괄 업데이트"""
+        DialogueSearchToken = apps.get_model('phrase', 'DialogueSearchToken')
+        DialogueTrigram = apps.get_model('phrase', 'DialogueTrigram')
+        DialogueKoreanGram = apps.get_model('phrase', 'DialogueKoreanGram')
         
-        dialogues = list(self.filter(is_active=True))
+        queryset = self.filter(is_active=True).only(
+            'id', 'dialogue_phrase', 'dialogue_phrase_ko', 'search_vector', 'search_vector_full'
+        ).order_by('id')
         updated_count = 0
-        batch_size = 100
+        last_id = 0
         
-        for i in range(0, len(dialogues), batch_size):
-            batch = dialogues[i:i + batch_size]
+        while True:
+            batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
             
             for dialogue in batch:
-                # 검색 벡터 생성
-                texts = [dialogue.dialogue_phrase]
-                if dialogue.dialogue_phrase_ko:
-                    texts.append(dialogue.dialogue_phrase_ko)
-                
-                # 텍스트 정규화
-                normalized_texts = []
-                for text in texts:
-                    normalized = re.sub(r'[^\w\s]', ' ', text.lower())
-                    normalized = re.sub(r'\s+', ' ', normalized).strip()
-                    normalized_texts.append(normalized)
-                
-                dialogue.search_vector = ' '.join(normalized_texts)[:1000]
-                updated_count += 1
+                dialogue.update_search_vector()
+            
+            # 배치 업데이트 (검색 벡터 + 포스팅)
+            self.model.objects.bulk_update(batch, ['search_vector', 'search_vector_full'])
+            DialogueSearchToken.objects.sync_dialogues(batch)
+            DialogueTrigram.objects.sync_dialogues(batch)
+            DialogueKoreanGram.objects.sync_dialogues(batch)
             
-            # 배치 업데이트
-            self.model.objects.bulk_update(batch, ['search_vector'])
+            updated_count += len(batch)
+            last_id = batch[-1].id
             logger.info(f"검색 벡터 업데이트 진행: {updated_count}개 완료")
         
         logger.info(f"검색 벡터 일괄 업데이트 완료: {updated_count}개")
         return updated_count
     
     def get_statistics(self):
-        """대사 통계 조회"""
-        cache_key = 'dialogue_statistics'
-        stats = cache.get(cache_key)
+        """대사 통계 조회 (정확한 집계를 주기적으로 재계산 - compute_dialogue_statistics)"""
+        return compute_dialogue_statistics()
+
+# ===== 검색 역색인 매니저 =====
+
+class DialogueSearchTokenManager(models.Manager):
+    """대사 역색인 (토큰 → 대사 ID) 매니저"""
+    
+    def postings(self, token, prefix=False):
+        """단일 토큰의 포스팅 (대사 ID 서브쿼리)"""
+        if prefix:
+            return self.filter(token__istartswith=token).values('dialogue_id')
+        return self.filter(token=token).values('dialogue_id')
+    
+    def matching_dialogue_ids(self, tokens):
+        """
+        모든 토큰을 포함하는 대사 ID 서브쿼리 (포스팅 교집합)
+        마지막 토큰은 입력 중인 단어일 수 있으므로 접두사 매칭
+        """
+        matched = None
+        last_index = len(tokens) - 1
         
-        if stats is None:
-            total_dialogues = self.count()
-            with_korean = self.with_korean().count()
+        for index, token in enumerate(tokens):
+            postings = self.postings(token, prefix=(index == last_index))
+            if matched is not None:
+                postings = postings.filter(dialogue_id__in=matched)
+            matched = postings
+        
+        return matched
+    
+    def tokens_by_dialogue(self, dialogue_ids):
+        """대사별 현재 포스팅 토큰 집합"""
+        tokens = {}
+        for dialogue_id, token in self.filter(dialogue_id__in=dialogue_ids).values_list('dialogue_id', 'token'):
+            tokens.setdefault(dialogue_id, set()).add(token)
+        return tokens
+    
+    def sync_dialogues(self, dialogues):
+        """대사들의 포스팅을 검색 벡터 기준으로 재생성 (변경된 대사만, 용어 통계 증분 반영)"""
+        dialogues = [dialogue for dialogue in dialogues if dialogue.pk]
+        if not dialogues:
+            return 0
+        
+        existing = self.tokens_by_dialogue([dialogue.pk for dialogue in dialogues])
+        changed = {}
+        for dialogue in dialogues:
+            new_tokens = set(tokenize_search_text(dialogue.search_vector_full))
+            if new_tokens != existing.get(dialogue.pk, set()):
+                changed[dialogue.pk] = new_tokens
+        
+        if not changed:
+            return 0
+        
+        self.filter(dialogue_id__in=list(changed)).delete()
+        
+        postings = [
+            self.model(token=token, dialogue_id=dialogue_id)
+            for dialogue_id, tokens in changed.items()
+            for token in tokens
+        ]
+        self.bulk_create(postings, batch_size=1000, ignore_conflicts=True)
+        
+        SearchTermStatistic = apps.get_model('phrase', 'SearchTermStatistic')
+        SearchTermStatistic.objects.apply_changes(
+            {dialogue_id: existing.get(dialogue_id, set()) for dialogue_id in changed},
+            changed
+        )
+        return len(postings)
+    
+    def forget_dialogues(self, dialogue_ids):
+        """삭제될 대사들의 토큰을 용어 통계에서 제외 (포스팅은 CASCADE로 삭제됨)"""
+        existing = self.tokens_by_dialogue(dialogue_ids)
+        if existing:
+            SearchTermStatistic = apps.get_model('phrase', 'SearchTermStatistic')
+            SearchTermStatistic.objects.apply_changes(existing, {})
+
+class DialogueGramIndexManager(models.Manager):
+    """대사 n-gram 색인 공통 매니저 (gram_field 컬럼 + dialogue FK)"""
+    
+    gram_field = 'gram'
+    
+    def extract(self, dialogue):
+        """대사에서 색인할 n-gram 집합"""
+        raise NotImplementedError
+    
+    def build_row(self, gram, dialogue_id, grams):
+        return self.model(**{self.gram_field: gram, 'dialogue_id': dialogue_id})
+    
+    def matching_dialogue_ids(self, grams):
+        """모든 n-gram을 포함하는 대사 ID 서브쿼리 (포스팅 교집합)"""
+        matched = None
+        for gram in grams:
+            postings = self.filter(**{self.gram_field: gram}).values('dialogue_id')
+            if matched is not None:
+                postings = postings.filter(dialogue_id__in=matched)
+            matched = postings
+        return matched
+    
+    def sync_dialogues(self, dialogues):
+        """대사들의 n-gram 색인 재생성 (변경된 대사만)"""
+        dialogues = [dialogue for dialogue in dialogues if dialogue.pk]
+        if not dialogues:
+            return 0
+        
+        existing = {}
+        for dialogue_id, gram in self.filter(
+            dialogue_id__in=[dialogue.pk for dialogue in dialogues]
+        ).values_list('dialogue_id', self.gram_field):
+            existing.setdefault(dialogue_id, set()).add(gram)
+        
+        changed = {}
+        for dialogue in dialogues:
+            grams = self.extract(dialogue)
+            if grams != existing.get(dialogue.pk, set()):
+                changed[dialogue.pk] = grams
+        
+        if not changed:
+            return 0
+        
+        self.filter(dialogue_id__in=list(changed)).delete()
+        
+        rows = [
+            self.build_row(gram, dialogue_id, grams)
+            for dialogue_id, grams in changed.items()
+            for gram in grams
+        ]
+        self.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+        return len(rows)
+
+class DialogueTrigramManager(DialogueGramIndexManager):
+    """대사 트라이그램 색인 매니저 (검색 벡터 기준)"""
+    
+    gram_field = 'trigram'
+    
+    # 이보다 많은 대사에 나오는 트라이그램은 후보 선정에서 제외 ('  t', ' th' 같은 단어 앞 패딩 트라이그램 등)
+    MAX_DOCUMENT_FREQUENCY = 5000
+    
+    # 유사도 계산 대상 후보 대사 최대 수 (흔하지 않은 트라이그램을 많이 공유하는 순)
+    MAX_CANDIDATES = 500
+    
+    # 트라이그램별 대사 수 캐시 시간 (초)
+    FREQUENCY_CACHE_TIMEOUT = 3600
+    
+    def document_frequencies(self, trigrams):
+        """
+        트라이그램별 대사 수 {트라이그램: 대사 수} - MAX_DOCUMENT_FREQUENCY + 1에서 집계 중단
+        (흔한 트라이그램도 LIMIT까지만 세므로 색인 크기와 무관)
+        """
+        keys = {trigram: make_key('trigram_frequency', trigram, normalize=False) for trigram in trigrams}
+        cached = cache.get_many(list(keys.values()))
+        
+        frequencies = {}
+        for trigram, key in keys.items():
+            frequency = cached.get(key)
+            if frequency is None:
+                frequency = self.filter(trigram=trigram)[:self.MAX_DOCUMENT_FREQUENCY + 1].count()
+                cache.set(key, frequency, self.FREQUENCY_CACHE_TIMEOUT)
+            frequencies[trigram] = frequency
+        return frequencies
+    
+    def candidate_dialogue_ids(self, trigrams, threshold):
+        """
+        유사도 threshold 이상이 될 수 있는 후보 대사 ID (최대 MAX_CANDIDATES개)
+        Jaccard >= threshold면 공유 트라이그램 수 >= threshold × 검색어 트라이그램 수이므로,
+        흔한 트라이그램을 뺀 나머지 중 최소 (그 수 - 뺀 개수)개는 공유해야 함 (GROUP BY 후 HAVING)
+        흔하지 않은 트라이그램이 하나도 없으면 빈 목록 (너무 흔한 검색어는 유사 검색 생략)
+        """
+        frequencies = self.document_frequencies(trigrams)
+        selective = [trigram for trigram in trigrams if frequencies[trigram] <= self.MAX_DOCUMENT_FREQUENCY]
+        if not selective:
+            return []
+        
+        dropped = len(trigrams) - len(selective)
+        min_shared = max(1, math.ceil(threshold * len(trigrams)) - dropped)
+        if min_shared > len(selective):
+            return []
+        
+        return list(
+            self.filter(trigram__in=selective)
+            .values('dialogue_id')
+            .annotate(shared=models.Count('id'))
+            .filter(shared__gte=min_shared)
+            .order_by('-shared', 'dialogue_id')
+            .values_list('dialogue_id', flat=True)[:self.MAX_CANDIDATES]
+        )
+    
+    def extract(self, dialogue):
+        return extract_trigrams(dialogue.search_vector_full)
+    
+    def build_row(self, gram, dialogue_id, grams):
+        return self.model(trigram=gram, dialogue_id=dialogue_id, gram_count=len(grams))
+
+class DialogueKoreanGramManager(DialogueGramIndexManager):
+    """한글 대사 n-gram 색인 매니저 (dialogue_phrase_ko 기준)"""
+    
+    gram_field = 'gram'
+    
+    def extract(self, dialogue):
+        return extract_korean_grams(dialogue.dialogue_phrase_ko)
+
+class SearchTermStatisticManager(models.Manager):
+    """BM25 용어 통계 매니저 (문서 빈도 + 코퍼스 크기/길이)"""
+    
+    # 코퍼스 전체 통계를 담는 예약 행 (document_frequency=문서 수, total_length=전체 문서 길이, rebuilt_at=재구축 시각)
+    # 모든 대사 저장이 같은 행을 갱신하므로 증감분은 카운터 버퍼로 모아 주기적으로 반영 (최대 반영 주기만큼 지연)
+    # 행 ID를 기억하지 않고 용어로 지정 (롤백 등으로 행이 없으면 반영 시 생성)
+    CORPUS_TERM = '__corpus__'
+    
+    def counters_reset_at(self):
+        """
+        카운터 버퍼 반영 전 확인용 - 마지막 재구축 시각 (없으면 None)
+        이 시각 이전부터 쌓인 증감분은 재구축 값에 포함되었거나 재구축과 겹치므로 버림
+        """
+        return self.filter(term=self.CORPUS_TERM).values_list('rebuilt_at', flat=True).first()
+    
+    def apply_changes(self, old_tokens, new_tokens):
+        """
+        대사별 토큰 집합 변경분을 통계에 반영
+        old_tokens/new_tokens: {dialogue_id: set(tokens)}, 문서 길이 = 고유 토큰 수
+        """
+        term_deltas = Counter()
+        document_delta = 0
+        length_delta = 0
+        
+        for dialogue_id in set(old_tokens) | set(new_tokens):
+            old = old_tokens.get(dialogue_id, set())
+            new = new_tokens.get(dialogue_id, set())
             
-            stats = {
-                'total_dialogues': total_dialogues,
-                'active_dialogues': self.filter(is_active=True).count(),
-                'with_korean': with_korean,
-                'without_korean': total_dialogues - with_korean,
-                'translation_rate': round((with_korean / total_dialogues * 100), 1) if total_dialogues > 0 else 0,
-                'with_videos': self.with_videos().count(),
-                'avg_play_count': self.aggregate(avg=models.Avg('play_count'))['avg'] or 0,
-                'by_translation_method': dict(
-                    self.values('translation_method').annotate(count=models.Count('id')).values_list('translation_method', 'count')
-                ),
-                'by_quality': dict(
-                    self.values('translation_quality').annotate(count=models.Count('id')).values_list('translation_quality', 'count')
-                )
+            term_deltas.update(new - old)
+            term_deltas.subtract(old - new)
+            document_delta += bool(new) - bool(old)
+            length_delta += len(new) - len(old)
+        
+        # 용어별 문서 빈도도 지연 쓰기 (용어 기준, 없는 용어 행은 반영 시 일괄 생성)
+        for term, delta in term_deltas.items():
+            increment_counter(self.model._meta.label, term, 'document_frequency', delta, key_field='term')
+        
+        # 코퍼스 통계도 지연 쓰기 (트랜잭션이 롤백되어도 반영되지만 rebuild로 정정)
+        increment_counter(self.model._meta.label, self.CORPUS_TERM, 'document_frequency', document_delta, key_field='term')
+        increment_counter(self.model._meta.label, self.CORPUS_TERM, 'total_length', length_delta, key_field='term')
+    
+    def lookup(self, terms, prefix=None):
+        """
+        코퍼스 통계 및 용어별 문서 빈도 조회 (단일 쿼리)
+        반환: (문서 수, 평균 문서 길이, {용어: 문서 빈도})
+        """
+        condition = models.Q(term__in=list(terms) + [self.CORPUS_TERM])
+        if prefix:
+            condition |= models.Q(term__startswith=prefix)
+        
+        document_count = 0
+        total_length = 0
+        frequencies = {}
+        for term, frequency, length in self.filter(condition).values_list('term', 'document_frequency', 'total_length'):
+            if term == self.CORPUS_TERM:
+                document_count, total_length = frequency, length
+            else:
+                frequencies[term] = frequency
+        
+        average_length = (total_length / document_count) if document_count else 0.0
+        return document_count, average_length, frequencies
+    
+    def rebuild(self):
+        """
+        역색인(포스팅)으로부터 통계 전체 재계산
+        다른 프로세스 버퍼에 남은 이전 증감분은 코퍼스 행의 rebuilt_at으로 걸러짐 (counters_reset_at)
+        """
+        DialogueSearchToken = apps.get_model('phrase', 'DialogueSearchToken')
+        rebuilt_at = timezone.now()
+        
+        # 이 프로세스의 대기 중인 용어/코퍼스 증감분 반영 (재계산 값에 이미 포함)
+        flush_counters()
+        
+        frequencies = DialogueSearchToken.objects.values('token').annotate(
+            frequency=models.Count('dialogue_id')
+        ).values_list('token', 'frequency')
+        
+        statistics = [
+            self.model(term=term, document_frequency=frequency)
+            for term, frequency in frequencies.iterator()
+        ]
+        
+        with transaction.atomic(using=self.db):
+            self.exclude(term=self.CORPUS_TERM).delete()
+            self.bulk_create(statistics, batch_size=1000)
+            self.update_or_create(
+                term=self.CORPUS_TERM,
+                defaults={
+                    'document_frequency': DialogueSearchToken.objects.values('dialogue_id').distinct().count(),
+                    'total_length': DialogueSearchToken.objects.count(),
+                    'rebuilt_at': rebuilt_at,
+                }
+            )
+        
+        logger.info(f"검색 용어 통계 재구축 완료: {len(statistics)}개 용어")
+        return len(statistics)
+
+# ===== 번역 메모리 매니저 =====
+
+class TranslationMemoryManager(models.Manager):
+    """번역 메모리 매니저 (원문 해시 단위 일괄 조회/저장)"""
+    
+    # 이 점수 미만의 번역은 조회 결과로 사용하지 않음 (번역 API로 재번역)
+    MIN_QUALITY_SCORE = 0.5
+    
+    # 해시 IN 조건 한 번에 넣을 최대 개수
+    LOOKUP_CHUNK_SIZE = 500
+    
+    def lookup_many(self, texts, langpair):
+        """
+        원문 목록의 번역 일괄 조회 - {원문: 번역} (없는 원문은 제외)
+        적중한 항목은 hit_count/last_used_at을 한 번의 UPDATE로 갱신
+        """
+        texts_by_hash = {}
+        for text in texts:
+            if text and text.strip():
+                texts_by_hash.setdefault(translation_source_hash(text, langpair), []).append(text)
+        
+        hashes = list(texts_by_hash)
+        found = {}
+        hit_ids = []
+        for start in range(0, len(hashes), self.LOOKUP_CHUNK_SIZE):
+            entries = self.filter(
+                source_hash__in=hashes[start:start + self.LOOKUP_CHUNK_SIZE],
+                quality_score__gte=self.MIN_QUALITY_SCORE
+            ).values_list('id', 'source_hash', 'translated_text')
+            
+            for entry_id, source_hash, translated_text in entries:
+                hit_ids.append(entry_id)
+                for text in texts_by_hash[source_hash]:
+                    found[text] = translated_text
+        
+        if hit_ids:
+            self.filter(id__in=hit_ids).update(
+                hit_count=models.F('hit_count') + 1,
+                last_used_at=timezone.now()
+            )
+        return found
+    
+    def lookup(self, text, langpair):
+        """원문 하나의 번역 조회 (없으면 None)"""
+        return self.lookup_many([text], langpair).get(text)
+    
+    def remember(self, source_text, translated_text, langpair, quality_score, origin='api'):
+        """번역 저장 - 같은 원문의 기존 번역보다 점수가 같거나 높을 때만 덮어씀"""
+        entry, created = self.get_or_create(
+            source_hash=translation_source_hash(source_text, langpair),
+            defaults={
+                'langpair': langpair,
+                'source_text': source_text,
+                'translated_text': translated_text,
+                'quality_score': quality_score,
+                'origin': origin,
             }
-            # 5분간 캐싱
-            cache.set(cache_key, stats, 300)
+        )
         
+        if not created and quality_score >= entry.quality_score and translated_text != entry.translated_text:
+            self.filter(pk=entry.pk).update(
+                translated_text=translated_text,
+                quality_score=quality_score,
+                origin=origin
+            )
+        return entry
+    
+    def seed_from_existing(self, batch_size=1000):
+        """기존 대사/요청 번역 쌍으로 시드 - 추가된 항목 수"""
+        DialogueTable = apps.get_model('phrase', 'DialogueTable')
+        RequestTable = apps.get_model('phrase', 'RequestTable')
+        
+        added = seed_translation_memory(self.model, DialogueTable, RequestTable, batch_size)
+        logger.info(f"번역 메모리 시드 완료: {added}개 추가")
+        return added
+    
+    def get_statistics(self):
+        """번역 메모리 규모/적중 통계"""
+        stats = self.aggregate(
+            entries=models.Count('id'),
+            total_hits=models.Sum('hit_count'),
+            average_score=models.Avg('quality_score')
+        )
+        stats['by_origin'] = dict(
+            self.values_list('origin').annotate(count=models.Count('id')).values_list('origin', 'count')
+        )
         return stats
 
+# ===== 백그라운드 작업 매니저 =====
+
+class BackgroundJobManager(models.Manager):
+    """백그라운드 작업 큐 매니저 (등록/선점/완료/재시도)"""
+    
+    # 재시도 대기 시간 (초) - 시도 횟수마다 2배
+    RETRY_BASE_DELAY = 30
+    
+    def enqueue(self, job_type, payload=None, priority=0, delay=0, max_attempts=3):
+        """작업 등록 (현재 트랜잭션과 함께 커밋되므로 커밋 전에는 워커에 보이지 않음)"""
+        return self.create(
+            job_type=job_type,
+            payload=payload or {},
+            priority=priority,
+            run_at=timezone.now() + timezone.timedelta(seconds=delay),
+            max_attempts=max_attempts
+        )
+    
+    def claim(self, worker_id, limit, job_types=None):
+        """
+        실행할 작업 최대 limit개 선점 - 선점한 작업 목록
+        SKIP LOCKED 지원 DB(MySQL 8/PostgreSQL): 다른 워커가 잠근 행은 건너뛰고 선택
+        미지원 DB(SQLite): 조건부 UPDATE(status='queued')로 선점 - 경쟁에서 진 행은 결과에서 제외
+        """
+        now = timezone.now()
+        queryset = self.filter(status='queued', run_at__lte=now)
+        if job_types:
+            queryset = queryset.filter(job_type__in=job_types)
+        queryset = queryset.order_by('-priority', 'run_at', 'id')
+        
+        # 이번 선점 식별자 (같은 워커의 이전 선점과 구분)
+        token = f"{worker_id}:{uuid.uuid4().hex[:8]}"
+        
+        with transaction.atomic(using=self.db):
+            if connections[self.db].features.has_select_for_update_skip_locked:
+                queryset = queryset.select_for_update(skip_locked=True)
+            job_ids = list(queryset.values_list('id', flat=True)[:limit])
+            if not job_ids:
+                return []
+            
+            self.filter(id__in=job_ids, status='queued').update(
+                status='running',
+                locked_by=token,
+                locked_at=now,
+                attempts=models.F('attempts') + 1
+            )
+        
+        return list(self.filter(locked_by=token, status='running').order_by('-priority', 'run_at', 'id'))
+    
+    def complete(self, job):
+        """작업 완료 처리"""
+        self.filter(pk=job.pk, locked_by=job.locked_by).update(
+            status='done',
+            finished_at=timezone.now(),
+            last_error=''
+        )
+    
+    def fail(self, job, error):
+        """작업 실패 처리 - 시도 횟수가 남았으면 지수 백오프 후 재실행"""
+        now = timezone.now()
+        if job.attempts >= job.max_attempts:
+            updates = {'status': 'failed', 'finished_at': now}
+        else:
+            delay = self.RETRY_BASE_DELAY * 2 ** (job.attempts - 1)
+            updates = {'status': 'queued', 'run_at': now + timezone.timedelta(seconds=delay), 'locked_by': ''}
+        
+        self.filter(pk=job.pk, locked_by=job.locked_by).update(last_error=str(error)[:2000], **updates)
+        return updates['status']
+    
+    def requeue_stale(self, timeout=600):
+        """
+        선점 후 timeout초가 지나도록 끝나지 않은 작업 복구 (워커 비정상 종료)
+        시도 횟수가 남은 작업은 대기로, 다 쓴 작업은 실패로 - 복구한 작업 수
+        """
+        cutoff = timezone.now() - timezone.timedelta(seconds=timeout)
+        stale = self.filter(status='running', locked_at__lt=cutoff)
+        
+        failed = stale.filter(attempts__gte=models.F('max_attempts')).update(
+            status='failed', finished_at=timezone.now(), last_error='워커 응답 없음 (선점 시간 초과)'
+        )
+        requeued = stale.update(status='queued', locked_by='', run_at=timezone.now())
+        
+        if failed or requeued:
+            logger.warning(f"중단된 작업 복구: {requeued}개 재실행, {failed}개 실패 처리")
+        return failed + requeued
+    
+    def cleanup_finished(self, days=7):
+        """완료된 작업 정리 (실패 작업은 확인용으로 유지) - 삭제한 작업 수"""
+        cutoff = timezone.now() - timezone.timedelta(days=days)
+        deleted_count = self.filter(status='done', finished_at__lt=cutoff).delete()[0]
+        if deleted_count:
+            logger.info(f"완료된 작업 {deleted_count}개 정리")
+        return deleted_count
+    
+    def get_statistics(self):
+        """상태별/작업 종류별 작업 수 및 가장 오래 기다린 작업의 대기 시간"""
+        by_status = dict(
+            self.values_list('status').annotate(count=models.Count('id')).values_list('status', 'count')
+        )
+        by_type = {}
+        for job_type, status, count in self.exclude(status='done').values_list('job_type', 'status').annotate(
+            count=models.Count('id')
+        ).values_list('job_type', 'status', 'count'):
+            by_type.setdefault(job_type, {})[status] = count
+        
+        oldest = self.filter(status='queued', run_at__lte=timezone.now()).aggregate(
+            oldest=models.Min('run_at')
+        )['oldest']
+        return {
+            'by_status': by_status,
+            'by_type': by_type,
+            'oldest_queued_seconds': round((timezone.now() - oldest).total_seconds(), 1) if oldest else 0,
+        }
+
 # ===== 사용자 검색 매니저 =====
 
 class UserSearchQueryManager(models.Manager):
@@ -418,15 +1034,10 @@ class CacheInvalidationManager(models.Manager):
 # ===== 매니저 유틸리티 함수 =====
 
 def clear_all_model_caches():
-    """모든 모델 관련 캐시 초기화"""
-    cache_keys = [
-        'request_statistics',
-        'movie_statistics', 
-        'dialogue_statistics'
-    ]
-    
-    for key in cache_keys:
-        cache.delete(key)
+    """모든 모델 관련 캐시 초기화 (요청/대사 통계는 삭제 대신 즉시 재계산)"""
+    cache.delete(make_key('movie_statistics'))
+    compute_request_statistics.refresh()
+    compute_dialogue_statistics.refresh()
     
     logger.info("모든 모델 캐시 초기화 완료")
 
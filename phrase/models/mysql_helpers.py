@@ -90,18 +90,25 @@ def check_mysql_settings():
     
     return recommendations
 
-def create_fulltext_index_for_mysql(table_name, columns):
-    """MySQL FULLTEXT 인덱스 생성"""
+def get_fulltext_index_sql(table_name, columns, index_name=None, parser=None):
+    """MySQL FULLTEXT 인덱스 생성/삭제 SQL 반환 (parser='ngram' 지정 시 CJK 검색 지원)"""
     column_list = ', '.join(columns)
-    index_name = f"ft_idx_{table_name}_{'_'.join(columns)}"
+    if not index_name:
+        index_name = f"ft_idx_{table_name}_{'_'.join(columns)}"
     
-    return RunSQL(
-        f"""
+    parser_clause = f" WITH PARSER {parser}" if parser else ''
+    sql = f"""
         ALTER TABLE {table_name} 
-        ADD FULLTEXT INDEX {index_name} ({column_list})
-        """,
-        reverse_sql=f"ALTER TABLE {table_name} DROP INDEX {index_name}"
-    )
+        ADD FULLTEXT INDEX {index_name} ({column_list}){parser_clause}
+        """
+    
+    return sql, f"ALTER TABLE {table_name} DROP INDEX {index_name}"
+
+def create_fulltext_index_for_mysql(table_name, columns, index_name=None, parser=None):
+    """MySQL FULLTEXT 인덱스 생성"""
+    sql, reverse_sql = get_fulltext_index_sql(table_name, columns, index_name, parser)
+    
+    return RunSQL(sql, reverse_sql=reverse_sql)
 
 def get_mysql_migration_operations():
     """MySQL 특화 마이그레이션 작업 목록 반환"""
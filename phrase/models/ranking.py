@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# phrase/models/ranking.py
+"""
+검색 결과 랭킹
+BM25 - 후보 대사의 search_vector_full 토큰과 SearchTermStatistic 문서 빈도로 점수 계산
+(코퍼스 재스캔 없이 후보 수에 비례하는 비용)
+"""
+import math
+import logging
+from collections import Counter
+from django.apps import apps
+
+from .utils import normalize_search_text, tokenize_search_text
+
+logger = logging.getLogger(__name__)
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def bm25_idf(document_count, document_frequency):
+    """BM25 역문서 빈도 (음수가 되지 않는 변형)"""
+    return math.log(1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+
+def rank_dialogues_bm25(dialogues, query):
+    """
+    후보 대사들을 BM25 점수 순으로 정렬 (각 대사에 search_score 속성 설정)
+    마지막 검색 토큰은 검색과 동일하게 접두사로 매칭
+    문서 길이는 통계와 동일하게 고유 토큰 수 기준
+    """
+    dialogues = list(dialogues)
+    tokens = tokenize_search_text(query)
+    if not dialogues or not tokens:
+        return dialogues
+
+    SearchTermStatistic = apps.get_model('phrase', 'SearchTermStatistic')
+    prefix = tokens[-1]
+    document_count, average_length, frequencies = SearchTermStatistic.objects.lookup(tokens, prefix=prefix)
+
+    # 통계가 비어 있으면 후보 집합으로 근사
+    if not document_count:
+        document_count = len(dialogues)
+
+    idf = {
+        token: bm25_idf(document_count, frequencies.get(token, 0))
+        for token in tokens[:-1]
+    }
+    # 접두사 토큰: 확장 용어 중 가장 흔한 용어의 문서 빈도 사용 (보수적인 idf)
+    prefix_frequency = max(
+        [frequency for term, frequency in frequencies.items() if term.startswith(prefix)],
+        default=0
+    )
+    prefix_idf = bm25_idf(document_count, prefix_frequency)
+
+    for dialogue in dialogues:
+        term_counts = Counter(normalize_search_text(dialogue.search_vector_full).split())
+        length = len(term_counts)
+        length_norm = BM25_K1 * (1 - BM25_B + BM25_B * (length / average_length if average_length else 1.0))
+
+        score = 0.0
+        for token, token_idf in idf.items():
+            tf = term_counts.get(token, 0)
+            if tf:
+                score += token_idf * tf * (BM25_K1 + 1) / (tf + length_norm)
+
+        prefix_tf = sum(count for term, count in term_counts.items() if term.startswith(prefix))
+        if prefix_tf:
+            score += prefix_idf * prefix_tf * (BM25_K1 + 1) / (prefix_tf + length_norm)
+
+        dialogue.search_score = score
+
+    dialogues.sort(key=lambda dialogue: (-dialogue.search_score, -(dialogue.play_count or 0), dialogue.id))
+    return dialogues
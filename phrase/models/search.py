@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# phrase/models/search.py
+"""
+검색 인덱스 모델
+DialogueSearchToken - 대사 역색인 (토큰 → 대사 ID 포스팅)
+SearchTermStatistic - BM25 랭킹용 용어 통계 (문서 빈도, 코퍼스 크기)
+DialogueTrigram - 오타 허용 검색용 트라이그램 색인
+DialogueKoreanGram - 한글 대사 음절/초성 바이그램 색인
+"""
+from django.db import models
+from .managers import (
+    DialogueSearchTokenManager, SearchTermStatisticManager,
+    DialogueTrigramManager, DialogueKoreanGramManager
+)
+from .utils import SEARCH_TOKEN_MAX_LENGTH
+
+class DialogueSearchToken(models.Model):
+    """대사 역색인 포스팅 - DialogueTable.update_search_vector() 결과에서 생성"""
+    token = models.CharField(max_length=SEARCH_TOKEN_MAX_LENGTH, verbose_name="토큰")
+    dialogue = models.ForeignKey(
+        'phrase.DialogueTable',
+        related_name='search_tokens',
+        on_delete=models.CASCADE,
+        verbose_name="대사"
+    )
+    
+    objects = DialogueSearchTokenManager()
+    
+    class Meta:
+        db_table = 'dialogue_search_token'
+        verbose_name = "대사 검색 토큰"
+        verbose_name_plural = "대사 검색 토큰들"
+        constraints = [
+            models.UniqueConstraint(fields=['token', 'dialogue'], name='unique_dialogue_search_token'),
+        ]
+    
+    def __str__(self):
+        return f"{self.token} → {self.dialogue_id}"
+
+
+class SearchTermStatistic(models.Model):
+    """용어별 문서 빈도 - 포스팅 동기화 시 증분 갱신, CORPUS_TERM 행은 코퍼스 전체 통계"""
+    term = models.CharField(max_length=SEARCH_TOKEN_MAX_LENGTH, unique=True, verbose_name="용어")
+    document_frequency = models.BigIntegerField(default=0, verbose_name="문서 빈도")
+    total_length = models.BigIntegerField(default=0, verbose_name="전체 문서 길이")
+    rebuilt_at = models.DateTimeField(null=True, blank=True, verbose_name="재구축 시각")
+    
+    objects = SearchTermStatisticManager()
+    
+    class Meta:
+        db_table = 'search_term_statistic'
+        verbose_name = "검색 용어 통계"
+        verbose_name_plural = "검색 용어 통계들"
+    
+    def __str__(self):
+        return f"{self.term} (df={self.document_frequency})"
+
+
+class DialogueTrigram(models.Model):
+    """대사 트라이그램 - gram_count는 해당 대사의 전체 트라이그램 수 (Jaccard 계산용)"""
+    trigram = models.CharField(max_length=3, verbose_name="트라이그램")
+    dialogue = models.ForeignKey(
+        'phrase.DialogueTable',
+        related_name='trigrams',
+        on_delete=models.CASCADE,
+        verbose_name="대사"
+    )
+    gram_count = models.PositiveIntegerField(default=0, verbose_name="대사 트라이그램 수")
+    
+    objects = DialogueTrigramManager()
+    
+    class Meta:
+        db_table = 'dialogue_trigram'
+        verbose_name = "대사 트라이그램"
+        verbose_name_plural = "대사 트라이그램들"
+        constraints = [
+            models.UniqueConstraint(fields=['trigram', 'dialogue'], name='unique_dialogue_trigram'),
+        ]
+    
+    def __str__(self):
+        return f"'{self.trigram}' → {self.dialogue_id}"
+
+
+class DialogueKoreanGram(models.Model):
+    """한글 대사 n-gram - 음절 바이그램('사랑') 및 초성 바이그램('ㅅㄹ')"""
+    gram = models.CharField(max_length=2, verbose_name="n-gram")
+    dialogue = models.ForeignKey(
+        'phrase.DialogueTable',
+        related_name='korean_grams',
+        on_delete=models.CASCADE,
+        verbose_name="대사"
+    )
+    
+    objects = DialogueKoreanGramManager()
+    
+    class Meta:
+        db_table = 'dialogue_korean_gram'
+        verbose_name = "한글 대사 n-gram"
+        verbose_name_plural = "한글 대사 n-gram들"
+        constraints = [
+            models.UniqueConstraint(fields=['gram', 'dialogue'], name='unique_dialogue_korean_gram'),
+        ]
+    
+    def __str__(self):
+        return f"'{self.gram}' → {self.dialogue_id}"
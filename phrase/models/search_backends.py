@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+# phrase/models/search_backends.py
+"""
+대사 전문 검색 백엔드
+- TokenIndexSearchBackend: 역색인 테이블(dialogue_search_token) 기반 (기본/대체)
+- MySQLFullTextSearchBackend: MySQL FULLTEXT (ngram parser) + MATCH ... AGAINST
+- SQLiteFTS5SearchBackend: SQLite FTS5 가상 테이블 + bm25 (로컬 개발/벤치마크용)
+
+DialogueManager의 검색 메서드는 get_search_backend()로 선택된 백엔드를 통해 실행됨
+"""
+import logging
+from django.apps import apps
+from django.conf import settings
+from django.db import connections, models
+from django.db.models.expressions import RawSQL
+
+from .mysql_helpers import get_fulltext_index_sql
+from .utils import tokenize_search_text
+
+logger = logging.getLogger(__name__)
+
+# 전문 검색 대상 컬럼 (dialogue_table)
+FULLTEXT_TABLE = 'dialogue_table'
+FULLTEXT_COLUMNS = ('dialogue_phrase', 'dialogue_phrase_ko', 'search_vector_full')
+
+
+class BaseSearchBackend:
+    """검색 백엔드 기본 클래스"""
+
+    name = 'base'
+    vendor = None
+
+    def is_installed(self, connection):
+        """백엔드에 필요한 인덱스가 설치되어 있는지 확인"""
+        return True
+
+    def install(self, connection):
+        """인덱스 생성"""
+
+    def uninstall(self, connection):
+        """인덱스 삭제"""
+
+    def rebuild(self, connection):
+        """인덱스 재구축"""
+
+    def match_q(self, query):
+        """검색어와 일치하는 대사 조건 (다른 조건과 OR 결합 가능하도록 독립적인 Q 반환)"""
+        tokens = tokenize_search_text(query)
+        if not tokens:
+            return models.Q(search_vector__icontains=(query or '').lower())
+        return self.tokens_q(tokens)
+
+    def tokens_q(self, tokens):
+        raise NotImplementedError
+
+    def rank_expression(self, query):
+        """관련도 점수 표현식 (값이 클수록 관련도 높음)"""
+        return models.Value(0.0, output_field=models.FloatField())
+
+    def annotate_rank(self, queryset, query):
+        """search_rank 주석 추가"""
+        return queryset.annotate(search_rank=self.rank_expression(query))
+
+    def search(self, queryset, query):
+        """검색 + 관련도 주석"""
+        return self.annotate_rank(queryset.filter(self.match_q(query)), query)
+
+
+class TokenIndexSearchBackend(BaseSearchBackend):
+    """역색인(토큰 포스팅) 검색 백엔드 - 모든 DB에서 동작"""
+
+    name = 'token'
+
+    def tokens_q(self, tokens):
+        DialogueSearchToken = apps.get_model('phrase', 'DialogueSearchToken')
+        return models.Q(id__in=DialogueSearchToken.objects.matching_dialogue_ids(tokens))
+
+
+class MySQLFullTextSearchBackend(BaseSearchBackend):
+    """MySQL FULLTEXT (ngram parser) 검색 백엔드"""
+
+    name = 'mysql_fulltext'
+    vendor = 'mysql'
+    index_name = 'ft_dialogue_search'
+
+    # ngram_token_size 기본값 - 이보다 짧은 토큰은 ngram 인덱스로 찾을 수 없음
+    min_token_length = 2
+
+    @property
+    def match_sql(self):
+        columns = ', '.join(f"{FULLTEXT_TABLE}.{column}" for column in FULLTEXT_COLUMNS)
+        return f"MATCH({columns}) AGAINST (%s IN BOOLEAN MODE)"
+
+    def is_installed(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s LIMIT 1",
+                [FULLTEXT_TABLE, self.index_name]
+            )
+            return cursor.fetchone() is not None
+
+    def install(self, connection):
+        sql, _ = get_fulltext_index_sql(FULLTEXT_TABLE, FULLTEXT_COLUMNS, self.index_name, parser='ngram')
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+
+    def uninstall(self, connection):
+        _, reverse_sql = get_fulltext_index_sql(FULLTEXT_TABLE, FULLTEXT_COLUMNS, self.index_name, parser='ngram')
+        with connection.cursor() as cursor:
+            cursor.execute(reverse_sql)
+
+    def boolean_query(self, tokens):
+        """BOOLEAN MODE 검색식 (모든 토큰 필수, 마지막 토큰은 접두사)"""
+        terms = [f'+"{token}"' for token in tokens[:-1]]
+        terms.append(f'+{tokens[-1]}*')
+        return ' '.join(terms)
+
+    def tokens_q(self, tokens):
+        if any(len(token) < self.min_token_length for token in tokens):
+            return TokenIndexSearchBackend().tokens_q(tokens)
+
+        return models.Q(id__in=RawSQL(
+            f"SELECT id FROM {FULLTEXT_TABLE} WHERE {self.match_sql}",
+            [self.boolean_query(tokens)]
+        ))
+
+    def rank_expression(self, query):
+        tokens = tokenize_search_text(query)
+        if not tokens or any(len(token) < self.min_token_length for token in tokens):
+            return super().rank_expression(query)
+        return RawSQL(self.match_sql, [self.boolean_query(tokens)], output_field=models.FloatField())
+
+
+class SQLiteFTS5SearchBackend(BaseSearchBackend):
+    """SQLite FTS5 가상 테이블 검색 백엔드 (external content + 트리거 동기화)"""
+
+    name = 'sqlite_fts5'
+    vendor = 'sqlite'
+    fts_table = 'dialogue_fts'
+
+    def is_installed(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [self.fts_table]
+            )
+            return cursor.fetchone() is not None
+
+    def install(self, connection):
+        columns = ', '.join(FULLTEXT_COLUMNS)
+        new_values = ', '.join(f"new.{column}" for column in FULLTEXT_COLUMNS)
+        old_values = ', '.join(f"old.{column}" for column in FULLTEXT_COLUMNS)
+
+        statements = [
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts_table} USING fts5(
+                {columns},
+                content='{FULLTEXT_TABLE}', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {self.fts_table}_ai AFTER INSERT ON {FULLTEXT_TABLE} BEGIN
+                INSERT INTO {self.fts_table}(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {self.fts_table}_ad AFTER DELETE ON {FULLTEXT_TABLE} BEGIN
+                INSERT INTO {self.fts_table}({self.fts_table}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {self.fts_table}_au AFTER UPDATE OF {columns} ON {FULLTEXT_TABLE} BEGIN
+                INSERT INTO {self.fts_table}({self.fts_table}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {self.fts_table}(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+            """,
+        ]
+
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+        self.rebuild(connection)
+
+    def uninstall(self, connection):
+        with connection.cursor() as cursor:
+            for suffix in ('ai', 'ad', 'au'):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {self.fts_table}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {self.fts_table}")
+
+    def rebuild(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('rebuild')")
+
+    def match_query(self, tokens):
+        """FTS5 MATCH 검색식 (모든 토큰 AND, 마지막 토큰은 접두사)"""
+        terms = [f'"{token}"' for token in tokens[:-1]]
+        terms.append(f'"{tokens[-1]}"*')
+        return ' '.join(terms)
+
+    def tokens_q(self, tokens):
+        return models.Q(id__in=RawSQL(
+            f"SELECT rowid FROM {self.fts_table} WHERE {self.fts_table} MATCH %s",
+            [self.match_query(tokens)]
+        ))
+
+    def rank_expression(self, query):
+        tokens = tokenize_search_text(query)
+        if not tokens:
+            return super().rank_expression(query)
+        
+        # bm25()는 값이 작을수록 관련도가 높으므로 부호 반전
+        return RawSQL(
+            f"SELECT -bm25({self.fts_table}) FROM {self.fts_table} "
+            f"WHERE {self.fts_table} MATCH %s AND rowid = {FULLTEXT_TABLE}.id",
+            [self.match_query(tokens)],
+            output_field=models.FloatField()
+        )
+
+
+SEARCH_BACKENDS = {
+    backend.name: backend
+    for backend in (TokenIndexSearchBackend, MySQLFullTextSearchBackend, SQLiteFTS5SearchBackend)
+}
+
+# DB 별칭별 선택된 백엔드 캐시
+_backend_cache = {}
+
+
+def get_search_backend(using='default'):
+    """
+    DB 별칭에 맞는 검색 백엔드 반환
+    settings.PHRASE_SEARCH_BACKEND: 'auto'(기본) | 'token' | 'mysql_fulltext' | 'sqlite_fts5'
+    전문 검색 인덱스가 설치되지 않은 경우 역색인 백엔드로 대체
+    """
+    if using in _backend_cache:
+        return _backend_cache[using]
+
+    connection = connections[using]
+    configured = getattr(settings, 'PHRASE_SEARCH_BACKEND', 'auto')
+
+    if configured == 'auto':
+        candidates = [
+            backend for backend in SEARCH_BACKENDS.values()
+            if backend.vendor == connection.vendor
+        ]
+    else:
+        candidates = [SEARCH_BACKENDS[configured]] if configured in SEARCH_BACKENDS else []
+
+    backend = TokenIndexSearchBackend()
+    for backend_class in candidates:
+        candidate = backend_class()
+        try:
+            if candidate.vendor in (None, connection.vendor) and candidate.is_installed(connection):
+                backend = candidate
+                break
+        except Exception as e:
+            logger.warning(f"검색 백엔드 확인 실패 ({candidate.name}): {e}")
+
+    logger.info(f"대사 검색 백엔드 선택: {backend.name} (db={using})")
+    _backend_cache[using] = backend
+    return backend
+
+
+def reset_search_backend_cache():
+    """백엔드 선택 캐시 초기화 (인덱스 설치/삭제 후 호출)"""
+    _backend_cache.clear()
+
+
+def install_fulltext_backends(connection):
+    """현재 DB 벤더에 맞는 전문 검색 인덱스 설치 (마이그레이션/관리 명령용)"""
+    for backend_class in SEARCH_BACKENDS.values():
+        if backend_class.vendor != connection.vendor:
+            continue
+
+        backend = backend_class()
+        try:
+            if not backend.is_installed(connection):
+                backend.install(connection)
+                logger.info(f"전문 검색 인덱스 설치 완료: {backend.name}")
+        except Exception as e:
+            # FTS5 미지원 SQLite 빌드 등 - 역색인 백엔드로 계속 동작
+            logger.warning(f"전문 검색 인덱스 설치 실패 ({backend.name}): {e}")
+
+    reset_search_backend_cache()
+
+
+def uninstall_fulltext_backends(connection):
+    """현재 DB 벤더에 맞는 전문 검색 인덱스 삭제"""
+    for backend_class in SEARCH_BACKENDS.values():
+        if backend_class.vendor != connection.vendor:
+            continue
+
+        backend = backend_class()
+        if backend.is_installed(connection):
+            backend.uninstall(connection)
+
+    reset_search_backend_cache()
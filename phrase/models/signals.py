@@ -2,53 +2,127 @@
 # phrase/models/signals.py
 """
 Django 신호 처리
-모델 변경 시 캐시 무효화 및 파일 정리
+모델 변경 시 캐시 무효화, 번역 대기 대사 배치 번역 등록 및 파일 정리
 """
 import os
 import logging
 from django.core.cache import cache
-from django.db.models.signals import post_save, post_delete
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete
 from django.dispatch import receiver
 
+from phrase.caching import (
+    make_key, bump_tags, SEARCH_TAG, REQUESTS_TAG, dialogue_tag, movie_tag
+)
+from .existence_filter import note_request_saved, note_dialogue_saved
+
 # 순환 임포트를 피하기 위해 함수 내부에서 임포트
 logger = logging.getLogger(__name__)
 
+# 변경 시 검색 결과 집합이 달라질 수 있는 필드 (그 외 필드는 해당 대사/영화 태그만 무효화)
+DIALOGUE_SEARCH_FIELDS = {
+    'dialogue_phrase', 'dialogue_phrase_ko', 'search_vector', 'search_vector_full', 'is_active', 'movie'
+}
+MOVIE_SEARCH_FIELDS = {'movie_title', 'director', 'release_year', 'is_active'}
+
+def _affects_search(created, update_fields, search_fields):
+    return created or update_fields is None or bool(search_fields & set(update_fields))
+
 @receiver(post_save, sender='phrase.RequestTable')
 def invalidate_request_cache(sender, instance, **kwargs):
-    """요청 테이블 변경 시 관련 캐시 무효화"""
-    cache_keys = [
-        f"search_result_{hash(instance.request_phrase)}",
-        f"search_results_{hash(f'{instance.request_phrase}_{instance.request_korean}')}",
-        'request_statistics',
-    ]
-    
-    for key in cache_keys:
-        cache.delete(key)
+    """요청 테이블 변경 시 관련 캐시 무효화 (요청 통계는 stale-while-revalidate로 주기 재계산)"""
+    bump_tags([REQUESTS_TAG])
+    note_request_saved(instance.request_phrase, instance.request_korean)
     
     logger.info(f"캐시 무효화: {instance.request_phrase}")
 
 @receiver(post_save, sender='phrase.DialogueTable')
-def invalidate_dialogue_cache(sender, instance, **kwargs):
+def invalidate_dialogue_cache(sender, instance, created=False, update_fields=None, raw=False, **kwargs):
     """대사 테이블 변경 시 관련 캐시 무효화"""
-    cache_keys = [
-        f"movie_dialogues_{instance.movie.id}",
-        f"dialogue_translation_{hash(instance.dialogue_phrase)}",
-        'dialogue_statistics',
-    ]
+    cache.delete_many([
+        make_key('movie_dialogues', instance.movie_id),
+        make_key('dialogue_translation', instance.dialogue_phrase),
+    ])
+    
+    if raw:
+        return
     
-    for key in cache_keys:
-        cache.delete(key)
+    tags = [dialogue_tag(instance.pk), movie_tag(instance.movie_id)]
+    if _affects_search(created, update_fields, DIALOGUE_SEARCH_FIELDS):
+        tags.append(SEARCH_TAG)
+    bump_tags(tags, 'DialogueTable', instance.pk, 'create' if created else 'update')
+
+@receiver(post_save, sender='phrase.DialogueTable')
+def schedule_dialogue_translation(sender, instance, update_fields=None, raw=False, **kwargs):
+    """번역 대기 대사 저장 시 커밋 후 배치 번역 작업 등록 (짧은 시간 안의 저장은 작업 1건으로 합침)"""
+    if raw or instance.translation_method != 'pending':
+        return
+    if update_fields is not None and 'translation_method' not in update_fields:
+        return
+    
+    from phrase.utils.translate import schedule_pending_translation
+    transaction.on_commit(schedule_pending_translation)
+
+@receiver(post_delete, sender='phrase.DialogueTable')
+def invalidate_deleted_dialogue_cache(sender, instance, **kwargs):
+    """대사 삭제 시 검색 결과 캐시 무효화"""
+    bump_tags(
+        [SEARCH_TAG, dialogue_tag(instance.pk), movie_tag(instance.movie_id)],
+        'DialogueTable', instance.pk, 'delete'
+    )
+
+@receiver(post_save, sender='phrase.DialogueTable')
+def sync_dialogue_search_tokens(sender, instance, update_fields=None, raw=False, **kwargs):
+    """대사 저장 시 검색 역색인(토큰 포스팅, 트라이그램, 한글 n-gram) 동기화"""
+    if raw:
+        return
+    
+    # 검색 벡터와 무관한 부분 저장(재생 횟수 등)은 역색인 갱신 생략
+    if update_fields is not None and 'search_vector_full' not in update_fields:
+        return
+    
+    # 존재 확인 필터 즉시 반영 (다른 프로세스는 증분 갱신으로 반영)
+    note_dialogue_saved(instance.search_vector_full)
+    
+    from .search import DialogueSearchToken, DialogueTrigram, DialogueKoreanGram
+    
+    try:
+        DialogueSearchToken.objects.sync_dialogues([instance])
+        DialogueTrigram.objects.sync_dialogues([instance])
+        DialogueKoreanGram.objects.sync_dialogues([instance])
+    except Exception as e:
+        logger.error(f"검색 역색인 동기화 실패 (dialogue_id={instance.pk}): {e}")
+
+@receiver(pre_delete, sender='phrase.DialogueTable')
+def forget_dialogue_search_terms(sender, instance, **kwargs):
+    """대사 삭제 전 BM25 용어 통계에서 해당 대사 토큰 제외"""
+    from .search import DialogueSearchToken
+    
+    try:
+        DialogueSearchToken.objects.forget_dialogues([instance.pk])
+    except Exception as e:
+        logger.error(f"검색 용어 통계 갱신 실패 (dialogue_id={instance.pk}): {e}")
 
 @receiver(post_save, sender='phrase.MovieTable')
-def invalidate_movie_cache(sender, instance, **kwargs):
+def invalidate_movie_cache(sender, instance, created=False, update_fields=None, raw=False, **kwargs):
     """영화 테이블 변경 시 관련 캐시 무효화"""
-    cache_keys = [
-        'movie_statistics',
-        f"movie_{instance.id}",
-    ]
+    cache.delete_many([
+        make_key('movie_statistics'),
+        make_key('movie', instance.id),
+    ])
+    
+    if raw:
+        return
     
-    for key in cache_keys:
-        cache.delete(key)
+    tags = [movie_tag(instance.pk)]
+    if _affects_search(created, update_fields, MOVIE_SEARCH_FIELDS):
+        tags.append(SEARCH_TAG)
+    bump_tags(tags, 'MovieTable', instance.pk, 'create' if created else 'update')
+
+@receiver(post_delete, sender='phrase.MovieTable')
+def invalidate_deleted_movie_cache(sender, instance, **kwargs):
+    """영화 삭제 시 검색 결과 캐시 무효화"""
+    bump_tags([SEARCH_TAG, movie_tag(instance.pk)], 'MovieTable', instance.pk, 'delete')
 
 @receiver(post_delete, sender='phrase.MovieTable')
 def cleanup_movie_files(sender, instance, **kwargs):
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+# phrase/models/substring_index.py
+"""
+대사 부분 문자열(substring) 검색 인덱스
+- 활성 대사의 search_vector_full(UTF-8)을 이어 붙인 텍스트 + 접미사 배열(suffix array)
+- 단일 바이너리 파일로 저장, 각 워커 프로세스가 읽기 전용 mmap으로 공유
+- 검색: 접미사 배열 이진 탐색 O(m log n)
+- 재빌드 시 임시 파일 작성 후 os.replace로 원자적 교체, 리더는 파일 변경을 감지해 자동 전환
+
+파일 구조 (네이티브 바이트 순서, 섹션은 8바이트 정렬):
+    header | text | doc_starts(uint32[doc_count]) | doc_ids(int64[doc_count]) | suffixes(uint32[suffix_count])
+"""
+import os
+import sys
+import mmap
+import time
+import struct
+import logging
+import threading
+from array import array
+from bisect import bisect_right
+from django.conf import settings
+
+from .utils import normalize_search_text
+
+logger = logging.getLogger(__name__)
+
+INDEX_MAGIC = b'PHSA'
+INDEX_VERSION = 1
+
+# magic, version, byteorder(0=little, 1=big), max_dialogue_id, text_length, doc_count, suffix_count
+HEADER_FORMAT = '<4sHHQQQQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# 대사 구분자 (정규화된 텍스트에는 나타나지 않으므로 대사 경계를 넘는 매칭이 생기지 않음)
+DOCUMENT_SEPARATOR = b'\x00'
+
+# 파일 변경 확인 주기 (초)
+INDEX_CHECK_INTERVAL = 5
+
+# 매칭 위치/대사가 이보다 많으면 인덱스 결과를 포기하고 검색 백엔드 사용 (너무 짧은 검색어 등)
+DEFAULT_MAX_POSITIONS = 100000
+DEFAULT_MAX_MATCHES = 1000
+
+
+def _align(offset, alignment=8):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _byteorder_flag():
+    return 0 if sys.byteorder == 'little' else 1
+
+
+def build_suffix_array(data, initial_length=16):
+    """
+    접미사 배열 생성
+    앞 initial_length 바이트로 1차 정렬 후 prefix doubling (O(n log² n))
+    구분자 위치에서 시작하는 접미사는 제외
+    """
+    n = len(data)
+    if not n:
+        return array('I')
+
+    suffixes = sorted(range(n), key=lambda i: data[i:i + initial_length])
+
+    rank = [0] * n
+    for position in range(1, n):
+        current, previous = suffixes[position], suffixes[position - 1]
+        rank[current] = rank[previous] + (
+            data[current:current + initial_length] != data[previous:previous + initial_length]
+        )
+
+    k = initial_length
+    while rank[suffixes[-1]] != n - 1:
+        def sort_key(i, rank=rank, k=k):
+            return rank[i] * (n + 1) + (rank[i + k] + 1 if i + k < n else 0)
+
+        suffixes.sort(key=sort_key)
+
+        new_rank = [0] * n
+        previous_key = sort_key(suffixes[0])
+        for position in range(1, n):
+            current_key = sort_key(suffixes[position])
+            new_rank[suffixes[position]] = new_rank[suffixes[position - 1]] + (current_key != previous_key)
+            previous_key = current_key
+        rank = new_rank
+        k <<= 1
+
+    separator = DOCUMENT_SEPARATOR[0]
+    return array('I', (i for i in suffixes if data[i] != separator))
+
+
+def write_substring_index(path, documents):
+    """
+    (dialogue_id, 정규화 텍스트) 목록으로 인덱스 파일 생성 후 원자적 교체
+    반환: 인덱스된 대사 수
+    """
+    text = bytearray()
+    doc_starts = array('I')
+    doc_ids = array('q')
+    max_dialogue_id = 0
+
+    for dialogue_id, search_text in documents:
+        encoded = normalize_search_text(search_text).encode('utf-8')
+        if not encoded:
+            continue
+
+        doc_starts.append(len(text))
+        doc_ids.append(dialogue_id)
+        max_dialogue_id = max(max_dialogue_id, dialogue_id)
+
+        text += encoded
+        text += DOCUMENT_SEPARATOR
+
+    if len(text) > 0xFFFFFFFF:
+        raise ValueError("인덱스 텍스트가 4GB를 초과합니다")
+
+    suffixes = build_suffix_array(bytes(text))
+
+    header = struct.pack(
+        HEADER_FORMAT, INDEX_MAGIC, INDEX_VERSION, _byteorder_flag(),
+        max_dialogue_id, len(text), len(doc_ids), len(suffixes)
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp-{os.getpid()}"
+
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            f.write(text)
+            for section in (doc_starts, doc_ids, suffixes):
+                f.write(b'\x00' * (_align(f.tell()) - f.tell()))
+                f.write(section.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+        # 기존 파일을 mmap 중인 리더는 이전 inode를 계속 사용, 새 리더는 새 파일 사용
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    logger.info(f"부분 문자열 인덱스 생성 완료: {len(doc_ids)}개 대사, {len(text)} bytes → {path}")
+    return len(doc_ids)
+
+
+class SubstringIndex:
+    """읽기 전용 mmap 부분 문자열 인덱스 (스레드 안전, 불변)"""
+
+    def __init__(self, path):
+        self.path = path
+
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        magic, version, byteorder, max_dialogue_id, text_length, doc_count, suffix_count = struct.unpack_from(
+            HEADER_FORMAT, self._mmap, 0
+        )
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 인덱스 파일 형식: {path}")
+        if byteorder != _byteorder_flag():
+            raise ValueError(f"인덱스 파일 바이트 순서 불일치: {path}")
+
+        self.max_dialogue_id = max_dialogue_id
+        self.text_offset = HEADER_SIZE
+        self.document_count = doc_count
+        self.suffix_count = suffix_count
+
+        # 복사 없이 mmap 페이지를 직접 참조 (프로세스 간 페이지 캐시 공유)
+        view = memoryview(self._mmap)
+        doc_starts_offset = _align(self.text_offset + text_length)
+        doc_ids_offset = _align(doc_starts_offset + 4 * doc_count)
+        suffixes_offset = _align(doc_ids_offset + 8 * doc_count)
+
+        self._doc_starts = view[doc_starts_offset:doc_starts_offset + 4 * doc_count].cast('I')
+        self._doc_ids = view[doc_ids_offset:doc_ids_offset + 8 * doc_count].cast('q')
+        self._suffixes = view[suffixes_offset:suffixes_offset + 4 * suffix_count].cast('I')
+
+    def _suffix_prefix(self, index, length):
+        start = self.text_offset + self._suffixes[index]
+        return self._mmap[start:start + length]
+
+    def _bound(self, pattern, upper):
+        """pattern으로 시작하는 접미사 범위의 하한/상한 (이진 탐색)"""
+        low, high = 0, self.suffix_count
+        length = len(pattern)
+
+        while low < high:
+            middle = (low + high) // 2
+            prefix = self._suffix_prefix(middle, length)
+            if prefix < pattern or (upper and prefix == pattern):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def search(self, query, max_positions=DEFAULT_MAX_POSITIONS, max_matches=DEFAULT_MAX_MATCHES):
+        """
+        부분 문자열을 포함하는 대사 ID 목록
+        매칭이 너무 많으면 None (호출 측에서 검색 백엔드로 대체)
+        """
+        pattern = normalize_search_text(query).encode('utf-8')
+        if not pattern:
+            return None
+
+        low = self._bound(pattern, upper=False)
+        high = self._bound(pattern, upper=True)
+        if high - low > max_positions:
+            return None
+
+        dialogue_ids = set()
+        for index in range(low, high):
+            document = bisect_right(self._doc_starts, self._suffixes[index]) - 1
+            dialogue_ids.add(self._doc_ids[document])
+            if len(dialogue_ids) > max_matches:
+                return None
+
+        return sorted(dialogue_ids)
+
+
+# 프로세스별 현재 인덱스 (파일 교체 시 자동 전환)
+_index_lock = threading.Lock()
+_index_state = {'index': None, 'signature': None, 'checked_at': 0.0}
+
+
+def get_substring_index_path():
+    return getattr(settings, 'PHRASE_SUBSTRING_INDEX_PATH', None)
+
+
+def get_substring_index():
+    """현재 부분 문자열 인덱스 반환 (파일이 없으면 None)"""
+    path = get_substring_index_path()
+    if not path:
+        return None
+
+    now = time.monotonic()
+    if now - _index_state['checked_at'] < INDEX_CHECK_INTERVAL:
+        return _index_state['index']
+
+    with _index_lock:
+        if now - _index_state['checked_at'] < INDEX_CHECK_INTERVAL:
+            return _index_state['index']
+
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        if signature != _index_state['signature']:
+            index = None
+            if signature is not None:
+                try:
+                    index = SubstringIndex(path)
+                    logger.info(f"부분 문자열 인덱스 로드: {index.document_count}개 대사 ({path})")
+                except (OSError, ValueError, struct.error) as e:
+                    logger.error(f"부분 문자열 인덱스 로드 실패: {e}")
+            _index_state['index'] = index
+            _index_state['signature'] = signature
+
+        _index_state['checked_at'] = now
+        return _index_state['index']
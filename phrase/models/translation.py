@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# phrase/models/translation.py
+"""
+번역 메모리 모델
+TranslationMemory - 정규화된 원문 해시(언어쌍 포함) → 번역 결과 (번역 API 호출 전 조회)
+"""
+from django.db import models
+from .fields import MySQLTextField
+from .managers import TranslationMemoryManager
+
+class TranslationMemory(models.Model):
+    """번역 메모리 - source_hash = sha256(언어쌍 + 정규화된 원문), 품질 점수가 높은 번역만 덮어씀"""
+    source_hash = models.CharField(max_length=64, unique=True, verbose_name="원문 해시")
+    langpair = models.CharField(
+        max_length=5,
+        choices=[('en|ko', '영어 → 한글'), ('ko|en', '한글 → 영어')],
+        verbose_name="언어쌍"
+    )
+    source_text = MySQLTextField(verbose_name="원문")
+    translated_text = MySQLTextField(verbose_name="번역")
+    quality_score = models.FloatField(default=0.0, verbose_name="품질 점수")
+    origin = models.CharField(
+        max_length=20,
+        choices=[
+            ('api', '번역 API'),
+            ('dialogue', '기존 대사 번역'),
+            ('request', '기존 요청 번역'),
+        ],
+        default='api',
+        verbose_name="출처"
+    )
+    hit_count = models.PositiveIntegerField(default=0, verbose_name="적중 횟수")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성시간")
+    last_used_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 사용 시간")
+
+    objects = TranslationMemoryManager()
+
+    class Meta:
+        db_table = 'translation_memory'
+        verbose_name = "번역 메모리"
+        verbose_name_plural = "번역 메모리들"
+        indexes = [
+            models.Index(fields=['-hit_count'], name='translation_memory_hits_idx'),
+        ]
+
+    def __str__(self):
+        return f"[{self.langpair}] {self.source_text[:30]} → {self.translated_text[:30]}"
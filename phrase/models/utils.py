@@ -4,13 +4,197 @@
 모델 관련 유틸리티 함수들
 파일 업로드 경로 생성, 통계, 데이터 정리 등
 """
+import re
 import uuid
+import hashlib
 import logging
+import unicodedata
 from django.utils import timezone
 from django.db import connection
 
 logger = logging.getLogger(__name__)
 
+# 검색 토큰 최대 길이 (dialogue_search_token.token 컬럼 길이와 동일)
+SEARCH_TOKEN_MAX_LENGTH = 64
+
+def normalize_search_text(text):
+    """검색용 텍스트 정규화 (특수문자 제거, 소문자 변환, 공백 정리)"""
+    if not text:
+        return ''
+    normalized = re.sub(r'[^\w\s]', ' ', text.lower())
+    return re.sub(r'\s+', ' ', normalized).strip()
+
+def tokenize_search_text(text):
+    """정규화된 검색 토큰 목록 반환 (순서 유지, 중복 제거)"""
+    tokens = []
+    seen = set()
+    for token in normalize_search_text(text).split():
+        token = token[:SEARCH_TOKEN_MAX_LENGTH]
+        if token not in seen:
+            seen.add(token)
+            tokens.append(token)
+    return tokens
+
+def extract_trigrams(text):
+    """오타 허용 검색용 트라이그램 집합 (단어별 앞 공백 2칸, 뒤 공백 1칸 패딩)"""
+    trigrams = set()
+    for word in normalize_search_text(text).split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            trigrams.add(padded[i:i + 3])
+    return trigrams
+
+# 한글 초성 (호환용 자모)
+KOREAN_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+
+def is_hangul_syllable(char):
+    return HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END
+
+def contains_hangul(text):
+    """한글 음절 또는 초성 포함 여부"""
+    return any(is_hangul_syllable(char) or char in KOREAN_CHOSEONG for char in text or '')
+
+def get_choseong(syllable):
+    """한글 음절의 초성"""
+    return KOREAN_CHOSEONG[(ord(syllable) - HANGUL_SYLLABLE_START) // 588]
+
+def _hangul_runs(text):
+    """공백/비한글 문자로 구분된 연속 한글 음절 구간들"""
+    runs = []
+    current = []
+    for char in text or '':
+        if is_hangul_syllable(char):
+            current.append(char)
+        elif current:
+            runs.append(''.join(current))
+            current = []
+    if current:
+        runs.append(''.join(current))
+    return runs
+
+def _bigrams(run):
+    return {run[i:i + 2] for i in range(len(run) - 1)}
+
+def extract_korean_grams(text):
+    """
+    한글 색인용 n-gram 집합 (교착어 대응)
+    - 음절 바이그램: '사랑해요' → 사랑, 랑해, 해요
+    - 초성 바이그램: '사랑해요' → ㅅㄹ, ㄹㅎ, ㅎㅇ
+    """
+    grams = set()
+    for run in _hangul_runs(text):
+        grams |= _bigrams(run)
+        grams |= _bigrams(''.join(get_choseong(char) for char in run))
+    return grams
+
+def korean_query_grams(query):
+    """
+    한글 검색어의 n-gram 목록 (모두 포함해야 매칭)
+    초성만으로 된 검색어('ㅅㄹㅎ')는 초성 바이그램, 그 외는 음절 바이그램
+    1음절 단어는 바이그램이 없어 제외
+    """
+    words = (query or '').split()
+    if words and all(char in KOREAN_CHOSEONG for word in words for char in word):
+        grams = set()
+        for word in words:
+            grams |= _bigrams(word)
+        return sorted(grams)
+
+    grams = set()
+    for run in _hangul_runs(query):
+        grams |= _bigrams(run)
+    return sorted(grams)
+
+# ===== 번역 메모리 =====
+
+# 번역 품질 등급 → 번역 메모리 품질 점수 (기존 번역 쌍 시드용)
+TRANSLATION_QUALITY_SCORES = {
+    'excellent': 1.0,
+    'good': 0.85,
+    'fair': 0.7,
+    'unknown': 0.6,
+    'needs_review': 0.4,
+    'poor': 0.3,
+}
+
+# 사람이 작성/검토한 번역은 품질 등급과 관계없이 최고 점수
+TRUSTED_TRANSLATION_METHODS = {'manual', 'user_submitted'}
+
+def normalize_translation_source(text):
+    """번역 메모리 키용 원문 정규화 (유니코드 NFC, 대소문자 무시, 공백 정리 - 문장부호는 유지)"""
+    if not text:
+        return ''
+    return ' '.join(unicodedata.normalize('NFC', text).casefold().split())
+
+def translation_source_hash(text, langpair):
+    """번역 메모리 키 - sha256(언어쌍 + 정규화된 원문)"""
+    key = f"{langpair}\x00{normalize_translation_source(text)}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+def translation_quality_score(quality, method=None):
+    """번역 품질 등급/방식 → 품질 점수 (0.0 ~ 1.0)"""
+    if method in TRUSTED_TRANSLATION_METHODS:
+        return 1.0
+    return TRANSLATION_QUALITY_SCORES.get(quality, TRANSLATION_QUALITY_SCORES['unknown'])
+
+def iter_translation_pairs(dialogue_model, request_model):
+    """
+    기존 번역 쌍 (원문, 번역, 언어쌍, 품질 점수, 출처) - 번역 메모리 시드용
+    대사: 영어 → 한글, 요청: 입력 언어를 알 수 없으므로 양방향
+    (0008 마이그레이션에는 같은 규칙의 사본이 있음 - 키 규칙을 바꾸면 번역 메모리 재시드 필요)
+    """
+    dialogues = dialogue_model.objects.exclude(dialogue_phrase_ko__isnull=True).exclude(dialogue_phrase_ko='')
+    for phrase, korean, quality, method in dialogues.values_list(
+        'dialogue_phrase', 'dialogue_phrase_ko', 'translation_quality', 'translation_method'
+    ).iterator(chunk_size=2000):
+        if phrase and phrase.strip() != korean.strip():
+            yield phrase, korean, 'en|ko', translation_quality_score(quality, method), 'dialogue'
+
+    requests = request_model.objects.exclude(request_korean__isnull=True).exclude(request_korean='')
+    for phrase, phrase_full, korean, korean_full, quality in requests.values_list(
+        'request_phrase', 'request_phrase_full', 'request_korean', 'request_korean_full', 'translation_quality'
+    ).iterator(chunk_size=2000):
+        phrase = phrase_full or phrase
+        korean = korean_full or korean
+        if phrase and phrase.strip() != korean.strip():
+            score = translation_quality_score(quality)
+            yield phrase, korean, 'en|ko', score, 'request'
+            yield korean, phrase, 'ko|en', score, 'request'
+
+def seed_translation_memory(memory_model, dialogue_model, request_model, batch_size=1000):
+    """
+    기존 번역 쌍으로 번역 메모리 시드 (이미 있는 원문 해시는 유지) - 추가된 항목 수
+    배치 안에서 같은 원문이 여러 번 나오면 품질 점수가 높은 번역 사용
+    """
+    before = memory_model.objects.count()
+    batch = {}
+
+    def flush():
+        memory_model.objects.bulk_create(batch.values(), batch_size=batch_size, ignore_conflicts=True)
+        batch.clear()
+
+    for source, translated, langpair, score, origin in iter_translation_pairs(dialogue_model, request_model):
+        source_hash = translation_source_hash(source, langpair)
+        current = batch.get(source_hash)
+        if current is None or score > current.quality_score:
+            batch[source_hash] = memory_model(
+                source_hash=source_hash,
+                langpair=langpair,
+                source_text=source,
+                translated_text=translated,
+                quality_score=score,
+                origin=origin,
+            )
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+
+    return memory_model.objects.count() - before
+
 def get_poster_upload_path(instance, filename):
     """포스터 이미지 업로드 경로 생성"""
     ext = filename.split('.')[-1].lower()
@@ -52,6 +52,7 @@ from .load_to_db import (
 
 from .translate import (
     LibreTranslator,
+    get_translator,
     translate_dialogue_batch,
     update_existing_dialogues_optimized
 )
@@ -67,6 +68,41 @@ from .search_history import (
     SearchHistoryManager
 )
 
+from .autocomplete import (
+    AutocompleteTrie,
+    AutocompleteIndex,
+    get_autocomplete_index,
+    start_autocomplete_build,
+    is_autocomplete_ready,
+    autocomplete
+)
+
+from .jobs import (
+    enqueue_job,
+    job_handler,
+    JobWorker,
+    get_job_statistics
+)
+
+from .http_client import (
+    HttpClient,
+    get_http_client,
+    get_http_statistics
+)
+
+from .batch_translate import (
+    BatchTranslationEngine,
+    get_batch_translation_engine,
+    get_batch_translation_statistics
+)
+
+from .cache_warmer import (
+    warm_search_cache,
+    warm_search_result,
+    schedule_cache_warming,
+    get_cache_warmer_report
+)
+
 __all__ = [
     # 기존 utils 모듈들
     'get_client_ip',
@@ -96,11 +132,32 @@ __all__ = [
     'save_dialogue_table_optimized',
     'get_search_results_from_db',
     'LibreTranslator',
+    'get_translator',
     'translate_dialogue_batch',
     'update_existing_dialogues_optimized',
     'IMDBPosterExtractor',
     'download_poster_image',
     'get_poster_url',
     'batch_update_movie_posters',
-    'SearchHistoryManager'
+    'SearchHistoryManager',
+    'AutocompleteTrie',
+    'AutocompleteIndex',
+    'get_autocomplete_index',
+    'start_autocomplete_build',
+    'is_autocomplete_ready',
+    'autocomplete',
+    'warm_search_cache',
+    'warm_search_result',
+    'schedule_cache_warming',
+    'get_cache_warmer_report',
+    'enqueue_job',
+    'job_handler',
+    'JobWorker',
+    'get_job_statistics',
+    'BatchTranslationEngine',
+    'get_batch_translation_engine',
+    'get_batch_translation_statistics',
+    'HttpClient',
+    'get_http_client',
+    'get_http_statistics'
 ]
\ No newline at end of file
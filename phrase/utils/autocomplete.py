@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+# phrase/utils/autocomplete.py
+"""
+검색어 자동완성 서비스
+- 프로세스별 메모리 접두사 트라이 (정규화된 검색어, search_count 가중치)
+- 노드마다 상위 k개 완성어를 미리 계산해 두므로 조회는 DB 접근 없이 O(접두사 길이)
+- 원천: RequestTable(request_phrase, request_korean) + UserSearchQuery(original_query)
+- 갱신: 마지막 반영 이후 updated_at이 바뀐 행만 증분 반영, 삭제된 행은 주기적 전체 재빌드로 정리
+- 최초 빌드도 백그라운드 스레드 (서버 시작 시 start_autocomplete_build) - 빌드 완료 전 조회는 빈 결과
+"""
+import time
+import heapq
+import logging
+import threading
+from bisect import insort
+from itertools import chain
+from django.db import connections
+from django.db.models import BooleanField, ExpressionWrapper, Q
+
+from phrase.models import RequestTable, UserSearchQuery
+from phrase.models.utils import normalize_search_text
+
+logger = logging.getLogger(__name__)
+
+# 노드별로 유지하는 완성어 수 (조회 limit 최대값)
+AUTOCOMPLETE_TOP_K = 10
+
+# 트라이에 저장하는 검색어 최대 길이 (정규화 후)
+AUTOCOMPLETE_MAX_KEY_LENGTH = 64
+
+# 증분 갱신 / 전체 재빌드 주기 (초)
+AUTOCOMPLETE_REFRESH_INTERVAL = 30
+AUTOCOMPLETE_FULL_REBUILD_INTERVAL = 3600
+
+AUTOCOMPLETE_BATCH_SIZE = 2000
+
+
+class _TrieNode:
+    __slots__ = ('children', 'top')
+
+    def __init__(self):
+        self.children = {}
+        # (-가중치, 키) 정렬 튜플 - 갱신 시 통째로 교체 (조회 스레드는 잠금 없이 읽음)
+        self.top = ()
+
+
+class AutocompleteTrie:
+    """
+    가중치 접두사 트라이
+    각 노드의 top에는 하위 트리 전체 검색어 중 가중치 상위 k개 (동률은 키 오름차순)
+    """
+
+    def __init__(self, top_k=AUTOCOMPLETE_TOP_K):
+        self.top_k = top_k
+        self.root = _TrieNode()
+        self.weights = {}
+        self.display = {}
+
+    def __len__(self):
+        return len(self.weights)
+
+    def _path(self, key, create):
+        """루트부터 key 끝 노드까지의 노드 목록 (nodes[i]는 key[:i] 접두사 노드)"""
+        node = self.root
+        nodes = [node]
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    return None
+                child = _TrieNode()
+                node.children[char] = child
+            node = child
+            nodes.append(node)
+        return nodes
+
+    def _promote(self, node, entry):
+        """가중치가 늘어난 검색어를 노드 top에 반영"""
+        key = entry[1]
+        top = node.top
+        if len(top) >= self.top_k and entry > top[-1] and all(item[1] != key for item in top):
+            return
+
+        updated = [item for item in top if item[1] != key]
+        insort(updated, entry)
+        node.top = tuple(updated[:self.top_k])
+
+    def _recompute(self, nodes, key):
+        """가중치가 줄거나 삭제된 검색어 경로의 top을 아래에서부터 다시 계산, 빈 노드 정리"""
+        for depth in range(len(nodes) - 1, -1, -1):
+            node = nodes[depth]
+            prefix = key[:depth]
+            own = [(-self.weights[prefix], prefix)] if prefix in self.weights else []
+            node.top = tuple(heapq.nsmallest(
+                self.top_k, chain(own, *(child.top for child in node.children.values()))
+            ))
+
+            if depth and not node.top and not node.children:
+                del nodes[depth - 1].children[key[depth - 1]]
+
+    def set(self, key, weight, display=None):
+        """검색어 가중치 설정 (0 이하면 삭제)"""
+        key = key[:AUTOCOMPLETE_MAX_KEY_LENGTH]
+        if not key:
+            return
+
+        previous = self.weights.get(key, 0)
+        if weight <= 0:
+            if key not in self.weights:
+                return
+            del self.weights[key]
+            self.display.pop(key, None)
+            nodes = self._path(key, create=False)
+            if nodes:
+                self._recompute(nodes, key)
+            return
+
+        self.weights[key] = weight
+        if display and key not in self.display:
+            self.display[key] = display
+
+        nodes = self._path(key, create=True)
+        if weight >= previous:
+            entry = (-weight, key)
+            for node in nodes:
+                self._promote(node, entry)
+        else:
+            self._recompute(nodes, key)
+
+    def add(self, key, delta, display=None):
+        key = key[:AUTOCOMPLETE_MAX_KEY_LENGTH]
+        self.set(key, self.weights.get(key, 0) + delta, display)
+
+    def complete(self, prefix, limit=AUTOCOMPLETE_TOP_K):
+        """정규화된 접두사의 상위 완성어 [(표시 문자열, 가중치), ...]"""
+        node = self.root
+        for char in prefix[:AUTOCOMPLETE_MAX_KEY_LENGTH]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        return [
+            (self.display.get(key, key), -negative_weight)
+            for negative_weight, key in node.top[:limit]
+        ]
+
+
+class AutocompleteSource:
+    """자동완성 원천 테이블 정의 (qualified: 제안에 포함할 행 조건)"""
+
+    def __init__(self, name, model, text_fields, qualified):
+        self.name = name
+        self.model = model
+        self.text_fields = text_fields
+        self.qualified = qualified
+
+    def rows(self, since=None):
+        """(id, updated_at, 포함 여부, search_count, 텍스트...) 행 - since 이후 변경분 또는 포함 대상 전체"""
+        queryset = self.model.objects.annotate(
+            qualified=ExpressionWrapper(self.qualified, output_field=BooleanField())
+        )
+        if since is None:
+            queryset = queryset.filter(self.qualified)
+        else:
+            queryset = queryset.filter(updated_at__gte=since)
+
+        return queryset.order_by().values_list(
+            'id', 'updated_at', 'qualified', 'search_count', *self.text_fields
+        ).iterator(chunk_size=AUTOCOMPLETE_BATCH_SIZE)
+
+
+AUTOCOMPLETE_SOURCES = (
+    AutocompleteSource(
+        'request', RequestTable, ('request_phrase', 'request_korean'),
+        Q(is_active=True, result_count__gt=0)
+    ),
+    AutocompleteSource(
+        'query', UserSearchQuery, ('original_query',),
+        Q(is_active=True, has_results=True)
+    ),
+)
+
+
+class AutocompleteIndex:
+    """
+    원천 테이블 → 트라이 동기화
+    같은 검색어의 여러 행(세션별 검색 기록 등)은 행별 기여분을 합산해 가중치로 사용
+    """
+
+    def __init__(self, sources=AUTOCOMPLETE_SOURCES):
+        self.sources = sources
+        self.trie = AutocompleteTrie()
+        self.contributions = {}
+        self.watermarks = {}
+        self.built_at = None
+        self.refreshed_at = None
+
+    def _apply(self, contribution_id, text, count):
+        key = normalize_search_text(text)[:AUTOCOMPLETE_MAX_KEY_LENGTH] if text else ''
+        current = (key, count) if key and count > 0 else None
+
+        previous = self.contributions.get(contribution_id)
+        if previous == current:
+            return
+
+        if previous:
+            self.trie.add(previous[0], -previous[1])
+        if current:
+            self.contributions[contribution_id] = current
+            self.trie.add(key, count, display=text.strip())
+        else:
+            self.contributions.pop(contribution_id, None)
+
+    def _load(self, source, since):
+        changed = 0
+        watermark = self.watermarks.get(source.name)
+
+        for row_id, updated_at, qualified, search_count, *texts in source.rows(since):
+            for field, text in zip(source.text_fields, texts):
+                self._apply((source.name, row_id, field), text, search_count if qualified else 0)
+            if watermark is None or updated_at > watermark:
+                watermark = updated_at
+            changed += 1
+
+        if watermark is not None:
+            self.watermarks[source.name] = watermark
+        return changed
+
+    def build(self):
+        """원천 테이블 전체로 빌드"""
+        started = time.monotonic()
+        for source in self.sources:
+            self._load(source, since=None)
+
+        self.built_at = self.refreshed_at = time.monotonic()
+        logger.info(
+            f"자동완성 인덱스 빌드 완료: {len(self.trie)}개 검색어 "
+            f"({(self.built_at - started) * 1000:.0f}ms)"
+        )
+        return self
+
+    def refresh(self):
+        """마지막 반영 이후 변경된 행만 반영 (같은 시각의 행은 다시 읽어도 결과가 같음)"""
+        changed = sum(
+            self._load(source, since=self.watermarks.get(source.name))
+            for source in self.sources
+        )
+        self.refreshed_at = time.monotonic()
+        if changed:
+            logger.debug(f"자동완성 인덱스 증분 갱신: {changed}개 행")
+        return changed
+
+    def complete(self, query, limit=AUTOCOMPLETE_TOP_K):
+        """빈 검색어는 전체 상위 검색어"""
+        prefix = normalize_search_text(query)
+        if prefix and query[-1:].isspace():
+            # "i love " → 다음 단어 완성만
+            prefix += ' '
+        return self.trie.complete(prefix, limit)
+
+
+# 프로세스별 현재 인덱스
+_refresh_lock = threading.Lock()
+_index_state = {'index': None, 'build_failed_at': None}
+
+
+def _refresh_index(index, full):
+    try:
+        if full:
+            _index_state['index'] = AutocompleteIndex().build()
+        else:
+            index.refresh()
+    except Exception as e:
+        logger.error(f"자동완성 인덱스 갱신 실패: {e}")
+        if index is None:
+            # 최초 빌드 실패 - 갱신 주기 후 다시 시도
+            _index_state['build_failed_at'] = time.monotonic()
+        else:
+            index.refreshed_at = time.monotonic()
+    finally:
+        connections.close_all()
+        _refresh_lock.release()
+
+
+def start_autocomplete_build():
+    """
+    최초 인덱스 빌드를 백그라운드 스레드에서 시작 (서버 시작 시 호출, 요청 경로에서 기다리지 않음)
+    이미 빌드됐거나 빌드/갱신 중이면 아무것도 하지 않음 - 시작했으면 True
+    """
+    if _index_state['index'] is not None:
+        return False
+
+    failed_at = _index_state['build_failed_at']
+    if failed_at is not None and time.monotonic() - failed_at < AUTOCOMPLETE_REFRESH_INTERVAL:
+        return False
+
+    if not _refresh_lock.acquire(blocking=False):
+        return False
+    if _index_state['index'] is not None:
+        _refresh_lock.release()
+        return False
+
+    threading.Thread(
+        target=_refresh_index, args=(None, True), name='autocomplete-build', daemon=True
+    ).start()
+    return True
+
+
+def is_autocomplete_ready():
+    """최초 빌드가 끝났는지 (현재 프로세스)"""
+    return _index_state['index'] is not None
+
+
+def get_autocomplete_index():
+    """
+    현재 자동완성 인덱스 반환 - 최초 빌드 전이면 백그라운드 빌드를 시작하고 None
+    갱신도 백그라운드 스레드에서 수행하고 조회는 기존 인덱스로 계속 응답
+    """
+    index = _index_state['index']
+    if index is None:
+        start_autocomplete_build()
+        return None
+
+    now = time.monotonic()
+    if now - index.refreshed_at >= AUTOCOMPLETE_REFRESH_INTERVAL and _refresh_lock.acquire(blocking=False):
+        full = now - index.built_at >= AUTOCOMPLETE_FULL_REBUILD_INTERVAL
+        threading.Thread(
+            target=_refresh_index, args=(index, full), name='autocomplete-refresh', daemon=True
+        ).start()
+
+    return index
+
+
+def autocomplete(query, limit=AUTOCOMPLETE_TOP_K):
+    """검색어 자동완성 [{'text', 'search_count'}, ...] (인덱스 빌드 전에는 빈 목록)"""
+    limit = max(1, min(int(limit), AUTOCOMPLETE_TOP_K))
+    index = get_autocomplete_index()
+    if index is None:
+        return []
+    return [
+        {'text': text, 'search_count': weight}
+        for text, weight in index.complete(query, limit)
+    ]
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# phrase/utils/batch_translate.py
+"""
+동시 배치 번역 엔진
+- 배치 안의 같은 원문은 한 번만 번역 (중복 제거)
+- 캐시/번역 메모리를 한 번에 조회하고, 둘 다 없는 원문만 스레드 풀에서 동시에 API 번역
+- API 호출마다 공유 토큰 버킷(모든 워커 공유)에서 토큰을 받아 전체 호출 속도 제한 (고정 대기 없음)
+- 설정: PHRASE_TRANSLATION_CONCURRENCY (동시 호출 수), PHRASE_TRANSLATION_RATE (초당 호출 수),
+  PHRASE_TRANSLATION_BURST (한 번에 허용하는 호출 수)
+"""
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connections
+
+from phrase.caching import RateLimiter
+from .translate import TranslationUnavailable
+
+logger = logging.getLogger(__name__)
+
+# 기본 동시 호출 수 / 초당 호출 수 / 버스트
+DEFAULT_TRANSLATION_CONCURRENCY = 4
+DEFAULT_TRANSLATION_RATE = 5
+DEFAULT_TRANSLATION_BURST = 10
+
+# 토큰을 기다리는 최대 시간 (초) - 초과하면 해당 원문은 번역하지 않음 (unavailable로 반환)
+TRANSLATION_RATE_WAIT_TIMEOUT = 60
+
+
+# 번역 API를 일시적으로 쓸 수 없어 번역하지 못함 (내부 표시)
+_UNAVAILABLE = object()
+
+
+class BatchTranslationResult(dict):
+    """
+    {원문: 번역} - 번역한 원문만 포함
+    unavailable: 번역 API를 일시적으로 쓸 수 없어 번역하지 못한 원문 (나중에 다시 번역할 대상)
+    그 외 빠진 원문은 응답은 왔지만 유효한 번역이 없었던 원문
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.unavailable = set()
+
+
+class BatchTranslationEngine:
+    """원문 목록 → BatchTranslationResult"""
+
+    def __init__(self, translator=None, concurrency=None, rate=None, burst=None):
+        if translator is None:
+            from .translate import get_translator
+            translator = get_translator()
+        self.translator = translator
+        self.concurrency = max(1, concurrency or getattr(
+            settings, 'PHRASE_TRANSLATION_CONCURRENCY', DEFAULT_TRANSLATION_CONCURRENCY
+        ))
+        self.limiter = RateLimiter(
+            'translation_api',
+            rate or getattr(settings, 'PHRASE_TRANSLATION_RATE', DEFAULT_TRANSLATION_RATE),
+            burst or getattr(settings, 'PHRASE_TRANSLATION_BURST', DEFAULT_TRANSLATION_BURST),
+        )
+        self.lock = threading.Lock()
+        self.stats = {
+            'batches': 0, 'texts': 0, 'duplicates': 0, 'stored_hits': 0,
+            'api_calls': 0, 'unavailable': 0, 'rate_limited': 0, 'api_seconds': 0.0,
+        }
+
+    def _record(self, **amounts):
+        with self.lock:
+            for field, amount in amounts.items():
+                self.stats[field] += amount
+
+    def translate_many(self, texts, langpair):
+        """
+        일괄 번역 - BatchTranslationResult ({원문: 번역} + unavailable)
+        저장된 번역(캐시/번역 메모리)을 먼저 쓰고, 없는 원문만 동시에 API 호출
+        """
+        unique = list(dict.fromkeys(text for text in texts if text))
+        if not unique:
+            return BatchTranslationResult()
+
+        translations = BatchTranslationResult(self.translator.lookup_translations(unique, langpair))
+        missing = [text for text in unique if text not in translations]
+
+        if missing:
+            logger.info(f"번역 메모리 미스 {len(missing)}/{len(unique)}개 API 번역 (동시 {self.concurrency})")
+            started = time.perf_counter()
+
+            if self.concurrency == 1 or len(missing) == 1:
+                results = [self._translate_one(text, langpair) for text in missing]
+            else:
+                workers = min(self.concurrency, len(missing))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='translate') as executor:
+                    results = list(executor.map(lambda text: self._translate_in_pool(text, langpair), missing))
+
+            for text, translated in zip(missing, results):
+                if translated is _UNAVAILABLE:
+                    translations.unavailable.add(text)
+                elif translated:
+                    translations[text] = translated
+            self._record(api_seconds=time.perf_counter() - started, unavailable=len(translations.unavailable))
+
+        self._record(
+            batches=1,
+            texts=len(texts),
+            duplicates=len(texts) - len(unique),
+            stored_hits=len(unique) - len(missing),
+        )
+        return translations
+
+    def _translate_one(self, text, langpair):
+        """토큰을 받은 뒤 API 번역 (캐시/번역 메모리 저장 포함)"""
+        if not self.limiter.acquire(TRANSLATION_RATE_WAIT_TIMEOUT):
+            logger.warning(f"번역 API 속도 제한 대기 시간 초과: {text[:30]}...")
+            self._record(rate_limited=1)
+            return _UNAVAILABLE
+
+        self._record(api_calls=1)
+        try:
+            # 배치 번역은 백그라운드 작업 - 긴 Retry-After도 대기
+            return self.translator._translate_and_remember(text, langpair, interactive=False)
+        except TranslationUnavailable:
+            return _UNAVAILABLE
+
+    def _translate_in_pool(self, text, langpair):
+        try:
+            return self._translate_one(text, langpair)
+        except Exception as e:
+            logger.error(f"배치 번역 실패: {text[:30]}... - {e}")
+            return _UNAVAILABLE
+        finally:
+            # 풀 스레드는 요청 주기 밖이므로 번역 메모리 저장에 쓴 연결을 직접 정리
+            connections.close_all()
+
+    def statistics(self):
+        with self.lock:
+            stats = dict(self.stats)
+        stats['api_seconds'] = round(stats['api_seconds'], 2)
+        stats['concurrency'] = self.concurrency
+        stats['rate_per_second'] = self.limiter.rate
+        stats['burst'] = self.limiter.burst
+        return stats
+
+
+# 프로세스별 엔진 (첫 사용 시 생성)
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_batch_translation_engine():
+    """프로세스 공용 배치 번역 엔진"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = BatchTranslationEngine()
+    return _engine
+
+
+def get_batch_translation_statistics():
+    """배치 번역 통계 (현재 프로세스) - 중복 제거/저장된 번역 적중/API 호출 수"""
+    if _engine is None:
+        return {}
+    return _engine.statistics()
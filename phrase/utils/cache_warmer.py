@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# phrase/utils/cache_warmer.py
+"""
+인기 검색어 캐시 예열
+- 배포/캐시 초기화 직후 인기 검색어가 한꺼번에 콜드 경로(번역 + 대사 검색 + 직렬화)를 타지 않도록 미리 계산
+- 대상: RequestTable 상위 N개 (search_count, last_searched_at 순 - popular_searches)
+- 예열 항목은 대상 함수(RequestTable 행 → 결과 여부)로 전달
+    search_result: 템플릿 뷰 검색 결과 (이 모듈의 warm_search_result)
+    db_search: API 검색 결과 (api.views.view_phrase.warm_db_search)
+- 제한된 동시성(스레드 풀)으로 실행, 소요 시간과 예열 대상이 차지하는 검색 비율(search_count 합 기준) 보고
+- 주기 실행 시 캐시 TTL(db_search 5분, search_result 10분)보다 짧은 간격 권장
+"""
+import time
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Sum
+from django.utils import timezone
+
+from phrase.caching import make_key
+from phrase.models import RequestTable
+from .data_processing import get_existing_results_from_db
+
+logger = logging.getLogger(__name__)
+
+# 기본 예열 대상 수 / 동시 실행 수
+DEFAULT_WARM_TOP_N = 100
+DEFAULT_WARM_CONCURRENCY = 4
+
+# 백그라운드 예열 잠금 유지 시간 (초) - 이 시간 안에 다른 워커가 시작한 예열은 건너뜀
+CACHE_WARM_LOCK_TIMEOUT = 600
+
+# 마지막 예열 보고 보관 시간 (초)
+CACHE_WARM_REPORT_TIMEOUT = 86400 * 7
+
+
+def warm_search_result(request):
+    """템플릿 뷰 검색 결과(search_result) 예열 - 결과가 있으면 True"""
+    return bool(get_existing_results_from_db(request.request_phrase, request.request_korean))
+
+
+def _warm_one(request, targets):
+    """검색어 하나의 대상별 결과 ('found' / 'empty' / 'failed')"""
+    outcome = {}
+    try:
+        for name, warm in targets.items():
+            try:
+                outcome[name] = 'found' if warm(request) else 'empty'
+            except Exception as e:
+                logger.warning(f"캐시 예열 실패 ({name}, '{request.request_phrase[:30]}'): {e}")
+                outcome[name] = 'failed'
+    finally:
+        # 풀 스레드는 요청 주기 밖이므로 연결을 직접 정리
+        connections.close_all()
+    return outcome
+
+
+def warm_search_cache(targets, top_n=DEFAULT_WARM_TOP_N, concurrency=DEFAULT_WARM_CONCURRENCY):
+    """
+    인기 검색어 상위 top_n개에 대해 targets(이름 → 함수(RequestTable 행)) 실행
+    반환: 예열 보고 (공유 캐시에 마지막 보고로도 저장)
+    """
+    started = time.monotonic()
+    requests = list(RequestTable.objects.popular_searches(top_n))
+
+    outcomes = {name: Counter() for name in targets}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='cache-warm') as executor:
+        for outcome in executor.map(lambda request: _warm_one(request, targets), requests):
+            for name, result in outcome.items():
+                outcomes[name][result] += 1
+
+    elapsed = time.monotonic() - started
+
+    # 예열 대상이 차지하는 검색 비율 (활성 요청 전체 search_count 대비)
+    covered = sum(request.search_count for request in requests)
+    total = RequestTable.objects.filter(is_active=True).aggregate(total=Sum('search_count'))['total'] or 0
+
+    report = {
+        'queries': len(requests),
+        'concurrency': max(1, concurrency),
+        'targets': {
+            name: {result: counts[result] for result in ('found', 'empty', 'failed')}
+            for name, counts in outcomes.items()
+        },
+        'elapsed_seconds': round(elapsed, 2),
+        'avg_ms_per_query': round(elapsed / len(requests) * 1000, 1) if requests else None,
+        'covered_searches': covered,
+        'total_searches': total,
+        'traffic_coverage': round(covered / total * 100, 1) if total else None,
+        'finished_at': timezone.now().isoformat(),
+    }
+
+    try:
+        cache.set(make_key('cache_warmer', 'last_report'), report, CACHE_WARM_REPORT_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"캐시 예열 보고 저장 실패: {e}")
+
+    logger.info(
+        f"🔥 캐시 예열 완료: {len(requests)}개 검색어, {elapsed:.1f}초, "
+        f"검색량의 {report['traffic_coverage']}% 포함"
+    )
+    return report
+
+
+def get_cache_warmer_report():
+    """마지막 예열 보고 (모든 워커 공유, 없으면 None)"""
+    try:
+        return cache.get(make_key('cache_warmer', 'last_report'))
+    except Exception as e:
+        logger.warning(f"캐시 예열 보고 조회 실패: {e}")
+        return None
+
+
+def _run_scheduled(targets, top_n, concurrency):
+    try:
+        warm_search_cache(targets, top_n, concurrency)
+    except Exception as e:
+        logger.error(f"백그라운드 캐시 예열 실패: {e}")
+    finally:
+        connections.close_all()
+
+
+def schedule_cache_warming(targets, top_n=DEFAULT_WARM_TOP_N, concurrency=DEFAULT_WARM_CONCURRENCY):
+    """
+    백그라운드 스레드에서 예열 (서버 시작 시)
+    공유 캐시 잠금으로 모든 워커 중 한 곳에서만 실행 - 시작했으면 True
+    """
+    try:
+        if not cache.add(make_key('cache_warmer', 'lock'), True, CACHE_WARM_LOCK_TIMEOUT):
+            return False
+    except Exception as e:
+        logger.warning(f"캐시 예열 잠금 실패: {e}")
+        return False
+
+    threading.Thread(
+        target=_run_scheduled,
+        args=(targets, top_n, concurrency),
+        name='cache-warmer',
+        daemon=True,
+    ).start()
+    return True
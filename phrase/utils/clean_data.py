@@ -13,7 +13,8 @@ import logging
 from django.core.cache import cache
 from django.db import transaction, models
 from django.utils import timezone
-from phrase.models import MovieTable, DialogueTable, RequestTable
+from phrase.caching import make_key, cache_get
+from phrase.models import MovieTable, DialogueTable, RequestTable, increment_counter
 from phrase.utils.get_imdb_poster_url import get_poster_url, download_poster_image
 
 logger = logging.getLogger(__name__)
@@ -29,8 +30,9 @@ def decode_playphrase_format(text):
         return ""
     
     # 캐시 확인 (인코딩 결과)
-    cache_key = f"decoded_{hash(text[:100])}"
-    cached_result = cache.get(cache_key)
+    # 원문 전체 기준 (앞부분만 같은 다른 응답과 충돌하지 않도록)
+    cache_key = make_key('decoded_playphrase', text, normalize=False)
+    cached_result = cache_get(cache_key)
     
     if cached_result:
         logger.debug("디코딩 결과 캐시에서 조회")
@@ -73,8 +75,8 @@ def extract_movie_info(data_text):
         return []
     
     # 캐시 확인 (추출 결과)
-    cache_key = f"extracted_movies_{hash(data_text)}"
-    cached_result = cache.get(cache_key)
+    cache_key = make_key('extracted_movies', data_text, normalize=False)
+    cached_result = cache_get(cache_key)
     
     if cached_result:
         logger.info(f"영화 정보 캐시에서 조회: {len(cached_result)}개")
@@ -423,8 +425,7 @@ def clean_data_from_playphrase(data_text, request_phrase=None, request_korean=No
                 }
             )
             if not created:
-                request_obj.search_count += 1
-                request_obj.save(update_fields=['search_count'])
+                increment_counter('phrase.RequestTable', request_obj.pk, 'search_count')
         except Exception as e:
             logger.warning(f"요청 기록 실패: {e}")
     
@@ -530,8 +531,8 @@ def process_existing_movies_dialogues(existing_movies):
 
 def get_cached_imdb_info(movie_title, release_year):
     """캐시 우선 IMDB 정보 조회"""
-    imdb_cache_key = f"imdb_{movie_title}_{release_year}"
-    cached_imdb = cache.get(imdb_cache_key)
+    imdb_cache_key = make_key('imdb_data', movie_title, release_year)
+    cached_imdb = cache_get(imdb_cache_key)
     
     if cached_imdb:
         return cached_imdb
@@ -820,28 +821,6 @@ def batch_process_movies_optimized(movies_data, batch_size=50):
     return processed_movies
 
 
-def optimize_cache_strategy():
-    """캐시 전략 최적화"""
-    try:
-        # 자주 사용되는 영화 정보 사전 캐싱
-        popular_movies = MovieTable.objects.popular(20)
-        
-        for movie in popular_movies:
-            cache_key = f"movie_info_{movie.movie_title}_{movie.release_year}"
-            movie_data = {
-                'id': movie.id,
-                'title': movie.movie_title,
-                'year': movie.release_year,
-                'director': movie.director,
-            }
-            cache.set(cache_key, movie_data, 3600)  # 1시간
-        
-        logger.info(f"인기 영화 {len(popular_movies)}개 사전 캐싱 완료")
-        
-    except Exception as e:
-        logger.error(f"캐시 최적화 실패: {e}")
-
-
 def create_legacy_compatibility_format(movies_data):
     """기존 clean_data_from_playphrase 호출과의 호환성 유지"""
     legacy_movies = []
@@ -889,8 +868,8 @@ def print_movies(movies):
 
 def get_extraction_statistics():
     """추출 통계 조회 (managers.py 통계와 연동)"""
-    cache_key = 'extraction_statistics_v4'
-    stats = cache.get(cache_key)
+    cache_key = make_key('extraction_stats')
+    stats = cache_get(cache_key)
     
     if stats is None:
         try:
@@ -969,9 +948,6 @@ def cleanup_and_finalize():
         processing_stats = get_extraction_statistics()
         logger.info(f"최종 처리 통계: {processing_stats}")
         
-        # 성능 최적화 적용
-        optimize_cache_strategy()
-        
         logger.info("clean_data.py 정리 작업 완료")
         
     except Exception as e:
@@ -991,9 +967,6 @@ def initialize_clean_data_module():
         else:
             logger.warning(f"⚠️ 일부 모듈 연동 실패: {integration_status}")
         
-        # 성능 최적화 적용
-        optimize_cache_strategy()
-        
         return True
         
     except Exception as e:
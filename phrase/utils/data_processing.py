@@ -4,14 +4,33 @@
 데이터 처리 관련 헬퍼 함수들 (수정됨)
 일본어, 중국어 필드 제거 완료
 """
-import time
 import logging
-from django.core.cache import cache
+from phrase.caching import (
+    make_key, get_with_tags, set_with_tags, get_tag_generations, SEARCH_TAG, ModelRowCodec
+)
 from phrase.models import DialogueTable
-from phrase.utils.translate import LibreTranslator
+from phrase.utils.translate import get_translator
 
 logger = logging.getLogger(__name__)
 
+# 템플릿 검색 결과 캐시 코덱 - context(필드명 중복 dict) 대신 context 생성에 필요한 필드만 저장
+SEARCH_CONTEXT_CODEC = ModelRowCodec(
+    'search_result',
+    'phrase.DialogueTable',
+    (
+        'id', 'movie', 'dialogue_phrase', 'dialogue_phrase_ko',
+        'dialogue_start_time', 'dialogue_end_time', 'duration_seconds',
+        'video_url', 'video_file', 'video_quality', 'file_size_bytes',
+        'translation_method', 'translation_quality', 'play_count', 'like_count', 'created_at',
+    ),
+    related='movie',
+    related_fields=(
+        'id', 'movie_title', 'release_year', 'director', 'production_country',
+        'original_title', 'genre', 'imdb_rating', 'imdb_url', 'poster_url', 'poster_image',
+        'data_quality', 'view_count', 'like_count',
+    ),
+)
+
 
 def get_existing_results_from_db(request_phrase, request_korean=None):
     """
@@ -19,30 +38,25 @@ def get_existing_results_from_db(request_phrase, request_korean=None):
     """
     try:
         # 캐시 확인
-        cache_key = f"search_result_{hash(request_phrase)}"
-        cached_results = cache.get(cache_key)
+        cache_key = make_key('search_result', request_phrase)
+        cached_payload = get_with_tags(cache_key)
+        cached_dialogues = SEARCH_CONTEXT_CODEC.loads(cached_payload) if cached_payload else None
         
-        if cached_results:
+        if cached_dialogues:
+            cached_results = build_movies_context_from_db(cached_dialogues)
             logger.info(f"✅ 캐시에서 결과 조회: {len(cached_results)}개")
             return cached_results
         
         print("🔍 DEBUG: 캐시에 없음, DB 직접 검색")
         
-        # DB에서 검색 (매니저 메서드 대신 직접 쿼리)
-        search_results = DialogueTable.objects.filter(
-            dialogue_phrase__icontains=request_phrase
-        )
+        # 검색 전 태그 세대 (검색 중 변경되면 다음 조회에서 캐시 미스)
+        generations = get_tag_generations([SEARCH_TAG])
         
-        # 요청한글이 있으면 추가 검색
-        if request_korean:
-            korean_results = DialogueTable.objects.filter(
-                dialogue_phrase_ko__icontains=request_korean
-            )
-            # 중복 제거를 위해 union 사용
-            search_results = search_results.union(korean_results)
+        # DB에서 검색 (검색 백엔드 경유, 요청한글이 있으면 함께 검색)
+        search_results = DialogueTable.objects.search_any(request_phrase, request_korean)
         
         # 영화 정보와 함께 조회
-        search_results = search_results.select_related('movie').distinct()
+        search_results = search_results.select_related('movie')
         
         if not search_results.exists():
             print("📭 DEBUG: DB에서 결과 없음")
@@ -59,9 +73,11 @@ def get_existing_results_from_db(request_phrase, request_korean=None):
         # context 형식으로 변환
         movies_context = build_movies_context_from_db(search_results)
         
-        # 캐시에 저장 (10분)
+        # 캐시에 저장 (10분, 컴팩트 행)
         try:
-            cache.set(cache_key, movies_context, 600)
+            set_with_tags(
+                cache_key, SEARCH_CONTEXT_CODEC.dumps(search_results), [SEARCH_TAG], 600, generations
+            )
             print(f"🗄️ DEBUG: 결과 캐싱 완료")
         except Exception as e:
             print(f"⚠️ DEBUG: 캐싱 실패: {e}")
@@ -174,7 +190,7 @@ def build_movies_context_from_db(search_results):
 def ensure_korean_translations_batch(dialogues):
     """대사들의 한글 번역 배치 확인 및 보완 - 예외 처리 강화"""
     try:
-        translator = LibreTranslator()
+        translator = get_translator()
         updated_dialogues = []
         
         # 한글 번역이 없는 대사들 찾기
@@ -185,27 +201,24 @@ def ensure_korean_translations_batch(dialogues):
                 needs_translation.append(dialogue)
             updated_dialogues.append(dialogue)
         
-        # 배치 번역 처리 (최대 10개씩)
+        # 배치 번역 처리 (캐시/번역 메모리 일괄 조회 후 없는 대사만 API 번역)
         if needs_translation:
             logger.info(f"🔄 배치 번역 시작: {len(needs_translation)}개")
             
-            batch_size = 10
-            for i in range(0, len(needs_translation), batch_size):
-                batch = needs_translation[i:i + batch_size]
-                
-                for dialogue in batch:
-                    try:
-                        korean_text = translator.translate_to_korean(dialogue.dialogue_phrase)
-                        if korean_text and korean_text != dialogue.dialogue_phrase:
-                            dialogue.dialogue_phrase_ko = korean_text
-                            dialogue.translation_method = 'api_auto'
-                            dialogue.save(update_fields=['dialogue_phrase_ko', 'translation_method'])
-                            logger.info(f"✅ 번역완료: {dialogue.dialogue_phrase[:30]}...")
-                    except Exception as e:
-                        logger.error(f"❌ 번역실패: {e}")
-                    
-                    # API 호출 간격 조절
-                    time.sleep(0.1)
+            translations = translator.translate_many_to_korean(
+                [dialogue.dialogue_phrase for dialogue in needs_translation]
+            )
+            
+            for dialogue in needs_translation:
+                try:
+                    korean_text = translations.get(dialogue.dialogue_phrase)
+                    if korean_text and korean_text != dialogue.dialogue_phrase:
+                        dialogue.dialogue_phrase_ko = korean_text
+                        dialogue.translation_method = 'api_auto'
+                        dialogue.save(update_fields=['dialogue_phrase_ko', 'translation_method'])
+                        logger.info(f"✅ 번역완료: {dialogue.dialogue_phrase[:30]}...")
+                except Exception as e:
+                    logger.error(f"❌ 번역실패: {e}")
         
         return updated_dialogues
         
@@ -24,7 +24,9 @@ from urllib.parse import urljoin, urlparse
 from io import BytesIO
 
 # 새로운 모델과 매니저 활용
+from phrase.caching import make_key, cache_get
 from phrase.models import MovieTable, DialogueTable, RequestTable
+from phrase.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -37,16 +39,8 @@ class IMDBPosterExtractor:
     """
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,utils/xhtml+xml,utils/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
-        self.timeout = 15
-        self.max_retries = 3
+        # IMDB 요청은 공용 HTTP 클라이언트 사용 (호스트별 세션/연결 재사용, 헤더/타임아웃/재시도는 HTTP_HOST_SETTINGS)
+        self.http = get_http_client()
         self.cache_timeout = 86400  # 24시간
     
     def extract_poster_url(self, imdb_url):
@@ -60,8 +54,8 @@ class IMDBPosterExtractor:
             return None
         
         # 캐시 확인 (get_movie_info.py와 일관성)
-        cache_key = f"imdb_poster_{hash(imdb_url)}"
-        cached_result = cache.get(cache_key)
+        cache_key = make_key('imdb_poster', imdb_url)
+        cached_result = cache_get(cache_key)
         
         if cached_result:
             logger.info(f"포스터 URL 캐시에서 조회: {imdb_url}")
@@ -93,31 +87,25 @@ class IMDBPosterExtractor:
             return False
     
     def _extract_with_retry(self, imdb_url):
-        """재시도 로직을 포함한 추출"""
-        for attempt in range(self.max_retries):
-            try:
-                logger.info(f"IMDB 포스터 추출 시도 {attempt + 1}/{self.max_retries}: {imdb_url}")
-                
-                response = self.session.get(imdb_url, timeout=self.timeout)
-                response.raise_for_status()
-                
-                # HTML 파싱 및 포스터 URL 추출
-                poster_url = self._parse_poster_from_html(response.text, imdb_url)
-                
-                if poster_url:
-                    return self._normalize_poster_url(poster_url)
-                else:
-                    logger.warning(f"포스터를 찾을 수 없음 (시도 {attempt + 1})")
-                    
-            except requests.RequestException as e:
-                logger.warning(f"HTTP 요청 실패 (시도 {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # 지수 백오프
-                    continue
-                    
-            except Exception as e:
-                logger.error(f"예상치 못한 오류 (시도 {attempt + 1}): {e}")
-                break
+        """추출 (연결 오류/429/5xx 재시도는 공용 HTTP 클라이언트가 처리)"""
+        try:
+            logger.info(f"IMDB 포스터 추출 시도: {imdb_url}")
+            
+            response = self.http.get(imdb_url)
+            response.raise_for_status()
+            
+            # HTML 파싱 및 포스터 URL 추출
+            poster_url = self._parse_poster_from_html(response.text, imdb_url)
+            
+            if poster_url:
+                return self._normalize_poster_url(poster_url)
+            logger.warning(f"포스터를 찾을 수 없음: {imdb_url}")
+            
+        except requests.RequestException as e:
+            logger.warning(f"HTTP 요청 실패: {e}")
+            
+        except Exception as e:
+            logger.error(f"예상치 못한 오류: {e}")
         
         return None
     
@@ -266,15 +254,8 @@ def download_poster_image(poster_url, filename=None, max_size_mb=10):
     try:
         logger.info(f"포스터 다운로드 시작: {poster_url}")
         
-        # 스트리밍 다운로드 (메모리 효율성)
-        response = requests.get(
-            poster_url, 
-            stream=True, 
-            timeout=30,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        )
+        # 스트리밍 다운로드 (메모리 효율성, 공용 HTTP 클라이언트의 호스트별 연결 재사용)
+        response = get_http_client().get(poster_url, stream=True, timeout=30)
         response.raise_for_status()
         
         # 파일 크기 체크
@@ -345,14 +326,7 @@ def download_video_file(video_url, filename=None, max_size_mb=100):
     try:
         logger.info(f"비디오 다운로드 시작: {video_url}")
         
-        response = requests.get(
-            video_url, 
-            stream=True, 
-            timeout=60,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        )
+        response = get_http_client().get(video_url, stream=True, timeout=60)
         response.raise_for_status()
         
         # 파일 크기 체크
@@ -560,7 +534,7 @@ def get_poster_ajax(request):
         response_data = {
             'poster_url': poster_url,
             'success': poster_url is not None,
-            'cached': cache.get(f"imdb_poster_{hash(imdb_url)}") is not None
+            'cached': cache.get(make_key('imdb_poster', imdb_url)) is not None
         }
         
         if poster_url:
@@ -724,8 +698,8 @@ def get_imdb_extraction_statistics():
     """
     IMDB 추출 통계 조회
     """
-    cache_key = 'imdb_extraction_stats'
-    stats = cache.get(cache_key)
+    cache_key = make_key('imdb_stats')
+    stats = cache_get(cache_key)
     
     if stats is None:
         try:
@@ -764,9 +738,9 @@ def monitor_extraction_performance():
     추출 성능 모니터링
     """
     today = timezone.now().strftime('%Y-%m-%d')
-    cache_key = f"imdb_performance_{today}"
+    cache_key = make_key('imdb_performance', today)
     
-    performance_stats = cache.get(cache_key, {
+    performance_stats = cache_get(cache_key, {
         'total_extractions': 0,
         'successful_extractions': 0,
         'failed_extractions': 0,
@@ -791,8 +765,8 @@ def cleanup_invalid_poster_urls():
         
         for movie in invalid_urls:
             try:
-                # URL 유효성 간단 체크
-                response = requests.head(movie.poster_url, timeout=10)
+                # URL 유효성 간단 체크 (같은 이미지 호스트 연결 재사용)
+                response = get_http_client().head(movie.poster_url, timeout=10, retries=0)
                 
                 if response.status_code >= 400:
                     movie.poster_url = ''
@@ -7,14 +7,21 @@ playphrase.me API 영화 정보 가져오기 모듈 - 최적화된 모델 활용
 - 에러 처리 및 재시도 로직 강화
 - 응답 데이터 검증 및 정규화
 """
+import json
 import requests
 import time
 import logging
 from django.core.cache import cache
 from django.conf import settings
+from django.db import models
 from django.utils import timezone
-from phrase.models import RequestTable, DialogueTable
+from phrase.caching import make_key, cache_get, is_negative, record_negative, clear_negative
+from phrase.models import (
+    RequestTable, DialogueTable,
+    request_might_exist, request_text_might_exist, dialogue_text_might_exist
+)
 from phrase.utils.clean_data import clean_data_from_playphrase
+from phrase.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +37,6 @@ class PlayPhraseAPIClient:
         self.base_url = 'https://www.playphrase.me/api/v1/phrases/search'
         self.timeout = 30
         self.max_retries = 3
-        self.retry_delay = 1
         self.cache_timeout = 3600  # 1시간
         
         # API 설정
@@ -66,9 +72,14 @@ class PlayPhraseAPIClient:
         
         text = text.strip()
         
+        # 최근 playphrase.me에 결과가 없었던 구문은 DB 확인/API 호출 생략
+        if is_negative(text):
+            logger.info(f"결과 없음 캐시로 API 호출 건너뜀: {text}")
+            return None
+        
         # 캐시 확인
-        cache_key = f"playphrase_api_{hash(text)}_{limit}_{skip}"
-        cached_result = cache.get(cache_key)
+        cache_key = make_key('playphrase_api', text, limit, skip)
+        cached_result = cache_get(cache_key)
         
         if cached_result:
             logger.info(f"API 응답 캐시에서 조회: {text}")
@@ -87,71 +98,59 @@ class PlayPhraseAPIClient:
             'skip': str(skip),
         }
         
-        # 재시도 로직
-        for attempt in range(self.max_retries):
-            try:
-                logger.info(f"playphrase.me API 요청 (시도 {attempt + 1}/{self.max_retries}): {text}")
-                
-                response = requests.get(
-                    self.base_url,
-                    params=params,
-                    cookies=self.cookies,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                
-                if response.status_code == 200:
-                    data = response.text
-                    
-                    # 응답 검증
-                    if self._validate_response(data, text):
-                        # 캐시에 저장
-                        cache.set(cache_key, data, self.cache_timeout)
-                        
-                        # API 사용 통계 기록
-                        self._record_api_usage(text, True, len(data))
-                        
-                        logger.info(f"API 응답 수신 성공: {len(data)} 문자")
-                        return data
-                    else:
-                        logger.warning(f"응답 검증 실패: {text}")
-                        return None
-                
-                elif response.status_code == 429:  # Rate limit
-                    wait_time = self.retry_delay * (attempt + 1) * 2
-                    logger.warning(f"API 요청 제한, {wait_time}초 대기...")
-                    time.sleep(wait_time)
-                    continue
+        # 연결 오류/429/5xx 재시도는 공용 HTTP 클라이언트가 처리 (Retry-After 준수)
+        try:
+            logger.info(f"playphrase.me API 요청: {text}")
+            
+            response = get_http_client().get(
+                self.base_url,
+                params=params,
+                cookies=self.cookies,
+                headers=self.headers,
+                timeout=self.timeout,
+                retries=self.max_retries - 1
+            )
+            
+            if response.status_code == 200:
+                data = response.text
                 
-                else:
-                    logger.error(f"API 응답 오류 - 상태 코드: {response.status_code}")
-                    logger.error(f"응답 내용: {response.text[:200]}...")
-                    
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delay * (attempt + 1))
-                        continue
-                    
-            except requests.exceptions.Timeout:
-                logger.error(f"API 요청 타임아웃 (시도 {attempt + 1}): {text}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    continue
+                # 응답 검증
+                if self._validate_response(data, text):
+                    # 캐시에 저장
+                    cache.set(cache_key, data, self.cache_timeout)
+                    clear_negative(text)
                     
-            except requests.exceptions.ConnectionError:
-                logger.error(f"API 연결 실패 (시도 {attempt + 1}): {text}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    continue
+                    # API 사용 통계 기록
+                    self._record_api_usage(text, True, len(data))
                     
-            except requests.exceptions.RequestException as e:
-                logger.error(f"API 요청 중 오류 (시도 {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    continue
-                    
-            except Exception as e:
-                logger.error(f"예상치 못한 오류: {e}")
-                break
+                    logger.info(f"API 응답 수신 성공: {len(data)} 문자")
+                    return data
+                else:
+                    logger.warning(f"응답 검증 실패: {text}")
+                    # 형식이 올바른 빈 결과일 때만 지수 백오프로 재호출 차단 (오류/잘린 응답은 다음 요청에서 재시도)
+                    if self._is_empty_result(data):
+                        record_negative(text)
+                    self._record_api_usage(text, False, len(data))
+                    return None
+            
+            elif response.status_code == 429:  # Rate limit
+                logger.warning(f"API 요청 제한 (재시도 후에도 429): {text}")
+            
+            else:
+                logger.error(f"API 응답 오류 - 상태 코드: {response.status_code}")
+                logger.error(f"응답 내용: {response.text[:200]}...")
+                
+        except requests.exceptions.Timeout:
+            logger.error(f"API 요청 타임아웃: {text}")
+            
+        except requests.exceptions.ConnectionError:
+            logger.error(f"API 연결 실패: {text}")
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"API 요청 중 오류: {e}")
+            
+        except Exception as e:
+            logger.error(f"예상치 못한 오류: {e}")
         
         # 모든 시도 실패
         self._record_api_usage(text, False, 0)
@@ -161,14 +160,15 @@ class PlayPhraseAPIClient:
     def _has_existing_data(self, text):
         """
         DB에 해당 텍스트와 관련된 데이터가 이미 있는지 확인 (매니저 활용)
+        블룸 필터가 "있을 수 있음"으로 판정한 경우에만 SQL 확인
         """
         try:
             # 요청 테이블에서 확인
-            if RequestTable.objects.filter(request_phrase=text).exists():
+            if request_might_exist(text) and RequestTable.objects.filter(request_phrase=text).exists():
                 return True
             
             # 대사 테이블에서 확인 (매니저 활용)
-            if DialogueTable.objects.search_text(text).exists():
+            if dialogue_text_might_exist(text) and DialogueTable.objects.search_text(text).exists():
                 return True
             
             return False
@@ -202,15 +202,25 @@ class PlayPhraseAPIClient:
         
         return True
     
+    def _is_empty_result(self, data):
+        """
+        형식이 올바르고 결과만 없는 응답인지 ({"phrases": []})
+        """
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return False
+        return isinstance(payload, dict) and isinstance(payload.get('phrases'), list) and not payload['phrases']
+    
     def _record_api_usage(self, text, success, response_size):
         """
         API 사용 통계 기록
         """
         try:
             today = timezone.now().strftime('%Y-%m-%d')
-            stats_key = f"api_usage_stats_{today}"
+            stats_key = make_key('playphrase_stats', today)
             
-            daily_stats = cache.get(stats_key, {
+            daily_stats = cache_get(stats_key, {
                 'total_requests': 0,
                 'successful_requests': 0,
                 'failed_requests': 0,
@@ -255,6 +265,11 @@ def get_movie_info(text):
     
     text = text.strip()
     
+    # 최근 결과가 없었던 구문은 DB 확인/API 호출 모두 생략
+    if is_negative(text):
+        logger.info(f"결과 없음 캐시로 조회 생략: {text}")
+        return None
+    
     # DB 우선 확인 (새 모델 활용)
     existing_data = check_existing_database_data(text)
     if existing_data:
@@ -287,10 +302,11 @@ def get_movie_info(text):
 def check_existing_database_data(text):
     """
     DB에서 기존 데이터 확인 (매니저 활용)
+    블룸 필터가 "있을 수 있음"으로 판정한 경우에만 SQL 확인
     """
     try:
         # 1. 요청 테이블에서 확인
-        request_exists = RequestTable.objects.filter(
+        request_exists = request_text_might_exist(text) and RequestTable.objects.filter(
             models.Q(request_phrase__icontains=text) |
             models.Q(request_korean__icontains=text)
         ).exists()
@@ -300,7 +316,7 @@ def check_existing_database_data(text):
             return True
         
         # 2. 대사 테이블에서 확인 (매니저 활용)
-        dialogue_exists = DialogueTable.objects.search_text(text).exists()
+        dialogue_exists = dialogue_text_might_exist(text) and DialogueTable.objects.search_text(text).exists()
         
         if dialogue_exists:
             logger.info(f"대사 테이블에서 기존 데이터 발견: {text}")
@@ -392,9 +408,9 @@ def get_api_statistics():
     API 사용 통계 조회
     """
     today = timezone.now().strftime('%Y-%m-%d')
-    stats_key = f"api_usage_stats_{today}"
+    stats_key = make_key('playphrase_stats', today)
     
-    daily_stats = cache.get(stats_key, {
+    daily_stats = cache_get(stats_key, {
         'total_requests': 0,
         'successful_requests': 0,
         'failed_requests': 0,
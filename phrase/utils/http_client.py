@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# phrase/utils/http_client.py
+"""
+공용 HTTP 클라이언트 (모든 외부 호출)
+- 호스트별 requests.Session + 연결 풀 (keep-alive) - 호출마다 TCP/TLS 핸드셰이크를 반복하지 않음
+- 호스트별 기본 타임아웃 (연결, 읽기) / 재시도 횟수 / 기본 헤더 (HTTP_HOST_SETTINGS)
+- 연결 오류와 429/5xx 응답은 재시도: Retry-After 헤더가 있으면 그 시간만큼, 없으면 지수 백오프
+  (POST 등 멱등이 아닌 요청은 요청이 처리되지 않은 경우(연결 시간 초과, 429/503)만 재시도)
+- 사용자 요청 처리 중인 호출은 max_retry_after=HTTP_INTERACTIVE_MAX_RETRY_AFTER로 짧은 Retry-After만 대기
+  (긴 대기는 백그라운드 작업만)
+- 프로세스 공용 클라이언트 (get_http_client), 호스트별 요청/오류 수와 응답 지연 시간 통계
+"""
+import time
+import random
+import logging
+import threading
+from collections import defaultdict
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# 호스트별 연결 풀 크기 (동시에 유지하는 연결 수)
+HTTP_POOL_MAXSIZE = 10
+
+# 재시도 대상 응답 코드 / 멱등 요청이 아니어도 재시도하는 응답 코드 (요청이 처리되지 않음)
+HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+HTTP_UNPROCESSED_STATUSES = frozenset({429, 503})
+HTTP_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+# 재시도 대기: 지수 백오프 기준 (초) / Retry-After를 따르는 최대 대기 시간 (초, 넘으면 재시도하지 않음)
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_MAX_RETRY_AFTER = 30
+
+# 사용자 요청 처리 경로(검색 번역, 채팅)에서 Retry-After를 따르는 최대 대기 시간 (초)
+HTTP_INTERACTIVE_MAX_RETRY_AFTER = 2
+
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# IMDB 페이지 요청 헤더 (포스터 추출용 HTML)
+IMDB_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+IMDB_HOST_SETTINGS = {'timeout': (5, 15), 'retries': 2, 'headers': IMDB_HEADERS}
+
+# 호스트 → 설정 (없는 항목은 'default' 사용), timeout = (연결, 읽기) 초
+HTTP_HOST_SETTINGS = {
+    'default': {
+        'timeout': (5, 30),
+        'retries': 2,
+        'headers': {'User-Agent': BROWSER_USER_AGENT},
+    },
+    'api.mymemory.translated.net': {
+        'timeout': (3.05, 10),
+        'retries': 2,
+        'headers': {'User-Agent': 'EndlessRealClips/1.0'},
+    },
+    'www.playphrase.me': {
+        'timeout': (5, 30),
+        'retries': 2,
+    },
+    'openrouter.ai': {
+        'timeout': (5, 30),
+        'retries': 1,
+    },
+    'www.imdb.com': IMDB_HOST_SETTINGS,
+    'imdb.com': IMDB_HOST_SETTINGS,
+    'm.imdb.com': IMDB_HOST_SETTINGS,
+}
+
+
+def _retry_after_seconds(response):
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 시간 (초), 없거나 잘못된 값이면 None"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - timezone.now()).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpClient:
+    """호스트별 세션 풀 + 재시도 + 통계"""
+
+    def __init__(self, host_settings=None, pool_maxsize=HTTP_POOL_MAXSIZE):
+        self.host_settings = host_settings or HTTP_HOST_SETTINGS
+        self.pool_maxsize = pool_maxsize
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.stats = defaultdict(lambda: {
+            'requests': 0, 'errors': 0, 'status_errors': 0, 'retries': 0,
+            'total_ms': 0.0, 'max_ms': 0.0,
+        })
+
+    def settings_for(self, host):
+        config = dict(self.host_settings['default'])
+        config.update(self.host_settings.get(host, {}))
+        return config
+
+    def session(self, host):
+        """호스트 전용 세션 (첫 요청 시 생성, 이후 연결 재사용)"""
+        session = self.sessions.get(host)
+        if session is None:
+            with self.lock:
+                session = self.sessions.get(host)
+                if session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=0)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    session.headers.update(self.settings_for(host).get('headers', {}))
+                    self.sessions[host] = session
+        return session
+
+    def _record(self, host, elapsed_ms, error=False, status_code=None):
+        with self.lock:
+            stats = self.stats[host]
+            stats['requests'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            if error:
+                stats['errors'] += 1
+            elif status_code is not None and status_code >= 400:
+                stats['status_errors'] += 1
+
+    def _note_retry(self, host):
+        with self.lock:
+            self.stats[host]['retries'] += 1
+
+    def request(self, method, url, timeout=None, retries=None, max_retry_after=HTTP_MAX_RETRY_AFTER, **kwargs):
+        """
+        요청 실행 - requests.Response (모든 시도가 연결 오류면 마지막 예외 발생)
+        timeout/retries를 생략하면 호스트 설정 사용, 나머지 인자는 requests.Session.request와 같음
+        max_retry_after: 이보다 긴 Retry-After 응답은 재시도하지 않고 그대로 반환
+        지연 시간은 응답 헤더 수신까지 (stream=True 본문 다운로드 제외)
+        """
+        host = urlparse(url).netloc
+        config = self.settings_for(host)
+        timeout = timeout or config['timeout']
+        retries = config['retries'] if retries is None else retries
+        idempotent = method.upper() in HTTP_IDEMPOTENT_METHODS
+        session = self.session(host)
+
+        for attempt in range(retries + 1):
+            started = time.perf_counter()
+            try:
+                response = session.request(method, url, timeout=timeout, **kwargs)
+            except requests.RequestException as e:
+                self._record(host, (time.perf_counter() - started) * 1000, error=True)
+                # 멱등이 아닌 요청은 연결 전에 실패한 경우만 재시도
+                retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+                if attempt >= retries or not retryable:
+                    raise
+                delay = HTTP_RETRY_BACKOFF * (2 ** attempt)
+                logger.warning(f"HTTP 요청 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{retries}): {host} - {e}")
+            else:
+                self._record(host, (time.perf_counter() - started) * 1000, status_code=response.status_code)
+                status_code = response.status_code
+                if (
+                    attempt >= retries
+                    or status_code not in HTTP_RETRY_STATUSES
+                    or not (idempotent or status_code in HTTP_UNPROCESSED_STATUSES)
+                ):
+                    return response
+
+                delay = _retry_after_seconds(response)
+                if delay is None:
+                    delay = HTTP_RETRY_BACKOFF * (2 ** attempt)
+                elif delay > max_retry_after:
+                    logger.warning(f"Retry-After {delay:.0f}초 - 재시도하지 않음: {host}")
+                    return response
+                response.close()
+                logger.warning(f"HTTP {status_code}, {delay:.1f}초 후 재시도 ({attempt + 1}/{retries}): {host}")
+
+            self._note_retry(host)
+            time.sleep(delay + random.uniform(0, HTTP_RETRY_BACKOFF / 2))
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def statistics(self):
+        """호스트별 요청/오류 수와 응답 지연 시간 (ms)"""
+        with self.lock:
+            snapshot = {host: dict(stats) for host, stats in self.stats.items()}
+        for stats in snapshot.values():
+            stats['avg_ms'] = round(stats['total_ms'] / stats['requests'], 1) if stats['requests'] else None
+            stats['error_rate'] = round(
+                (stats['errors'] + stats['status_errors']) / stats['requests'] * 100, 1
+            ) if stats['requests'] else None
+            stats['total_ms'] = round(stats['total_ms'], 1)
+            stats['max_ms'] = round(stats['max_ms'], 1)
+        return snapshot
+
+    def close(self):
+        with self.lock:
+            sessions, self.sessions = self.sessions, {}
+        for session in sessions.values():
+            session.close()
+
+
+# 프로세스별 클라이언트 (첫 사용 시 생성)
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """프로세스 공용 HTTP 클라이언트"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def get_http_statistics():
+    """호스트별 외부 호출 통계 (현재 프로세스)"""
+    if _client is None:
+        return {}
+    return _client.statistics()
@@ -5,7 +5,7 @@
 """
 import re
 import logging
-from phrase.utils.translate import LibreTranslator
+from phrase.utils.translate import get_translator
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,7 @@ class InputValidator:
     """입력 텍스트 검증 및 품질 확인"""
     
     def __init__(self):
-        self.translator = LibreTranslator()
+        self.translator = get_translator()
     
     def validate_input(self, user_input):
         """
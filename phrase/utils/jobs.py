@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# phrase/utils/jobs.py
+"""
+백그라운드 작업 큐 (DB 테이블 기반)
+- 요청 처리 경로에서는 enqueue_job으로 작업 행만 추가하고 바로 응답
+- run_job_worker 명령(JobWorker)이 작업을 선점(SELECT ... FOR UPDATE SKIP LOCKED, SQLite는 조건부 UPDATE)해
+  스레드 풀에서 실행
+- 실패한 작업은 지수 백오프 후 재시도, 최대 시도 횟수를 넘으면 실패 상태로 보관
+- 워커가 비정상 종료해 선점된 채 남은 작업은 주기적으로 복구
+- 완료 작업/오래된 캐시 무효화 이력은 주기적으로 정리
+- PHRASE_JOB_MODE = 'inline'이면 워커 없이 커밋 직후 같은 프로세스에서 실행 (개발 환경용)
+"""
+import os
+import time
+import socket
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from django.conf import settings
+from django.db import connections, transaction
+
+from phrase.models import BackgroundJob, CacheInvalidation
+
+logger = logging.getLogger(__name__)
+
+# 워커 기본값: 동시 실행 수 / 대기 작업이 없을 때 조회 간격 (초)
+DEFAULT_JOB_CONCURRENCY = 4
+DEFAULT_JOB_POLL_INTERVAL = 1.0
+
+# 선점 후 이 시간(초)이 지나도 끝나지 않은 작업은 중단된 것으로 보고 복구
+JOB_STALE_TIMEOUT = 600
+
+# 중단 작업 복구 / 완료 작업 정리 주기 (초)
+JOB_MAINTENANCE_INTERVAL = 60
+JOB_CLEANUP_INTERVAL = 3600
+
+# 작업 종류 → 처리 함수(payload)
+_handlers = {}
+
+
+def job_handler(job_type):
+    """작업 처리 함수 등록 데코레이터 - 처리 함수가 예외를 내면 재시도"""
+    def decorator(func):
+        _handlers[job_type] = func
+        return func
+    return decorator
+
+
+def enqueue_job(job_type, payload=None, priority=0, delay=0, max_attempts=3):
+    """
+    작업 등록 - 등록한 BackgroundJob (inline 모드에서는 None)
+    payload는 JSON 직렬화 가능한 dict
+    """
+    if job_type not in _handlers:
+        raise ValueError(f"등록되지 않은 작업 종류: {job_type}")
+
+    if getattr(settings, 'PHRASE_JOB_MODE', 'queue') == 'inline':
+        transaction.on_commit(lambda: _run_inline(job_type, payload or {}))
+        return None
+
+    return BackgroundJob.objects.enqueue(job_type, payload, priority, delay, max_attempts)
+
+
+def _run_inline(job_type, payload):
+    try:
+        _handlers[job_type](payload)
+    except Exception as e:
+        logger.error(f"작업 실행 실패 ({job_type}, inline): {e}")
+
+
+def execute_job(job):
+    """선점한 작업 1건 실행 - 결과 상태 ('done' / 'queued'(재시도 예정) / 'failed')"""
+    started = time.perf_counter()
+    try:
+        handler = _handlers.get(job.job_type)
+        if handler is None:
+            raise LookupError(f"처리 함수가 없는 작업 종류: {job.job_type}")
+
+        handler(job.payload)
+        BackgroundJob.objects.complete(job)
+        logger.debug(f"작업 완료: {job} ({(time.perf_counter() - started) * 1000:.0f}ms)")
+        return 'done'
+
+    except Exception as e:
+        status = BackgroundJob.objects.fail(job, e)
+        logger.warning(f"작업 실패: {job} (시도 {job.attempts}/{job.max_attempts}, {status}): {e}")
+        return status
+
+    finally:
+        # 풀 스레드는 요청 주기 밖이므로 연결을 직접 정리
+        connections.close_all()
+
+
+class JobWorker:
+    """작업 선점 + 스레드 풀 실행 루프 (run_job_worker 명령)"""
+
+    def __init__(self, concurrency=DEFAULT_JOB_CONCURRENCY, poll_interval=DEFAULT_JOB_POLL_INTERVAL,
+                 job_types=None, stale_timeout=JOB_STALE_TIMEOUT):
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.job_types = job_types or None
+        self.stale_timeout = stale_timeout
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        """새 작업 선점 중단 - 실행 중인 작업은 끝까지 처리"""
+        self.stop_event.set()
+
+    def _maintain(self, now, state):
+        if now >= state['next_requeue']:
+            BackgroundJob.objects.requeue_stale(self.stale_timeout)
+            state['next_requeue'] = now + JOB_MAINTENANCE_INTERVAL
+        if now >= state['next_cleanup']:
+            BackgroundJob.objects.cleanup_finished()
+            CacheInvalidation.objects.cleanup_old_records()
+            state['next_cleanup'] = now + JOB_CLEANUP_INTERVAL
+
+    def _claim(self, limit):
+        try:
+            return BackgroundJob.objects.claim(self.worker_id, limit, self.job_types)
+        except Exception as e:
+            logger.error(f"작업 선점 실패: {e}")
+            connections.close_all()
+            return []
+
+    def run(self, once=False):
+        """
+        작업 처리 루프 - 결과 상태별 처리 건수
+        once: 지금 실행 가능한 작업을 모두 처리하면 종료 (cron 등 주기 실행용)
+        """
+        processed = Counter()
+        in_flight = set()
+        state = {'next_requeue': 0, 'next_cleanup': 0}
+
+        logger.info(f"작업 워커 시작: {self.worker_id} (동시 실행 {self.concurrency})")
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='job') as executor:
+            while not self.stop_event.is_set():
+                try:
+                    self._maintain(time.monotonic(), state)
+                except Exception as e:
+                    logger.error(f"작업 큐 정리 실패: {e}")
+
+                jobs = self._claim(self.concurrency - len(in_flight)) if len(in_flight) < self.concurrency else []
+                for job in jobs:
+                    in_flight.add(executor.submit(execute_job, job))
+
+                if not in_flight:
+                    if once:
+                        break
+                    self.stop_event.wait(self.poll_interval)
+                    continue
+
+                # 빈 슬롯이 생기거나 조회 간격이 지나면 다시 선점
+                done, in_flight = wait(in_flight, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    processed[future.result()] += 1
+
+            # 종료 요청 - 실행 중인 작업 완료 대기
+            for future in wait(in_flight).done:
+                processed[future.result()] += 1
+
+        connections.close_all()
+        logger.info(f"작업 워커 종료: {self.worker_id} {dict(processed)}")
+        return processed
+
+
+def get_job_statistics():
+    """작업 큐 상태 (모든 워커 공유 - DB 집계)"""
+    try:
+        return BackgroundJob.objects.get_statistics()
+    except Exception as e:
+        logger.warning(f"작업 큐 통계 조회 실패: {e}")
+        return {}
+
+
+# ===== 작업 처리 함수 =====
+# 처리 함수 모듈은 이 모듈을 임포트하는 쪽이 많으므로 함수 안에서 임포트
+
+@job_handler('record_search_query')
+def _record_search_query(payload):
+    """세션별 검색 기록 (템플릿 뷰)"""
+    from phrase.utils.search_helpers import record_search_query
+    record_search_query(**payload)
+
+
+@job_handler('search_history')
+def _save_search_history(payload):
+    """검색어 기록 (API 검색)"""
+    from phrase.utils.search_history import SearchHistoryManager
+    SearchHistoryManager.save_search_query(
+        payload['original_query'],
+        payload.get('translated_query'),
+        payload.get('result_count', 0)
+    )
+
+
+@job_handler('translate_dialogue')
+def _translate_dialogue(payload):
+    """대사 한글 번역"""
+    from phrase.utils.translate import translate_dialogue_async
+    translate_dialogue_async(payload['dialogue_id'])
+
+
+@job_handler('translate_pending_dialogues')
+def _translate_pending_dialogues(payload):
+    """번역 대기 대사 일괄 번역"""
+    from phrase.utils.translate import translate_pending_dialogues
+    translate_pending_dialogues(**payload)
+
+
+@job_handler('collect_movie_poster')
+def _collect_movie_poster(payload):
+    """영화 IMDB 포스터/정보 수집"""
+    from phrase.utils.load_to_db import collect_movie_poster
+    collect_movie_poster(payload['movie_id'], payload['imdb_url'])
@@ -7,7 +7,6 @@ DB 저장 및 조회 함수 - 4개 모듈 완전 최적화 (수정됨)
 - 에러 처리 강화
 """
 import re
-import time
 import logging
 from django.db import transaction, models
 from django.core.files import File
@@ -18,10 +17,14 @@ from io import BytesIO
 import requests
 
 # 새로운 모델과 매니저 활용
-from phrase.models import RequestTable, MovieTable, DialogueTable
+from phrase.caching import make_key, cache_get, clear_negative
+from phrase.models import RequestTable, MovieTable, DialogueTable, increment_counter
+from phrase.models.managers import compute_request_statistics, compute_dialogue_statistics
 from phrase.utils.get_imdb_poster_url import IMDBPosterExtractor, download_poster_image
 # 임포트 오류 수정: phrase.application.translate -> phrase.utils.translate
-from phrase.utils.translate import LibreTranslator
+from phrase.utils.translate import get_translator
+from phrase.utils.jobs import enqueue_job
+from phrase.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -55,48 +58,42 @@ def convert_to_pep8_filename(text):
 
 
 def download_file_with_retry(url, file_type='image', max_retries=3, timeout=30):
-    """파일 다운로드 재시도 로직 (개선된 버전)"""
+    """파일 다운로드 (연결 오류/429/5xx 재시도는 공용 HTTP 클라이언트가 처리)"""
     if not url:
         logger.warning(f"{file_type} URL이 없습니다")
         return None
     
-    for attempt in range(max_retries):
-        try:
-            logger.info(f"{file_type} 다운로드 시도 {attempt + 1}/{max_retries}: {url}")
-            
-            response = requests.get(
-                url, 
-                stream=True, 
-                timeout=timeout,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-            )
-            response.raise_for_status()
-            
-            # 파일 크기 체크 (메모리 보호)
-            content_length = response.headers.get('content-length')
-            if content_length:
-                size_mb = int(content_length) / (1024 * 1024)
-                max_size = 50 if file_type == 'video' else 10  # MB
-                
-                if size_mb > max_size:
-                    logger.warning(f"{file_type} 파일이 너무 큼: {size_mb:.1f}MB (최대 {max_size}MB)")
-                    return None
-            
-            content = BytesIO(response.content)
-            ext = 'jpg' if file_type == 'image' else 'mp4'
-            
-            logger.info(f"{file_type} 다운로드 성공: {len(response.content)} bytes")
-            return content, ext
+    try:
+        logger.info(f"{file_type} 다운로드: {url}")
+        
+        response = get_http_client().get(
+            url,
+            stream=True,
+            timeout=timeout,
+            retries=max_retries - 1
+        )
+        response.raise_for_status()
+        
+        # 파일 크기 체크 (메모리 보호)
+        content_length = response.headers.get('content-length')
+        if content_length:
+            size_mb = int(content_length) / (1024 * 1024)
+            max_size = 50 if file_type == 'video' else 10  # MB
             
-        except requests.RequestException as e:
-            logger.warning(f"{file_type} 다운로드 시도 {attempt + 1} 실패: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # 지수 백오프
-            else:
-                logger.error(f"{file_type} 다운로드 최종 실패: {url}")
+            if size_mb > max_size:
+                logger.warning(f"{file_type} 파일이 너무 큼: {size_mb:.1f}MB (최대 {max_size}MB)")
+                response.close()
                 return None
+        
+        content = BytesIO(response.content)
+        ext = 'jpg' if file_type == 'image' else 'mp4'
+        
+        logger.info(f"{file_type} 다운로드 성공: {len(response.content)} bytes")
+        return content, ext
+        
+    except requests.RequestException as e:
+        logger.error(f"{file_type} 다운로드 최종 실패: {url} - {e}")
+        return None
 
 
 # ===== 4개 모듈 연동 최적화 함수들 =====
@@ -120,9 +117,8 @@ def save_request_table_optimized(request_phrase, request_korean=None,
         )
         
         if not created:
-            # 기존 요청인 경우 카운트 증가
-            request_obj.search_count += 1
-            request_obj.save(update_fields=['search_count'])
+            # 기존 요청인 경우 카운트 증가 (지연 쓰기)
+            increment_counter('phrase.RequestTable', request_obj.pk, 'search_count')
             
             # 한글 번역이 없고 새로운 한글이 있으면 업데이트
             if not request_obj.request_korean and request_korean:
@@ -172,14 +168,12 @@ def save_movie_table_optimized(movie_data):
             data_quality='pending'  # 초기 품질 상태
         )
         
-        # IMDB 정보 수집 (조건부)
+        # IMDB 정보 수집 (조건부, 작업 큐 - 요청 처리 경로에서 외부 호출/다운로드 없음)
         if movie_data.get('source_url') and not movie_obj.poster_url:
-            poster_info = collect_imdb_info_smart(movie_obj, movie_data['source_url'])
-            
-            if poster_info:
-                movie_obj.poster_url = poster_info.get('poster_url', '')
-                movie_obj.data_quality = 'verified'  # IMDB 정보 있으면 검증됨
-                movie_obj.save(update_fields=['poster_url', 'data_quality'])
+            enqueue_job('collect_movie_poster', {
+                'movie_id': movie_obj.id,
+                'imdb_url': movie_data['source_url'],
+            })
         
         logger.info(f"✅ 새 영화 저장 완료: {movie_title}")
         return movie_obj
@@ -189,13 +183,31 @@ def save_movie_table_optimized(movie_data):
         return None
 
 
+def collect_movie_poster(movie_id, imdb_url):
+    """
+    영화 IMDB 포스터/정보 수집 후 저장 (백그라운드 작업 collect_movie_poster)
+    """
+    movie_obj = MovieTable.objects.filter(id=movie_id).first()
+    if movie_obj is None or movie_obj.poster_url:
+        return None
+    
+    poster_info = collect_imdb_info_smart(movie_obj, imdb_url)
+    
+    if poster_info:
+        movie_obj.poster_url = poster_info.get('poster_url', '')
+        movie_obj.data_quality = 'verified'  # IMDB 정보 있으면 검증됨
+        movie_obj.save(update_fields=['poster_url', 'data_quality'])
+    
+    return poster_info
+
+
 def collect_imdb_info_smart(movie_obj, imdb_url):
     """
     IMDB 정보 스마트 수집 (캐시 우선)
     """
     # 캐시 확인
-    cache_key = f"imdb_info_{movie_obj.movie_title}_{movie_obj.release_year}"
-    cached_info = cache.get(cache_key)
+    cache_key = make_key('imdb_info', movie_obj.movie_title, movie_obj.release_year)
+    cached_info = cache_get(cache_key)
     
     if cached_info:
         logger.info(f"IMDB 정보 캐시에서 조회: {movie_obj.movie_title}")
@@ -240,7 +252,9 @@ def collect_imdb_info_smart(movie_obj, imdb_url):
 def save_dialogue_table_optimized(movie_obj, dialogue_data, 
                                  auto_translate=True, download_video=False):
     """
-    대사테이블 최적화 저장 (자동 번역 포함) - 일본어/중국어 필드 제거 반영
+    대사테이블 최적화 저장 - 일본어/중국어 필드 제거 반영
+    auto_translate: 캐시/번역 메모리에 있는 번역은 바로 채움 (API 호출 없음)
+    나머지는 번역 대기로 저장되고 커밋 후 배치 번역 작업이 번역
     """
     try:
         dialogue_phrase = dialogue_data.get('dialogue_phrase', dialogue_data.get('text', ''))
@@ -261,28 +275,22 @@ def save_dialogue_table_optimized(movie_obj, dialogue_data,
             logger.info(f"⏩ 대사 이미 존재: {dialogue_phrase[:50]}...")
             return existing_dialogue
         
+        # 저장된 번역 조회 (없으면 번역 대기로 저장 - 트랜잭션 안에서 번역 API 호출 안 함)
+        korean_translation = lookup_saved_translation(dialogue_phrase) if auto_translate else None
+        
         # 새 대사 생성
         dialogue_obj = DialogueTable.objects.create(
             movie=movie_obj,
             dialogue_phrase=dialogue_phrase,
+            dialogue_phrase_ko=korean_translation or '',
             dialogue_start_time=start_time,
             dialogue_end_time=dialogue_data.get('dialogue_end_time', ''),
             video_url=video_url,
             video_quality=dialogue_data.get('video_quality', 'unknown'),
-            translation_method='unknown',
+            translation_method='api_auto' if korean_translation else 'unknown',
             translation_quality='fair'
         )
         
-        # 자동 번역 수행 (조건부)
-        if auto_translate and dialogue_phrase:
-            korean_translation = perform_smart_translation(dialogue_phrase)
-            
-            if korean_translation:
-                dialogue_obj.dialogue_phrase_ko = korean_translation
-                dialogue_obj.translation_method = 'api_auto'
-                dialogue_obj.save(update_fields=['dialogue_phrase_ko', 'translation_method'])
-                logger.info(f"✅ 자동 번역 완료: {dialogue_phrase[:30]}...")
-        
         # 비디오 다운로드 (선택적)
         if download_video and video_url:
             video_content = download_file_with_retry(video_url, 'video')
@@ -310,46 +318,12 @@ def save_dialogue_table_optimized(movie_obj, dialogue_data,
         return None
 
 
-def perform_smart_translation(text):
-    """
-    스마트 번역 수행 (캐시 및 품질 체크)
-    """
-    if not text or len(text.strip()) < 2:
-        return None
-    
-    # 번역 캐시 확인
-    cache_key = f"translation_{hash(text)}"
-    cached_translation = cache.get(cache_key)
-    
-    if cached_translation:
-        logger.debug(f"번역 캐시에서 조회: {text[:20]}...")
-        return cached_translation
-    
+def lookup_saved_translation(text):
+    """캐시/번역 메모리에 저장된 한글 번역 조회 (API 호출 없음, 없으면 None)"""
     try:
-        translator = LibreTranslator()
-        
-        # 이미 한글인지 확인
-        if translator.is_korean(text):
-            logger.debug(f"이미 한글 텍스트: {text[:20]}...")
-            return text
-        
-        # 영어 → 한글 번역
-        korean_text = translator.translate_to_korean(text)
-        
-        if korean_text and korean_text != text:
-            # 번역 품질 간단 체크
-            if len(korean_text) > len(text) * 3:  # 너무 긴 번역은 의심
-                logger.warning(f"번역이 의심스럽게 김: {text[:20]}... → {korean_text[:20]}...")
-                return None
-            
-            # 캐시에 저장 (1시간)
-            cache.set(cache_key, korean_text, 3600)
-            return korean_text
-        
-        return None
-        
+        return get_translator().lookup_translations([text], 'en|ko').get(text)
     except Exception as e:
-        logger.error(f"번역 실패: {text[:20]}... - {e}")
+        logger.warning(f"저장된 번역 조회 실패: {text[:20]}... - {e}")
         return None
 
 
@@ -410,6 +384,12 @@ def load_to_db(movies, request_phrase=None, request_korean=None,
     # 4단계: 통계 및 캐시 업데이트
     update_statistics_and_cache(processed_movies)
     
+    # 대사가 저장된 요청 구문은 결과 없음 캐시 해제 (이후 검색에서 DB/API 조회 생략되지 않도록)
+    if processed_movies:
+        for phrase in (request_phrase, request_korean):
+            if phrase:
+                clear_negative(phrase.strip())
+    
     logger.info(f"✅ 4개 모듈 최적화 저장 완료: {len(processed_movies)}개 성공")
     return processed_movies
 
@@ -449,10 +429,6 @@ def process_movie_batch_optimized(batch, auto_translate=True, download_media=Fal
         except Exception as e:
             logger.error(f"영화 개별 처리 실패: {movie_data.get('name', movie_data.get('movie_title', 'Unknown'))} - {e}")
             continue
-            
-        # API 호출 간격 조절 (번역 API 부하 방지)
-        if auto_translate:
-            time.sleep(0.2)
     
     return batch_results
 
@@ -504,14 +480,10 @@ def update_statistics_and_cache(processed_movies):
     """
     try:
         # 관련 캐시 무효화
-        cache_keys = [
-            'movie_statistics',
-            'dialogue_statistics',
-            'request_statistics'
-        ]
-        
-        for key in cache_keys:
-            cache.delete(key)
+        cache.delete(make_key('movie_statistics'))
+        # 요청/대사 통계는 삭제하면 다음 요청이 전체 집계를 기다리므로 여기(배치 작업)에서 재계산
+        compute_request_statistics.refresh()
+        compute_dialogue_statistics.refresh()
         
         logger.info(f"통계 캐시 무효화 완료: {len(processed_movies)}개 처리")
         
@@ -526,20 +498,11 @@ def get_search_results_from_db(request_phrase, request_korean=None):
     매니저를 활용한 최적화된 DB 조회
     """
     try:
-        # 기본 텍스트 검색
-        search_results = DialogueTable.objects.filter(
-            dialogue_phrase__icontains=request_phrase
-        )
-        
-        # 한글 검색 추가
-        if request_korean:
-            korean_results = DialogueTable.objects.filter(
-                dialogue_phrase_ko__icontains=request_korean
-            )
-            search_results = search_results.union(korean_results)
+        # 기본 텍스트 검색 + 한글 검색 (한글은 n-gram 색인 포함)
+        search_results = DialogueTable.objects.search_any(request_phrase, request_korean)
         
         # 영화 정보와 함께 조회 (select_related 최적화)
-        search_results = search_results.select_related('movie').distinct()
+        search_results = search_results.select_related('movie')
         
         if not search_results.exists():
             logger.info(f"DB 조회 결과 없음: {request_phrase}")
@@ -581,7 +544,7 @@ __features__ = [
     "임포트 오류 수정",
     "4개 모듈 완전 연동",
     "배치 처리 최적화",
-    "자동 번역 시스템",
+    "번역 대기 + 배치 번역 작업",
     "에러 복구 강화"
 ]
 
@@ -5,8 +5,9 @@
 - 임포트 오류 수정
 """
 import logging
-from phrase.models import RequestTable, UserSearchQuery
-from phrase.utils.translate import LibreTranslator
+from django.db.models import F
+from phrase.models import RequestTable, UserSearchQuery, increment_counter
+from phrase.utils.translate import get_translator
 
 logger = logging.getLogger(__name__)
 
@@ -51,8 +52,8 @@ def record_search_query(session_key, original_query, translated_query,
         
         if not created:
             # 기존 검색인 경우 카운트 증가
-            search_query.search_count += 1
-            search_query.save(update_fields=['search_count'])
+            search_query.search_count = F('search_count') + 1
+            search_query.save(update_fields=['search_count', 'updated_at'])
         
         logger.info(f"📊 검색기록 저장: {original_query} ({result_count}개 결과)")
         
@@ -60,6 +61,27 @@ def record_search_query(session_key, original_query, translated_query,
         logger.error(f"❌ 검색기록 저장 실패: {e}")
 
 
+def schedule_search_query_record(session_key, original_query, translated_query,
+                                 result_count, has_results, response_time,
+                                 ip_address, user_agent):
+    """검색 쿼리 기록을 백그라운드 작업으로 등록 (record_search_query와 같은 인자)"""
+    from phrase.utils.jobs import enqueue_job
+    
+    try:
+        enqueue_job('record_search_query', {
+            'session_key': session_key,
+            'original_query': original_query,
+            'translated_query': translated_query,
+            'result_count': result_count,
+            'has_results': has_results,
+            'response_time': response_time,
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+        })
+    except Exception as e:
+        logger.error(f"❌ 검색기록 작업 등록 실패: {e}")
+
+
 def increment_search_count(request_phrase, request_korean, result_count, user_ip, user_agent):
     """검색 횟수 증가"""
     try:
@@ -74,8 +96,8 @@ def increment_search_count(request_phrase, request_korean, result_count, user_ip
             }
         )
         if not created:
-            request_obj.search_count += 1
-            request_obj.save(update_fields=['search_count'])
+            # 지연 쓰기 (동시 요청에서도 증가분 유실 없음)
+            increment_counter('phrase.RequestTable', request_obj.pk, 'search_count')
         print("📊 DEBUG: 검색횟수 증가 완료")
     except Exception as e:
         print(f"⚠️ DEBUG: 검색횟수 증가 실패: {e}")
@@ -86,7 +108,7 @@ def get_input_type(user_input):
     try:
         # 수정: phrase.application.translate -> phrase.utils.translate
 
-        translator = LibreTranslator()
+        translator = get_translator()
         
         if translator.is_korean(user_input):
             return {
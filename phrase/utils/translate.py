@@ -10,25 +10,29 @@
 import requests
 import re
 from urllib.parse import quote
-import time
 import logging
 from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 
+from phrase.caching import make_key, cache_get, record_cache_access
+from .http_client import get_http_client, HTTP_INTERACTIVE_MAX_RETRY_AFTER
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+class TranslationUnavailable(Exception):
+    """번역 API를 일시적으로 쓸 수 없음 (429/5xx/네트워크 오류/속도 제한 대기 초과) - 나중에 다시 번역할 대상"""
+
+
 class LibreTranslator:
     def __init__(self):
         # MyMemory API 사용 (더 안정적)
         self.api_url = "https://api.mymemory.translated.net/get"
         self.max_retries = 3
-        self.retry_delay = 1
         
-        # 캐싱 설정
+        # 캐싱 설정 (영구 보관은 번역 메모리 - TranslationMemory)
         self.cache_timeout = 3600  # 1시간
-        self.cache_prefix = "translation_"
     
     def is_korean(self, text):
         """한글 포함 여부 확인"""
@@ -41,122 +45,194 @@ class LibreTranslator:
         return bool(english_pattern.search(text))
     
     def translate_to_english(self, text):
-        """한글 → 영어 번역 (캐싱 적용)"""
+        """한글 → 영어 번역 (캐시 → 번역 메모리 → API)"""
         if not self.is_korean(text):
             return text
         
         if len(text.strip()) < 2:
             return text
         
-        # 캐시 확인
-        cache_key = f"{self.cache_prefix}ko_en_{hash(text)}"
-        cached_result = cache.get(cache_key)
-        
-        if cached_result:
-            logger.debug(f"캐시에서 번역 조회: {text[:20]}...")
-            return cached_result
-        
-        # 번역 수행
-        translated = self._translate(text, 'ko|en')
-        
-        # 캐시에 저장
-        if translated != text:  # 번역이 성공한 경우만
-            cache.set(cache_key, translated, self.cache_timeout)
-        
-        return translated
+        return self._translate_with_memory(text, 'ko|en')
     
     def translate_to_korean(self, text):
-        """영어 → 한글 번역 (캐싱 적용)"""
+        """영어 → 한글 번역 (캐시 → 번역 메모리 → API)"""
         if not self.is_english(text):
             return text
         
         if len(text.strip()) < 2:
             return text
         
-        # 캐시 확인
-        cache_key = f"{self.cache_prefix}en_ko_{hash(text)}"
-        cached_result = cache.get(cache_key)
+        return self._translate_with_memory(text, 'en|ko')
+    
+    def translate_many_to_korean(self, texts):
+        """
+        영어 → 한글 일괄 번역 - {원문: 번역} (BatchTranslationResult, unavailable: API를 쓸 수 없어 번역하지 못한 원문)
+        배치 번역 엔진 사용: 중복 제거 + 캐시/번역 메모리 일괄 조회 + 없는 원문만 동시 API 호출 (공유 속도 제한)
+        """
+        from .batch_translate import get_batch_translation_engine
+        
+        candidates = [
+            text for text in texts if text and self.is_english(text) and len(text.strip()) >= 2
+        ]
+        return get_batch_translation_engine().translate_many(candidates, 'en|ko')
+    
+    def lookup_translations(self, texts, langpair):
+        """
+        캐시 → 번역 메모리 순서로 일괄 조회 (API 호출 없음) - {원문: 번역}
+        번역 메모리에서 찾은 번역은 캐시에도 저장
+        """
+        source, target = langpair.split('|')
+        keys = {make_key('translation', source, target, text): text for text in texts}
+        if not keys:
+            return {}
+        
+        translations = {}
+        try:
+            cached = cache.get_many(list(keys))
+        except Exception as e:
+            logger.warning(f"번역 캐시 조회 실패: {e}")
+            cached = {}
+        
+        for key, text in keys.items():
+            hit = cached.get(key) is not None
+            record_cache_access('translation', hit)
+            if hit:
+                translations[text] = cached[key]
         
-        if cached_result:
-            logger.debug(f"캐시에서 번역 조회: {text[:20]}...")
-            return cached_result
+        remaining = [text for text in keys.values() if text not in translations]
+        if not remaining:
+            return translations
         
-        # 번역 수행
-        translated = self._translate(text, 'en|ko')
+        try:
+            from phrase.models import TranslationMemory
+            remembered = TranslationMemory.objects.lookup_many(remaining, langpair)
+        except Exception as e:
+            logger.warning(f"번역 메모리 조회 실패: {e}")
+            return translations
+        
+        if remembered:
+            logger.debug(f"번역 메모리 적중: {len(remembered)}/{len(remaining)}개 ({langpair})")
+            cache.set_many(
+                {make_key('translation', source, target, text): translated for text, translated in remembered.items()},
+                self.cache_timeout
+            )
+            translations.update(remembered)
         
-        # 캐시에 저장
-        if translated != text:  # 번역이 성공한 경우만
-            cache.set(cache_key, translated, self.cache_timeout)
+        return translations
+    
+    def _translate_with_memory(self, text, langpair):
+        """캐시/번역 메모리에 없을 때만 API 번역 (번역하지 못하면 원문)"""
+        remembered = self.lookup_translations([text], langpair).get(text)
+        if remembered:
+            logger.debug(f"저장된 번역 사용: {text[:20]}...")
+            return remembered
         
-        return translated
+        try:
+            return self._translate_and_remember(text, langpair) or text
+        except TranslationUnavailable:
+            return text
     
-    def _translate(self, text, langpair):
-        """공통 번역 로직 (개선된 에러 처리)"""
-        for attempt in range(self.max_retries):
+    def _translate_and_remember(self, text, langpair, interactive=True):
+        """
+        API 번역 후 성공한 번역만 캐시와 번역 메모리에 저장 (interactive: _request_translation 참고)
+        반환: 번역 / None (응답은 왔지만 유효하지 않은 번역), API를 쓸 수 없으면 TranslationUnavailable
+        """
+        translated = self._request_translation(text, langpair, interactive)
+        
+        if translated:
+            source, target = langpair.split('|')
+            cache.set(make_key('translation', source, target, text), translated, self.cache_timeout)
+            
             try:
-                # URL 파라미터로 전송
-                params = {
-                    'q': text.strip(),
-                    'langpair': langpair
-                }
-                
-                response = requests.get(
-                    self.api_url, 
-                    params=params, 
-                    timeout=10,
-                    headers={
-                        'User-Agent': 'EndlessRealClips/1.0'
-                    }
+                from phrase.models import TranslationMemory
+                TranslationMemory.objects.remember(
+                    text, translated, langpair,
+                    quality_score=self._calculate_confidence(text, translated, langpair)
                 )
-                
-                logger.debug(f"번역 API 응답: {response.status_code} (시도 {attempt + 1}/{self.max_retries})")
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    if result.get('responseStatus') == 200:
-                        translated_text = result['responseData']['translatedText']
-                        
-                        # 번역 품질 검증
-                        if self._is_valid_translation(text, translated_text, langpair):
-                            logger.info(f"번역 성공: '{text[:30]}...' → '{translated_text[:30]}...' ({langpair})")
-                            
-                            # 번역 품질 기록 (통계용)
-                            self._record_translation_quality(text, translated_text, langpair, 'success')
-                            
-                            return translated_text
-                        else:
-                            logger.warning(f"번역 품질 낮음: '{text[:30]}...' → '{translated_text[:30]}...'")
-                            self._record_translation_quality(text, translated_text, langpair, 'poor_quality')
-                            
-                    else:
-                        logger.warning(f"API 응답 오류: {result.get('responseDetails', 'Unknown error')}")
-                        
-                elif response.status_code == 429:  # Too Many Requests
-                    logger.warning(f"API 요청 한도 초과, {self.retry_delay * (attempt + 1)}초 대기")
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    continue
-                    
-                else:
-                    logger.error(f"HTTP 오류: {response.status_code}")
-                
-                # 재시도 대기
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                    
-            except requests.exceptions.RequestException as e:
-                logger.error(f"번역 요청 중 오류 (시도 {attempt + 1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    
             except Exception as e:
-                logger.error(f"번역 중 예상치 못한 오류: {e}")
-                break
+                logger.warning(f"번역 메모리 저장 실패: {e}")
         
-        # 모든 시도 실패 시 원본 반환
-        logger.error(f"번역 최종 실패: '{text[:30]}...' ({langpair})")
-        self._record_translation_quality(text, text, langpair, 'failed')
-        return text
+        return translated
+    
+    def _translate(self, text, langpair):
+        """공통 번역 로직 - 번역하지 못하면 원문 반환"""
+        try:
+            return self._request_translation(text, langpair) or text
+        except TranslationUnavailable:
+            return text
+    
+    def _request_translation(self, text, langpair, interactive=True):
+        """
+        번역 API 호출 - 연결 오류/429/5xx 재시도는 공용 HTTP 클라이언트가 처리 (Retry-After 준수)
+        interactive: 사용자 요청 처리 중 호출 - 재시도 1회, 짧은 Retry-After만 대기 (False: 백그라운드 배치 번역)
+        반환: 번역 / None (응답은 왔지만 유효하지 않은 번역)
+        재시도 후에도 429/5xx/네트워크 오류/사용량 초과면 TranslationUnavailable (일시적 - 다시 시도할 대상)
+        """
+        try:
+            # URL 파라미터로 전송
+            params = {
+                'q': text.strip(),
+                'langpair': langpair
+            }
+            
+            if interactive:
+                retry_options = {'retries': 1, 'max_retry_after': HTTP_INTERACTIVE_MAX_RETRY_AFTER}
+            else:
+                retry_options = {'retries': self.max_retries - 1}
+            
+            response = get_http_client().get(
+                self.api_url,
+                params=params,
+                **retry_options
+            )
+            
+            logger.debug(f"번역 API 응답: {response.status_code}")
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                raise TranslationUnavailable(f"HTTP {response.status_code}")
+            
+            if response.status_code != 200:
+                logger.error(f"HTTP 오류: {response.status_code}")
+                self._record_translation_quality(text, text, langpair, 'failed')
+                return None
+            
+            result = response.json()
+            response_status = result.get('responseStatus')
+            
+            if response_status == 429 or (isinstance(response_status, int) and response_status >= 500):
+                # 일일 사용량 초과 등
+                raise TranslationUnavailable(f"API 응답 {response_status}: {result.get('responseDetails', '')}")
+            
+            if response_status != 200:
+                logger.warning(f"API 응답 오류: {result.get('responseDetails', 'Unknown error')}")
+                self._record_translation_quality(text, text, langpair, 'failed')
+                return None
+            
+            translated_text = (result.get('responseData') or {}).get('translatedText') or ''
+            
+            # 번역 품질 검증
+            if self._is_valid_translation(text, translated_text, langpair):
+                logger.info(f"번역 성공: '{text[:30]}...' → '{translated_text[:30]}...' ({langpair})")
+                
+                # 번역 품질 기록 (통계용)
+                self._record_translation_quality(text, translated_text, langpair, 'success')
+                
+                return translated_text
+            
+            logger.warning(f"번역 품질 낮음: '{text[:30]}...' → '{translated_text[:30]}...'")
+            self._record_translation_quality(text, translated_text, langpair, 'poor_quality')
+            return None
+            
+        except TranslationUnavailable as e:
+            logger.error(f"번역 API 사용 불가: '{text[:30]}...' ({langpair}) - {e}")
+            self._record_translation_quality(text, text, langpair, 'failed')
+            raise
+            
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # 네트워크 오류 / JSON이 아닌 응답 (오류 페이지 등)
+            logger.error(f"번역 요청 중 오류: '{text[:30]}...' ({langpair}) - {e}")
+            self._record_translation_quality(text, text, langpair, 'failed')
+            raise TranslationUnavailable(str(e)) from e
     
     def _is_valid_translation(self, original, translated, langpair):
         """번역 품질 검증 (강화)"""
@@ -220,9 +296,9 @@ class LibreTranslator:
             
             # 캐시에 통계 저장 (일일 통계)
             today = timezone.now().strftime('%Y-%m-%d')
-            stats_key = f"translation_stats_{today}"
+            stats_key = make_key('translation_stats', today)
             
-            daily_stats = cache.get(stats_key, {
+            daily_stats = cache_get(stats_key, {
                 'total': 0,
                 'success': 0,
                 'poor_quality': 0,
@@ -305,9 +381,9 @@ class LibreTranslator:
     def get_translation_statistics(self):
         """번역 통계 조회"""
         today = timezone.now().strftime('%Y-%m-%d')
-        stats_key = f"translation_stats_{today}"
+        stats_key = make_key('translation_stats', today)
         
-        return cache.get(stats_key, {
+        return cache_get(stats_key, {
             'total': 0,
             'success': 0,
             'poor_quality': 0,
@@ -316,11 +392,22 @@ class LibreTranslator:
             'en_ko': 0
         })
 
+# 프로세스 공용 번역기 (설정만 가진 객체라 스레드 간 공유 가능)
+_translator = None
+
+
+def get_translator():
+    """프로세스 공용 LibreTranslator"""
+    global _translator
+    if _translator is None:
+        _translator = LibreTranslator()
+    return _translator
+
 # 번역 유틸리티 함수들 (새 모델 활용)
 
 def translate_dialogue_batch(dialogues, batch_size=20):
     """대화 목록을 배치 번역 (최적화)"""
-    translator = LibreTranslator()
+    translator = get_translator()
     translated_dialogues = []
     
     # 번역이 필요한 대사들만 필터링
@@ -331,27 +418,26 @@ def translate_dialogue_batch(dialogues, batch_size=20):
     for i in range(0, len(needs_translation), batch_size):
         batch = needs_translation[i:i + batch_size]
         
+        # 캐시/번역 메모리 일괄 조회 후 없는 대사만 API 번역
+        failed = False
+        try:
+            translations = translator.translate_many_to_korean([dialogue['text'] for dialogue in batch])
+        except Exception as e:
+            logger.error(f"배치 번역 실패: {e}")
+            translations, failed = {}, True
+        
         for dialogue in batch:
-            try:
-                korean_text = translator.translate_to_korean(dialogue['text'])
-                if korean_text and korean_text != dialogue['text']:
-                    dialogue['text_ko'] = korean_text
-                    dialogue['translation_method'] = 'api_auto'
-                    dialogue['translation_quality'] = 'fair'
-            except Exception as e:
-                logger.error(f"배치 번역 실패: {e}")
+            korean_text = translations.get(dialogue['text'])
+            if korean_text and korean_text != dialogue['text']:
+                dialogue['text_ko'] = korean_text
+                dialogue['translation_method'] = 'api_auto'
+                dialogue['translation_quality'] = 'fair'
+            elif failed:
                 dialogue['text_ko'] = dialogue['text']  # 원본 유지
                 dialogue['translation_method'] = 'failed'
                 dialogue['translation_quality'] = 'poor'
             
             translated_dialogues.append(dialogue)
-            
-            # API 호출 간격 조절
-            time.sleep(0.05)
-        
-        # 배치 간 대기
-        if i + batch_size < len(needs_translation):
-            time.sleep(0.5)
     
     # 번역이 필요없던 대사들 추가
     for dialogue in dialogues:
@@ -366,7 +452,7 @@ def update_existing_dialogues_optimized():
     """기존 대사들의 한글 번역 업데이트 (최적화된 매니저 활용)"""
     from phrase.models import DialogueTable
     
-    translator = LibreTranslator()
+    translator = get_translator()
     
     # 매니저를 활용하여 번역이 필요한 대사들 조회
     dialogues_without_korean = DialogueTable.objects.needs_translation('ko')
@@ -374,6 +460,7 @@ def update_existing_dialogues_optimized():
     total_count = dialogues_without_korean.count()
     updated_count = 0
     failed_count = 0
+    skipped_count = 0
     
     logger.info(f"한글 번역이 필요한 대사 {total_count}개 발견")
     
@@ -386,11 +473,24 @@ def update_existing_dialogues_optimized():
     for i in range(0, total_count, batch_size):
         batch_dialogues = dialogues_without_korean[i:i + batch_size]
         
+        batch_dialogues = list(batch_dialogues)
+        
+        # 캐시/번역 메모리 일괄 조회 후 없는 대사만 API 번역 (영어 → 한글)
+        translations = translator.translate_many_to_korean(
+            [dialogue.dialogue_phrase for dialogue in batch_dialogues]
+        )
+        
+        unavailable = getattr(translations, 'unavailable', set())
+        
         with transaction.atomic():
             for dialogue in batch_dialogues:
                 try:
-                    # 영어 → 한글 번역
-                    korean_text = translator.translate_to_korean(dialogue.dialogue_phrase)
+                    korean_text = translations.get(dialogue.dialogue_phrase)
+                    
+                    if dialogue.dialogue_phrase in unavailable:
+                        # API를 일시적으로 쓸 수 없음 - 실패로 표시하지 않고 다음 실행에서 다시 번역
+                        skipped_count += 1
+                        continue
                     
                     if korean_text and korean_text != dialogue.dialogue_phrase:
                         # 번역 성공
@@ -414,18 +514,12 @@ def update_existing_dialogues_optimized():
                     logger.error(f"대사 번역 실패 (ID: {dialogue.id}): {e}")
                     failed_count += 1
                     continue
-                
-                # API 호출 간격 조절
-                time.sleep(0.1)
         
         # 배치 간 진행 상황 로그
         processed = min(i + batch_size, total_count)
         logger.info(f"진행 상황: {processed}/{total_count} ({updated_count}개 성공, {failed_count}개 실패)")
-        
-        # 배치 간 대기 (API 제한 방지)
-        time.sleep(1)
     
-    logger.info(f"일괄 번역 완료: {updated_count}개 번역됨, {failed_count}개 실패")
+    logger.info(f"일괄 번역 완료: {updated_count}개 번역됨, {failed_count}개 실패, {skipped_count}개 보류 (API 사용 불가)")
     
     # 통계 업데이트
     _update_translation_statistics(updated_count, failed_count)
@@ -438,6 +532,105 @@ def translate_missing_korean_dialogues():
     return update_existing_dialogues_optimized()
 
 
+# 번역 대기(pending) 대사 배치 번역
+# 저장 후 이 시간(초) 동안 들어온 대기 대사를 모아 작업 1건으로 번역
+PENDING_TRANSLATION_DELAY = 5
+PENDING_TRANSLATION_BATCH_SIZE = 50
+# 작업 1건이 처리하는 최대 대사 수 (남으면 다음 작업을 이어서 등록)
+PENDING_TRANSLATION_LIMIT = 500
+# API를 쓸 수 없을 때 작업 재시도 횟수 (작업 큐의 지수 백오프 적용)
+PENDING_TRANSLATION_MAX_ATTEMPTS = 10
+
+
+def schedule_pending_translation(delay=PENDING_TRANSLATION_DELAY):
+    """
+    번역 대기 대사 배치 번역 작업 등록 - 등록했으면 True
+    지연 시간 안에 이미 등록된 작업이 있으면 건너뜀 (그 작업이 함께 처리)
+    """
+    from .jobs import enqueue_job
+    
+    guard_key = make_key('job_schedule', 'translate_pending_dialogues')
+    try:
+        if not cache.add(guard_key, True, max(1, delay)):
+            return False
+        enqueue_job(
+            'translate_pending_dialogues', delay=delay, max_attempts=PENDING_TRANSLATION_MAX_ATTEMPTS
+        )
+        return True
+    except Exception as e:
+        cache.delete(guard_key)
+        logger.warning(f"번역 대기 작업 등록 실패: {e}")
+        return False
+
+
+def translate_pending_dialogues(batch_size=PENDING_TRANSLATION_BATCH_SIZE, limit=PENDING_TRANSLATION_LIMIT):
+    """
+    번역 대기 대사 일괄 번역 (배치 번역 작업) - 처리한 대사 수
+    캐시/번역 메모리를 먼저 조회하고 없는 대사만 API 번역
+    - 응답은 왔지만 유효한 번역이 없으면 실패로 표시
+    - API를 일시적으로 쓸 수 없으면 (429/5xx/네트워크 오류/속도 제한 대기 초과) 대기 상태로 두고
+      나머지를 저장한 뒤 TranslationUnavailable 발생 → 작업 큐가 백오프 후 재시도
+    """
+    from phrase.models import DialogueTable
+    
+    translator = get_translator()
+    processed = translated_count = 0
+    unavailable_count = 0
+    
+    while processed < limit:
+        batch = list(
+            DialogueTable.objects.pending_translation()
+            .order_by('id')[:min(batch_size, limit - processed)]
+        )
+        if not batch:
+            break
+        
+        translations = translator.translate_many_to_korean(
+            [dialogue.dialogue_phrase for dialogue in batch]
+        )
+        
+        for dialogue in batch:
+            if dialogue.dialogue_phrase in translations.unavailable:
+                unavailable_count += 1
+                continue
+            
+            korean_text = translations.get(dialogue.dialogue_phrase)
+            if korean_text and korean_text != dialogue.dialogue_phrase:
+                dialogue.dialogue_phrase_ko = korean_text
+                dialogue.translation_method = 'api_auto'
+                dialogue.translation_quality = 'fair'
+                translated_count += 1
+            else:
+                dialogue.translation_method = 'failed'
+                dialogue.translation_quality = 'poor'
+            
+            dialogue.save(update_fields=[
+                'dialogue_phrase_ko',
+                'translation_method',
+                'translation_quality'
+            ])
+            processed += 1
+        
+        # 대기 상태로 남긴 대사를 다시 조회하지 않도록 API 사용 불가 시 중단
+        if translations.unavailable:
+            break
+    
+    if processed:
+        failed_count = processed - translated_count
+        logger.info(f"번역 대기 대사 처리: {processed}개 ({translated_count}개 번역, {failed_count}개 실패)")
+        _update_translation_statistics(translated_count, failed_count)
+    
+    if unavailable_count:
+        raise TranslationUnavailable(f"번역 API 사용 불가 - {unavailable_count}개 대사 대기 상태 유지")
+    
+    # 한도를 넘게 남은 대기 대사는 다음 작업에서 이어서 처리
+    if processed >= limit and DialogueTable.objects.pending_translation().exists():
+        from .jobs import enqueue_job
+        enqueue_job('translate_pending_dialogues', max_attempts=PENDING_TRANSLATION_MAX_ATTEMPTS)
+    
+    return processed
+
+
 def bulk_translate_by_movie(movie_id, force_retranslate=False):
     """특정 영화의 대사들을 일괄 번역"""
     from phrase.models import MovieTable, DialogueTable
@@ -454,15 +647,21 @@ def bulk_translate_by_movie(movie_id, force_retranslate=False):
                 dialogue_phrase_ko__isnull=True
             )
         
-        translator = LibreTranslator()
+        translator = get_translator()
         updated_count = 0
         
-        logger.info(f"영화 '{movie.movie_title}' 대사 번역 시작: {dialogues.count()}개")
+        dialogues = list(dialogues)
+        logger.info(f"영화 '{movie.movie_title}' 대사 번역 시작: {len(dialogues)}개")
+        
+        # 캐시/번역 메모리 일괄 조회 후 없는 대사만 API 번역
+        translations = translator.translate_many_to_korean(
+            [dialogue.dialogue_phrase for dialogue in dialogues]
+        )
         
         with transaction.atomic():
             for dialogue in dialogues:
                 try:
-                    korean_text = translator.translate_to_korean(dialogue.dialogue_phrase)
+                    korean_text = translations.get(dialogue.dialogue_phrase)
                     
                     if korean_text and korean_text != dialogue.dialogue_phrase:
                         dialogue.dialogue_phrase_ko = korean_text
@@ -478,8 +677,6 @@ def bulk_translate_by_movie(movie_id, force_retranslate=False):
                 except Exception as e:
                     logger.error(f"대사 번역 실패: {e}")
                     continue
-                
-                time.sleep(0.1)
         
         logger.info(f"영화 '{movie.movie_title}' 번역 완료: {updated_count}개")
         return updated_count
@@ -512,7 +709,7 @@ def get_translation_quality_report():
             }
     
     # 일일 번역 통계
-    translator = LibreTranslator()
+    translator = get_translator()
     daily_stats = translator.get_translation_statistics()
     
     report = {
@@ -559,9 +756,9 @@ def _update_translation_statistics(success_count, failed_count):
     """번역 통계 업데이트"""
     try:
         today = timezone.now().strftime('%Y-%m-%d')
-        stats_key = f"bulk_translation_stats_{today}"
+        stats_key = make_key('bulk_translation_stats', today)
         
-        daily_bulk_stats = cache.get(stats_key, {
+        daily_bulk_stats = cache_get(stats_key, {
             'total_processed': 0,
             'successful': 0,
             'failed': 0,
@@ -590,7 +787,7 @@ def translate_dialogue_async(dialogue_id):
         if dialogue.dialogue_phrase_ko:
             return "이미 번역됨"
         
-        translator = LibreTranslator()
+        translator = get_translator()
         korean_text = translator.translate_to_korean(dialogue.dialogue_phrase)
         
         if korean_text and korean_text != dialogue.dialogue_phrase:
@@ -7,6 +7,7 @@ import logging
 from django.http import JsonResponse
 from django.views.decorators.cache import cache_page
 
+from phrase.caching import stale_while_revalidate
 from phrase.models import RequestTable, MovieTable, DialogueTable, UserSearchQuery
 
 logger = logging.getLogger(__name__)
@@ -53,41 +54,46 @@ def popular_searches_api(request):
         return JsonResponse({'error': '데이터를 불러올 수 없습니다.'}, status=500)
 
 
-@cache_page(60 * 10)  # 10분 캐싱
 def statistics_api(request):
-    """통계 API"""
+    """통계 API (만료된 통계는 즉시 반환 후 백그라운드 재계산)"""
     try:
-        # get_all_statistics 대신 직접 통계 수집
-        stats = {
-            'movies': {
-                'total_movies': MovieTable.objects.filter(is_active=True).count(),
-                'verified_movies': MovieTable.objects.filter(is_active=True, data_quality='verified').count(),
-                'recent_movies': MovieTable.objects.filter(is_active=True).order_by('-created_at')[:5].count(),
-            },
-            'dialogues': {
-                'total_dialogues': DialogueTable.objects.filter(is_active=True).count(),
-                'with_korean': DialogueTable.objects.filter(is_active=True, dialogue_phrase_ko__isnull=False).exclude(dialogue_phrase_ko='').count(),
-                'translation_rate': 0,  # 나중에 계산
-            },
-            'requests': {
-                'total_requests': RequestTable.objects.filter(is_active=True).count(),
-                'successful_requests': RequestTable.objects.filter(is_active=True, result_count__gt=0).count(),
-                'popular_requests': RequestTable.objects.filter(is_active=True, search_count__gt=1).count(),
-            }
-        }
-        
-        # 번역율 계산
-        total_dialogues = stats['dialogues']['total_dialogues']
-        if total_dialogues > 0:
-            stats['dialogues']['translation_rate'] = round(
-                (stats['dialogues']['with_korean'] / total_dialogues) * 100, 1
-            )
-        
         return JsonResponse({
-            'statistics': stats,
+            'statistics': collect_statistics(),
             'success': True
         })
         
     except Exception as e:
         logger.error(f"❌ 통계 API 오류: {e}")
-        return JsonResponse({'error': '통계를 불러올 수 없습니다.'}, status=500)
\ No newline at end of file
+        return JsonResponse({'error': '통계를 불러올 수 없습니다.'}, status=500)
+
+
+@stale_while_revalidate('statistics_api', fresh_for=60 * 10, max_stale=60 * 30)
+def collect_statistics():
+    """통계 집계 (10분 신선, 최대 30분 추가로 이전 값 사용)"""
+    # get_all_statistics 대신 직접 통계 수집
+    stats = {
+        'movies': {
+            'total_movies': MovieTable.objects.filter(is_active=True).count(),
+            'verified_movies': MovieTable.objects.filter(is_active=True, data_quality='verified').count(),
+            'recent_movies': MovieTable.objects.filter(is_active=True).order_by('-created_at')[:5].count(),
+        },
+        'dialogues': {
+            'total_dialogues': DialogueTable.objects.filter(is_active=True).count(),
+            'with_korean': DialogueTable.objects.filter(is_active=True, dialogue_phrase_ko__isnull=False).exclude(dialogue_phrase_ko='').count(),
+            'translation_rate': 0,  # 나중에 계산
+        },
+        'requests': {
+            'total_requests': RequestTable.objects.filter(is_active=True).count(),
+            'successful_requests': RequestTable.objects.filter(is_active=True, result_count__gt=0).count(),
+            'popular_requests': RequestTable.objects.filter(is_active=True, search_count__gt=1).count(),
+        }
+    }
+    
+    # 번역율 계산
+    total_dialogues = stats['dialogues']['total_dialogues']
+    if total_dialogues > 0:
+        stats['dialogues']['translation_rate'] = round(
+            (stats['dialogues']['with_korean'] / total_dialogues) * 100, 1
+        )
+    
+    return stats
\ No newline at end of file
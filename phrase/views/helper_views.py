@@ -3,15 +3,15 @@
 """
 헬퍼 뷰 - 디버그, 관리자용 뷰들 (수정된 버전)
 """
-import time
 import logging
 from django.shortcuts import render
 from django.http import HttpResponse, JsonResponse
 from django.db import transaction, models
 from django.contrib.auth.decorators import user_passes_test
 
+from phrase.caching import stale_while_revalidate
 from phrase.models import RequestTable, MovieTable, DialogueTable, UserSearchQuery
-from phrase.utils.translate import LibreTranslator
+from phrase.utils.translate import get_translator
 from ..utils.search_helpers import get_input_type
 
 logger = logging.getLogger(__name__)
@@ -29,7 +29,7 @@ def debug_view(request):
                 
                 # 번역 처리
                 try:
-                    translator = LibreTranslator()
+                    translator = get_translator()
                     if translator.is_korean(user_input):
                         translation_info = {
                             'detected_language': 'korean',
@@ -77,73 +77,8 @@ def korean_translation_status(request):
     print("🔍 DEBUG: korean_translation_status 뷰 호출")
     
     try:
-        # 기본 통계 계산
-        print("📊 DEBUG: 기본 통계 계산 시작")
-        
-        try:
-            total_dialogues = DialogueTable.objects.filter(is_active=True).count()
-            print(f"📊 DEBUG: 전체 대사 수: {total_dialogues}")
-        except Exception as e:
-            print(f"❌ DEBUG: 전체 대사 수 계산 실패: {e}")
-            total_dialogues = 0
-        
-        try:
-            with_korean = DialogueTable.objects.filter(
-                is_active=True, 
-                dialogue_phrase_ko__isnull=False
-            ).exclude(dialogue_phrase_ko='').count()
-            print(f"📊 DEBUG: 한글 번역 완료: {with_korean}")
-        except Exception as e:
-            print(f"❌ DEBUG: 한글 번역 완료 수 계산 실패: {e}")
-            with_korean = 0
-        
-        without_korean = total_dialogues - with_korean
-        translation_rate = round((with_korean / total_dialogues) * 100, 1) if total_dialogues > 0 else 0
-        
-        dialogue_stats = {
-            'total_dialogues': total_dialogues,
-            'with_korean': with_korean,
-            'without_korean': without_korean,
-            'translation_rate': translation_rate,
-        }
-        
-        print(f"📊 DEBUG: 통계 계산 완료: {dialogue_stats}")
-        
-        # 최근 번역된 대사들
-        print("📋 DEBUG: 최근 번역된 대사 조회")
-        try:
-            recent_translated = DialogueTable.objects.filter(
-                is_active=True,
-                dialogue_phrase_ko__isnull=False
-            ).exclude(dialogue_phrase_ko='').select_related('movie').order_by('-updated_at')[:10]
-            
-            recent_translated_list = list(recent_translated)
-            print(f"📋 DEBUG: 최근 번역된 대사: {len(recent_translated_list)}개")
-        except Exception as e:
-            print(f"❌ DEBUG: 최근 번역된 대사 조회 실패: {e}")
-            recent_translated_list = []
-        
-        # 번역이 필요한 대사들
-        print("📋 DEBUG: 번역 필요한 대사 조회")
-        try:
-            needs_translation = DialogueTable.objects.filter(
-                is_active=True
-            ).filter(
-                models.Q(dialogue_phrase_ko__isnull=True) | models.Q(dialogue_phrase_ko='')
-            ).select_related('movie')[:10]
-            
-            needs_translation_list = list(needs_translation)
-            print(f"📋 DEBUG: 번역 필요한 대사: {len(needs_translation_list)}개")
-        except Exception as e:
-            print(f"❌ DEBUG: 번역 필요한 대사 조회 실패: {e}")
-            needs_translation_list = []
-        
-        # 컨텍스트 구성
-        context = {
-            'stats': dialogue_stats,
-            'recent_translated': recent_translated_list,
-            'needs_translation': needs_translation_list,
-        }
+        # 통계/목록 조회 (만료된 값은 즉시 반환 후 백그라운드 재계산)
+        context = dict(collect_translation_status())
         
         print(f"📋 DEBUG: 최종 컨텍스트 키: {list(context.keys())}")
         print("🎭 DEBUG: korean_translation_status.html 렌더링 시작")
@@ -178,6 +113,77 @@ def korean_translation_status(request):
             return HttpResponse(f"번역 상태 뷰 오류: {str(e)}", status=500)
 
 
+@stale_while_revalidate('translation_status', fresh_for=60 * 5, max_stale=60 * 30)
+def collect_translation_status():
+    """한글 번역 상태 집계 (5분 신선, 최대 30분 추가로 이전 값 사용)"""
+    # 기본 통계 계산
+    print("📊 DEBUG: 기본 통계 계산 시작")
+    
+    try:
+        total_dialogues = DialogueTable.objects.filter(is_active=True).count()
+        print(f"📊 DEBUG: 전체 대사 수: {total_dialogues}")
+    except Exception as e:
+        print(f"❌ DEBUG: 전체 대사 수 계산 실패: {e}")
+        total_dialogues = 0
+    
+    try:
+        with_korean = DialogueTable.objects.filter(
+            is_active=True, 
+            dialogue_phrase_ko__isnull=False
+        ).exclude(dialogue_phrase_ko='').count()
+        print(f"📊 DEBUG: 한글 번역 완료: {with_korean}")
+    except Exception as e:
+        print(f"❌ DEBUG: 한글 번역 완료 수 계산 실패: {e}")
+        with_korean = 0
+    
+    without_korean = total_dialogues - with_korean
+    translation_rate = round((with_korean / total_dialogues) * 100, 1) if total_dialogues > 0 else 0
+    
+    dialogue_stats = {
+        'total_dialogues': total_dialogues,
+        'with_korean': with_korean,
+        'without_korean': without_korean,
+        'translation_rate': translation_rate,
+    }
+    
+    print(f"📊 DEBUG: 통계 계산 완료: {dialogue_stats}")
+    
+    # 최근 번역된 대사들
+    print("📋 DEBUG: 최근 번역된 대사 조회")
+    try:
+        recent_translated = DialogueTable.objects.filter(
+            is_active=True,
+            dialogue_phrase_ko__isnull=False
+        ).exclude(dialogue_phrase_ko='').select_related('movie').order_by('-updated_at')[:10]
+        
+        recent_translated_list = list(recent_translated)
+        print(f"📋 DEBUG: 최근 번역된 대사: {len(recent_translated_list)}개")
+    except Exception as e:
+        print(f"❌ DEBUG: 최근 번역된 대사 조회 실패: {e}")
+        recent_translated_list = []
+    
+    # 번역이 필요한 대사들
+    print("📋 DEBUG: 번역 필요한 대사 조회")
+    try:
+        needs_translation = DialogueTable.objects.filter(
+            is_active=True
+        ).filter(
+            models.Q(dialogue_phrase_ko__isnull=True) | models.Q(dialogue_phrase_ko='')
+        ).select_related('movie')[:10]
+        
+        needs_translation_list = list(needs_translation)
+        print(f"📋 DEBUG: 번역 필요한 대사: {len(needs_translation_list)}개")
+    except Exception as e:
+        print(f"❌ DEBUG: 번역 필요한 대사 조회 실패: {e}")
+        needs_translation_list = []
+    
+    return {
+        'stats': dialogue_stats,
+        'recent_translated': recent_translated_list,
+        'needs_translation': needs_translation_list,
+    }
+
+
 @user_passes_test(lambda u: u.is_staff)
 def bulk_translate_dialogues(request):
     """대사 일괄 번역 뷰 (관리자용) - 수정된 버전"""
@@ -205,15 +211,19 @@ def bulk_translate_dialogues(request):
                         'message': '번역이 필요한 대사가 없습니다.'
                     })
                 
-                translator = LibreTranslator()
+                translator = get_translator()
                 updated_count = 0
                 
-                # 배치 번역 처리
+                # 배치 번역 처리 (번역은 트랜잭션 밖에서 동시 처리, 저장만 트랜잭션으로 묶음)
                 print("🔄 DEBUG: 배치 번역 시작")
+                translations = translator.translate_many_to_korean(
+                    [dialogue.dialogue_phrase for dialogue in dialogues_list]
+                )
+                
                 with transaction.atomic():
                     for dialogue in dialogues_list:
                         try:
-                            korean_text = translator.translate_to_korean(dialogue.dialogue_phrase)
+                            korean_text = translations.get(dialogue.dialogue_phrase)
                             if korean_text and korean_text != dialogue.dialogue_phrase:
                                 dialogue.dialogue_phrase_ko = korean_text
                                 dialogue.translation_method = 'api_auto'
@@ -223,9 +233,6 @@ def bulk_translate_dialogues(request):
                         except Exception as e:
                             print(f"❌ DEBUG: 개별 번역 실패: {e}")
                             continue
-                        
-                        # API 호출 간격 조절
-                        time.sleep(0.1)
                 
                 print(f"🎉 DEBUG: 일괄 번역 완료: {updated_count}개")
                 return JsonResponse({
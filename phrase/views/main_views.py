@@ -12,14 +12,15 @@ from django.core.cache import cache
 from django.http import HttpResponse
 from django.db import transaction
 
-from phrase.models import RequestTable, DialogueTable
+from phrase.caching import make_key, single_flight, is_negative, record_negative
+from phrase.models import RequestTable, DialogueTable, dialogue_text_might_exist, increment_counter
 from phrase.utils.get_movie_info import get_movie_info
 from phrase.utils.clean_data import clean_data_v4
 from phrase.utils.load_to_db import load_to_db
 # 수정: phrase.application.translate -> phrase.utils.translate
-from phrase.utils.translate import LibreTranslator
+from phrase.utils.translate import get_translator
 
-from ..utils.search_helpers import get_client_ip, record_search_query, increment_search_count
+from ..utils.search_helpers import get_client_ip, schedule_search_query_record, increment_search_count
 from ..utils.data_processing import get_existing_results_from_db
 from ..utils.template_helpers import render_search_results, build_error_context
 from ..utils.input_validation import InputValidator, get_confirmation_context
@@ -167,18 +168,25 @@ def process_text(request):
         # 4단계: 번역 처리
         translation_result = _process_translation(user_input)
         
+        # 최근 결과가 없었던 구문은 DB 조회/외부 API 호출 모두 생략
+        negative = is_negative(translation_result['request_phrase'])
+
         # 5단계: DB에서 기존 결과 조회
-        print("🗄️ DEBUG: DB 검색 시작...")
-        
-        try:
-            existing_results = get_existing_results_from_db(
-                translation_result['request_phrase'], 
-                translation_result['request_korean']
-            )
-            print(f"📊 DEBUG: DB 검색 결과: {len(existing_results) if existing_results else 0}개")
-        except Exception as e:
-            print(f"❌ DEBUG: DB 검색 중 오류: {e}")
-            existing_results = None
+        existing_results = None
+        if negative:
+            print("🚫 DEBUG: 최근 결과 없음으로 기록된 구문 - DB 검색 생략")
+        else:
+            print("🗄️ DEBUG: DB 검색 시작...")
+            
+            try:
+                existing_results = get_existing_results_from_db(
+                    translation_result['request_phrase'], 
+                    translation_result['request_korean']
+                )
+                print(f"📊 DEBUG: DB 검색 결과: {len(existing_results) if existing_results else 0}개")
+            except Exception as e:
+                print(f"❌ DEBUG: DB 검색 중 오류: {e}")
+                existing_results = None
         
         if existing_results:
             print(f"✅ DEBUG: DB에서 발견: {len(existing_results)}개 영화")
@@ -198,7 +206,7 @@ def process_text(request):
             # 응답 시간 계산 및 검색 기록 저장
             response_time = int((time.time() - start_time) * 1000)
             try:
-                record_search_query(
+                schedule_search_query_record(
                     session_key, user_input, translation_result['translated_query'],
                     len(existing_results), True, response_time, user_ip, user_agent
                 )
@@ -212,37 +220,25 @@ def process_text(request):
                 translation_result['request_phrase'], existing_results, from_cache=True
             )
 
-        # 6단계: 외부 API 호출
-        print("🌐 DEBUG: 외부 API 호출 시작 (DB에 결과 없음)")
-        
-        try:
-            # DB 중복 확인 로직 추가
-            existing_dialogues = DialogueTable.objects.filter(
-                dialogue_phrase__icontains=translation_result['request_phrase']
-            ).count()
-            
-            if existing_dialogues > 0:
-                print(f"DB에 기존 데이터 존재, API 호출 건너뜀: {translation_result['request_phrase']}")
-                playphrase_movies = []
-            else:
-                playphrase_movies = get_movie_info(translation_result['request_phrase'])
-                print(f"📡 DEBUG: 외부 API 응답: {len(playphrase_movies) if playphrase_movies else 0}개")
-        except Exception as e:
-            print(f"DB 확인 중 오류: {e}")
-            try:
-                playphrase_movies = get_movie_info(translation_result['request_phrase'])
-                print(f"📡 DEBUG: 외부 API 응답: {len(playphrase_movies) if playphrase_movies else 0}개")
-            except Exception as api_error:
-                print(f"API에서 데이터를 가져올 수 없음: {translation_result['request_phrase']}")
-                playphrase_movies = None
+        # 6단계: 외부 API 호출 + 7단계 데이터 처리 및 저장
+        # 같은 구문의 동시 요청은 외부 API 호출/DB 저장을 한 번만 수행하고 결과 공유
+        if negative:
+            playphrase_found, processed_results = False, None
+        else:
+            print("🌐 DEBUG: 외부 API 호출 시작 (DB에 결과 없음)")
+            playphrase_found, processed_results = single_flight(
+                'process_text',
+                translation_result['request_phrase'],
+                lambda: _fetch_and_save_external(translation_result, user_ip, user_agent)
+            )
 
-        if not playphrase_movies:
+        if not playphrase_found:
             print("❌ DEBUG: 외부 API 결과 없음")
             
             # 실패 기록 저장
             response_time = int((time.time() - start_time) * 1000)
             try:
-                record_search_query(
+                schedule_search_query_record(
                     session_key, user_input, translation_result['translated_query'],
                     0, False, response_time, user_ip, user_agent
                 )
@@ -263,11 +259,6 @@ def process_text(request):
                 'source': 'api_no_results'
             })
 
-        # 7단계: 데이터 처리 및 저장
-        processed_results = _process_and_save_data(
-            playphrase_movies, translation_result, user_ip, user_agent
-        )
-        
         if not processed_results:
             print("❌ DEBUG: 최종 결과 없음")
             return render(request, 'phrase/index.html', {
@@ -283,7 +274,7 @@ def process_text(request):
             })
 
         # 8단계: 결과 캐싱 및 최종 응답
-        cache_key = f"processed_movies_{hash(translation_result['request_phrase'])}_{len(processed_results)}"
+        cache_key = make_key('processed_movies', translation_result['request_phrase'], len(processed_results))
         try:
             cache.set(cache_key, processed_results, 600)  # 10분 캐싱
             print(f"🗄️ DEBUG: 캐시 저장 완료: {cache_key}")
@@ -295,7 +286,7 @@ def process_text(request):
         
         # 검색 기록 저장
         try:
-            record_search_query(
+            schedule_search_query_record(
                 session_key, user_input, translation_result['translated_query'],
                 len(processed_results), True, response_time, user_ip, user_agent
             )
@@ -333,11 +324,46 @@ def process_text(request):
             return HttpResponse(f"시스템 오류: {str(e)}", status=500)
 
 
+def _fetch_and_save_external(translation_result, user_ip, user_agent):
+    """
+    외부 API 조회 및 DB 저장 헬퍼 함수 (single-flight 실행 단위)
+    반환: (외부 API 결과 존재 여부, 처리된 결과)
+    """
+    try:
+        # DB 중복 확인 (블룸 필터가 "있을 수 있음"일 때만 SQL 확인)
+        request_phrase = translation_result['request_phrase']
+        existing_dialogues = dialogue_text_might_exist(request_phrase) and DialogueTable.objects.filter(
+            dialogue_phrase__icontains=request_phrase
+        ).exists()
+        
+        if existing_dialogues:
+            print(f"DB에 기존 데이터 존재, API 호출 건너뜀: {translation_result['request_phrase']}")
+            playphrase_movies = []
+        else:
+            playphrase_movies = get_movie_info(translation_result['request_phrase'])
+            print(f"📡 DEBUG: 외부 API 응답: {len(playphrase_movies) if playphrase_movies else 0}개")
+    except Exception as e:
+        print(f"DB 확인 중 오류: {e}")
+        try:
+            playphrase_movies = get_movie_info(translation_result['request_phrase'])
+            print(f"📡 DEBUG: 외부 API 응답: {len(playphrase_movies) if playphrase_movies else 0}개")
+        except Exception as api_error:
+            print(f"API에서 데이터를 가져올 수 없음: {translation_result['request_phrase']}")
+            playphrase_movies = None
+
+    if not playphrase_movies:
+        return False, None
+
+    return True, _process_and_save_data(
+        playphrase_movies, translation_result, user_ip, user_agent
+    )
+
+
 def _process_translation(user_input):
     """번역 처리 헬퍼 함수"""
     print("🔄 DEBUG: 번역기 초기화")
     try:
-        translator = LibreTranslator()
+        translator = get_translator()
         
         if translator.is_korean(user_input):
             print("🇰🇷 DEBUG: 한글구문 감지")
@@ -386,6 +412,7 @@ def _process_and_save_data(playphrase_movies, translation_result, user_ip, user_
     
     if not movies:
         print("❌ DEBUG: 데이터 추출 실패")
+        record_negative(translation_result['request_phrase'])
         return None
 
     # DB 저장
@@ -408,8 +435,7 @@ def _process_and_save_data(playphrase_movies, translation_result, user_ip, user_
             print(f"📋 DEBUG: 요청 테이블 처리: {'생성' if created else '업데이트'}")
             
             if not created:
-                request_obj.search_count += 1
-                request_obj.save(update_fields=['search_count'])
+                increment_counter('phrase.RequestTable', request_obj.pk, 'search_count')
                 print("📊 DEBUG: 검색 횟수 증가")
 
             # 영화 및 대사 정보 저장
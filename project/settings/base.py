@@ -119,6 +119,75 @@ REST_FRAMEWORK = {
 }
 
 
+# ===== 대사 검색 설정 =====
+
+# 검색 백엔드: auto(DB 벤더 자동 선택) | token | mysql_fulltext | sqlite_fts5
+PHRASE_SEARCH_BACKEND = os.getenv("PHRASE_SEARCH_BACKEND", "auto")
+
+# 부분 문자열(suffix array) 인덱스 파일 - build_substring_index 명령으로 생성, 파일이 있으면 검색에 사용
+PHRASE_SUBSTRING_INDEX_PATH = os.getenv(
+    "PHRASE_SUBSTRING_INDEX_PATH", str(BASE_DIR / "search_index" / "dialogue_substring.idx")
+)
+
+
+# ===== 캐시 설정 =====
+
+# default: 프로세스 LRU(L1) + 공유 캐시(L2) - phrase.caching.backends.TwoTierCache
+# shared: 워커 간 공유 캐시 (REDIS_URL이 있으면 Redis, 없으면 로컬 파일 캐시)
+# 파일 캐시의 add/incr는 원자적이지 않음 (잠금 중복 획득/카운터 유실 가능) - 워커가 여럿인 운영 환경은 REDIS_URL 필수
+# (서버 시작 시 공유 캐시에 원자적 add/incr가 없으면 경고 로그)
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+        "TIMEOUT": 300,
+    }
+else:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("PHRASE_CACHE_DIR", str(BASE_DIR / "cache")),
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 10000, "CULL_FREQUENCY": 3},
+    }
+
+CACHES = {
+    "default": {
+        "BACKEND": "phrase.caching.backends.TwoTierCache",
+        "TIMEOUT": 300,
+        "OPTIONS": {
+            "L2": "shared",
+            # L1 항목 최대 수명 (초) - 다른 워커의 변경/삭제가 보이기까지의 최대 지연
+            "L1_TIMEOUT": int(os.getenv("PHRASE_L1_CACHE_TIMEOUT", "30")),
+            # 네임스페이스별 L1 최대 항목 수 (phrase.caching.backends.DEFAULT_NAMESPACE_LIMITS에 병합)
+            "NAMESPACE_LIMITS": {},
+        },
+    },
+    "shared": SHARED_CACHE,
+}
+
+# 서버 시작 시 인기 검색어 캐시 예열 (warm_search_cache 명령과 같은 작업, 백그라운드)
+PHRASE_CACHE_WARM_ON_STARTUP = os.getenv("PHRASE_CACHE_WARM_ON_STARTUP", "false").lower() == "true"
+PHRASE_CACHE_WARM_TOP_N = int(os.getenv("PHRASE_CACHE_WARM_TOP_N", "50"))
+
+
+# ===== 백그라운드 작업 =====
+
+# queue: background_job 테이블에 등록, run_job_worker 명령이 처리 (운영 - 워커 프로세스 필요)
+# inline: 워커 없이 커밋 직후 요청 프로세스에서 실행 (개발 환경)
+PHRASE_JOB_MODE = os.getenv("PHRASE_JOB_MODE", "queue")
+
+
+# ===== 번역 API 호출 =====
+
+# 배치 번역 동시 호출 수 (프로세스별)
+PHRASE_TRANSLATION_CONCURRENCY = int(os.getenv("PHRASE_TRANSLATION_CONCURRENCY", "4"))
+# 모든 워커가 공유하는 호출 속도 제한 (초당 호출 수 / 한 번에 허용하는 호출 수)
+PHRASE_TRANSLATION_RATE = float(os.getenv("PHRASE_TRANSLATION_RATE", "5"))
+PHRASE_TRANSLATION_BURST = int(os.getenv("PHRASE_TRANSLATION_BURST", "10"))
+
+
 # ===== 세션 설정 - 자동 로그아웃 =====
 
 # 1. 브라우저 종료 시 세션 만료